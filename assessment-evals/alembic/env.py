@@ -10,13 +10,20 @@ from sqlmodel import SQLModel
 
 from app.models.answersheet_model import AnswerSheet
 from app.models.answerslot_model import AnswerSlot
+from app.models.regrade_model import RegradeJob
+from app.models.collusion_model import CollusionScan, CollusionPair
+from app.models.archive_model import AnswerSheetArchive
+from app.models.idempotency_model import IdempotencyRecord
+from app.models.answer_staging_model import AnswerSlotStaging
+from app.models.telemetry_model import AttemptEvent, QuestionTimeOnTask
 
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-config.set_main_option("sqlalchemy.url", str(DATABASE_URL))
+# % is the interpolation character of the ini config - escape it (url encoded passwords, query options)
+config.set_main_option("sqlalchemy.url", str(DATABASE_URL).replace("%", "%%"))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,38 @@
+"""Add IdempotencyRecord table
+
+Revision ID: 0c5a9e7d2b48
+Revises: f47b1d3e8c65
+Create Date: 2026-10-18 16:48:30.661904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c5a9e7d2b48'
+down_revision: Union[str, None] = 'f47b1d3e8c65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('idempotencyrecord',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('idempotency_key', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('request_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response_body', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('student_id', 'idempotency_key')
+    )
+    op.create_index(op.f('ix_idempotencyrecord_expires_at'), 'idempotencyrecord', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_idempotencyrecord_expires_at'), table_name='idempotencyrecord')
+    op.drop_table('idempotencyrecord')
@@ -0,0 +1,27 @@
+"""Add RegradeJob lease_expires_at
+
+Revision ID: 1a7d3c9e5b46
+Revises: 4f8a6c2e9d15
+Create Date: 2026-10-19 14:12:08.402517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1a7d3c9e5b46'
+down_revision: Union[str, None] = '4f8a6c2e9d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Running jobs without a lease can be taken over right away
+    op.add_column('regradejob', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('regradejob', 'lease_expires_at')
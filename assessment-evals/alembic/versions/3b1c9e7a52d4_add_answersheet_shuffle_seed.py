@@ -0,0 +1,26 @@
+"""Add AnswerSheet shuffle_seed
+
+Revision ID: 3b1c9e7a52d4
+Revises: d77e08f8d23d
+Create Date: 2026-10-18 09:12:40.551203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1c9e7a52d4'
+down_revision: Union[str, None] = 'd77e08f8d23d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answersheet', sa.Column('shuffle_seed', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('answersheet', 'shuffle_seed')
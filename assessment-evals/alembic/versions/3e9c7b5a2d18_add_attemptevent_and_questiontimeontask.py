@@ -0,0 +1,52 @@
+"""Add AttemptEvent & QuestionTimeOnTask tables
+
+Revision ID: 3e9c7b5a2d18
+Revises: 8f2b6d4a1c97
+Create Date: 2026-10-18 20:16:08.257931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9c7b5a2d18'
+down_revision: Union[str, None] = '8f2b6d4a1c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Monthly partitions are created by the telemetry flusher before rows are written to them
+    op.execute("CREATE SEQUENCE attemptevent_id_seq")
+    op.create_table('attemptevent',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('attemptevent_id_seq')"), nullable=False),
+    sa.Column('received_at', sa.DateTime(), nullable=False),
+    sa.Column('answer_sheet_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=True),
+    sa.Column('event_type', sa.Enum('view', 'answer_change', 'blur', name='attempteventtype'), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'received_at'),
+    postgresql_partition_by='RANGE (received_at)'
+    )
+    op.execute("ALTER SEQUENCE attemptevent_id_seq OWNED BY attemptevent.id")
+    op.create_index('ix_attemptevent_answer_sheet_occurred', 'attemptevent', ['answer_sheet_id', 'occurred_at'], unique=False)
+    op.create_table('questiontimeontask',
+    sa.Column('answer_sheet_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('time_spent_seconds', sa.Float(), nullable=False),
+    sa.Column('view_count', sa.Integer(), nullable=False),
+    sa.Column('answer_changes', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('answer_sheet_id', 'question_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('questiontimeontask')
+    op.drop_index('ix_attemptevent_answer_sheet_occurred', table_name='attemptevent')
+    # Dropping the partitioned table drops its partitions and the owned sequence
+    op.drop_table('attemptevent')
+    sa.Enum(name='attempteventtype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,27 @@
+"""Add IdempotencyRecord locked_until
+
+Revision ID: 4f8a6c2e9d15
+Revises: 9b5d3f7e2a64
+Create Date: 2026-10-19 10:41:55.183029
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a6c2e9d15'
+down_revision: Union[str, None] = '9b5d3f7e2a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pending records without a lease can be taken over right away
+    op.add_column('idempotencyrecord', sa.Column('locked_until', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('idempotencyrecord', 'locked_until')
@@ -0,0 +1,48 @@
+"""Add RegradeJob table
+
+Revision ID: 5d8e1b4f7c20
+Revises: a9f3c2d81e57
+Create Date: 2026-10-18 14:02:36.811245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e1b4f7c20'
+down_revision: Union[str, None] = 'a9f3c2d81e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('regradejob',
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('queued', 'running', 'completed', 'failed', name='regradejobstatus'), nullable=False),
+    sa.Column('total_slots', sa.Integer(), nullable=True),
+    sa.Column('regraded_slots', sa.Integer(), nullable=False),
+    sa.Column('changed_slots', sa.Integer(), nullable=False),
+    sa.Column('refreshed_sheets', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_regradejob_id'), 'regradejob', ['id'], unique=False)
+    op.create_index(op.f('ix_regradejob_question_id'), 'regradejob', ['question_id'], unique=False)
+    op.create_index(op.f('ix_regradejob_status'), 'regradejob', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_regradejob_status'), table_name='regradejob')
+    op.drop_index(op.f('ix_regradejob_question_id'), table_name='regradejob')
+    op.drop_index(op.f('ix_regradejob_id'), table_name='regradejob')
+    op.drop_table('regradejob')
+    sa.Enum(name='regradejobstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,27 @@
+"""Add answerkey_version_seq
+
+Revision ID: 6c2f8a4d1b93
+Revises: 3e9c7b5a2d18
+Create Date: 2026-10-19 09:12:41.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2f8a4d1b93'
+down_revision: Union[str, None] = '3e9c7b5a2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bumped on every answer key change - processes drop cached answer keys of older versions
+    op.execute(sa.schema.CreateSequence(sa.Sequence('answerkey_version_seq')))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence('answerkey_version_seq')))
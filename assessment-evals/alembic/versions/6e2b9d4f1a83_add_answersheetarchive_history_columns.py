@@ -0,0 +1,75 @@
+"""Add AnswerSheetArchive history columns
+
+Revision ID: 6e2b9d4f1a83
+Revises: 1a7d3c9e5b46
+Create Date: 2026-10-19 16:38:52.271904
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2b9d4f1a83'
+down_revision: Union[str, None] = '1a7d3c9e5b46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _history_columns(row) -> dict:
+    answer_sheet = json.loads(zlib.decompress(row.payload))["answer_sheet"]
+    return {
+        "id": row.id,
+        "time_finish": row.time_finish,
+        "course_id": answer_sheet.get("course_id"),
+        "time_start": answer_sheet["time_start"],
+        "attempt_score": answer_sheet["attempt_score"],
+        "total_points": answer_sheet["total_points"],
+    }
+
+
+def upgrade() -> None:
+    op.add_column('answersheetarchive', sa.Column('course_id', sa.Integer(), nullable=True))
+    op.add_column('answersheetarchive', sa.Column('time_start', sa.DateTime(), nullable=True))
+    op.add_column('answersheetarchive', sa.Column('attempt_score', sa.Float(), nullable=True))
+    op.add_column('answersheetarchive', sa.Column('total_points', sa.Integer(), nullable=True))
+
+    # The history columns of the rows already archived are only in their compressed payload
+    bind = op.get_bind()
+    after_id = 0
+    while True:
+        archived = bind.execute(
+            sa.text(
+                "SELECT id, time_finish, payload FROM answersheetarchive WHERE id > :after_id ORDER BY id LIMIT :limit"
+            ),
+            {"after_id": after_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not archived:
+            break
+        bind.execute(
+            sa.text(
+                "UPDATE answersheetarchive SET course_id = :course_id, time_start = CAST(:time_start AS timestamp), "
+                "attempt_score = :attempt_score, total_points = :total_points "
+                "WHERE id = :id AND time_finish = :time_finish"
+            ),
+            [_history_columns(row) for row in archived],
+        )
+        after_id = archived[-1].id
+
+    op.create_index(
+        'ix_answersheetarchive_student_history', 'answersheetarchive', ['student_id', 'time_start', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answersheetarchive_student_history', table_name='answersheetarchive')
+    op.drop_column('answersheetarchive', 'total_points')
+    op.drop_column('answersheetarchive', 'attempt_score')
+    op.drop_column('answersheetarchive', 'time_start')
+    op.drop_column('answersheetarchive', 'course_id')
@@ -0,0 +1,37 @@
+"""Add AnswerSlotStaging table
+
+Revision ID: 7a3e5c1f9d02
+Revises: 0c5a9e7d2b48
+Create Date: 2026-10-18 17:31:08.417362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e5c1f9d02'
+down_revision: Union[str, None] = '0c5a9e7d2b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ids come from the answerslot sequence, staged answers keep their id once flushed
+    op.create_table('answerslotstaging',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('answerslot_id_seq')"), nullable=False),
+    sa.Column('quiz_answer_sheet_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('question_type', postgresql.ENUM('single_select_mcq', 'multiple_select_mcq', name='questiontypeenum', create_type=False), nullable=False),
+    sa.Column('selected_option_ids', sa.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('quiz_answer_sheet_id', 'question_id', name='uq_answerslotstaging_sheet_question')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('answerslotstaging')
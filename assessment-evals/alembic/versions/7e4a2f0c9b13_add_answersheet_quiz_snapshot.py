@@ -0,0 +1,26 @@
+"""Add AnswerSheet quiz_snapshot
+
+Revision ID: 7e4a2f0c9b13
+Revises: 3b1c9e7a52d4
+Create Date: 2026-10-18 10:04:17.218934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4a2f0c9b13'
+down_revision: Union[str, None] = '3b1c9e7a52d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answersheet', sa.Column('quiz_snapshot', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('answersheet', 'quiz_snapshot')
@@ -0,0 +1,69 @@
+"""Add CollusionScan & CollusionPair tables
+
+Revision ID: 8f2b6d4a1c97
+Revises: c4e7a1d0f356
+Create Date: 2026-10-18 19:41:52.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2b6d4a1c97'
+down_revision: Union[str, None] = 'c4e7a1d0f356'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('collusionscan',
+    sa.Column('quiz_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('queued', 'running', 'completed', 'failed', name='collusionscanstatus'), nullable=False),
+    sa.Column('scanned_sheets', sa.Integer(), nullable=False),
+    sa.Column('candidate_pairs', sa.Integer(), nullable=False),
+    sa.Column('flagged_pairs', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_collusionscan_id'), 'collusionscan', ['id'], unique=False)
+    op.create_index(op.f('ix_collusionscan_quiz_id'), 'collusionscan', ['quiz_id'], unique=False)
+    op.create_index(op.f('ix_collusionscan_status'), 'collusionscan', ['status'], unique=False)
+    op.create_table('collusionpair',
+    sa.Column('scan_id', sa.Integer(), nullable=False),
+    sa.Column('quiz_id', sa.Integer(), nullable=False),
+    sa.Column('answer_sheet_id_a', sa.Integer(), nullable=False),
+    sa.Column('student_id_a', sa.Integer(), nullable=False),
+    sa.Column('answer_sheet_id_b', sa.Integer(), nullable=False),
+    sa.Column('student_id_b', sa.Integer(), nullable=False),
+    sa.Column('shared_wrong_answers', sa.Integer(), nullable=False),
+    sa.Column('jaccard', sa.Float(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['scan_id'], ['collusionscan.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_collusionpair_id'), 'collusionpair', ['id'], unique=False)
+    op.create_index(op.f('ix_collusionpair_quiz_id'), 'collusionpair', ['quiz_id'], unique=False)
+    op.create_index(op.f('ix_collusionpair_scan_id'), 'collusionpair', ['scan_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_collusionpair_scan_id'), table_name='collusionpair')
+    op.drop_index(op.f('ix_collusionpair_quiz_id'), table_name='collusionpair')
+    op.drop_index(op.f('ix_collusionpair_id'), table_name='collusionpair')
+    op.drop_table('collusionpair')
+    op.drop_index(op.f('ix_collusionscan_status'), table_name='collusionscan')
+    op.drop_index(op.f('ix_collusionscan_quiz_id'), table_name='collusionscan')
+    op.drop_index(op.f('ix_collusionscan_id'), table_name='collusionscan')
+    op.drop_table('collusionscan')
+    sa.Enum(name='collusionscanstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,56 @@
+"""Add AnswerSheetArchive quiz_key
+
+Revision ID: 9b5d3f7e2a64
+Revises: 6c2f8a4d1b93
+Create Date: 2026-10-19 10:02:17.664205
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b5d3f7e2a64'
+down_revision: Union[str, None] = '6c2f8a4d1b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column('answersheetarchive', sa.Column('quiz_key', sqlmodel.sql.sqltypes.AutoString(length=160), nullable=True))
+
+    # quiz_key of the rows already archived is only in their compressed payload
+    bind = op.get_bind()
+    after_id = 0
+    while True:
+        archived = bind.execute(
+            sa.text(
+                "SELECT id, time_finish, payload FROM answersheetarchive WHERE id > :after_id ORDER BY id LIMIT :limit"
+            ),
+            {"after_id": after_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not archived:
+            break
+        bind.execute(
+            sa.text("UPDATE answersheetarchive SET quiz_key = :quiz_key WHERE id = :id AND time_finish = :time_finish"),
+            [
+                {
+                    "id": row.id,
+                    "time_finish": row.time_finish,
+                    "quiz_key": json.loads(zlib.decompress(row.payload))["answer_sheet"]["quiz_key"],
+                }
+                for row in archived
+            ],
+        )
+        after_id = archived[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column('answersheetarchive', 'quiz_key')
@@ -0,0 +1,37 @@
+"""Add AnswerSheet deadline
+
+Revision ID: a9f3c2d81e57
+Revises: 7e4a2f0c9b13
+Create Date: 2026-10-18 12:41:53.097410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9f3c2d81e57'
+down_revision: Union[str, None] = '7e4a2f0c9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answersheet', sa.Column('deadline', sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE answersheet SET deadline = time_start + time_limit WHERE time_start IS NOT NULL"
+    )
+    op.create_index(
+        'ix_answersheet_in_progress_deadline',
+        'answersheet',
+        ['deadline'],
+        unique=False,
+        postgresql_where=sa.text("status = 'in_progress'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answersheet_in_progress_deadline', table_name='answersheet')
+    op.drop_column('answersheet', 'deadline')
@@ -0,0 +1,32 @@
+"""Add AnswerSheet course_id
+
+Revision ID: b81d4f6a3e29
+Revises: 7a3e5c1f9d02
+Create Date: 2026-10-18 18:12:47.902133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d4f6a3e29'
+down_revision: Union[str, None] = '7a3e5c1f9d02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answersheet', sa.Column('course_id', sa.Integer(), nullable=True))
+    # Sheets created before quiz snapshots keep NULL, course exports filter on the course's quiz ids
+    op.execute(
+        "UPDATE answersheet SET course_id = (quiz_snapshot->>'course_id')::int WHERE quiz_snapshot IS NOT NULL"
+    )
+    op.create_index(op.f('ix_answersheet_course_id'), 'answersheet', ['course_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_answersheet_course_id'), table_name='answersheet')
+    op.drop_column('answersheet', 'course_id')
@@ -0,0 +1,35 @@
+"""Add AnswerSheet student history index
+
+Revision ID: c4e7a1d0f356
+Revises: b81d4f6a3e29
+Create Date: 2026-10-18 19:04:11.385620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a1d0f356'
+down_revision: Union[str, None] = 'b81d4f6a3e29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_answersheet_student_history',
+        'answersheet',
+        ['student_id', 'time_start', 'id'],
+        unique=False,
+        postgresql_include=[
+            'quiz_id', 'course_id', 'status', 'attempt_score', 'total_points',
+            'time_limit', 'time_finish', 'quiz_title', 'quiz_key',
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answersheet_student_history', table_name='answersheet')
@@ -0,0 +1,61 @@
+"""Store selected option ids on AnswerSlot
+
+Revision ID: e2c6a4d9b731
+Revises: 5d8e1b4f7c20
+Create Date: 2026-10-18 15:20:44.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6a4d9b731'
+down_revision: Union[str, None] = '5d8e1b4f7c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'answerslot',
+        sa.Column('selected_option_ids', sa.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False),
+    )
+    # Backfill from the option rows, then drop them
+    op.execute(
+        """
+        UPDATE answerslot
+        SET selected_option_ids = selected.option_ids
+        FROM (
+            SELECT quiz_answer_slot_id, array_agg(DISTINCT option_id ORDER BY option_id) AS option_ids
+            FROM answerslotoption
+            GROUP BY quiz_answer_slot_id
+        ) AS selected
+        WHERE answerslot.id = selected.quiz_answer_slot_id
+        """
+    )
+    op.drop_index('ix_answerslotoption_id', table_name='answerslotoption')
+    op.drop_table('answerslotoption')
+
+
+def downgrade() -> None:
+    op.create_table('answerslotoption',
+    sa.Column('quiz_answer_slot_id', sa.Integer(), nullable=False),
+    sa.Column('option_id', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['quiz_answer_slot_id'], ['answerslot.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_answerslotoption_id', 'answerslotoption', ['id'], unique=False)
+    op.execute(
+        """
+        INSERT INTO answerslotoption (quiz_answer_slot_id, option_id, created_at, updated_at)
+        SELECT answerslot.id, unnest(answerslot.selected_option_ids), answerslot.created_at, answerslot.updated_at
+        FROM answerslot
+        """
+    )
+    op.drop_column('answerslot', 'selected_option_ids')
@@ -0,0 +1,41 @@
+"""Add partitioned AnswerSheetArchive table
+
+Revision ID: f47b1d3e8c65
+Revises: e2c6a4d9b731
+Create Date: 2026-10-18 16:05:12.204718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f47b1d3e8c65'
+down_revision: Union[str, None] = 'e2c6a4d9b731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Yearly partitions are created by the archival job before rows are written to them
+    op.create_table('answersheetarchive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('time_finish', sa.DateTime(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('quiz_id', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'time_finish'),
+    postgresql_partition_by='RANGE (time_finish)'
+    )
+    op.create_index(op.f('ix_answersheetarchive_quiz_id'), 'answersheetarchive', ['quiz_id'], unique=False)
+    op.create_index(op.f('ix_answersheetarchive_student_id'), 'answersheetarchive', ['student_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_answersheetarchive_student_id'), table_name='answersheetarchive')
+    op.drop_index(op.f('ix_answersheetarchive_quiz_id'), table_name='answersheetarchive')
+    # Dropping the partitioned table drops its partitions
+    op.drop_table('answersheetarchive')
@@ -1,8 +1,10 @@
-from fastapi import Depends, HTTPException
+import secrets
+from fastapi import Depends, HTTPException, Header
 from typing import Annotated, Any
 from sqlmodel import Session
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
+from app import settings
 from app.core.db_eng import engine
 from app.core import requests
 
@@ -25,6 +27,27 @@ def get_current_student_dep(token: Annotated[str | None, Depends(oauth2_scheme)]
 
 GetCurrentStudentDep = Annotated[ Any, Depends(get_current_student_dep)]
 
+def get_current_admin_dep(token: Annotated[str | None, Depends(oauth2_scheme)]):
+    if token is None:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    user = requests.get_current_user(token)
+    if user.get("is_superuser") == False:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return user
+
+GetCurrentAdminDep = Annotated[Any, Depends(get_current_admin_dep)]
+
+# Service to service calls (quiz-engine) - shared SERVICE_TOKEN in the X-Service-Token header
+def verify_service_token(service_token: Annotated[str | None, Header(alias="X-Service-Token")] = None):
+    expected_token = str(settings.SERVICE_TOKEN)
+    if not expected_token or service_token is None or not secrets.compare_digest(service_token, expected_token):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+ServiceTokenDep = Annotated[None, Depends(verify_service_token)]
+
+# Optional Idempotency-Key header - retries with the same key replay the first response
+IdempotencyKeyDep = Annotated[str | None, Header(alias="Idempotency-Key", min_length=1, max_length=255)]
+
 def get_login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     return requests.login_for_access_token(form_data)
 
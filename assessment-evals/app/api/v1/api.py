@@ -1,9 +1,27 @@
 from fastapi import APIRouter
-from app.api.v1.routes import (health, answersheet)
+from app.api.v1.routes import (health, answersheet, waiting_room, provision, regrade, proctor, export, integrity)
 
 api_router = APIRouter()
 
 api_router.include_router(health.router, prefix="/health", tags=["Health"])
 api_router.include_router(
     answersheet.router, prefix="/answersheet", tags=["AnswerSheet"]
-)
\ No newline at end of file
+)
+api_router.include_router(
+    waiting_room.router, prefix="/waiting-room", tags=["Waiting Room"]
+)
+api_router.include_router(
+    provision.router, prefix="/provision", tags=["Provision"]
+)
+api_router.include_router(
+    regrade.router, prefix="/regrade", tags=["Regrade"]
+)
+api_router.include_router(
+    proctor.router, prefix="/proctor", tags=["Proctor"]
+)
+api_router.include_router(
+    export.router, prefix="/export", tags=["Export"]
+)
+api_router.include_router(
+    integrity.router, prefix="/integrity", tags=["Integrity"]
+)
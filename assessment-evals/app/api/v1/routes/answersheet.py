@@ -1,14 +1,44 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, status
-from app.api.deps import DBSessionDep, GetCurrentStudentDep
+import asyncio
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, status
+from fastapi.responses import StreamingResponse
+from app.api.deps import DBSessionDep, GetCurrentStudentDep, IdempotencyKeyDep
 
+from app import settings
 from app.core.config import logger_config
-from app.core.requests import validate_quiz_key
-from app.service.quiz_attempt_manager import create_new_quiz_attempt, handle_in_progress_quiz_attempt
+from app.core.requests import upstream_executor, validate_quiz_key_coalesced
+from app.service.prewarm import get_runtime_quiz
+from app.service.quiz_attempt_manager import create_new_quiz_attempt, handle_in_progress_quiz_attempt, activate_provisioned_quiz_attempt
+from app.service.waiting_room import ensure_admitted, get_waiting_room, open_waiting_room
+from app.service.quiz_snapshot import get_attempt_snapshot, validate_answer_against_snapshot
+from app.service.idempotency import run_idempotent
+from app.service.attempt_stream import (
+    attempt_events,
+    attempt_state_events,
+    load_attempt_state,
+    publish_answer_saved,
+)
+from app.service.attempt_finish import attempts_finished, is_answer_sheet_active
+from app.service.proctor import record_answer_saved
+from app.service.archive import archived_answer_sheet_read, archived_quiz_feedback, archived_time_on_task
+from app.service.attempt_history import get_attempt_history_page, get_attempt_history_summary
+from app.service.telemetry import ingest_attempt_events
 from app.crud.answersheet_crud import crud_answer_sheet, crud_answer_slot
-
-from app.models.answersheet_model import AnswerSheetRead, AttemptQuizRequest
+from app.crud.archive_crud import crud_answer_sheet_archive
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.crud.telemetry_crud import crud_attempt_telemetry
+
+from app.models.base import QuizAttemptStatus
+from app.models.answersheet_model import (
+    AnswerSheet,
+    AnswerSheetRead,
+    AttemptHistoryPage,
+    AttemptHistorySummary,
+    AttemptQuizRequest,
+    QuizFeedback,
+)
 from app.models.answerslot_model import AnswerSlotCreate, AnswerSlotRead
 from app.models.quiz_runtime_model import RuntimeQuizGenerated
+from app.models.telemetry_model import AttemptEventBatch, AttemptEventBatchAccepted, QuestionTimeOnTaskRead
 
 logger = logger_config(__name__)
 
@@ -30,7 +60,10 @@ def get_all_quiz_attempts_for_student(
         quiz_attempts = crud_answer_sheet.all_quiz_attempts_for_student(
             db_session=db, student_id=student_id
         )
-        return quiz_attempts
+        archived_attempts = crud_answer_sheet_archive.get_archived_answer_sheets_for_student(
+            db_session=db, student_id=student_id
+        )
+        return [archived_answer_sheet_read(archived) for archived in archived_attempts] + list(quiz_attempts)
 
     except Exception as e:
         raise HTTPException(
@@ -38,6 +71,46 @@ def get_all_quiz_attempts_for_student(
         )
 
 
+# ------------------------------
+# Paginated Attempt History & Summary for Student
+# ------------------------------
+
+@router.get("/history", response_model=AttemptHistoryPage)
+def get_quiz_attempt_history_for_student(
+    db: DBSessionDep,
+    student_data: GetCurrentStudentDep,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+):
+    """
+    Started Quiz Attempts for Student, newest first.
+    Pass next_cursor of a page as cursor to get the next page.
+    """
+    try:
+        return get_attempt_history_page(db, student_id=student_data["id"], limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"get_quiz_attempt_history_for_student Error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Fetching Quiz Attempts"
+        )
+
+
+@router.get("/history/summary", response_model=AttemptHistorySummary)
+def get_quiz_attempt_summary_for_student(db: DBSessionDep, student_data: GetCurrentStudentDep):
+    """
+    Attempt counts and scores for Student, overall and per course
+    """
+    try:
+        return get_attempt_history_summary(db, student_id=student_data["id"])
+    except Exception as e:
+        logger.error(f"get_quiz_attempt_summary_for_student Error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Fetching Quiz Summary"
+        )
+
+
 # ------------------------------
 # Quiz Generation Endpoint
 # ------------------------------
@@ -46,34 +119,63 @@ def get_all_quiz_attempts_for_student(
 def generate_runtime_quiz_for_student(
     attempt_ids: AttemptQuizRequest, 
     db: DBSessionDep, 
-    student_data: GetCurrentStudentDep
+    student_data: GetCurrentStudentDep,
+    idempotency_key: IdempotencyKeyDep = None,
 ):
     """
     Take Quiz ID and Generate Quiz For Student
     Generate New Quiz Attempt for Student Or
     Returns In Progress Remaining Quiz Questions
 
+    Retries sent with the same Idempotency-Key header replay the first response.
+
     """
     logger.info(f"Generating Quiz for Student ID: {student_data['id']}")
     quiz_id = attempt_ids.quiz_id
     quiz_key = attempt_ids.quiz_key
 
-    try:
+    def generate_quiz() -> RuntimeQuizGenerated:
+        attempt_sheet = crud_answer_sheet.student_answer_sheet_exists(
+            db, user_id=student_data["id"], quiz_id=quiz_id, quiz_key=quiz_key
+        )
+
+        is_provisioned = attempt_sheet is not None and attempt_sheet.status == QuizAttemptStatus.to_attempt
+        if not attempt_sheet or is_provisioned:
+            # Waiting Room: students not admitted yet are turned away before any upstream call
+            ensure_admitted(room=get_waiting_room(quiz_id, quiz_key), student_id=student_data["id"])
+
+        # New attempts need the quiz as well - fetch it while the quiz key is being validated
+        runtime_quiz_future = None
+        if not attempt_sheet:
+            runtime_quiz_future = upstream_executor.submit(get_runtime_quiz, quiz_id)
 
         # # Check if quiz key is valid
-        quiz_key_validated = validate_quiz_key(
+        quiz_key_validated = validate_quiz_key_coalesced(
             quiz_id=quiz_id, quiz_key=quiz_key
         )
 
-        attempt_sheet = crud_answer_sheet.student_answer_sheet_exists(
-            db, user_id=student_data["id"], quiz_id=quiz_id, quiz_key=quiz_key
-        )
-
         if not attempt_sheet:
-            return create_new_quiz_attempt(db=db, student_id=student_data['id'], quiz_id=quiz_id, quiz_key=quiz_key, quiz_key_validated=quiz_key_validated)
+            ensure_admitted(room=open_waiting_room(quiz_key_validated), student_id=student_data["id"])
+            return create_new_quiz_attempt(db=db, student_id=student_data['id'], quiz_id=quiz_id, quiz_key=quiz_key, quiz_key_validated=quiz_key_validated, runtime_quiz=runtime_quiz_future.result())
+
+        # Pre-provisioned Answer Sheet - lookup and activate
+        if is_provisioned:
+            ensure_admitted(room=open_waiting_room(quiz_key_validated), student_id=student_data["id"])
+            return activate_provisioned_quiz_attempt(db=db, attempt_sheet=attempt_sheet, student_id=student_data["id"], quiz_key_validated=quiz_key_validated)
 
         return handle_in_progress_quiz_attempt(db=db,  attempt_sheet=attempt_sheet, student_id=student_data["id"], quiz_key_validated=quiz_key_validated)
-            
+
+    try:
+        return run_idempotent(
+            db=db,
+            student_id=student_data["id"],
+            idempotency_key=idempotency_key,
+            route="attempt",
+            request_body=attempt_ids,
+            response_model=RuntimeQuizGenerated,
+            fn=generate_quiz,
+        )
+
     except HTTPException as http_err:
         logger.error(f"generate_quiz Error: {http_err}")
         raise http_err
@@ -101,7 +203,13 @@ def get_quiz_attempt_by_id(
             db_session=db, answer_sheet_id=quiz_attempt_id, student_id=student_id
         )
         if not answer_sheet_obj:
-            raise HTTPException(status_code=404, detail="Quiz Attempt Not Found")
+            # Older completed attempts live in the archive
+            archived = crud_answer_sheet_archive.get_archived_answer_sheet(
+                db_session=db, answer_sheet_id=quiz_attempt_id, student_id=student_id
+            )
+            if not archived:
+                raise HTTPException(status_code=404, detail="Quiz Attempt Not Found")
+            return archived_answer_sheet_read(archived)
         return answer_sheet_obj
 
     except HTTPException as http_err:
@@ -114,7 +222,9 @@ def get_quiz_attempt_by_id(
 
 # ~ Update Quiz Attempt - Finish Quiz
 @router.patch("/{answer_sheet_id}/finish")
-def update_quiz_attempt(answer_sheet_id: int, db_session: DBSessionDep, student_data: GetCurrentStudentDep):
+def update_quiz_attempt(
+    answer_sheet_id: int, background_tasks: BackgroundTasks, db_session: DBSessionDep, student_data: GetCurrentStudentDep
+):
     """
     Update Quiz Attempt
     """
@@ -122,6 +232,7 @@ def update_quiz_attempt(answer_sheet_id: int, db_session: DBSessionDep, student_
         quiz_attempt_response = crud_answer_sheet.finish_answer_sheet_attempt(
             db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_data["id"]
         )
+        attempts_finished([(answer_sheet_id, quiz_attempt_response.quiz_id)], "submitted", background_tasks)
         return quiz_attempt_response
 
     except ValueError as e:
@@ -138,31 +249,51 @@ def save_quiz_answer_slot(
     background_tasks: BackgroundTasks,
     quiz_answer_slot: AnswerSlotCreate,
     db_session: DBSessionDep,
-    student_data: GetCurrentStudentDep
+    student_data: GetCurrentStudentDep,
+    idempotency_key: IdempotencyKeyDep = None,
 ):
     """
     Saves a student attempted Quiz Answer Slot
+
+    Retries sent with the same Idempotency-Key header replay the first response.
     """
-    try:
-        student_id=student_data["id"]
+    student_id=student_data["id"]
+
+    def save_answer():
         # 1. ValidateIf Quiz is Active & Quiz Attempt ID is Valid
-        quiz_attempt = crud_answer_sheet.is_answer_sheet_active(
+        quiz_attempt = is_answer_sheet_active(
             db_session=db_session,
             answer_sheet_id=quiz_answer_slot.quiz_answer_sheet_id,
             student_id=student_id,
+            background_tasks=background_tasks,
         )
 
-        print("\n\n\n quiz_attempt", quiz_attempt, "\n\n\n")
         if not quiz_attempt:
             raise ValueError("Quiz Time has Ended or Invalid Quiz Attempt ID")
 
         # 1.5: Validate if Quiz Question being attempted is valid Quiz Question and not attemted before
-        
-        
+        answer_sheet = db_session.get(AnswerSheet, quiz_answer_slot.quiz_answer_sheet_id)
+        snapshot = get_attempt_snapshot(db=db_session, answer_sheet=answer_sheet)
+        validate_answer_against_snapshot(snapshot, quiz_answer_slot)
+
         # 2. Save Quiz Answer Slot
+        if settings.ANSWER_WRITE_BEHIND_ENABLED:
+            # Staged answers are flushed & graded in batches by the answer buffer
+            crud_answer_slot.validate_quiz_question_attempt(
+                db_session=db_session,
+                answersheet_id=quiz_answer_slot.quiz_answer_sheet_id,
+                question_id=quiz_answer_slot.question_id,
+            )
+            staged_answer_slot = crud_answer_slot_staging.stage_answer_slot(db_session, quiz_answer_slot)
+            publish_answer_saved(quiz_answer_slot.quiz_answer_sheet_id)
+            record_answer_saved(answer_sheet.quiz_id, answer_sheet.id, quiz_answer_slot.question_id)
+            return staged_answer_slot
+
         quiz_answer_slot_response = crud_answer_slot.create_quiz_answer_slot(
             db_session, quiz_answer_slot
         )
+        publish_answer_saved(quiz_answer_slot.quiz_answer_sheet_id)
+        record_answer_saved(answer_sheet.quiz_id, answer_sheet.id, quiz_answer_slot.question_id)
         
         
 
@@ -176,33 +307,142 @@ def save_quiz_answer_slot(
         # 3. Return Quiz Answer Slot
         return quiz_answer_slot_response
 
+    try:
+        return run_idempotent(
+            db=db_session,
+            student_id=student_id,
+            idempotency_key=idempotency_key,
+            route="answer_slot/save",
+            request_body=quiz_answer_slot,
+            response_model=AnswerSlotRead,
+            fn=save_answer,
+        )
+
+    except HTTPException as http_err:
+        raise http_err
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# # ---------------------
+# # Attempt Telemetry
+# # ---------------------
+
+@router.post(
+    "/{answer_sheet_id}/events", response_model=AttemptEventBatchAccepted, status_code=status.HTTP_202_ACCEPTED
+)
+def ingest_quiz_attempt_events(
+    answer_sheet_id: int, batch: AttemptEventBatch, db_session: DBSessionDep, student_data: GetCurrentStudentDep
+):
+    """
+    Batch of view, answer_change and blur events of an in progress Quiz Attempt.
+    Events are buffered and written in bulk, accepted is lower than sent when the buffer is full.
+    """
+    try:
+        accepted = ingest_attempt_events(
+            db_session, student_id=student_data["id"], answer_sheet_id=answer_sheet_id, batch=batch
+        )
+        return AttemptEventBatchAccepted(accepted=accepted)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{answer_sheet_id}/time-on-task", response_model=list[QuestionTimeOnTaskRead])
+def get_quiz_attempt_time_on_task(answer_sheet_id: int, db_session: DBSessionDep, student_data: GetCurrentStudentDep):
+    """
+    Time spent, views and answer changes per question of a finished Quiz Attempt
+    """
+    try:
+        answer_sheet = crud_answer_sheet.get_answer_sheet_by_id(
+            db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_data["id"]
+        )
+        if not answer_sheet:
+            archived = crud_answer_sheet_archive.get_archived_answer_sheet(
+                db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_data["id"]
+            )
+            if not archived:
+                raise ValueError("Invalid Quiz Attempt ID")
+            return archived_time_on_task(archived)
+        return crud_attempt_telemetry.get_time_on_task(db_session, answer_sheet_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# # ---------------------
+# # Attempt State Stream (SSE)
+# # ---------------------
+
+@router.get("/{answer_sheet_id}/stream")
+async def stream_quiz_attempt_state(answer_sheet_id: int, student_data: GetCurrentStudentDep):
+    """
+    Server Sent Events for an Answer Sheet: remaining time, answered count and the finish event.
+
+    Events: state (on connect), answered, tick (every ATTEMPT_STREAM_TICK_SECONDS) and finished.
+    """
+    # Subscribe before reading the state so no event is missed in between
+    queue = attempt_events.subscribe(answer_sheet_id)
+    try:
+        state = await asyncio.to_thread(load_attempt_state, answer_sheet_id, student_data["id"])
+    except ValueError as e:
+        attempt_events.unsubscribe(answer_sheet_id, queue)
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        attempt_events.unsubscribe(answer_sheet_id, queue)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        attempt_state_events(state, queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # # ---------------------
 # # QuizFeedback - All Questions + Answers
 # # ---------------------
 
-@router.get("/{answer_sheet_id}/view-all-answers")
+@router.get("/{answer_sheet_id}/view-all-answers", response_model=QuizFeedback)
 def get_quiz_feedback(
-    answer_sheet_id: int, db_session: DBSessionDep, student_data: GetCurrentStudentDep
+    answer_sheet_id: int, db_session: DBSessionDep, student_data: GetCurrentStudentDep, include_questions: bool = True
 ):
     """
     Get Quiz Feedback
+
+    Answer Sheet, attempted answers with selected option ids and (optionally) the
+    questions from the attempt snapshot.
     """
     try:
         student_id = student_data["id"]
         quiz_feedback = crud_answer_sheet.get_quiz_feedback(
-            db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_id
+            db_session=db_session,
+            answer_sheet_id=answer_sheet_id,
+            student_id=student_id,
+            include_snapshot=include_questions,
         )
+        if not quiz_feedback:
+            archived = crud_answer_sheet_archive.get_archived_answer_sheet(
+                db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_id
+            )
+            if not archived:
+                raise ValueError("Quiz Attempt Not Found")
+            return archived_quiz_feedback(archived, include_questions=include_questions)
         
-        overview = quiz_feedback
-        quiz_answers = quiz_feedback.quiz_answers
+        answer_sheet, quiz_answers = quiz_feedback
+        quiz_questions = None
+        if include_questions:
+            quiz_questions = get_attempt_snapshot(db=db_session, answer_sheet=answer_sheet)["quiz_questions"]
         
-        return {"overview": overview, "quiz_answers_attempted": quiz_answers}
+        return QuizFeedback(
+            overview=AnswerSheetRead.model_validate(answer_sheet),
+            quiz_answers_attempted=quiz_answers,
+            quiz_questions=quiz_questions,
+        )
         
 
     except ValueError as e:
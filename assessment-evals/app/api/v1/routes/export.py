@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from app.api.deps import GetCurrentAdminDep
+
+from app.core.config import logger_config
+from app.service.gradebook_export import export_gradebook, parquet_available
+
+from app.models.export_model import ExportFormat
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Gradebook Export
+# ------------------------------
+
+@router.get("/gradebook")
+def export_gradebook_for_quiz_or_course(
+    admin_data: GetCurrentAdminDep,
+    quiz_id: int | None = None,
+    course_id: int | None = None,
+    format: ExportFormat = ExportFormat.csv,
+    include_question_points: bool = False,
+):
+    """
+    Stream every Answer Sheet of a quiz or a course as CSV, NDJSON or Parquet.
+    include_question_points adds the points awarded per question (question_id -> points).
+    """
+    if (quiz_id is None) == (course_id is None):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide either quiz_id or course_id")
+    if format == ExportFormat.parquet and not parquet_available():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Parquet export is not available")
+
+    logger.info(f"Exporting Gradebook for Quiz ID: {quiz_id} Course ID: {course_id} as {format.value}")
+    content, media_type = export_gradebook(
+        export_format=format, quiz_id=quiz_id, course_id=course_id, include_question_points=include_question_points
+    )
+    filename = f"gradebook-{'quiz' if quiz_id is not None else 'course'}-{quiz_id or course_id}.{format.value}"
+    return StreamingResponse(
+        content, media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
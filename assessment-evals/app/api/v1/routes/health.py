@@ -2,8 +2,9 @@ from fastapi import APIRouter, status
 
 from app.api.deps import DBSessionDep
 from app.core.config import logger_config
+from app.core.singleflight import get_flight_stats
 from app.crud.health_crud import get_health, get_stats
-from app.models.health_models import Health, Stats
+from app.models.health_models import Health, Stats, UpstreamFlightStats
 
 
 router = APIRouter()
@@ -28,3 +29,16 @@ def health(db: DBSessionDep):
 )
 def health_stats(db: DBSessionDep):
     return get_stats(db=db)
+
+
+@router.get(
+    "/upstream",
+    response_model=list[UpstreamFlightStats],
+    status_code=status.HTTP_200_OK,
+)
+def health_upstream():
+    """
+    Single flight counters for quiz-engine calls.
+    executed - upstream requests made, coalesced - calls served by another in flight request
+    """
+    return get_flight_stats()
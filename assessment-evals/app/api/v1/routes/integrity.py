@@ -0,0 +1,64 @@
+from fastapi import APIRouter, HTTPException, status
+from app.api.deps import DBSessionDep, GetCurrentAdminDep
+
+from app.core.config import logger_config
+from app.crud.collusion_crud import crud_collusion_scan
+
+from app.models.collusion_model import CollusionScanRead, CollusionPairRead
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Collusion Scans - Admin
+# ------------------------------
+
+@router.post("/quiz/{quiz_id}/collusion-scan", response_model=CollusionScanRead)
+def queue_collusion_scan(quiz_id: int, db: DBSessionDep, admin_data: GetCurrentAdminDep):
+    """
+    Queue a Collusion Scan over the completed attempts of a quiz
+    """
+    try:
+        return crud_collusion_scan.enqueue_collusion_scan(db_session=db, quiz_id=quiz_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/collusion-scans", response_model=list[CollusionScanRead])
+def get_collusion_scans(
+    db: DBSessionDep, admin_data: GetCurrentAdminDep, quiz_id: int | None = None, offset: int = 0, limit: int = 20
+):
+    """
+    Latest Collusion Scans, optionally for one quiz
+    """
+    return crud_collusion_scan.get_collusion_scans(db, quiz_id=quiz_id, offset=offset, limit=limit)
+
+
+@router.get("/collusion-scans/{scan_id}", response_model=CollusionScanRead)
+def get_collusion_scan_status(scan_id: int, db: DBSessionDep, admin_data: GetCurrentAdminDep):
+    """
+    Status & Progress of a Collusion Scan
+    """
+    try:
+        return crud_collusion_scan.get_collusion_scan(db, scan_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/collusion-scans/{scan_id}/pairs", response_model=list[CollusionPairRead])
+def get_collusion_pairs(
+    scan_id: int, db: DBSessionDep, admin_data: GetCurrentAdminDep, offset: int = 0, limit: int = 50
+):
+    """
+    Attempt pairs flagged by a Collusion Scan for review, most similar first
+    """
+    try:
+        crud_collusion_scan.get_collusion_scan(db, scan_id)
+        return crud_collusion_scan.get_collusion_pairs(db, scan_id, offset=offset, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from app.api.deps import GetCurrentAdminDep
+
+from app.core.config import logger_config
+from app.service.proctor import get_quiz_snapshot, subscribe_quiz_dashboard, quiz_dashboard_events
+
+from app.models.proctor_model import ProctorQuizSnapshot
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Live Proctor Dashboard
+# ------------------------------
+
+@router.get("/quiz/{quiz_id}", response_model=ProctorQuizSnapshot)
+def get_proctor_quiz_snapshot(quiz_id: int, admin_data: GetCurrentAdminDep):
+    """
+    Current counters of a quiz: started, in progress, finished and answers per question
+    """
+    try:
+        return get_quiz_snapshot(quiz_id)
+    except Exception as err:
+        logger.error(f"get_proctor_quiz_snapshot Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Counting Quiz Attempts"
+        )
+
+
+@router.get("/quiz/{quiz_id}/stream")
+async def stream_proctor_quiz_counters(quiz_id: int, admin_data: GetCurrentAdminDep):
+    """
+    Server Sent Events with the quiz counters: sent on connect and whenever they change
+    """
+    try:
+        queue = await subscribe_quiz_dashboard(quiz_id)
+    except Exception as err:
+        logger.error(f"stream_proctor_quiz_counters Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Counting Quiz Attempts"
+        )
+
+    return StreamingResponse(
+        quiz_dashboard_events(quiz_id, queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
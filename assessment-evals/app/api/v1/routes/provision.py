@@ -0,0 +1,40 @@
+from fastapi import APIRouter, HTTPException, status
+from app.api.deps import DBSessionDep, GetCurrentAdminDep
+
+from app.core.config import logger_config
+from app.service.quiz_attempt_manager import provision_quiz_attempts
+
+from app.models.answersheet_model import ProvisionAnswerSheetsRequest, ProvisionAnswerSheetsResponse
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Pre-Provision Answer Sheets for a Roster
+# ------------------------------
+
+@router.post("", response_model=ProvisionAnswerSheetsResponse)
+def provision_answer_sheets(
+    roster: ProvisionAnswerSheetsRequest,
+    db: DBSessionDep,
+    admin_data: GetCurrentAdminDep
+):
+    """
+    Bulk create Answer Sheets for a roster ahead of the quiz start time.
+    Students already provisioned for the quiz key are skipped.
+    """
+    logger.info(f"Provisioning Answer Sheets for Quiz ID: {roster.quiz_id}")
+    try:
+        return provision_quiz_attempts(
+            db=db, quiz_id=roster.quiz_id, quiz_key=roster.quiz_key, student_ids=roster.student_ids
+        )
+
+    except HTTPException as http_err:
+        logger.error(f"provision_answer_sheets Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"provision_answer_sheets Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Provisioning Answer Sheets"
+        )
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, HTTPException, status
+from app.api.deps import DBSessionDep, GetCurrentAdminDep, ServiceTokenDep
+
+from app.core.config import logger_config
+from app.crud.regrade_crud import crud_regrade_job
+from app.service.regrade import answer_key_changed
+
+from app.models.regrade_model import RegradeJobRead, RegradeRequest
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Answer Key Changed - Called by quiz-engine
+# ------------------------------
+
+@router.post("/answer-key-changed", response_model=RegradeJobRead)
+def queue_regrade_for_answer_key_change(regrade: RegradeRequest, db: DBSessionDep, service: ServiceTokenDep):
+    """
+    Queue a Regrade Job when a question's answer key changes in quiz-engine
+    """
+    logger.info(f"Answer Key Changed for Question ID: {regrade.question_id}")
+    try:
+        return answer_key_changed(db_session=db, question_id=regrade.question_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ------------------------------
+# Regrade Jobs - Admin
+# ------------------------------
+
+@router.post("", response_model=RegradeJobRead)
+def queue_regrade(regrade: RegradeRequest, db: DBSessionDep, admin_data: GetCurrentAdminDep):
+    """
+    Queue a Regrade Job for a question
+    """
+    try:
+        return answer_key_changed(db_session=db, question_id=regrade.question_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("", response_model=list[RegradeJobRead])
+def get_regrade_jobs(db: DBSessionDep, admin_data: GetCurrentAdminDep, offset: int = 0, limit: int = 20):
+    """
+    Latest Regrade Jobs
+    """
+    return crud_regrade_job.get_regrade_jobs(db, offset=offset, limit=limit)
+
+
+@router.get("/{regrade_job_id}", response_model=RegradeJobRead)
+def get_regrade_job_status(regrade_job_id: int, db: DBSessionDep, admin_data: GetCurrentAdminDep):
+    """
+    Status & Progress of a Regrade Job
+    """
+    try:
+        return crud_regrade_job.get_regrade_job(db, regrade_job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, HTTPException, status
+from app.api.deps import GetCurrentStudentDep
+
+from app.core.config import logger_config
+from app.service.waiting_room import join_waiting_room, get_waiting_room_status
+
+from app.models.answersheet_model import AttemptQuizRequest
+from app.models.waiting_room_model import WaitingRoomStatus, WaitingRoomAdmitted
+
+logger = logger_config(__name__)
+
+router = APIRouter()
+
+# ------------------------------
+# Waiting Room - Join Queue
+# ------------------------------
+
+@router.post("/ticket", response_model=WaitingRoomStatus | WaitingRoomAdmitted)
+def get_waiting_room_ticket(
+    attempt_ids: AttemptQuizRequest,
+    student_data: GetCurrentStudentDep
+):
+    """
+    Join the Waiting Room for a Quiz.
+    Quizzes without a Waiting Room return admitted straight away.
+    """
+    try:
+        room_status = join_waiting_room(
+            student_id=student_data["id"], quiz_id=attempt_ids.quiz_id, quiz_key=attempt_ids.quiz_key
+        )
+        if room_status is None:
+            return WaitingRoomAdmitted(quiz_id=attempt_ids.quiz_id)
+        return room_status
+
+    except HTTPException as http_err:
+        logger.error(f"get_waiting_room_ticket Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"get_waiting_room_ticket Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected Error Occured When Joining Waiting Room"
+        )
+
+
+# ------------------------------
+# Waiting Room - Poll Position
+# ------------------------------
+
+@router.get("/status", response_model=WaitingRoomStatus)
+def get_waiting_room_position(
+    quiz_id: int, quiz_key: str, student_data: GetCurrentStudentDep
+):
+    """
+    Queue Position & Estimated Wait. Served from memory, poll again after poll_after_seconds.
+    """
+    try:
+        return get_waiting_room_status(student_id=student_data["id"], quiz_id=quiz_id, quiz_key=quiz_key)
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import Any, Hashable
+
+# ----------------------------
+# ----- In Process TTL Cache
+# ----------------------------
+# Small thread safe cache for upstream data that is prewarmed ahead of a quiz.
+# Entries expire after ttl_seconds; the oldest entries are evicted once max_size is reached.
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_size: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_size:
+                self._evict(time.monotonic())
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def _evict(self, now: float):
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
+        # dicts keep insertion order so the first keys are the oldest
+        while len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
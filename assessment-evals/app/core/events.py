@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from typing import Any, Hashable
+
+from app.core.config import logger_config
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- In Process Event Bus
+# ----------------------------
+# Async subscribers (e.g. SSE streams) get an asyncio.Queue per topic.
+# publish is thread safe: sync routes and background jobs publish from worker threads and the
+# event is handed to each subscriber's event loop. Topics without subscribers cost a dict lookup.
+
+
+class EventBus:
+    def __init__(self, name: str, max_queued_events: int = 100):
+        self.name = name
+        self.max_queued_events = max_queued_events
+        self._lock = threading.Lock()
+        self._subscribers: dict[Hashable, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def subscribe(self, topic: Hashable) -> asyncio.Queue:
+        """
+        Queue receiving the events of a topic. Call from the subscriber's event loop.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queued_events)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, topic: Hashable, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(topic, set())
+            subscribers.difference_update({subscriber for subscriber in subscribers if subscriber[1] is queue})
+            if not subscribers:
+                self._subscribers.pop(topic, None)
+
+    def has_subscribers(self, topic: Hashable) -> bool:
+        return topic in self._subscribers
+
+    def publish(self, topic: Hashable, event: Any) -> int:
+        """
+        Send an event to all subscribers of a topic. Returns the number of subscribers.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_put_latest, queue, event)
+            except RuntimeError:
+                # Subscriber's loop is closed (shutdown) - nothing to deliver to
+                pass
+        return len(subscribers)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+def _put_latest(queue: asyncio.Queue, event: Any):
+    # A slow subscriber drops its oldest event instead of blocking the publisher
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
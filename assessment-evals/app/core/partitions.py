@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlmodel import Session, text
+
+# ----------------------------
+# ----- Range Partitions
+# ----------------------------
+# Partitioned tables get one partition per calendar year (<table>_<year>) or, for high volume
+# tables, per month (<table>_<year>_<month>) of the partition key.
+# Partitions are created on demand before rows are written to them.
+
+
+def yearly_partition_name(table_name: str, year: int) -> str:
+    return f"{table_name}_{year}"
+
+
+def ensure_yearly_partitions(db_session: Session, table_name: str, values: list[datetime]):
+    """
+    Create the yearly partitions of table_name that hold the given partition key values
+    """
+    for year in sorted({value.year for value in values}):
+        db_session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {yearly_partition_name(table_name, year)} "
+                f"PARTITION OF {table_name} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        )
+
+
+def monthly_partition_name(table_name: str, year: int, month: int) -> str:
+    return f"{table_name}_{year}_{month:02d}"
+
+
+def ensure_monthly_partitions(db_session: Session, table_name: str, values: list[datetime]):
+    """
+    Create the monthly partitions of table_name that hold the given partition key values
+    """
+    for year, month in sorted({(value.year, value.month) for value in values}):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        db_session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {monthly_partition_name(table_name, year, month)} "
+                f"PARTITION OF {table_name} "
+                f"FOR VALUES FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')"
+            )
+        )
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException
 from requests import get, post
 from app import settings
 from app.core.utils import load_error_json
+from app.core.singleflight import get_flight_group
 
 def get_course(course_id: int, token: str):
     course_request = get(f"{settings.EDUCATIONAL_PROGRAM_URL}/api/v1/course/{course_id}",
@@ -32,6 +34,55 @@ def validate_quiz_key(quiz_id: int, quiz_key: str):
         return quiz_key_request.json()
     raise HTTPException(status_code=quiz_key_request.status_code, detail=load_error_json(quiz_key_request))
 
+# ----------------------------
+# ----- Coalesced Quiz Engine Wrappers
+# ----------------------------
+# At exam start many students call the same endpoints for the same quiz at once.
+# Concurrent identical calls share a single upstream request - see app.core.singleflight
+
+upstream_executor = ThreadPoolExecutor(max_workers=settings.UPSTREAM_MAX_WORKERS, thread_name_prefix="upstream")
+
+def get_question_coalesced(question_id: int):
+    return get_flight_group("get_question").do(question_id, get_question, question_id)
+
+# The runtime quiz does not depend on the quiz key so all keys of a quiz share the call
+def get_runtime_quiz_questions_coalesced(quiz_id: int):
+    return get_flight_group("get_runtime_quiz_questions").do(quiz_id, get_runtime_quiz_questions, quiz_id)
+
+def validate_quiz_key_coalesced(quiz_id: int, quiz_key: str):
+    return get_flight_group("validate_quiz_key").do((quiz_id, quiz_key), validate_quiz_key, quiz_id, quiz_key)
+
+# Get Quiz Setting by Quiz Key without the active time check - Wrapper
+def get_quiz_setting(quiz_id: int, quiz_key: str):
+    quiz_setting_request = get(f"{settings.QUIZ_ENGINE_API_URL}/api/v1/wrapper/quiz-setting?quiz_id={quiz_id}&quiz_key={quiz_key}")
+    if quiz_setting_request.status_code == 200:
+        return quiz_setting_request.json()
+    raise HTTPException(status_code=quiz_setting_request.status_code, detail=load_error_json(quiz_setting_request))
+
+# Get Quiz Settings starting within the next minutes - Wrapper
+def get_upcoming_quiz_settings(within_minutes: int):
+    quiz_settings_request = get(f"{settings.QUIZ_ENGINE_API_URL}/api/v1/wrapper/upcoming-quiz-settings?within_minutes={within_minutes}")
+    if quiz_settings_request.status_code == 200:
+        return quiz_settings_request.json()
+    raise HTTPException(status_code=quiz_settings_request.status_code, detail=load_error_json(quiz_settings_request))
+
+# Get Quiz Questions with correct options - Wrapper
+def get_quiz_answer_key(quiz_id: int):
+    answer_key_request = get(f"{settings.QUIZ_ENGINE_API_URL}/api/v1/wrapper/answer-key?quiz_id={quiz_id}")
+    if answer_key_request.status_code == 200:
+        return answer_key_request.json()
+    raise HTTPException(status_code=answer_key_request.status_code, detail=load_error_json(answer_key_request))
+
+# Get the Quiz IDs of a Course - Wrapper
+def get_course_quiz_ids(course_id: int):
+    course_quiz_ids_request = get(f"{settings.QUIZ_ENGINE_API_URL}/api/v1/wrapper/course-quiz-ids?course_id={course_id}")
+    if course_quiz_ids_request.status_code == 200:
+        return course_quiz_ids_request.json()
+    raise HTTPException(status_code=course_quiz_ids_request.status_code, detail=load_error_json(course_quiz_ids_request))
+
+def get_quiz_setting_coalesced(quiz_id: int, quiz_key: str):
+    return get_flight_group("get_quiz_setting").do((quiz_id, quiz_key), get_quiz_setting, quiz_id, quiz_key)
+
 def get_current_user(token: str):
     url = f"{settings.AUTH_SERVER_URL}/api/v1/users/me"
     headers = {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,19 @@
+import asyncio
+from typing import Callable
+
+from app.core.config import logger_config
+
+logger = logger_config(__name__)
+
+
+async def run_periodically(job: Callable[[], object], interval_seconds: float):
+    """
+    Run a blocking job in a worker thread every interval_seconds until cancelled.
+    Errors are logged and the job runs again on the next tick.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(job)
+        except Exception as err:
+            logger.error(f"{job.__name__} Error: {err}")
+        await asyncio.sleep(interval_seconds)
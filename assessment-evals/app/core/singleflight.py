@@ -0,0 +1,77 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+# ----------------------------
+# ----- Single Flight Request Coalescing
+# ----------------------------
+# Concurrent calls with the same key share one in flight call.
+# The first caller (leader) runs the function, callers arriving while it runs wait
+# for and receive the same result or exception. Nothing is cached once the call returns.
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) once for all concurrent callers using the same key
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "calls": self.calls,
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+_flight_groups: dict[str, SingleFlight] = {}
+_flight_groups_lock = threading.Lock()
+
+
+def get_flight_group(name: str) -> SingleFlight:
+    with _flight_groups_lock:
+        if name not in _flight_groups:
+            _flight_groups[name] = SingleFlight(name)
+        return _flight_groups[name]
+
+
+def get_flight_stats() -> list[dict]:
+    with _flight_groups_lock:
+        groups = list(_flight_groups.values())
+    return [group.stats() for group in groups]
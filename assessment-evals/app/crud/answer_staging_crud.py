@@ -0,0 +1,134 @@
+from sqlmodel import select, delete, and_, Session
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.answerslot_model import AnswerSlot, AnswerSlotCreate
+from app.models.answer_staging_model import AnswerSlotStaging
+
+# Columns written to answerslot by COPY, in COPY order
+ANSWER_SLOT_COPY_COLUMNS = (
+    "id",
+    "quiz_answer_sheet_id",
+    "question_id",
+    "question_type",
+    "points_awarded",
+    "selected_option_ids",
+    "created_at",
+    "updated_at",
+)
+
+
+class CRUDAnswerSlotStaging:
+    def stage_answer_slot(
+        self, db_session: Session, quiz_answer_slot: AnswerSlotCreate
+    ) -> AnswerSlot:
+        """
+        Save an answer to the staging table with one INSERT.
+        Returns the (not yet flushed) AnswerSlot with its final id.
+        """
+        try:
+            staged = db_session.execute(
+                insert(AnswerSlotStaging)
+                .values(
+                    quiz_answer_sheet_id=quiz_answer_slot.quiz_answer_sheet_id,
+                    question_id=quiz_answer_slot.question_id,
+                    question_type=quiz_answer_slot.question_type,
+                    selected_option_ids=sorted(set(quiz_answer_slot.selected_options_ids)),
+                )
+                .on_conflict_do_nothing(constraint="uq_answerslotstaging_sheet_question")
+                .returning(AnswerSlotStaging.id, AnswerSlotStaging.selected_option_ids, AnswerSlotStaging.created_at)
+            ).first()
+            db_session.commit()
+
+            if staged is None:
+                raise ValueError("Question Already Attempted")
+
+            return AnswerSlot(
+                id=staged.id,
+                quiz_answer_sheet_id=quiz_answer_slot.quiz_answer_sheet_id,
+                question_id=quiz_answer_slot.question_id,
+                question_type=quiz_answer_slot.question_type,
+                selected_option_ids=staged.selected_option_ids,
+                created_at=staged.created_at,
+            )
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def is_question_staged(self, db_session: Session, answer_sheet_id: int, question_id: int) -> bool:
+        return db_session.exec(
+            select(AnswerSlotStaging.id).where(
+                and_(
+                    AnswerSlotStaging.quiz_answer_sheet_id == answer_sheet_id,
+                    AnswerSlotStaging.question_id == question_id,
+                )
+            )
+        ).first() is not None
+
+    def get_staged_question_ids(self, db_session: Session, answer_sheet_id: int) -> set[int]:
+        return set(
+            db_session.exec(
+                select(AnswerSlotStaging.question_id).where(
+                    AnswerSlotStaging.quiz_answer_sheet_id == answer_sheet_id
+                )
+            ).all()
+        )
+
+    def flush_staged_answers(
+        self,
+        db_session: Session,
+        *,
+        answer_sheet_ids: list[int] | None = None,
+        limit: int | None = None,
+        skip_locked: bool = True,
+    ) -> list[tuple[int, int]]:
+        """
+        Move staged answers into answerslot: DELETE .. RETURNING from staging and COPY into answerslot.
+        Does not commit - a rollback (or crash) leaves the answers staged for the next flush.
+        The background flusher skips rows another flush holds; finishing sheets pass skip_locked=False
+        to wait for that flush instead, so every answer is in answerslot before it is graded.
+        Returns (answer slot id, answer sheet id) of the flushed answers.
+        """
+        claimed = select(AnswerSlotStaging.id).order_by(AnswerSlotStaging.id)  # type:ignore
+        if answer_sheet_ids is not None:
+            claimed = claimed.where(AnswerSlotStaging.quiz_answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+        if limit is not None:
+            claimed = claimed.limit(limit)
+        claimed = claimed.with_for_update(skip_locked=skip_locked)
+
+        staged_answers = db_session.execute(
+            delete(AnswerSlotStaging)
+            .where(AnswerSlotStaging.id.in_(claimed.scalar_subquery()))  # type:ignore
+            .returning(
+                AnswerSlotStaging.id,
+                AnswerSlotStaging.quiz_answer_sheet_id,
+                AnswerSlotStaging.question_id,
+                AnswerSlotStaging.question_type,
+                AnswerSlotStaging.selected_option_ids,
+                AnswerSlotStaging.created_at,
+            )
+        ).all()
+        if not staged_answers:
+            return []
+
+        with db_session.connection().connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {AnswerSlot.__tablename__} ({', '.join(ANSWER_SLOT_COPY_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for staged in staged_answers:
+                    copy.write_row(
+                        (
+                            staged.id,
+                            staged.quiz_answer_sheet_id,
+                            staged.question_id,
+                            staged.question_type.name,
+                            0,
+                            staged.selected_option_ids,
+                            staged.created_at,
+                            staged.created_at,
+                        )
+                    )
+
+        return [(staged.id, staged.quiz_answer_sheet_id) for staged in staged_answers]
+
+
+crud_answer_slot_staging = CRUDAnswerSlotStaging()
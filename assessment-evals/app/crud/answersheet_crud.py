@@ -1,15 +1,24 @@
 from datetime import datetime
-from sqlmodel import select, func, and_, Session
-from sqlalchemy.orm import selectinload
+from sqlmodel import select, update, func, and_, Session
+from sqlalchemy import literal_column, null, union_all, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import selectinload, defer
 
 # from app.crud.question_crud import question_crud
 from app.models.base import QuizAttemptStatus
 from app.models.answersheet_model import (
     AnswerSheet,
     AnswerSheetCreate,
+    AnswerSheetProvision,
+    AnswerSheetRead,
 )
 from app.models.answerslot_model import  AnswerSlot
+from app.models.answer_staging_model import AnswerSlotStaging
+from app.models.archive_model import AnswerSheetArchive
 from app.crud.answerslot_crud import crud_answer_slot
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.crud.archive_crud import crud_answer_sheet_archive
+from app.service.archive import archived_answer_sheet_read
 
 # TODO: Test and Remove it
 from sqlalchemy.engine.result import ScalarResult
@@ -29,6 +38,7 @@ class CRUDQuizAnswerSheetEngine:
             #     )
 
             db_quiz_attempt = AnswerSheet.model_validate(answer_sheet_obj_in)
+            db_quiz_attempt.deadline = db_quiz_attempt.time_start + db_quiz_attempt.time_limit
             print("\n---db_quiz_attempt---\n", db_quiz_attempt)
             db_session.add(db_quiz_attempt)
             db_session.commit()
@@ -38,6 +48,68 @@ class CRUDQuizAnswerSheetEngine:
             db_session.rollback()
             raise e
 
+    def bulk_create_answer_sheets(
+        self, *, db_session: Session, answer_sheets_in: list[AnswerSheetProvision]
+    ) -> int:
+        """
+        Insert many Answer Sheets in one batch. Used to pre-provision a quiz roster.
+        """
+        try:
+            db_session.add_all([AnswerSheet.model_validate(answer_sheet) for answer_sheet in answer_sheets_in])
+            db_session.commit()
+            return len(answer_sheets_in)
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def get_provisioned_student_ids(
+        self, db_session: Session, quiz_id: int, quiz_key: str, student_ids: list[int]
+    ) -> set[int]:
+        """
+        Students from student_ids that already have an Answer Sheet for the quiz key
+        """
+        provisioned = db_session.exec(
+            select(AnswerSheet.student_id).where(
+                and_(
+                    AnswerSheet.quiz_id == quiz_id,
+                    AnswerSheet.quiz_key == quiz_key,
+                    AnswerSheet.student_id.in_(student_ids),  # type:ignore
+                )
+            )
+        ).all()
+        return set(provisioned)
+
+    def activate_answer_sheet(
+        self, *, db_session: Session, answer_sheet: AnswerSheet, time_limit
+    ) -> bool:
+        """
+        Start a pre-provisioned Answer Sheet.
+        Returns False when the sheet was already activated by another request.
+        """
+        try:
+            time_start = datetime.utcnow()
+            result = db_session.exec(
+                update(AnswerSheet)
+                .where(
+                    and_(
+                        AnswerSheet.id == answer_sheet.id,
+                        AnswerSheet.status == QuizAttemptStatus.to_attempt,
+                    )
+                )
+                .values(
+                    status=QuizAttemptStatus.in_progress,
+                    time_start=time_start,
+                    time_limit=time_limit,
+                    deadline=time_start + time_limit,
+                )
+            )
+            db_session.commit()
+            db_session.refresh(answer_sheet)
+            return result.rowcount == 1
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
     def get_answer_sheet_by_id(
         self, db_session: Session, answer_sheet_id: int, student_id: int
     ):
@@ -63,7 +135,16 @@ class CRUDQuizAnswerSheetEngine:
         """
         Check if the  Answer Sheet is still active
             If yes, then the quiz is still active and return True
-            If not add time_finish to quiz_id and return False
+            If not finalize it (time_finish at the deadline, graded and scored) and return False
+        """
+        active, _ = self.check_answer_sheet_active(db_session, answer_sheet_id, student_id)
+        return active
+
+    def check_answer_sheet_active(
+        self, db_session: Session, answer_sheet_id: int, student_id: int
+    ) -> tuple[bool, bool]:
+        """
+        (active, finalized) of an Answer Sheet, finalized is True when this call completed the overdue sheet
         """
 
         answer_sheet_obj = self.get_answer_sheet_by_id(
@@ -76,7 +157,7 @@ class CRUDQuizAnswerSheetEngine:
 
         if answer_sheet_obj.status == QuizAttemptStatus.completed:
             print("\n-----Quiz is already completed----\n")
-            return False
+            return False, False
 
         if answer_sheet_obj.status == QuizAttemptStatus.in_progress:
             print("\n-----Quiz is in progress----\n")
@@ -88,13 +169,16 @@ class CRUDQuizAnswerSheetEngine:
             # Check if current UTC time is past the end time
             if datetime.utcnow() < end_time:
                 print("\n-----Quiz is still active----\n")
-                return True
+                return True, False
             else:
                 print("\n-----Quiz is not active----\n")
-                answer_sheet_obj.time_finish = datetime.utcnow()
-                answer_sheet_obj.status = QuizAttemptStatus.completed
-                db_session.commit()
-                return False
+                # Same path as the deadline sweeper so the overdue sheet is graded and scored,
+                # 0 when the sweeper finalized it first
+                finalized = self.finalize_answer_sheets(db_session, [answer_sheet_obj.id])
+                db_session.refresh(answer_sheet_obj)
+                return False, finalized > 0
+
+        return False, False
 
     def finish_answer_sheet_attempt(
         self, db_session: Session, answer_sheet_id: int, student_id: int
@@ -102,10 +186,9 @@ class CRUDQuizAnswerSheetEngine:
         """
         Lock the Answer Sheet
         """
-        # 1. Load the Answer Sheet with AnswerSlot
+        # 1. Load the Answer Sheet
         answer_sheet_obj_exec = db_session.exec(
             select(AnswerSheet)
-            .options(selectinload(AnswerSheet.quiz_answers))  # type:ignore
             .where(and_(AnswerSheet.id == answer_sheet_id, AnswerSheet.student_id == student_id))
         )  # type:ignore
         answer_sheet_obj = answer_sheet_obj_exec.one_or_none()
@@ -113,21 +196,19 @@ class CRUDQuizAnswerSheetEngine:
         if not answer_sheet_obj:
             raise ValueError("Invalid Quiz Attempt ID")
 
-        print("\n-----answer_sheet_obj----\n", answer_sheet_obj)
-
         # 2. Add Finish Time to Quiz Attempt if not already added
         if not answer_sheet_obj.time_finish:
             answer_sheet_obj.time_finish = datetime.utcnow()
             answer_sheet_obj.status = QuizAttemptStatus.completed
             db_session.commit()
 
-        # 3. Grade & Count
-        # 3.1 Check if any Quiz Answer Slot is not graded
-        for answer_slot in answer_sheet_obj.quiz_answers:
-            if not answer_slot.points_awarded:
-                crud_answer_slot.grade_quiz_answer_slot(
-                    db_session=db_session, quiz_answer_slot=answer_slot
-                )
+        # 3. Flush answers still staged in write behind mode, then grade all ungraded Quiz Answer Slots as one batch
+        crud_answer_slot_staging.flush_staged_answers(
+            db_session, answer_sheet_ids=[answer_sheet_obj.id], skip_locked=False
+        )
+        crud_answer_slot.grade_answer_slots_for_sheets(
+            db_session=db_session, answer_sheet_ids=[answer_sheet_obj.id]
+        )
 
         # 4. Calculate the total score
         # A Query that returns the sum of points_awarded for all quiz_answer_slots
@@ -141,8 +222,6 @@ class CRUDQuizAnswerSheetEngine:
         if attempt_score is None:
             attempt_score = 0
 
-        print("\n-----attempt_score----\n", attempt_score)
-
         # 5. Update the Quiz Attempt with attempt_score
         answer_sheet_obj.attempt_score = attempt_score
 
@@ -151,6 +230,66 @@ class CRUDQuizAnswerSheetEngine:
 
         return answer_sheet_obj
 
+    def claim_expired_answer_sheets(
+        self, db_session: Session, now: datetime, limit: int
+    ) -> list[tuple[int, int]]:
+        """
+        Lock a batch of in progress Answer Sheets past their deadline, returns (id, quiz_id) pairs.
+        SKIP LOCKED lets several sweepers work on different batches at the same time.
+        """
+        expired_sheets = db_session.exec(
+            select(AnswerSheet.id, AnswerSheet.quiz_id)
+            .where(
+                and_(
+                    AnswerSheet.status == QuizAttemptStatus.in_progress,
+                    AnswerSheet.deadline <= now,
+                )
+            )
+            .order_by(AnswerSheet.deadline)  # type:ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+        return [(answer_sheet_id, quiz_id) for answer_sheet_id, quiz_id in expired_sheets]
+
+    def finalize_answer_sheets(
+        self, db_session: Session, answer_sheet_ids: list[int]
+    ) -> int:
+        """
+        Grade and complete many Answer Sheets with set based updates.
+        time_finish is the deadline and attempt_score the sum of the graded Answer Slots.
+        """
+        try:
+            crud_answer_slot_staging.flush_staged_answers(
+                db_session, answer_sheet_ids=answer_sheet_ids, skip_locked=False
+            )
+            crud_answer_slot.grade_answer_slots_for_sheets(
+                db_session=db_session, answer_sheet_ids=answer_sheet_ids
+            )
+            attempt_score = (
+                select(func.coalesce(func.sum(AnswerSlot.points_awarded), 0))
+                .where(AnswerSlot.quiz_answer_sheet_id == AnswerSheet.id)
+                .scalar_subquery()
+            )
+            result = db_session.exec(
+                update(AnswerSheet)
+                .where(
+                    and_(
+                        AnswerSheet.id.in_(answer_sheet_ids),  # type:ignore
+                        AnswerSheet.status == QuizAttemptStatus.in_progress,
+                    )
+                )
+                .values(
+                    status=QuizAttemptStatus.completed,
+                    time_finish=AnswerSheet.deadline,
+                    attempt_score=attempt_score,
+                )
+            )
+            db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
     def get_answer_sheet_by_user_id_and_quiz_id(
         self, db_session: Session, user_id: str, quiz_id: int
     ):
@@ -180,24 +319,216 @@ class CRUDQuizAnswerSheetEngine:
             )
         )
         answer_sheet_obj = answer_sheet_query.one_or_none()
+        if answer_sheet_obj is not None:
+            return answer_sheet_obj
 
-        return answer_sheet_obj
+        # An archived attempt still counts - its completed AnswerSheetRead keeps it from being started again
+        archived = crud_answer_sheet_archive.get_archived_answer_sheet_by_quiz_key(
+            db_session, student_id=user_id, quiz_id=quiz_id, quiz_key=quiz_key
+        )
+        return archived_answer_sheet_read(archived) if archived is not None else None
     
+    def get_answered_question_ids(self, db_session: Session, answer_sheet_id: int) -> set[int]:
+        """
+        Get the question ids already answered in an Answer Sheet, including answers not flushed yet
+        """
+        answered_ids = db_session.exec(
+            select(AnswerSlot.question_id).where(AnswerSlot.quiz_answer_sheet_id == answer_sheet_id)
+        ).all()
+        return set(answered_ids) | crud_answer_slot_staging.get_staged_question_ids(db_session, answer_sheet_id)
+
+    def stream_gradebook_rows(
+        self,
+        db_session: Session,
+        *,
+        quiz_ids: list[int],
+        include_question_points: bool,
+        batch_size: int,
+    ):
+        """
+        Gradebook rows of the live and archived Answer Sheets of quizzes, in id order,
+        fetched batch_size rows at a time with a server side cursor.
+        Archived rows carry their payload instead (the other columns are NULL).
+        """
+        columns = [
+            AnswerSheet.id.label("answer_sheet_id"),  # type:ignore
+            AnswerSheet.student_id,
+            AnswerSheet.quiz_id,
+            AnswerSheet.course_id,
+            AnswerSheet.quiz_title,
+            AnswerSheet.quiz_key,
+            AnswerSheet.status,
+            AnswerSheet.time_start,
+            AnswerSheet.time_finish,
+            AnswerSheet.attempt_score,
+            AnswerSheet.total_points,
+        ]
+        if include_question_points:
+            columns.append(
+                select(func.json_object_agg(AnswerSlot.question_id, AnswerSlot.points_awarded))
+                .where(AnswerSlot.quiz_answer_sheet_id == AnswerSheet.id)
+                .correlate(AnswerSheet)
+                .scalar_subquery()
+                .label("question_points")
+            )
+
+        gradebook = union_all(
+            select(*columns, null().label("payload")).where(AnswerSheet.quiz_id.in_(quiz_ids)),  # type:ignore
+            select(
+                AnswerSheetArchive.id, *[null() for _ in columns[1:]], AnswerSheetArchive.payload
+            ).where(AnswerSheetArchive.quiz_id.in_(quiz_ids)),  # type:ignore
+        ).subquery()
+        statement = select(*gradebook.c).order_by(gradebook.c.answer_sheet_id)
+        return db_session.execute(statement.execution_options(yield_per=batch_size)).mappings()
+
+    def get_quiz_live_state(
+        self, db_session: Session, quiz_id: int
+    ) -> tuple[list[tuple[int, QuizAttemptStatus]], list[tuple[int, int]]]:
+        """
+        (id, status) of the started Answer Sheets and (answer sheet id, question id) of the answers for a quiz
+        """
+        started_sheets = db_session.exec(
+            select(AnswerSheet.id, AnswerSheet.status).where(
+                and_(
+                    AnswerSheet.quiz_id == quiz_id,
+                    AnswerSheet.status != QuizAttemptStatus.to_attempt,
+                )
+            )
+        ).all()
+
+        answered = db_session.exec(
+            union_all(
+                select(AnswerSlot.quiz_answer_sheet_id, AnswerSlot.question_id)
+                .join(AnswerSheet, AnswerSheet.id == AnswerSlot.quiz_answer_sheet_id)  # type:ignore
+                .where(AnswerSheet.quiz_id == quiz_id),
+                select(AnswerSlotStaging.quiz_answer_sheet_id, AnswerSlotStaging.question_id)
+                .join(AnswerSheet, AnswerSheet.id == AnswerSlotStaging.quiz_answer_sheet_id)  # type:ignore
+                .where(AnswerSheet.quiz_id == quiz_id),
+            )
+        ).all()
+
+        return (
+            [(answer_sheet_id, status) for answer_sheet_id, status in started_sheets],
+            [(answer_sheet_id, question_id) for answer_sheet_id, question_id in answered],
+        )
+
     def get_quiz_feedback(
-        self, db_session: Session, answer_sheet_id: int, student_id: int
+        self, db_session: Session, answer_sheet_id: int, student_id: int, include_snapshot: bool = True
     ):
         """
-        Get Quiz Feedback
+        Get Quiz Feedback - the Answer Sheet and its Answer Slots in one query.
+        Returns (AnswerSheet, quiz_answers) or None
         """
-        # 1. Load the Answer Sheet with AnswerSlot
-        answer_sheet_obj_exec = db_session.exec(
-            select(AnswerSheet)
-            .where(and_(AnswerSheet.id == answer_sheet_id, AnswerSheet.student_id == student_id))
-        ).one_or_none()
-        
-    
-        return answer_sheet_obj_exec
+        # Flushed and still staged (write behind) answers of the sheet
+        answer_slots = union_all(
+            select(
+                AnswerSlot.id,
+                AnswerSlot.quiz_answer_sheet_id,
+                AnswerSlot.question_id,
+                AnswerSlot.question_type,
+                AnswerSlot.points_awarded,
+                AnswerSlot.selected_option_ids,
+            ).where(AnswerSlot.quiz_answer_sheet_id == answer_sheet_id),
+            select(
+                AnswerSlotStaging.id,
+                AnswerSlotStaging.quiz_answer_sheet_id,
+                AnswerSlotStaging.question_id,
+                AnswerSlotStaging.question_type,
+                literal_column("0::float"),
+                AnswerSlotStaging.selected_option_ids,
+            ).where(AnswerSlotStaging.quiz_answer_sheet_id == answer_sheet_id),
+        ).subquery("answer_slots")
+
+        quiz_answers = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            # keys are inlined, json_build_object cannot infer the type of bound parameters
+                            func.json_build_object(
+                                literal_column("'id'"), answer_slots.c.id,
+                                literal_column("'quiz_answer_sheet_id'"), answer_slots.c.quiz_answer_sheet_id,
+                                literal_column("'question_id'"), answer_slots.c.question_id,
+                                literal_column("'question_type'"), answer_slots.c.question_type,
+                                literal_column("'points_awarded'"), answer_slots.c.points_awarded,
+                                literal_column("'selected_option_ids'"), answer_slots.c.selected_option_ids,
+                            ),
+                            answer_slots.c.id,
+                        )
+                    ),
+                    literal_column("'[]'::json"),
+                )
+            )
+            .scalar_subquery()
+        )
+
+        statement = select(AnswerSheet, quiz_answers.label("quiz_answers")).where(
+            and_(AnswerSheet.id == answer_sheet_id, AnswerSheet.student_id == student_id)
+        )
+        if not include_snapshot:
+            statement = statement.options(defer(AnswerSheet.quiz_snapshot))
+
+        return db_session.exec(statement).one_or_none()
         
+    def get_attempt_history(
+        self, db_session: Session, student_id: int, limit: int, before: tuple[datetime, int] | None = None
+    ):
+        """
+        Started attempts of a student, live and archived, newest first, keyset paginated on (time_start, id).
+        Live rows select only AnswerSheetRead columns so the covering index answers them, archived rows
+        carry their payload instead (the other columns are NULL) and are read with the archive history index.
+        """
+        live = select(
+            *[getattr(AnswerSheet, field) for field in AnswerSheetRead.model_fields], null().label("payload")
+        ).where(and_(AnswerSheet.student_id == student_id, AnswerSheet.time_start.is_not(None)))  # type:ignore
+        archived = select(
+            *[
+                getattr(AnswerSheetArchive, field) if field in ("id", "time_start") else null()
+                for field in AnswerSheetRead.model_fields
+            ],
+            AnswerSheetArchive.payload,
+        ).where(AnswerSheetArchive.student_id == student_id)
+        if before is not None:
+            live = live.where(tuple_(AnswerSheet.time_start, AnswerSheet.id) < tuple_(*before))
+            archived = archived.where(tuple_(AnswerSheetArchive.time_start, AnswerSheetArchive.id) < tuple_(*before))
+
+        history = union_all(live, archived).subquery()
+        return db_session.exec(
+            select(*history.c).order_by(history.c.time_start.desc(), history.c.id.desc()).limit(limit)
+        ).mappings().all()
+
+    def get_attempt_summary(self, db_session: Session, student_id: int):
+        """
+        Per course aggregates and the overall row (is_overall) of the live and archived attempts in one ROLLUP query
+        """
+        attempts = union_all(
+            select(AnswerSheet.course_id, AnswerSheet.status, AnswerSheet.attempt_score, AnswerSheet.total_points).where(
+                and_(AnswerSheet.student_id == student_id, AnswerSheet.status != QuizAttemptStatus.to_attempt)
+            ),
+            # Only completed attempts are archived
+            select(
+                AnswerSheetArchive.course_id,
+                literal_column(f"'{QuizAttemptStatus.completed.name}'"),
+                AnswerSheetArchive.attempt_score,
+                AnswerSheetArchive.total_points,
+            ).where(AnswerSheetArchive.student_id == student_id),
+        ).subquery()
+        completed = attempts.c.status == QuizAttemptStatus.completed
+        return db_session.exec(
+            select(
+                func.grouping(attempts.c.course_id).label("is_overall"),
+                attempts.c.course_id,
+                func.count().label("attempt_count"),
+                func.count().filter(completed).label("completed_count"),
+                func.count().filter(attempts.c.status == QuizAttemptStatus.in_progress).label("in_progress_count"),
+                func.avg(attempts.c.attempt_score).filter(completed).label("average_score"),
+                func.max(attempts.c.attempt_score).filter(completed).label("best_score"),
+                func.avg(attempts.c.attempt_score * 100.0 / func.nullif(attempts.c.total_points, 0))
+                .filter(completed)
+                .label("average_percentage"),
+            ).group_by(func.rollup(attempts.c.course_id))
+        ).mappings().all()
+
     # 
     def all_quiz_attempts_for_student(self, db_session: Session, student_id: int):
         """
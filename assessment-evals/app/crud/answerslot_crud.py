@@ -1,9 +1,12 @@
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 from fastapi import HTTPException
-from app.models.base import QuestionTypeEnum
 
-from app.models.answerslot_model import  AnswerSlot, AnswerSlotOption, AnswerSlotCreate
-from app.core.requests import get_question
+from app.models.answerslot_model import  AnswerSlot, AnswerSlotCreate
+from app.models.answersheet_model import AnswerSheet
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.core.requests import get_question_coalesced
+from app.service.prewarm import get_answer_key_question, get_answer_key
+from app.service.grading import compile_answer_key, grade_answer
 
 class CRUDQuizAnswerSlotEngine:
     # 0. Validate if Quiz Question being attempted is valid Quiz Question and not attemted before
@@ -22,7 +25,9 @@ class CRUDQuizAnswerSlotEngine:
                 )
             ).one_or_none()
 
-            if db_quiz_answer_slot:
+            if db_quiz_answer_slot or crud_answer_slot_staging.is_question_staged(
+                db_session, answer_sheet_id=answersheet_id, question_id=question_id
+            ):
                 raise ValueError("Question Already Attempted")
 
             return True
@@ -52,14 +57,8 @@ class CRUDQuizAnswerSlotEngine:
             if quiz_answer_slot.selected_options_ids is None:
                 raise ValueError("Select MCQ Option to Save It")
 
-            # Prep to add selected_options
-            sanitized_selected_options: list[AnswerSlotOption] = []
-
-            for option_id in quiz_answer_slot.selected_options_ids:
-                sanitized_selected_options.append(AnswerSlotOption(option_id=option_id))
-
             db_quiz_answer_slot = AnswerSlot.model_validate(quiz_answer_slot)
-            db_quiz_answer_slot.selected_options.extend(sanitized_selected_options)
+            db_quiz_answer_slot.selected_option_ids = sorted(set(quiz_answer_slot.selected_options_ids))
             db_session.add(db_quiz_answer_slot)
 
             db_session.commit()
@@ -81,81 +80,21 @@ class CRUDQuizAnswerSlotEngine:
         Grade a Quiz Answer Slot
         """
         try:
-            print("\n\n\n GRADING" "\n\n\n")
-            
-            if len(quiz_answer_slot.selected_options) == 0:
-                print("\n\n\n No Option Selected GRADE IS 0" "\n\n\n")
-                quiz_answer_slot.points_awarded = 0
-                db_session.add(quiz_answer_slot)
-                db_session.commit()
-                db_session.refresh(quiz_answer_slot)
-                return quiz_answer_slot
-            # 1. Get Questions using question_id from question_engine
-            question = get_question(
-                question_id=quiz_answer_slot.question_id
-            )
-
-            # 2.1 for single_select_mcq match answer_id with question.mcq_options and update points_awarded
-            if quiz_answer_slot.question_type == QuestionTypeEnum.single_select_mcq:
-                
-                # Get the correct answer
-                selected_option_id = quiz_answer_slot.selected_options[0].option_id
-                correct_option_id = next(
-                    (option["id"] for option in question["options"] if option["is_correct"]),
-                    None,
-                )
-                if selected_option_id == correct_option_id:
-                    quiz_answer_slot.points_awarded = question["points"]
-                else:
-                    quiz_answer_slot.points_awarded = 0
-
-                db_session.add(quiz_answer_slot)
-
-            # 2.2 for multi_select_mcq match answer_id with question.mcq_options for total correct and matching correct and update points_awarded
-            if quiz_answer_slot.question_type == QuestionTypeEnum.multiple_select_mcq:
-                print("\n\n\n multi_select_mcq GRADING" "\n\n\n")
-                # Get the correct answer
-                selected_option_ids = [
-                    option.option_id for option in quiz_answer_slot.selected_options
-                ]
-
-                print("\n\n\n selected_option_ids", selected_option_ids, "\n\n\n")
-
-                correct_option_ids = [
-                    option["id"] for option in question["options"] if option["is_correct"]
-                ]
-
-                print("\n\n\n correct_option_ids", correct_option_ids, "\n\n\n")
-
-                # Calculate the number of correctly selected options
-                correct_selections = len(
-                    set(selected_option_ids) & set(correct_option_ids)
-                )
-                print(
-                    "\n\n\n Calculate the number of correctly selected options \n\n correct_selections",
-                    correct_selections,
-                    "\n\n\n",
-                )
-                total_correct_options = len(correct_option_ids)
-
-                print("\n\n\n total_correct_options", total_correct_options, "\n\n\n")
-
-                # Calculate partial points. This could be customized based on  grading policy.
-                # For example, award points proportionally based on the number of correctly selected options.
-                if correct_selections > 0:
-                    partial_points = (
-                        correct_selections / total_correct_options
-                    ) * question["points"]
-                    print("\n\n\n partial_points", partial_points, "\n\n\n")
-                    # Round the partial points to two decimal places
-                    quiz_answer_slot.points_awarded = round(partial_points, 2)
-                else:
-                    # No points if no correct options are selected
-                    print("\n\n\n No points if no correct options are selected \n\n\n")
-                    quiz_answer_slot.points_awarded = 0
-
-                db_session.add(quiz_answer_slot)
+            selected_option_ids = quiz_answer_slot.selected_option_ids
 
+            if len(selected_option_ids) == 0:
+                quiz_answer_slot.points_awarded = 0
+            else:
+                # 1. Get the compiled answer key from the prewarmed quiz or from question_engine
+                answer_key = get_answer_key_question(
+                    quiz_answer_slot.answer_sheet.quiz_id, quiz_answer_slot.question_id
+                ) or compile_answer_key(get_question_coalesced(
+                    question_id=quiz_answer_slot.question_id
+                ))
+                # 2. Grade the selected options and update points_awarded
+                quiz_answer_slot.points_awarded = grade_answer(answer_key, selected_option_ids)
+
+            db_session.add(quiz_answer_slot)
             db_session.commit()
 
             # Refresh the Quiz Answer Slot
@@ -163,9 +102,54 @@ class CRUDQuizAnswerSlotEngine:
 
             return quiz_answer_slot
 
-            # 3. Update Quiz Answer Slot with points_awarded
         except Exception as e:
             db_session.rollback()
             raise e
 
+    # 3. Grade all ungraded Answer Slots of many Answer Sheets
+    def grade_answer_slots_for_sheets(
+        self, *, db_session: Session, answer_sheet_ids: list[int], answer_slot_ids: list[int] | None = None
+    ) -> int:
+        """
+        Grade the ungraded Answer Slots of the given Answer Sheets (only answer_slot_ids when given).
+        The answer key is fetched once per quiz and points are written in one bulk UPDATE.
+        Does not commit - the caller finalizes the Answer Sheets in the same transaction.
+        """
+        ungraded_query = (
+            select(AnswerSlot, AnswerSheet.quiz_id)
+            .join(AnswerSheet, AnswerSheet.id == AnswerSlot.quiz_answer_sheet_id)  # type:ignore
+            .where(
+                AnswerSlot.quiz_answer_sheet_id.in_(answer_sheet_ids),  # type:ignore
+                AnswerSlot.points_awarded == 0,
+            )
+        )
+        if answer_slot_ids is not None:
+            ungraded_query = ungraded_query.where(AnswerSlot.id.in_(answer_slot_ids))  # type:ignore
+        ungraded_slots = db_session.exec(ungraded_query).all()
+
+        # Group by quiz and grade each group as one batch
+        slots_by_quiz: dict[int, list[AnswerSlot]] = {}
+        for answer_slot, quiz_id in ungraded_slots:
+            if answer_slot.selected_option_ids:
+                slots_by_quiz.setdefault(quiz_id, []).append(answer_slot)
+
+        graded_points = []
+        for quiz_id, answer_slots in slots_by_quiz.items():
+            points_awarded = get_answer_key(quiz_id).grade_batch(
+                [answer_slot.question_id for answer_slot in answer_slots],
+                [answer_slot.selected_option_ids for answer_slot in answer_slots],
+            )
+            graded_points.extend(
+                {"id": answer_slot.id, "points_awarded": float(points)}
+                for answer_slot, points in zip(answer_slots, points_awarded)
+                # NaN - question no longer in the quiz, 0 - nothing to write
+                if points > 0
+            )
+
+        if graded_points:
+            db_session.execute(update(AnswerSlot), graded_points)
+
+        return len(graded_points)
+
+
 crud_answer_slot = CRUDQuizAnswerSlotEngine()
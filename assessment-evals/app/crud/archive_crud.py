@@ -0,0 +1,119 @@
+from datetime import datetime
+from sqlmodel import select, delete, and_, Session
+
+from app.core.partitions import ensure_yearly_partitions
+from app.models.base import QuizAttemptStatus
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.archive_model import AnswerSheetArchive
+from app.models.idempotency_model import IdempotencyRecord
+from app.models.telemetry_model import AttemptEvent, QuestionTimeOnTask
+
+
+class CRUDAnswerSheetArchive:
+    def claim_archivable_answer_sheets(
+        self, db_session: Session, finished_before: datetime, limit: int
+    ) -> list[AnswerSheet]:
+        """
+        Lock a batch of completed Answer Sheets finished before finished_before.
+        SKIP LOCKED lets several replicas archive different batches.
+        """
+        return db_session.exec(
+            select(AnswerSheet)
+            .where(
+                and_(
+                    AnswerSheet.status == QuizAttemptStatus.completed,
+                    AnswerSheet.time_finish < finished_before,  # type:ignore
+                )
+            )
+            .order_by(AnswerSheet.time_finish)  # type:ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+    def get_answer_slots_for_sheets(self, db_session: Session, answer_sheet_ids: list[int]) -> list[AnswerSlot]:
+        return db_session.exec(
+            select(AnswerSlot)
+            .where(AnswerSlot.quiz_answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            .order_by(AnswerSlot.id)  # type:ignore
+        ).all()
+
+    def get_time_on_task_for_sheets(self, db_session: Session, answer_sheet_ids: list[int]) -> list[QuestionTimeOnTask]:
+        return db_session.exec(
+            select(QuestionTimeOnTask)
+            .where(QuestionTimeOnTask.answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            .order_by(QuestionTimeOnTask.answer_sheet_id, QuestionTimeOnTask.question_id)  # type:ignore
+        ).all()
+
+    def move_to_archive(
+        self, db_session: Session, archived_sheets: list[AnswerSheetArchive]
+    ) -> int:
+        """
+        Insert the archive rows and delete the archived Answer Sheets with every row referencing them
+        (Answer Slots, time on task, telemetry events & stored attempt responses) in one transaction.
+        Time on task is kept in the archive payload.
+        """
+        try:
+            ensure_yearly_partitions(
+                db_session, AnswerSheetArchive.__tablename__, [archived.time_finish for archived in archived_sheets]
+            )
+            db_session.add_all(archived_sheets)
+            db_session.flush()
+
+            answer_sheet_ids = [archived.id for archived in archived_sheets]
+            db_session.exec(
+                delete(AnswerSlot).where(AnswerSlot.quiz_answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            )
+            db_session.exec(
+                delete(QuestionTimeOnTask).where(QuestionTimeOnTask.answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            )
+            db_session.exec(
+                delete(AttemptEvent).where(AttemptEvent.answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            )
+            db_session.exec(
+                delete(IdempotencyRecord).where(
+                    IdempotencyRecord.response_body["answer_sheet_id"].as_integer().in_(answer_sheet_ids)  # type:ignore
+                )
+            )
+            db_session.exec(
+                delete(AnswerSheet).where(AnswerSheet.id.in_(answer_sheet_ids))  # type:ignore
+            )
+            db_session.commit()
+            return len(archived_sheets)
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def get_archived_answer_sheet(
+        self, db_session: Session, answer_sheet_id: int, student_id: int
+    ) -> AnswerSheetArchive | None:
+        return db_session.exec(
+            select(AnswerSheetArchive).where(
+                and_(AnswerSheetArchive.id == answer_sheet_id, AnswerSheetArchive.student_id == student_id)
+            )
+        ).one_or_none()
+
+    def get_archived_answer_sheet_by_quiz_key(
+        self, db_session: Session, student_id: int, quiz_id: int, quiz_key: str
+    ) -> AnswerSheetArchive | None:
+        return db_session.exec(
+            select(AnswerSheetArchive).where(
+                and_(
+                    AnswerSheetArchive.student_id == student_id,
+                    AnswerSheetArchive.quiz_id == quiz_id,
+                    AnswerSheetArchive.quiz_key == quiz_key,
+                )
+            )
+        ).first()
+
+    def get_archived_answer_sheets_for_student(
+        self, db_session: Session, student_id: int
+    ) -> list[AnswerSheetArchive]:
+        return db_session.exec(
+            select(AnswerSheetArchive)
+            .where(AnswerSheetArchive.student_id == student_id)
+            .order_by(AnswerSheetArchive.time_finish)  # type:ignore
+        ).all()
+
+
+crud_answer_sheet_archive = CRUDAnswerSheetArchive()
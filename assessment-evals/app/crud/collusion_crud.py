@@ -0,0 +1,125 @@
+from datetime import datetime
+from sqlmodel import select, delete, insert, func, and_, Session
+
+from app.models.base import QuizAttemptStatus, CollusionScanStatus
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.collusion_model import CollusionScan, CollusionPair
+
+
+class CRUDCollusionScan:
+    def enqueue_collusion_scan(self, *, db_session: Session, quiz_id: int) -> CollusionScan:
+        """
+        Queue a Collusion Scan for a quiz. A scan already queued for the quiz is reused.
+        """
+        try:
+            queued_scan = db_session.exec(
+                select(CollusionScan).where(
+                    and_(
+                        CollusionScan.quiz_id == quiz_id,
+                        CollusionScan.status == CollusionScanStatus.queued,
+                    )
+                )
+            ).first()
+            if queued_scan:
+                return queued_scan
+
+            collusion_scan = CollusionScan(quiz_id=quiz_id)
+            db_session.add(collusion_scan)
+            db_session.commit()
+            db_session.refresh(collusion_scan)
+            return collusion_scan
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def get_collusion_scan(self, db_session: Session, scan_id: int) -> CollusionScan:
+        collusion_scan = db_session.get(CollusionScan, scan_id)
+        if not collusion_scan:
+            raise ValueError("Collusion Scan Not Found")
+        return collusion_scan
+
+    def get_collusion_scans(self, db_session: Session, quiz_id: int | None, offset: int, limit: int) -> list[CollusionScan]:
+        statement = select(CollusionScan)
+        if quiz_id is not None:
+            statement = statement.where(CollusionScan.quiz_id == quiz_id)
+        return db_session.exec(
+            statement.order_by(CollusionScan.id.desc()).offset(offset).limit(limit)  # type:ignore
+        ).all()
+
+    def get_collusion_pairs(self, db_session: Session, scan_id: int, offset: int, limit: int) -> list[CollusionPair]:
+        """
+        Flagged pairs of a scan, most similar first
+        """
+        return db_session.exec(
+            select(CollusionPair)
+            .where(CollusionPair.scan_id == scan_id)
+            .order_by(CollusionPair.jaccard.desc(), CollusionPair.shared_wrong_answers.desc())  # type:ignore
+            .offset(offset)
+            .limit(limit)
+        ).all()
+
+    def claim_collusion_scan(self, db_session: Session) -> CollusionScan | None:
+        """
+        Take the oldest queued scan and mark it running.
+        SKIP LOCKED lets several workers claim different scans.
+        """
+        try:
+            collusion_scan = db_session.exec(
+                select(CollusionScan)
+                .where(CollusionScan.status == CollusionScanStatus.queued)
+                .order_by(CollusionScan.id)  # type:ignore
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if not collusion_scan:
+                return None
+
+            collusion_scan.status = CollusionScanStatus.running
+            collusion_scan.started_at = datetime.utcnow()
+            db_session.commit()
+            db_session.refresh(collusion_scan)
+            return collusion_scan
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def get_quiz_selections(self, db_session: Session, quiz_id: int) -> list[tuple[int, int, int, list[int]]]:
+        """
+        (answer sheet id, student id, question id, selected option ids) of every answered
+        question in the completed Answer Sheets of a quiz
+        """
+        return db_session.exec(
+            select(
+                AnswerSlot.quiz_answer_sheet_id,
+                AnswerSheet.student_id,
+                AnswerSlot.question_id,
+                AnswerSlot.selected_option_ids,
+            )
+            .join(AnswerSheet, AnswerSheet.id == AnswerSlot.quiz_answer_sheet_id)  # type:ignore
+            .where(
+                and_(
+                    AnswerSheet.quiz_id == quiz_id,
+                    AnswerSheet.status == QuizAttemptStatus.completed,
+                    func.cardinality(AnswerSlot.selected_option_ids) > 0,
+                )
+            )
+        ).all()
+
+    def replace_collusion_pairs(self, db_session: Session, collusion_scan: CollusionScan, pairs: list[dict]):
+        """
+        Store the flagged pairs of a scan in one bulk INSERT. Does not commit.
+        """
+        db_session.exec(delete(CollusionPair).where(CollusionPair.scan_id == collusion_scan.id))
+        if pairs:
+            created_at = datetime.utcnow()
+            db_session.execute(
+                insert(CollusionPair),
+                [
+                    {"scan_id": collusion_scan.id, "quiz_id": collusion_scan.quiz_id, "created_at": created_at, **pair}
+                    for pair in pairs
+                ],
+            )
+
+
+crud_collusion_scan = CRUDCollusionScan()
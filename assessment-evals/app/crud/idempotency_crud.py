@@ -0,0 +1,101 @@
+from datetime import datetime
+from sqlmodel import select, delete, and_, or_, Session
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.idempotency_model import IdempotencyRecord
+
+
+class CRUDIdempotencyRecord:
+    def claim_idempotency_key(
+        self,
+        db_session: Session,
+        *,
+        student_id: int,
+        idempotency_key: str,
+        request_hash: str,
+        expires_at: datetime,
+        locked_until: datetime,
+    ) -> IdempotencyRecord | None:
+        """
+        Claim a key for a new request in one statement. An expired record for the key is taken over,
+        as is a record still pending after its lease (the request holding it never finished).
+        Returns None when the key is claimed, otherwise the existing record.
+        """
+        try:
+            now = datetime.utcnow()
+            claim = insert(IdempotencyRecord).values(
+                student_id=student_id,
+                idempotency_key=idempotency_key,
+                request_hash=request_hash,
+                created_at=now,
+                expires_at=expires_at,
+                locked_until=locked_until,
+            )
+            claim = claim.on_conflict_do_update(
+                index_elements=[IdempotencyRecord.student_id, IdempotencyRecord.idempotency_key],
+                set_={
+                    "request_hash": claim.excluded.request_hash,
+                    "status_code": None,
+                    "response_body": None,
+                    "created_at": claim.excluded.created_at,
+                    "expires_at": claim.excluded.expires_at,
+                    "locked_until": claim.excluded.locked_until,
+                },
+                where=or_(
+                    IdempotencyRecord.expires_at < now,
+                    and_(
+                        IdempotencyRecord.status_code.is_(None),  # type:ignore
+                        or_(IdempotencyRecord.locked_until.is_(None), IdempotencyRecord.locked_until < now),  # type:ignore
+                    ),
+                ),
+            ).returning(IdempotencyRecord.student_id)
+
+            claimed = db_session.execute(claim).first()
+            db_session.commit()
+            if claimed:
+                return None
+
+            return db_session.exec(
+                select(IdempotencyRecord).where(
+                    and_(
+                        IdempotencyRecord.student_id == student_id,
+                        IdempotencyRecord.idempotency_key == idempotency_key,
+                    )
+                )
+            ).one()
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def complete_idempotency_key(
+        self, db_session: Session, *, student_id: int, idempotency_key: str, status_code: int, response_body
+    ):
+        record = db_session.get(IdempotencyRecord, (student_id, idempotency_key))
+        record.status_code = status_code
+        record.response_body = response_body
+        record.locked_until = None
+        db_session.add(record)
+        db_session.commit()
+
+    def release_idempotency_key(self, db_session: Session, *, student_id: int, idempotency_key: str):
+        """
+        Drop the claim of a failed request so a retry runs it again
+        """
+        db_session.rollback()
+        db_session.exec(
+            delete(IdempotencyRecord).where(
+                and_(
+                    IdempotencyRecord.student_id == student_id,
+                    IdempotencyRecord.idempotency_key == idempotency_key,
+                )
+            )
+        )
+        db_session.commit()
+
+    def delete_expired_records(self, db_session: Session, now: datetime) -> int:
+        result = db_session.exec(delete(IdempotencyRecord).where(IdempotencyRecord.expires_at < now))
+        db_session.commit()
+        return result.rowcount
+
+
+crud_idempotency_record = CRUDIdempotencyRecord()
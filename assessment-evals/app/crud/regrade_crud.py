@@ -0,0 +1,141 @@
+from datetime import datetime
+from sqlmodel import select, update, func, and_, or_, text, Session
+
+from app.models.base import QuizAttemptStatus, RegradeJobStatus
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.regrade_model import RegradeJob, answer_key_version_seq
+
+
+class CRUDRegradeJob:
+    def enqueue_regrade_job(self, *, db_session: Session, question_id: int) -> RegradeJob:
+        """
+        Queue a Regrade Job for a question.
+        A job already queued for the question is reused - it will read the latest answer key.
+        """
+        try:
+            queued_job = db_session.exec(
+                select(RegradeJob).where(
+                    and_(
+                        RegradeJob.question_id == question_id,
+                        RegradeJob.status == RegradeJobStatus.queued,
+                    )
+                )
+            ).first()
+            if queued_job:
+                return queued_job
+
+            regrade_job = RegradeJob(question_id=question_id)
+            db_session.add(regrade_job)
+            db_session.commit()
+            db_session.refresh(regrade_job)
+            return regrade_job
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def bump_answer_key_version(self, db_session: Session) -> int:
+        """
+        Move the answer key version forward. nextval is not transactional - the new version
+        is visible to every process right away, even before the caller commits.
+        """
+        return db_session.execute(select(answer_key_version_seq.next_value())).scalar_one()
+
+    def get_answer_key_version(self, db_session: Session) -> int:
+        # last_value is 1 both before and after the first nextval - is_called tells them apart
+        return db_session.execute(
+            text(f"SELECT last_value + is_called::int FROM {answer_key_version_seq.name}")
+        ).scalar_one()
+
+    def get_regrade_job(self, db_session: Session, regrade_job_id: int) -> RegradeJob:
+        regrade_job = db_session.get(RegradeJob, regrade_job_id)
+        if not regrade_job:
+            raise ValueError("Regrade Job Not Found")
+        return regrade_job
+
+    def get_regrade_jobs(self, db_session: Session, offset: int, limit: int) -> list[RegradeJob]:
+        return db_session.exec(
+            select(RegradeJob).order_by(RegradeJob.id.desc()).offset(offset).limit(limit)  # type:ignore
+        ).all()
+
+    def claim_regrade_job(
+        self, db_session: Session, now: datetime, lease_expires_at: datetime
+    ) -> RegradeJob | None:
+        """
+        Take the oldest queued job, or running job whose lease expired, and mark it running until lease_expires_at.
+        SKIP LOCKED lets several workers claim different jobs. A taken over job is regraded from the start,
+        regrading is idempotent.
+        """
+        try:
+            regrade_job = db_session.exec(
+                select(RegradeJob)
+                .where(
+                    or_(
+                        RegradeJob.status == RegradeJobStatus.queued,
+                        and_(
+                            RegradeJob.status == RegradeJobStatus.running,
+                            or_(RegradeJob.lease_expires_at.is_(None), RegradeJob.lease_expires_at < now),  # type:ignore
+                        ),
+                    )
+                )
+                .order_by(RegradeJob.id)  # type:ignore
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if not regrade_job:
+                return None
+
+            regrade_job.status = RegradeJobStatus.running
+            regrade_job.started_at = now
+            regrade_job.lease_expires_at = lease_expires_at
+            regrade_job.regraded_slots = 0
+            regrade_job.total_slots = self.count_question_slots(db_session, regrade_job.question_id)
+            db_session.commit()
+            db_session.refresh(regrade_job)
+            return regrade_job
+        except Exception as e:
+            db_session.rollback()
+            raise e
+
+    def count_question_slots(self, db_session: Session, question_id: int) -> int:
+        return db_session.exec(
+            select(func.count(AnswerSlot.id)).where(AnswerSlot.question_id == question_id)
+        ).one()
+
+    def get_question_slots_batch(
+        self, db_session: Session, question_id: int, after_id: int, limit: int
+    ) -> list[tuple[int, int, float, list[int]]]:
+        """
+        Next batch of (slot id, answer sheet id, points_awarded, selected option ids) for a question,
+        keyset paginated on the slot id
+        """
+        return db_session.exec(
+            select(AnswerSlot.id, AnswerSlot.quiz_answer_sheet_id, AnswerSlot.points_awarded, AnswerSlot.selected_option_ids)
+            .where(and_(AnswerSlot.question_id == question_id, AnswerSlot.id > after_id))
+            .order_by(AnswerSlot.id)  # type:ignore
+            .limit(limit)
+        ).all()
+
+    def refresh_attempt_scores(self, db_session: Session, answer_sheet_ids: list[int]) -> int:
+        """
+        Recompute attempt_score of completed Answer Sheets in one UPDATE
+        """
+        attempt_score = (
+            select(func.coalesce(func.sum(AnswerSlot.points_awarded), 0))
+            .where(AnswerSlot.quiz_answer_sheet_id == AnswerSheet.id)
+            .scalar_subquery()
+        )
+        result = db_session.exec(
+            update(AnswerSheet)
+            .where(
+                and_(
+                    AnswerSheet.id.in_(answer_sheet_ids),  # type:ignore
+                    AnswerSheet.status == QuizAttemptStatus.completed,
+                )
+            )
+            .values(attempt_score=attempt_score)
+        )
+        return result.rowcount
+
+
+crud_regrade_job = CRUDRegradeJob()
@@ -0,0 +1,105 @@
+from datetime import datetime
+from sqlmodel import select, func, and_, Session
+from sqlalchemy import literal, DateTime
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.partitions import ensure_monthly_partitions
+from app.models.base import QuizAttemptStatus, AttemptEventType
+from app.models.answersheet_model import AnswerSheet
+from app.models.telemetry_model import AttemptEvent, QuestionTimeOnTask
+
+# Columns written to attemptevent by COPY, in COPY order - id comes from its sequence
+ATTEMPT_EVENT_COPY_COLUMNS = ("received_at", "answer_sheet_id", "question_id", "event_type", "occurred_at")
+
+
+class CRUDAttemptTelemetry:
+    def get_answer_sheet_owner(self, db_session: Session, answer_sheet_id: int):
+        """
+        (student_id, status) of an Answer Sheet or None
+        """
+        return db_session.exec(
+            select(AnswerSheet.student_id, AnswerSheet.status).where(AnswerSheet.id == answer_sheet_id)
+        ).one_or_none()
+
+    def copy_attempt_events(self, db_session: Session, events: list[tuple]):
+        """
+        Append events (rows in ATTEMPT_EVENT_COPY_COLUMNS order) with COPY. Does not commit.
+        """
+        ensure_monthly_partitions(db_session, AttemptEvent.__tablename__, [event[0] for event in events])
+        with db_session.connection().connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {AttemptEvent.__tablename__} ({', '.join(ATTEMPT_EVENT_COPY_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for event in events:
+                    copy.write_row(event)
+
+    def compute_time_on_task(self, db_session: Session, answer_sheet_ids: list[int], max_view_seconds: int) -> int:
+        """
+        Upsert per question time aggregates of the completed Answer Sheets among answer_sheet_ids.
+        A view lasts until the next event of the sheet (or time_finish) and at most max_view_seconds.
+        Does not commit.
+        """
+        next_occurred_at = func.lead(AttemptEvent.occurred_at).over(
+            partition_by=AttemptEvent.answer_sheet_id,
+            order_by=(AttemptEvent.occurred_at, AttemptEvent.id),
+        )
+        events = (
+            select(
+                AttemptEvent.answer_sheet_id,
+                AttemptEvent.question_id,
+                AttemptEvent.event_type,
+                AttemptEvent.occurred_at,
+                next_occurred_at.label("next_occurred_at"),
+            )
+            .where(AttemptEvent.answer_sheet_id.in_(answer_sheet_ids))  # type:ignore
+            .subquery()
+        )
+        view_end = func.least(func.coalesce(events.c.next_occurred_at, AnswerSheet.time_finish), AnswerSheet.time_finish)
+        view_seconds = func.least(
+            func.greatest(func.extract("epoch", view_end - events.c.occurred_at), 0), max_view_seconds
+        )
+        is_view = events.c.event_type == AttemptEventType.view
+        aggregates = (
+            select(
+                events.c.answer_sheet_id,
+                events.c.question_id,
+                func.coalesce(func.sum(view_seconds).filter(is_view), 0),
+                func.count().filter(is_view),
+                func.count().filter(events.c.event_type == AttemptEventType.answer_change),
+                literal(datetime.utcnow(), DateTime),
+            )
+            .join(AnswerSheet, AnswerSheet.id == events.c.answer_sheet_id)  # type:ignore
+            .where(
+                and_(
+                    AnswerSheet.status == QuizAttemptStatus.completed,
+                    events.c.question_id.is_not(None),
+                )
+            )
+            .group_by(events.c.answer_sheet_id, events.c.question_id)
+        )
+        upsert = insert(QuestionTimeOnTask).from_select(
+            ["answer_sheet_id", "question_id", "time_spent_seconds", "view_count", "answer_changes", "computed_at"],
+            aggregates,
+        )
+        result = db_session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=["answer_sheet_id", "question_id"],
+                set_={
+                    "time_spent_seconds": upsert.excluded.time_spent_seconds,
+                    "view_count": upsert.excluded.view_count,
+                    "answer_changes": upsert.excluded.answer_changes,
+                    "computed_at": upsert.excluded.computed_at,
+                },
+            )
+        )
+        return result.rowcount
+
+    def get_time_on_task(self, db_session: Session, answer_sheet_id: int) -> list[QuestionTimeOnTask]:
+        return db_session.exec(
+            select(QuestionTimeOnTask)
+            .where(QuestionTimeOnTask.answer_sheet_id == answer_sheet_id)
+            .order_by(QuestionTimeOnTask.question_id)  # type:ignore
+        ).all()
+
+
+crud_attempt_telemetry = CRUDAttemptTelemetry()
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from contextlib import asynccontextmanager
@@ -7,6 +8,16 @@ from app import settings
 from app.core.config import logger_config
 from app.api.deps import LoginForAccessTokenDep
 from app.api.v1 import api as v1_api
+from app.core.scheduler import run_periodically
+from app.service.prewarm import prewarm_upcoming_quizzes
+from app.service.deadline_sweeper import sweep_expired_answer_sheets
+from app.service.regrade import process_regrade_jobs
+from app.service.collusion import process_collusion_scans
+from app.service.archive import archive_completed_attempts
+from app.service.idempotency import purge_expired_idempotency_records
+from app.service.answer_buffer import flush_staged_answers
+from app.service.proctor import broadcast_proctor_counters
+from app.service.telemetry import flush_attempt_events
 
 logger = logger_config(__name__)
 
@@ -15,8 +26,51 @@ async def lifespan(app: FastAPI):
     logger.info("startup: triggered")
     origins = [str(origin).strip("/") for origin in settings.BACKEND_CORS_ORIGINS]
     print(f"Allowed origins: {origins}")
+    background_tasks = [
+        asyncio.create_task(
+            run_periodically(purge_expired_idempotency_records, settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS)
+        ),
+        asyncio.create_task(
+            run_periodically(broadcast_proctor_counters, settings.PROCTOR_BROADCAST_INTERVAL_SECONDS)
+        ),
+        asyncio.create_task(
+            run_periodically(flush_attempt_events, settings.TELEMETRY_FLUSH_INTERVAL_SECONDS)
+        ),
+    ]
+    if settings.PREWARM_ENABLED:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(prewarm_upcoming_quizzes, settings.PREWARM_INTERVAL_SECONDS)
+        ))
+    if settings.DEADLINE_SWEEPER_ENABLED:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(sweep_expired_answer_sheets, settings.DEADLINE_SWEEPER_INTERVAL_SECONDS)
+        ))
+    if settings.REGRADE_WORKER_ENABLED:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(process_regrade_jobs, settings.REGRADE_INTERVAL_SECONDS)
+        ))
+    if settings.COLLUSION_WORKER_ENABLED:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(process_collusion_scans, settings.COLLUSION_INTERVAL_SECONDS)
+        ))
+    if settings.ANSWER_WRITE_BEHIND_ENABLED:
+        # The first run also replays answers staged before a restart
+        background_tasks.append(asyncio.create_task(
+            run_periodically(flush_staged_answers, settings.ANSWER_FLUSH_INTERVAL_SECONDS)
+        ))
+    if settings.ARCHIVE_ENABLED:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(archive_completed_attempts, settings.ARCHIVE_INTERVAL_SECONDS)
+        ))
     yield
     logger.info("shutdown: triggered")
+    for task in background_tasks:
+        task.cancel()
+    # Buffered telemetry only lives in memory
+    try:
+        await asyncio.to_thread(flush_attempt_events)
+    except Exception as err:
+        logger.error(f"flush_attempt_events Error on shutdown: {err}")
 
 
 app = FastAPI()
@@ -0,0 +1,32 @@
+from sqlmodel import Field, SQLModel, Column, ARRAY, Integer, UniqueConstraint, text
+from datetime import datetime
+
+from app.models.base import QuestionTypeEnum
+from app.models.answerslot_model import AnswerSlot
+
+
+class AnswerSlotStaging(SQLModel, table=True):
+    """
+    Answer saved in write behind mode and not yet flushed into AnswerSlot.
+    The id is taken from the answerslot sequence so the saved answer keeps its id once flushed.
+    Only the unique (sheet, question) index - it rejects a second answer to the same question.
+    """
+    __table_args__ = (
+        UniqueConstraint("quiz_answer_sheet_id", "question_id", name="uq_answerslotstaging_sheet_question"),
+    )
+
+    id: int | None = Field(
+        default=None, primary_key=True, sa_column_kwargs={"server_default": text("nextval('answerslot_id_seq')")}
+    )
+    quiz_answer_sheet_id: int
+    question_id: int
+    question_type: QuestionTypeEnum
+    selected_option_ids: list[int] = Field(
+        default_factory=list,
+        sa_column=Column(ARRAY(Integer), nullable=False, server_default=text("'{}'")),
+    )
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# create_all (test databases) must create answerslot and its id sequence first
+AnswerSlotStaging.__table__.add_is_dependent_on(AnswerSlot.__table__)
@@ -1,7 +1,8 @@
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Column, JSON, Index, text
 from datetime import timedelta, datetime
 from typing import TYPE_CHECKING
 from app.models.base import BaseIdModel, QuizAttemptStatus
+from app.models.answerslot_model import AnswerSlotFeedback
 
 if TYPE_CHECKING:
     from app.models.answerslot_model import AnswerSlot
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
 class AnswerSheetBase(SQLModel):
     student_id: int = Field(index=True)
     quiz_id: int = Field(index=True)
+    course_id: int | None = Field(default=None, index=True)
 
     time_limit: timedelta = Field()
     time_start: datetime | None = Field(default=None)
@@ -26,6 +28,33 @@ class AnswerSheetBase(SQLModel):
 
 
 class AnswerSheet(BaseIdModel, AnswerSheetBase, table=True):
+    # Partial index read by the deadline sweeper - only in progress sheets are indexed
+    __table_args__ = (
+        Index(
+            "ix_answersheet_in_progress_deadline",
+            "deadline",
+            postgresql_where=text("status = 'in_progress'"),
+        ),
+        # Covering index for the keyset paginated attempt history - read with index only scans
+        Index(
+            "ix_answersheet_student_history",
+            "student_id",
+            "time_start",
+            "id",
+            postgresql_include=[
+                "quiz_id", "course_id", "status", "attempt_score", "total_points",
+                "time_limit", "time_finish", "quiz_title", "quiz_key",
+            ],
+        ),
+    )
+
+    # time_start + time_limit, set when the attempt starts
+    deadline: datetime | None = Field(default=None)
+    # Seed for the per attempt question & option order. Not exposed in Read Models.
+    shuffle_seed: int | None = Field(default=None, exclude=True)
+    # Questions & Options (without answers) as they were when the attempt was created
+    quiz_snapshot: dict | None = Field(default=None, sa_column=Column(JSON), exclude=True)
+
     quiz_answers: list["AnswerSlot"] = Relationship(back_populates="answer_sheet")
 
     # TODO: quiz_grades: list["QuizGrade"] = Relationship(back_populates="quiz_attempt")
@@ -34,11 +63,27 @@ class AnswerSheet(BaseIdModel, AnswerSheetBase, table=True):
 class AnswerSheetCreate(SQLModel):
     student_id: int
     quiz_id: int
+    course_id: int | None = None
     time_limit: timedelta
     time_start: datetime
     total_points: int
     quiz_key: str
     quiz_title: str
+    shuffle_seed: int | None = None
+    quiz_snapshot: dict | None = None
+
+
+class AnswerSheetProvision(SQLModel):
+    student_id: int
+    quiz_id: int
+    course_id: int | None = None
+    time_limit: timedelta
+    total_points: int
+    quiz_key: str
+    quiz_title: str
+    status: QuizAttemptStatus = QuizAttemptStatus.to_attempt
+    shuffle_seed: int | None = None
+    quiz_snapshot: dict | None = None
 
 
 class AnswerSheetUpdate(SQLModel):
@@ -51,7 +96,47 @@ class AnswerSheetRead(AnswerSheetBase):
     id: int
 
 
+class QuizFeedback(SQLModel):
+    overview: AnswerSheetRead
+    quiz_answers_attempted: list[AnswerSlotFeedback]
+    # Questions & Options from the attempt snapshot, None when not requested
+    quiz_questions: list[dict] | None = None
+
+
+
+class AttemptHistoryPage(SQLModel):
+    items: list[AnswerSheetRead]
+    # Pass as cursor to get the next (older) page, None on the last page
+    next_cursor: str | None = None
+
+
+class AttemptSummary(SQLModel):
+    # None for the overall summary
+    course_id: int | None
+    attempt_count: int = 0
+    completed_count: int = 0
+    in_progress_count: int = 0
+    average_score: float | None = None
+    best_score: float | None = None
+    average_percentage: float | None = None
+
+
+class AttemptHistorySummary(SQLModel):
+    overall: AttemptSummary
+    courses: list[AttemptSummary]
+
 
 class AttemptQuizRequest(SQLModel):
     quiz_id: int
     quiz_key: str
+
+
+class ProvisionAnswerSheetsRequest(AttemptQuizRequest):
+    student_ids: list[int]
+
+
+class ProvisionAnswerSheetsResponse(SQLModel):
+    quiz_id: int
+    quiz_key: str
+    provisioned: int
+    already_provisioned: int
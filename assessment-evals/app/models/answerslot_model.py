@@ -1,4 +1,4 @@
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Column, ARRAY, Integer, text
 from typing import TYPE_CHECKING
 
 from app.models.base import QuestionTypeEnum, BaseIdModel
@@ -17,13 +17,22 @@ class AnswerSlot(BaseIdModel, AnswerSlotBase, table=True):
     points_awarded: float = Field(default=0)
     answer_sheet: "AnswerSheet" = Relationship(back_populates="quiz_answers")
 
-    selected_options: list["AnswerSlotOption"] = Relationship(
-        back_populates="quiz_answer_slot", sa_relationship_kwargs={"lazy": "selectin"}
+    # Selected option ids stored on the slot row (sorted, unique) - one row per answer
+    selected_option_ids: list[int] = Field(
+        default_factory=list,
+        sa_column=Column(ARRAY(Integer), nullable=False, server_default=text("'{}'")),
     )
 
+    @property
+    def selected_options(self) -> list["AnswerSlotOptionBase"]:
+        return [
+            AnswerSlotOptionBase(quiz_answer_slot_id=self.id, option_id=option_id)
+            for option_id in self.selected_option_ids
+        ]
+
 
 class AnswerSlotCreate(AnswerSlotBase):
-    # We will sanitize, append to a new list to extend .selected_options
+    # Sanitized (sorted, unique) into AnswerSlot.selected_option_ids
     selected_options_ids: list[int] = []
 
 
@@ -32,18 +41,17 @@ class AnswerSlotRead(AnswerSlotBase):
     selected_options: list["AnswerSlotOptionBase"] = []
 
 
+class AnswerSlotFeedback(AnswerSlotBase):
+    id: int
+    points_awarded: float
+    selected_option_ids: list[int] = []
+
+
 class AnswerSlotUpdate(SQLModel):
     answer_slot_id: int | None = None
     points_awarded: float | None = None
 
 
 class AnswerSlotOptionBase(SQLModel):
-    quiz_answer_slot_id: int = Field(foreign_key="answerslot.id")
+    quiz_answer_slot_id: int
     option_id: int  # This represents the specific option selected
-
-
-class AnswerSlotOption(BaseIdModel, AnswerSlotOptionBase, table=True):
-    # Relationship back to the AnswerSlot
-    quiz_answer_slot: "AnswerSlot" = Relationship(
-        back_populates="selected_options", sa_relationship_kwargs={"lazy": "joined"}
-    )
@@ -0,0 +1,31 @@
+from sqlmodel import Field, SQLModel, Column, Index, LargeBinary
+from datetime import datetime
+
+
+class AnswerSheetArchive(SQLModel, table=True):
+    """
+    Completed attempt compacted into one compressed row.
+    Range partitioned by time_finish (one partition per year), the partition key is part of the primary key.
+    """
+    __table_args__ = (
+        # Keyset paginated attempt history, merged with the live answer sheets
+        Index("ix_answersheetarchive_student_history", "student_id", "time_start", "id"),
+        {"postgresql_partition_by": "RANGE (time_finish)"},
+    )
+
+    # AnswerSheet id of the archived attempt
+    id: int = Field(primary_key=True)
+    time_finish: datetime = Field(primary_key=True)
+    student_id: int = Field(index=True)
+    quiz_id: int = Field(index=True)
+    # Looked up with student_id & quiz_id so an archived attempt cannot be started again
+    quiz_key: str | None = Field(default=None, max_length=160)
+    # Attempt history & summary columns, every other field is only in the payload
+    course_id: int | None = Field(default=None)
+    time_start: datetime | None = Field(default=None)
+    attempt_score: float | None = Field(default=None)
+    total_points: int | None = Field(default=None)
+
+    # zlib compressed JSON: answer sheet, answer slots and quiz snapshot
+    payload: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,14 @@
+from sqlmodel import SQLModel
+from datetime import datetime
+
+from app.models.base import QuizAttemptStatus
+
+
+class AttemptStateEvent(SQLModel):
+    answer_sheet_id: int
+    status: QuizAttemptStatus | None
+    deadline: datetime | None
+    remaining_seconds: int | None
+    answered_count: int
+    # Set on the finished event: submitted | deadline
+    finish_reason: str | None = None
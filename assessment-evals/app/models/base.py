@@ -35,3 +35,26 @@ class QuizAttemptStatus(str, enum.Enum):
     to_attempt = ("to_attempt",)
     in_progress = ("in_progress",)
     completed = "completed"
+
+
+class RegradeJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class AttemptEventType(str, enum.Enum):
+    # Question shown to the student
+    view = "view"
+    # Selection changed before saving
+    answer_change = "answer_change"
+    # Page lost focus - ends the current view until the next view event
+    blur = "blur"
+
+
+class CollusionScanStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
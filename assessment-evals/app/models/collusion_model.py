@@ -0,0 +1,49 @@
+from sqlmodel import Field, SQLModel
+from datetime import datetime
+
+from app.models.base import BaseIdModel, CollusionScanStatus
+
+
+class CollusionScanBase(SQLModel):
+    quiz_id: int = Field(index=True)
+    status: CollusionScanStatus = Field(default=CollusionScanStatus.queued, index=True)
+
+    # Progress
+    scanned_sheets: int = Field(default=0)
+    candidate_pairs: int = Field(default=0)
+    flagged_pairs: int = Field(default=0)
+
+    started_at: datetime | None = Field(default=None)
+    finished_at: datetime | None = Field(default=None)
+    error: str | None = Field(default=None)
+
+
+class CollusionScan(BaseIdModel, CollusionScanBase, table=True):
+    pass
+
+
+class CollusionScanRead(CollusionScanBase):
+    id: int
+    created_at: datetime | None
+
+
+class CollusionPairBase(SQLModel):
+    scan_id: int = Field(index=True, foreign_key="collusionscan.id")
+    quiz_id: int = Field(index=True)
+
+    answer_sheet_id_a: int
+    student_id_a: int
+    answer_sheet_id_b: int
+    student_id_b: int
+
+    # Wrong options both students selected and the Jaccard similarity of their wrong selections
+    shared_wrong_answers: int
+    jaccard: float
+
+
+class CollusionPair(BaseIdModel, CollusionPairBase, table=True):
+    pass
+
+
+class CollusionPairRead(CollusionPairBase):
+    id: int
@@ -0,0 +1,22 @@
+import enum
+
+
+class ExportFormat(str, enum.Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+    parquet = "parquet"
+
+
+GRADEBOOK_COLUMNS = [
+    "answer_sheet_id",
+    "student_id",
+    "quiz_id",
+    "course_id",
+    "quiz_title",
+    "quiz_key",
+    "status",
+    "time_start",
+    "time_finish",
+    "attempt_score",
+    "total_points",
+]
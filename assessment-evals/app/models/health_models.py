@@ -18,4 +18,10 @@ class Stats(BaseModel):
     answersheet: int | None
     answerslot: int | None
 
-   
+
+class UpstreamFlightStats(BaseModel):
+    name: str
+    calls: int
+    executed: int
+    coalesced: int
+    in_flight: int
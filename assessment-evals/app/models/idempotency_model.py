@@ -0,0 +1,21 @@
+from sqlmodel import Field, SQLModel, Column, JSON
+from datetime import datetime
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """
+    Response of a request sent with an Idempotency-Key, replayed when the student retries.
+    response_body is None while the first request is still running.
+    """
+    student_id: int = Field(primary_key=True)
+    idempotency_key: str = Field(primary_key=True, max_length=255)
+    # Hash of the route & request body, a key reused for a different request is rejected
+    request_hash: str = Field(max_length=64)
+
+    status_code: int | None = Field(default=None)
+    response_body: dict | list | None = Field(default=None, sa_column=Column(JSON))
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Lease of the request holding the key - a pending record past it (its process died) can be taken over
+    locked_until: datetime | None = Field(default=None)
+    expires_at: datetime = Field(index=True)
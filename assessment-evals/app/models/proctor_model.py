@@ -0,0 +1,13 @@
+from sqlmodel import SQLModel
+from datetime import datetime
+
+
+class ProctorQuizSnapshot(SQLModel):
+    quiz_id: int
+    started: int
+    in_progress: int
+    finished: int
+    total_answers: int
+    # question_id -> number of students who answered it
+    answers_per_question: dict[int, int]
+    updated_at: datetime
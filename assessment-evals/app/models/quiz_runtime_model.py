@@ -5,8 +5,6 @@ from datetime import datetime, timedelta
 
 from app.models.base import QuestionTypeEnum
 
-import random
-
 # TODO: Review when create quiz apis - LEAVING AS IT IS THE BELOW Models
 # ----------------------------
 # ----- Runtime Quiz Models for Validation & Serialization
@@ -40,11 +38,8 @@ class RuntimeQuizGenerated(SQLModel):
     total_points: int
     quiz_key: str
 
-    # Custom validator to shuffle the order of quiz_questions
-    @validator("quiz_questions", pre=True)
-    def shuffle_quiz_questions(cls, v):
-        random.shuffle(v)
-        return v
+    # quiz_questions are ordered per attempt using AnswerSheet.shuffle_seed
+    # See app.service.question_ordering
 
     # Custom validator to directly include question data
 
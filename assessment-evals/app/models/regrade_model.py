@@ -0,0 +1,39 @@
+from sqlmodel import Field, SQLModel
+from sqlalchemy import Sequence
+from datetime import datetime
+
+from app.models.base import BaseIdModel, RegradeJobStatus
+
+
+class RegradeJobBase(SQLModel):
+    question_id: int = Field(index=True)
+    status: RegradeJobStatus = Field(default=RegradeJobStatus.queued, index=True)
+
+    # Progress
+    total_slots: int | None = Field(default=None)
+    regraded_slots: int = Field(default=0)
+    changed_slots: int = Field(default=0)
+    refreshed_sheets: int = Field(default=0)
+
+    started_at: datetime | None = Field(default=None)
+    # A running job whose lease ran out is taken over by another worker - its worker died
+    lease_expires_at: datetime | None = Field(default=None)
+    finished_at: datetime | None = Field(default=None)
+    error: str | None = Field(default=None)
+
+
+class RegradeJob(BaseIdModel, RegradeJobBase, table=True):
+    pass
+
+
+# Answer key version - bumped on every answer key change, cached answer keys of older versions are not used
+answer_key_version_seq = Sequence("answerkey_version_seq", metadata=SQLModel.metadata)
+
+
+class RegradeJobRead(RegradeJobBase):
+    id: int
+    created_at: datetime | None
+
+
+class RegradeRequest(SQLModel):
+    question_id: int
@@ -0,0 +1,68 @@
+from sqlmodel import Field, SQLModel, Column, BigInteger, Index, text
+from sqlalchemy import Sequence
+from datetime import datetime
+
+from app.models.base import AttemptEventType
+
+MAX_EVENTS_PER_BATCH = 500
+
+
+class AttemptEvent(SQLModel, table=True):
+    """
+    Append only client telemetry of an Answer Sheet.
+    Range partitioned by received_at (one partition per month), the partition key is part of the primary key.
+    """
+    __table_args__ = (
+        Index("ix_attemptevent_answer_sheet_occurred", "answer_sheet_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (received_at)"},
+    )
+
+    id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            Sequence("attemptevent_id_seq"),
+            primary_key=True,
+            server_default=text("nextval('attemptevent_id_seq')"),
+        ),
+    )
+    received_at: datetime = Field(primary_key=True)
+    answer_sheet_id: int
+    # None for events not tied to a question (blur)
+    question_id: int | None = Field(default=None)
+    event_type: AttemptEventType
+    # Client clock
+    occurred_at: datetime
+
+
+class AttemptEventCreate(SQLModel):
+    question_id: int | None = None
+    event_type: AttemptEventType
+    occurred_at: datetime
+
+
+class AttemptEventBatch(SQLModel):
+    events: list[AttemptEventCreate] = Field(min_length=1, max_length=MAX_EVENTS_PER_BATCH)
+
+
+class AttemptEventBatchAccepted(SQLModel):
+    accepted: int
+
+
+class QuestionTimeOnTaskBase(SQLModel):
+    answer_sheet_id: int = Field(primary_key=True)
+    question_id: int = Field(primary_key=True)
+    time_spent_seconds: float = Field(default=0)
+    view_count: int = Field(default=0)
+    answer_changes: int = Field(default=0)
+
+
+class QuestionTimeOnTask(QuestionTimeOnTaskBase, table=True):
+    """
+    Per question time aggregates of a finished Answer Sheet, computed from its AttemptEvents
+    """
+    computed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class QuestionTimeOnTaskRead(QuestionTimeOnTaskBase):
+    pass
@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel
+from datetime import datetime
+
+
+class WaitingRoomStatus(SQLModel):
+    quiz_id: int
+    ticket: int
+    # Students still waiting ahead of this ticket
+    position: int
+    admitted: bool
+    admit_at: datetime
+    estimated_wait_seconds: int
+    # Suggested delay before polling again
+    poll_after_seconds: int
+
+
+class WaitingRoomAdmitted(SQLModel):
+    quiz_id: int
+    admitted: bool = True
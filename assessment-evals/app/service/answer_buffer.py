@@ -0,0 +1,53 @@
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.crud.answerslot_crud import crud_answer_slot
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Write Behind Answer Buffer
+# ----------------------------
+# With ANSWER_WRITE_BEHIND_ENABLED an answer save is one INSERT into answerslotstaging.
+# The flusher moves staged answers into answerslot in batches (DELETE .. RETURNING + COPY in one
+# transaction) and grades them. Staged rows are durable, so after a crash the next flush replays them.
+# Reads (resume, feedback) include staged answers; finishing or sweeping a sheet flushes it first.
+
+
+def flush_staged_answers() -> int:
+    """
+    Flush all staged answers in batches of ANSWER_FLUSH_BATCH_SIZE
+    """
+    flushed = 0
+    with Session(engine) as db_session:
+        while True:
+            try:
+                flushed_slots = crud_answer_slot_staging.flush_staged_answers(
+                    db_session, limit=settings.ANSWER_FLUSH_BATCH_SIZE
+                )
+                db_session.commit()
+            except Exception as e:
+                db_session.rollback()
+                raise e
+            if not flushed_slots:
+                break
+            flushed += len(flushed_slots)
+
+            # Grading needs the answer key, a failure here leaves the slots for finish / the deadline sweeper
+            try:
+                crud_answer_slot.grade_answer_slots_for_sheets(
+                    db_session=db_session,
+                    answer_sheet_ids=list({answer_sheet_id for _, answer_sheet_id in flushed_slots}),
+                    answer_slot_ids=[answer_slot_id for answer_slot_id, _ in flushed_slots],
+                )
+                db_session.commit()
+            except Exception as err:
+                db_session.rollback()
+                logger.error(f"Grading flushed Answer Slots Error: {err}")
+
+    if flushed:
+        logger.info(f"Flushed {flushed} staged Answer Slots")
+    return flushed
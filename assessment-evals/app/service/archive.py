@@ -0,0 +1,119 @@
+import json
+import zlib
+from datetime import datetime, timedelta
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.archive_crud import crud_answer_sheet_archive
+from app.models.answersheet_model import AnswerSheet, AnswerSheetRead, QuizFeedback
+from app.models.answerslot_model import AnswerSlot, AnswerSlotFeedback
+from app.models.archive_model import AnswerSheetArchive
+from app.models.telemetry_model import QuestionTimeOnTask, QuestionTimeOnTaskRead
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Attempt Archival
+# ----------------------------
+# Completed attempts older than ARCHIVE_AFTER_DAYS are moved out of answersheet & answerslot
+# into answersheetarchive: one zlib compressed JSON row per attempt in a yearly range partition.
+# The live tables (and their indexes) then only hold recent terms.
+# Read endpoints fall back to the archive when an attempt is no longer in the live tables.
+
+
+def pack_attempt(
+    answer_sheet: AnswerSheet, answer_slots: list[AnswerSlot], time_on_task: list[QuestionTimeOnTask] | None = None
+) -> bytes:
+    payload = {
+        "answer_sheet": AnswerSheetRead.model_validate(answer_sheet).model_dump(mode="json"),
+        "quiz_answers": [
+            AnswerSlotFeedback.model_validate(answer_slot).model_dump(mode="json") for answer_slot in answer_slots
+        ],
+        "quiz_snapshot": answer_sheet.quiz_snapshot,
+        "time_on_task": [
+            QuestionTimeOnTaskRead.model_validate(question_time).model_dump(mode="json")
+            for question_time in time_on_task or []
+        ],
+    }
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode(), level=9)
+
+
+def unpack_attempt(payload: bytes) -> dict:
+    return json.loads(zlib.decompress(payload))
+
+
+def archived_answer_sheet_read(archived: AnswerSheetArchive) -> AnswerSheetRead:
+    return AnswerSheetRead.model_validate(unpack_attempt(archived.payload)["answer_sheet"])
+
+
+def archived_quiz_feedback(archived: AnswerSheetArchive, include_questions: bool = True) -> QuizFeedback:
+    attempt = unpack_attempt(archived.payload)
+    quiz_questions = None
+    if include_questions and attempt["quiz_snapshot"] is not None:
+        quiz_questions = attempt["quiz_snapshot"]["quiz_questions"]
+    return QuizFeedback(
+        overview=attempt["answer_sheet"],
+        quiz_answers_attempted=attempt["quiz_answers"],
+        quiz_questions=quiz_questions,
+    )
+
+
+def archived_time_on_task(archived: AnswerSheetArchive) -> list[QuestionTimeOnTaskRead]:
+    # Attempts archived before time on task was kept in the payload have none
+    return [
+        QuestionTimeOnTaskRead.model_validate(question_time)
+        for question_time in unpack_attempt(archived.payload).get("time_on_task", [])
+    ]
+
+
+def archive_completed_attempts() -> int:
+    """
+    Archive completed Answer Sheets finished more than ARCHIVE_AFTER_DAYS ago, in batches of ARCHIVE_BATCH_SIZE
+    """
+    finished_before = datetime.utcnow() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    archived = 0
+    with Session(engine) as db_session:
+        while True:
+            answer_sheets = crud_answer_sheet_archive.claim_archivable_answer_sheets(
+                db_session, finished_before=finished_before, limit=settings.ARCHIVE_BATCH_SIZE
+            )
+            if not answer_sheets:
+                break
+
+            answer_slots: dict[int, list[AnswerSlot]] = {}
+            for answer_slot in crud_answer_sheet_archive.get_answer_slots_for_sheets(
+                db_session, [answer_sheet.id for answer_sheet in answer_sheets]
+            ):
+                answer_slots.setdefault(answer_slot.quiz_answer_sheet_id, []).append(answer_slot)
+            time_on_task: dict[int, list[QuestionTimeOnTask]] = {}
+            for question_time in crud_answer_sheet_archive.get_time_on_task_for_sheets(
+                db_session, [answer_sheet.id for answer_sheet in answer_sheets]
+            ):
+                time_on_task.setdefault(question_time.answer_sheet_id, []).append(question_time)
+
+            archived += crud_answer_sheet_archive.move_to_archive(
+                db_session,
+                [
+                    AnswerSheetArchive(
+                        id=answer_sheet.id,
+                        time_finish=answer_sheet.time_finish,
+                        student_id=answer_sheet.student_id,
+                        quiz_id=answer_sheet.quiz_id,
+                        quiz_key=answer_sheet.quiz_key,
+                        course_id=answer_sheet.course_id,
+                        time_start=answer_sheet.time_start,
+                        attempt_score=answer_sheet.attempt_score,
+                        total_points=answer_sheet.total_points,
+                        payload=pack_attempt(
+                            answer_sheet, answer_slots.get(answer_sheet.id, []), time_on_task.get(answer_sheet.id, [])
+                        ),
+                    )
+                    for answer_sheet in answer_sheets
+                ],
+            )
+
+    if archived:
+        logger.info(f"Archived {archived} completed Answer Sheets")
+    return archived
@@ -0,0 +1,48 @@
+from fastapi import BackgroundTasks
+from sqlmodel import Session
+
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.service.attempt_stream import publish_attempt_finished
+from app.service.proctor import record_attempt_finished
+from app.service.telemetry import record_time_on_task
+
+# ----------------------------
+# ----- Attempt Finished
+# ----------------------------
+# A sheet is finalized by /finish, by the deadline sweeper or by a late call finding it overdue.
+# Whichever path finalized it then pushes the finish event to open attempt streams, updates the
+# proctor dashboard and computes time on task from the attempt events.
+
+
+def attempts_finished(
+    finished_sheets: list[tuple[int, int]], finish_reason: str, background_tasks: BackgroundTasks | None = None
+):
+    """
+    Follow up of just finalized (answer_sheet_id, quiz_id) sheets,
+    time on task runs after the response when background_tasks is given
+    """
+    if not finished_sheets:
+        return
+    for answer_sheet_id, quiz_id in finished_sheets:
+        publish_attempt_finished(answer_sheet_id, finish_reason=finish_reason)
+        record_attempt_finished(quiz_id, answer_sheet_id)
+    answer_sheet_ids = [answer_sheet_id for answer_sheet_id, _ in finished_sheets]
+    if background_tasks is not None:
+        background_tasks.add_task(record_time_on_task, answer_sheet_ids)
+    else:
+        record_time_on_task(answer_sheet_ids)
+
+
+def is_answer_sheet_active(
+    db_session: Session, answer_sheet_id: int, student_id: int, background_tasks: BackgroundTasks | None = None
+) -> bool:
+    """
+    crud_answer_sheet.is_answer_sheet_active, following up an overdue sheet it finalized
+    """
+    active, finalized = crud_answer_sheet.check_answer_sheet_active(db_session, answer_sheet_id, student_id)
+    if finalized:
+        answer_sheet = crud_answer_sheet.get_answer_sheet_by_id(
+            db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_id
+        )
+        attempts_finished([(answer_sheet.id, answer_sheet.quiz_id)], "deadline", background_tasks)
+    return active
@@ -0,0 +1,67 @@
+import base64
+from datetime import datetime
+from sqlmodel import Session
+
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.service.archive import unpack_attempt
+from app.models.answersheet_model import (
+    AnswerSheetRead,
+    AttemptHistoryPage,
+    AttemptHistorySummary,
+    AttemptSummary,
+)
+
+# ----------------------------
+# ----- Attempt History
+# ----------------------------
+# History pages are keyset paginated on (time_start, id) newest first. The cursor is the
+# opaque encoding of the last row of a page, so deep pages cost the same as the first one.
+# The summary is computed in the database with a single ROLLUP over course_id.
+# Archived attempts are merged in with UNION ALL, their rows are read from the archive payload.
+
+
+def encode_history_cursor(time_start: datetime, answer_sheet_id: int) -> str:
+    raw = f"{time_start.isoformat()}|{answer_sheet_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    (time_start, id) of a cursor, ValueError when the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        time_start, answer_sheet_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(time_start), int(answer_sheet_id)
+    except (ValueError, UnicodeDecodeError) as err:
+        raise ValueError("Invalid History Cursor") from err
+
+
+def get_attempt_history_page(db: Session, student_id: int, limit: int, cursor: str | None = None) -> AttemptHistoryPage:
+    before = decode_history_cursor(cursor) if cursor else None
+    # One extra row tells whether there is a next page
+    rows = crud_answer_sheet.get_attempt_history(
+        db_session=db, student_id=student_id, limit=limit + 1, before=before
+    )
+    items = [
+        AnswerSheetRead.model_validate(
+            unpack_attempt(row["payload"])["answer_sheet"] if row["payload"] is not None else dict(row)
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_history_cursor(items[-1].time_start, items[-1].id)
+    return AttemptHistoryPage(items=items, next_cursor=next_cursor)
+
+
+def get_attempt_history_summary(db: Session, student_id: int) -> AttemptHistorySummary:
+    overall = AttemptSummary(course_id=None)
+    courses = []
+    for row in crud_answer_sheet.get_attempt_summary(db_session=db, student_id=student_id):
+        summary = AttemptSummary.model_validate(dict(row))
+        if row["is_overall"]:
+            overall = summary
+        else:
+            courses.append(summary)
+    return AttemptHistorySummary(overall=overall, courses=courses)
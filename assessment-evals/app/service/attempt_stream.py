@@ -0,0 +1,111 @@
+import asyncio
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlmodel import Session
+
+from app import settings
+from app.core.db_eng import engine
+from app.core.events import EventBus
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.models.base import QuizAttemptStatus
+from app.models.attempt_stream_model import AttemptStateEvent
+
+# ----------------------------
+# ----- Attempt State Stream
+# ----------------------------
+# An SSE stream per open attempt page pushes remaining time, answered count and the finish event.
+# The state is read from the DB once when the stream opens; after that it is kept in memory and
+# updated from events published by answer saves, finish and the deadline sweeper.
+# Each stream is one coroutine waiting on its queue, so a worker holds thousands of them.
+
+attempt_events = EventBus("attempt_state")
+
+
+@dataclass
+class AttemptState:
+    answer_sheet_id: int
+    status: QuizAttemptStatus | None
+    deadline: datetime | None
+    answered_count: int
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status == QuizAttemptStatus.completed
+
+    def remaining_seconds(self, now: datetime) -> int | None:
+        if self.deadline is None:
+            return None
+        return max(math.ceil((self.deadline - now).total_seconds()), 0)
+
+    def to_event(self, now: datetime, finish_reason: str | None = None) -> AttemptStateEvent:
+        return AttemptStateEvent(
+            answer_sheet_id=self.answer_sheet_id,
+            status=self.status,
+            deadline=self.deadline,
+            remaining_seconds=self.remaining_seconds(now),
+            answered_count=self.answered_count,
+            finish_reason=finish_reason,
+        )
+
+
+def load_attempt_state(answer_sheet_id: int, student_id: int) -> AttemptState:
+    with Session(engine) as db_session:
+        answer_sheet = crud_answer_sheet.get_answer_sheet_by_id(
+            db_session=db_session, answer_sheet_id=answer_sheet_id, student_id=student_id
+        )
+        if not answer_sheet:
+            raise ValueError("Quiz Attempt Not Found")
+        return AttemptState(
+            answer_sheet_id=answer_sheet.id,
+            status=answer_sheet.status,
+            deadline=answer_sheet.deadline,
+            answered_count=len(crud_answer_sheet.get_answered_question_ids(db_session, answer_sheet.id)),
+        )
+
+
+def publish_answer_saved(answer_sheet_id: int):
+    attempt_events.publish(answer_sheet_id, ("answered", None))
+
+
+def publish_attempt_finished(answer_sheet_id: int, finish_reason: str):
+    attempt_events.publish(answer_sheet_id, ("finished", finish_reason))
+
+
+def format_sse(event_type: str, event: AttemptStateEvent) -> str:
+    return f"event: {event_type}\ndata: {event.model_dump_json()}\n\n"
+
+
+async def attempt_state_events(state: AttemptState, queue: asyncio.Queue) -> AsyncIterator[str]:
+    """
+    SSE messages for an attempt until it is finished: state, then answered / tick events and a final finished event
+    """
+    try:
+        yield format_sse("state", state.to_event(datetime.utcnow()))
+        while not state.is_finished:
+            timeout = settings.ATTEMPT_STREAM_TICK_SECONDS
+            remaining = state.remaining_seconds(datetime.utcnow())
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+
+            try:
+                event_type, finish_reason = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                now = datetime.utcnow()
+                if state.deadline is not None and now >= state.deadline:
+                    state.status = QuizAttemptStatus.completed
+                    yield format_sse("finished", state.to_event(now, finish_reason="deadline"))
+                else:
+                    yield format_sse("tick", state.to_event(now))
+                continue
+
+            if event_type == "answered":
+                state.answered_count += 1
+                yield format_sse("answered", state.to_event(datetime.utcnow()))
+            elif event_type == "finished":
+                state.status = QuizAttemptStatus.completed
+                yield format_sse("finished", state.to_event(datetime.utcnow(), finish_reason=finish_reason))
+    finally:
+        attempt_events.unsubscribe(state.answer_sheet_id, queue)
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import combinations
+from typing import Sequence
+
+import numpy as np
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.collusion_crud import crud_collusion_scan
+from app.models.base import CollusionScanStatus
+from app.models.collusion_model import CollusionScan
+from app.service.grading import CompiledQuiz
+from app.service.prewarm import get_answer_key
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Collusion Detection
+# ----------------------------
+# Every completed attempt of a quiz is encoded as a bitset of the wrong options it selected
+# (bit i = option i of the quiz, options ordered by id). Sharing correct answers says little,
+# sharing the same wrong choices is what stands out.
+# Comparing all pairs is quadratic, so candidates come from MinHash signatures split into LSH
+# bands: two attempts are compared only when all rows of at least one band match. Candidates are
+# then scored with the exact Jaccard similarity of their bitsets and pairs above the threshold stored.
+
+# Universal hashing h(x) = (a * x + b) mod p, p < 2^31 keeps a * x + b within uint64
+_HASH_PRIME = np.uint64((1 << 31) - 1)
+
+
+@dataclass(frozen=True)
+class WrongAnswerSet:
+    answer_sheet_id: int
+    student_id: int
+    # Positions of the wrong options selected, ascending
+    positions: np.ndarray
+    bitset: int
+
+
+def encode_wrong_answers(
+    compiled_quiz: CompiledQuiz, selections: Sequence[tuple[int, int, int, Sequence[int]]]
+) -> list[WrongAnswerSet]:
+    """
+    Wrong option bitset per Answer Sheet from (answer sheet id, student id, question id, selected option ids) rows.
+    Options that do not belong to the question are ignored.
+    """
+    option_positions = {int(option_id): position for position, option_id in enumerate(compiled_quiz.option_ids)}
+
+    wrong_positions: dict[tuple[int, int], set[int]] = {}
+    for answer_sheet_id, student_id, question_id, selected_option_ids in selections:
+        answer_key = compiled_quiz.get(question_id)
+        if answer_key is None:
+            continue
+        wrong_mask = answer_key.selection_mask(selected_option_ids) & ~answer_key.correct_mask
+        positions = wrong_positions.setdefault((answer_sheet_id, student_id), set())
+        for bit, option_id in enumerate(answer_key.option_ids):
+            if wrong_mask >> bit & 1:
+                positions.add(option_positions[option_id])
+
+    return [
+        WrongAnswerSet(
+            answer_sheet_id=answer_sheet_id,
+            student_id=student_id,
+            positions=np.array(sorted(positions), dtype=np.uint64),
+            bitset=sum(1 << position for position in positions),
+        )
+        for (answer_sheet_id, student_id), positions in wrong_positions.items()
+        if positions
+    ]
+
+
+def minhash_signatures(feature_sets: Sequence[np.ndarray], num_permutations: int, seed: int = 0) -> np.ndarray:
+    """
+    MinHash signature (num_permutations values) per non empty feature set
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _HASH_PRIME, size=num_permutations, dtype=np.uint64)
+    b = rng.integers(0, _HASH_PRIME, size=num_permutations, dtype=np.uint64)
+
+    features = np.concatenate(feature_sets).astype(np.uint64)
+    starts = np.concatenate(([0], np.cumsum([len(feature_set) for feature_set in feature_sets])[:-1]))
+    hashes = (a[:, None] * features[None, :] + b[:, None]) % _HASH_PRIME
+    # Minimum hash of each set's segment of features, for every permutation
+    return np.minimum.reduceat(hashes, starts, axis=1).T
+
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int, max_bucket_size: int | None = None) -> set[tuple[int, int]]:
+    """
+    Index pairs whose signatures agree on every row of at least one band
+    """
+    rows_per_band = signatures.shape[1] // bands
+    candidates: set[tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: dict[bytes, list[int]] = {}
+        band_rows = np.ascontiguousarray(signatures[:, band * rows_per_band : (band + 1) * rows_per_band])
+        for index, band_row in enumerate(band_rows):
+            buckets.setdefault(band_row.tobytes(), []).append(index)
+
+        for bucket in buckets.values():
+            if max_bucket_size is not None and len(bucket) > max_bucket_size:
+                logger.warning(f"Skipping LSH bucket of {len(bucket)} attempts in band {band}")
+                continue
+            candidates.update(combinations(bucket, 2))
+    return candidates
+
+
+def jaccard(bitset_a: int, bitset_b: int) -> float:
+    union = (bitset_a | bitset_b).bit_count()
+    return (bitset_a & bitset_b).bit_count() / union if union else 0.0
+
+
+def find_similar_attempts(wrong_answer_sets: Sequence[WrongAnswerSet]) -> tuple[int, list[dict]]:
+    """
+    (candidate pair count, flagged pairs) for the wrong answer sets of a quiz
+    """
+    if len(wrong_answer_sets) < 2:
+        return 0, []
+
+    signatures = minhash_signatures(
+        [wrong_answers.positions for wrong_answers in wrong_answer_sets], settings.COLLUSION_MINHASH_PERMUTATIONS
+    )
+    candidates = lsh_candidate_pairs(signatures, settings.COLLUSION_LSH_BANDS, settings.COLLUSION_MAX_BUCKET_SIZE)
+
+    flagged_pairs = []
+    for index_a, index_b in candidates:
+        attempt_a, attempt_b = wrong_answer_sets[index_a], wrong_answer_sets[index_b]
+        if attempt_a.student_id == attempt_b.student_id:
+            continue
+        shared_wrong_answers = (attempt_a.bitset & attempt_b.bitset).bit_count()
+        similarity = jaccard(attempt_a.bitset, attempt_b.bitset)
+        if shared_wrong_answers >= settings.COLLUSION_MIN_SHARED_WRONG_ANSWERS and similarity >= settings.COLLUSION_JACCARD_THRESHOLD:
+            flagged_pairs.append(
+                {
+                    "answer_sheet_id_a": attempt_a.answer_sheet_id,
+                    "student_id_a": attempt_a.student_id,
+                    "answer_sheet_id_b": attempt_b.answer_sheet_id,
+                    "student_id_b": attempt_b.student_id,
+                    "shared_wrong_answers": shared_wrong_answers,
+                    "jaccard": round(similarity, 4),
+                }
+            )
+    return len(candidates), flagged_pairs
+
+
+# ----------------------------
+# ----- Collusion Scan Worker
+# ----------------------------
+
+
+def run_collusion_scan(db_session: Session, collusion_scan: CollusionScan):
+    try:
+        compiled_quiz = get_answer_key(collusion_scan.quiz_id)
+        wrong_answer_sets = encode_wrong_answers(
+            compiled_quiz, crud_collusion_scan.get_quiz_selections(db_session, collusion_scan.quiz_id)
+        )
+        candidate_pairs, flagged_pairs = find_similar_attempts(wrong_answer_sets)
+        crud_collusion_scan.replace_collusion_pairs(db_session, collusion_scan, flagged_pairs)
+
+        collusion_scan.scanned_sheets = len(wrong_answer_sets)
+        collusion_scan.candidate_pairs = candidate_pairs
+        collusion_scan.flagged_pairs = len(flagged_pairs)
+        collusion_scan.status = CollusionScanStatus.completed
+        collusion_scan.finished_at = datetime.utcnow()
+        db_session.add(collusion_scan)
+        db_session.commit()
+        logger.info(
+            f"Collusion Scan {collusion_scan.id} flagged {len(flagged_pairs)} of {candidate_pairs} candidate pairs "
+            f"for Quiz ID: {collusion_scan.quiz_id}"
+        )
+
+    except Exception as e:
+        db_session.rollback()
+        logger.error(f"run_collusion_scan Error for Collusion Scan {collusion_scan.id}: {e}")
+        collusion_scan.status = CollusionScanStatus.failed
+        collusion_scan.error = str(e)
+        collusion_scan.finished_at = datetime.utcnow()
+        db_session.add(collusion_scan)
+        db_session.commit()
+
+
+def process_collusion_scans() -> int:
+    """
+    Run queued Collusion Scans until none are left
+    """
+    processed = 0
+    with Session(engine) as db_session:
+        while (collusion_scan := crud_collusion_scan.claim_collusion_scan(db_session)) is not None:
+            run_collusion_scan(db_session, collusion_scan)
+            processed += 1
+    return processed
@@ -0,0 +1,40 @@
+from datetime import datetime
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.service.attempt_finish import attempts_finished
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Deadline Sweeper
+# ----------------------------
+# Attempts are only completed lazily when a student calls again. The sweeper periodically
+# finalizes in progress sheets past their deadline so results are ready right after the exam.
+# Each batch is claimed with FOR UPDATE SKIP LOCKED and committed on its own, so several
+# replicas can sweep at the same time without waiting on each other.
+
+
+def sweep_expired_answer_sheets() -> int:
+    """
+    Finalize all expired Answer Sheets in batches of DEADLINE_SWEEPER_BATCH_SIZE
+    """
+    finalized = 0
+    with Session(engine) as db_session:
+        while True:
+            expired_sheets = crud_answer_sheet.claim_expired_answer_sheets(
+                db_session, now=datetime.utcnow(), limit=settings.DEADLINE_SWEEPER_BATCH_SIZE
+            )
+            if not expired_sheets:
+                break
+            finalized += crud_answer_sheet.finalize_answer_sheets(
+                db_session, [answer_sheet_id for answer_sheet_id, _ in expired_sheets]
+            )
+            attempts_finished(expired_sheets, "deadline")
+
+    if finalized:
+        logger.info(f"Deadline Sweeper finalized {finalized} Answer Sheets")
+    return finalized
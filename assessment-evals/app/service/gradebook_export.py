@@ -0,0 +1,162 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+
+from sqlmodel import Session
+
+from app import settings
+from app.core.db_eng import engine
+from app.core.requests import get_course_quiz_ids
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.models.answersheet_model import AnswerSheetRead
+from app.models.export_model import ExportFormat, GRADEBOOK_COLUMNS
+from app.service.archive import unpack_attempt
+
+# ----------------------------
+# ----- Gradebook Export
+# ----------------------------
+# Answer Sheets of a quiz or course are read with a server side cursor (yield_per) and
+# serialized batch by batch, so an export of any size uses constant memory and the first
+# bytes (the header) are sent before the query has finished.
+# A course is exported through the ids of its quizzes (from Quiz Engine): Answer Sheets created
+# before quiz snapshots have no course_id. Archived attempts are rebuilt from their payload.
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional: pip install pyarrow
+    pa = None
+    pq = None
+
+
+def parquet_available() -> bool:
+    return pa is not None
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "name"):  # QuizAttemptStatus
+        return value.name
+    return value
+
+
+def _archived_gradebook_row(payload: bytes, include_question_points: bool) -> dict:
+    attempt = unpack_attempt(payload)
+    answer_sheet = AnswerSheetRead.model_validate(attempt["answer_sheet"])
+    row = {"answer_sheet_id": answer_sheet.id}
+    row.update({column: getattr(answer_sheet, column) for column in GRADEBOOK_COLUMNS[1:]})
+    if include_question_points:
+        # Same shape as json_object_agg of the live rows
+        row["question_points"] = {
+            str(answer_slot["question_id"]): answer_slot["points_awarded"] for answer_slot in attempt["quiz_answers"]
+        } or None
+    return row
+
+
+def _gradebook_row(row, include_question_points: bool) -> dict:
+    if row["payload"] is not None:
+        row = _archived_gradebook_row(row["payload"], include_question_points)
+    return {key: _export_value(value) for key, value in row.items() if key != "payload"}
+
+
+def gradebook_rows(*, quiz_ids: list[int], include_question_points: bool) -> Iterator[list[dict]]:
+    """
+    Gradebook rows in batches of EXPORT_BATCH_SIZE. Opens its own Session as it outlives the request handler.
+    """
+    with Session(engine) as db_session:
+        rows = crud_answer_sheet.stream_gradebook_rows(
+            db_session,
+            quiz_ids=quiz_ids,
+            include_question_points=include_question_points,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+        for partition in rows.partitions():
+            yield [_gradebook_row(row, include_question_points) for row in partition]
+
+
+def gradebook_columns(include_question_points: bool) -> list[str]:
+    return GRADEBOOK_COLUMNS + (["question_points"] if include_question_points else [])
+
+
+def export_csv(batches: Iterator[list[dict]], columns: list[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in batch:
+            if "question_points" in row:
+                row["question_points"] = json.dumps(row["question_points"] or {})
+            writer.writerow(row)
+        yield buffer.getvalue()
+
+
+def export_ndjson(batches: Iterator[list[dict]], columns: list[str]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(json.dumps(row) + "\n" for row in batch)
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write only file collecting the bytes ParquetWriter produces until they are sent
+    """
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def export_parquet(batches: Iterator[list[dict]], columns: list[str]) -> Iterator[bytes]:
+    string_columns = {"quiz_title", "quiz_key", "status", "time_start", "time_finish", "question_points"}
+    float_columns = {"attempt_score"}
+    schema = pa.schema(
+        [
+            (column, pa.string() if column in string_columns else pa.float64() if column in float_columns else pa.int64())
+            for column in columns
+        ]
+    )
+    sink = _ChunkSink()
+    # One row group per batch
+    with pq.ParquetWriter(sink, schema) as writer:
+        for batch in batches:
+            for row in batch:
+                if "question_points" in row:
+                    row["question_points"] = json.dumps(row["question_points"] or {})
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+EXPORTERS = {
+    ExportFormat.csv: (export_csv, "text/csv"),
+    ExportFormat.ndjson: (export_ndjson, "application/x-ndjson"),
+    ExportFormat.parquet: (export_parquet, "application/vnd.apache.parquet"),
+}
+
+
+def export_gradebook(
+    *, export_format: ExportFormat, quiz_id: int | None, course_id: int | None, include_question_points: bool
+) -> tuple[Iterator, str]:
+    """
+    (content iterator, media type) of a gradebook export
+    """
+    exporter, media_type = EXPORTERS[export_format]
+    # Resolved before streaming starts so a Quiz Engine error is still returned as the response
+    quiz_ids = [quiz_id] if quiz_id is not None else get_course_quiz_ids(course_id)
+    batches = gradebook_rows(quiz_ids=quiz_ids, include_question_points=include_question_points)
+    return exporter(batches, gradebook_columns(include_question_points)), media_type
@@ -0,0 +1,203 @@
+from dataclasses import dataclass
+from itertools import chain
+from typing import Callable, Sequence
+
+import numpy as np
+
+from app.models.base import QuestionTypeEnum
+
+# ----------------------------
+# ----- Grading Engine
+# ----------------------------
+# Each question's answer key is compiled once into a bitmask: option i of the question
+# (options ordered by id) is bit i, correct_mask has the bits of the correct options.
+# A selection is graded with bit operations and a batch of selections as NumPy uint64 arrays.
+# Scoring rules live in a registry keyed by question type so new types only add a scorer.
+
+MAX_OPTIONS_PER_QUESTION = 64
+
+
+@dataclass(frozen=True)
+class CompiledAnswerKey:
+    question_id: int
+    question_type: str
+    points: float
+    option_ids: tuple[int, ...]
+    correct_mask: int
+
+    @property
+    def correct_count(self) -> int:
+        return self.correct_mask.bit_count()
+
+    def selection_mask(self, selected_option_ids: Sequence[int]) -> int:
+        """
+        Bitmask of the selected options. Options not belonging to the question are ignored.
+        """
+        selected = set(selected_option_ids)
+        return sum(1 << bit for bit, option_id in enumerate(self.option_ids) if option_id in selected)
+
+
+def compile_answer_key(question: dict) -> CompiledAnswerKey:
+    """
+    Compile a quiz-engine question payload (options with is_correct) into an answer key
+    """
+    options = sorted(question["options"], key=lambda option: option["id"])
+    if len(options) > MAX_OPTIONS_PER_QUESTION:
+        raise ValueError(f"Question {question['id']} has more than {MAX_OPTIONS_PER_QUESTION} options")
+
+    return CompiledAnswerKey(
+        question_id=question["id"],
+        question_type=question["question_type"],
+        points=question["points"],
+        option_ids=tuple(option["id"] for option in options),
+        correct_mask=sum(1 << bit for bit, option in enumerate(options) if option["is_correct"]),
+    )
+
+
+# ----------------------------
+# ----- Scorer Registry
+# ----------------------------
+
+
+@dataclass(frozen=True)
+class Scorer:
+    # (answer key, selected mask) -> points
+    score: Callable[[CompiledAnswerKey, int], float]
+    # (selected masks, correct masks, points) arrays -> points array
+    score_batch: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+_scorers: dict[str, Scorer] = {}
+
+
+def register_scorer(question_type: str, scorer: Scorer):
+    _scorers[question_type] = scorer
+
+
+def get_scorer(question_type: str) -> Scorer:
+    if question_type not in _scorers:
+        raise ValueError(f"No scorer registered for question type: {question_type}")
+    return _scorers[question_type]
+
+
+# single_select_mcq: full points when exactly one option is selected and it is correct
+def _score_single_select(answer_key: CompiledAnswerKey, selected_mask: int) -> float:
+    if selected_mask.bit_count() == 1 and selected_mask & answer_key.correct_mask:
+        return answer_key.points
+    return 0
+
+
+def _score_single_select_batch(selected: np.ndarray, correct: np.ndarray, points: np.ndarray) -> np.ndarray:
+    is_correct = (np.bitwise_count(selected) == 1) & ((selected & correct) != 0)
+    return np.where(is_correct, points, 0.0)
+
+
+# multiple_select_mcq: points in proportion to the correct options selected
+def _score_multiple_select(answer_key: CompiledAnswerKey, selected_mask: int) -> float:
+    if not answer_key.correct_mask:
+        return 0
+    correct_selections = (selected_mask & answer_key.correct_mask).bit_count()
+    return round(correct_selections / answer_key.correct_count * answer_key.points, 2)
+
+
+def _score_multiple_select_batch(selected: np.ndarray, correct: np.ndarray, points: np.ndarray) -> np.ndarray:
+    correct_selections = np.bitwise_count(selected & correct).astype(np.float64)
+    correct_count = np.bitwise_count(correct).astype(np.float64)
+    partial_points = np.divide(
+        correct_selections * points, correct_count, out=np.zeros_like(points), where=correct_count > 0
+    )
+    return np.round(partial_points, 2)
+
+
+register_scorer(QuestionTypeEnum.single_select_mcq.value, Scorer(_score_single_select, _score_single_select_batch))
+register_scorer(QuestionTypeEnum.multiple_select_mcq.value, Scorer(_score_multiple_select, _score_multiple_select_batch))
+
+
+# ----------------------------
+# ----- Grading
+# ----------------------------
+
+
+def grade_answer(answer_key: CompiledAnswerKey, selected_option_ids: Sequence[int]) -> float:
+    """
+    Points awarded for the selected options of a single question
+    """
+    selected_mask = answer_key.selection_mask(selected_option_ids)
+    if not selected_mask:
+        return 0
+    return get_scorer(answer_key.question_type).score(answer_key, selected_mask)
+
+
+class CompiledQuiz:
+    """
+    Answer keys of a quiz with lookup arrays for grading batches of selections
+    """
+
+    def __init__(self, answer_keys: Sequence[CompiledAnswerKey]):
+        self.answer_keys = {answer_key.question_id: answer_key for answer_key in answer_keys}
+        ordered_keys = sorted(self.answer_keys.values(), key=lambda answer_key: answer_key.question_id)
+
+        self.question_ids = np.array([key.question_id for key in ordered_keys], dtype=np.int64)
+        self.correct_masks = np.array([key.correct_mask for key in ordered_keys], dtype=np.uint64)
+        self.points = np.array([key.points for key in ordered_keys], dtype=np.float64)
+        self.question_types = [key.question_type for key in ordered_keys]
+
+        # Option id -> (question, bit) lookup, option ids are unique across questions
+        options = sorted(
+            (option_id, key.question_id, bit)
+            for key in ordered_keys
+            for bit, option_id in enumerate(key.option_ids)
+        )
+        self.option_ids = np.array([option[0] for option in options], dtype=np.int64)
+        self.option_question_ids = np.array([option[1] for option in options], dtype=np.int64)
+        self.option_bits = np.array([1 << option[2] for option in options], dtype=np.uint64)
+
+    @classmethod
+    def from_questions(cls, questions: Sequence[dict]) -> "CompiledQuiz":
+        return cls([compile_answer_key(question) for question in questions])
+
+    def get(self, question_id: int) -> CompiledAnswerKey | None:
+        return self.answer_keys.get(question_id)
+
+    def selection_masks(self, question_ids: np.ndarray, selections: Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        Bitmask per selection. Options that do not belong to the selection's question are ignored.
+        """
+        masks = np.zeros(len(selections), dtype=np.uint64)
+        lengths = np.fromiter((len(selection) for selection in selections), dtype=np.int64, count=len(selections))
+        flat_option_ids = np.fromiter(chain.from_iterable(selections), dtype=np.int64, count=int(lengths.sum()))
+        if flat_option_ids.size == 0 or self.option_ids.size == 0:
+            return masks
+
+        slot_index = np.repeat(np.arange(len(selections)), lengths)
+        position = np.minimum(np.searchsorted(self.option_ids, flat_option_ids), self.option_ids.size - 1)
+        is_valid = (self.option_ids[position] == flat_option_ids) & (
+            self.option_question_ids[position] == question_ids[slot_index]
+        )
+        np.bitwise_or.at(masks, slot_index[is_valid], self.option_bits[position[is_valid]])
+        return masks
+
+    def grade_batch(self, question_ids: Sequence[int], selections: Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        Points for many (question_id, selected option ids) answers.
+        Answers to questions not in the quiz get NaN.
+        """
+        question_ids = np.asarray(question_ids, dtype=np.int64)
+        points_awarded = np.full(question_ids.size, np.nan)
+        if question_ids.size == 0 or self.question_ids.size == 0:
+            return points_awarded
+
+        question_index = np.minimum(np.searchsorted(self.question_ids, question_ids), self.question_ids.size - 1)
+        is_known = self.question_ids[question_index] == question_ids
+        selected = self.selection_masks(question_ids, selections)
+
+        for question_type in set(self.question_types):
+            type_index = np.flatnonzero(np.array(self.question_types) == question_type)
+            rows = np.flatnonzero(is_known & np.isin(question_index, type_index))
+            if rows.size == 0:
+                continue
+            key_index = question_index[rows]
+            points_awarded[rows] = get_scorer(question_type).score_batch(
+                selected[rows], self.correct_masks[key_index], self.points[key_index]
+            )
+        return points_awarded
@@ -0,0 +1,103 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.idempotency_crud import crud_idempotency_record
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Idempotency Keys
+# ----------------------------
+# A request sent with an Idempotency-Key header runs once per (student, key).
+# The response is stored for IDEMPOTENCY_TTL_SECONDS and a retry with the same key
+# gets the stored response back without running the request again.
+# Failed requests are not stored, retrying them runs the request again.
+# A claim is leased for IDEMPOTENCY_LEASE_SECONDS: when the process running the request dies
+# the record stays pending, and a retry after the lease takes the key over instead of a 409.
+
+
+def request_hash(route: str, request_body: Any) -> str:
+    body = json.dumps(jsonable_encoder(request_body), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{route}:{body}".encode()).hexdigest()
+
+
+def run_idempotent(
+    *,
+    db: Session,
+    student_id: int,
+    idempotency_key: str | None,
+    route: str,
+    request_body: Any,
+    response_model: type[BaseModel],
+    fn: Callable[[], Any],
+):
+    """
+    Run fn once for an Idempotency-Key. Requests without a key just run fn.
+    """
+    if idempotency_key is None:
+        return fn()
+
+    fingerprint = request_hash(route, request_body)
+    now = datetime.utcnow()
+    existing = crud_idempotency_record.claim_idempotency_key(
+        db,
+        student_id=student_id,
+        idempotency_key=idempotency_key,
+        request_hash=fingerprint,
+        expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS),
+        locked_until=now + timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS),
+    )
+    if existing is not None:
+        if existing.request_hash != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request",
+            )
+        if existing.status_code is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        logger.info(f"Replaying Idempotency-Key {idempotency_key} for Student ID: {student_id}")
+        return JSONResponse(
+            status_code=existing.status_code,
+            content=existing.response_body,
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    try:
+        response = fn()
+    except BaseException:
+        crud_idempotency_record.release_idempotency_key(
+            db, student_id=student_id, idempotency_key=idempotency_key
+        )
+        raise
+
+    crud_idempotency_record.complete_idempotency_key(
+        db,
+        student_id=student_id,
+        idempotency_key=idempotency_key,
+        status_code=status.HTTP_200_OK,
+        response_body=response_model.model_validate(response).model_dump(mode="json"),
+    )
+    return response
+
+
+def purge_expired_idempotency_records() -> int:
+    with Session(engine) as db_session:
+        purged = crud_idempotency_record.delete_expired_records(db_session, now=datetime.utcnow())
+    if purged:
+        logger.info(f"Purged {purged} expired Idempotency Records")
+    return purged
@@ -0,0 +1,150 @@
+import threading
+import time
+from sqlmodel import Session
+
+from app import settings
+from app.core.cache import TTLCache
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.core.requests import (
+    get_upcoming_quiz_settings,
+    get_quiz_answer_key,
+    get_runtime_quiz_questions_coalesced,
+)
+from app.crud.regrade_crud import crud_regrade_job
+from app.service.waiting_room import open_waiting_room
+from app.service.grading import CompiledAnswerKey, CompiledQuiz
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Quiz Prewarming
+# ----------------------------
+# Shortly before a QuizSetting opens the runtime quiz and answer key are fetched once
+# and kept in memory, so attempt creation and grading at start time do not each call quiz-engine.
+# Only the scheduler fills the caches; a miss falls back to the (coalesced) upstream call.
+#
+# Every process has its own caches. Entries are stored with the answer key version (a DB sequence
+# bumped by answer_key_changed) read before they were fetched, and are only used while that
+# version is still current - a change reported to any process invalidates the caches of all.
+
+# quiz_id -> (answer key version, runtime quiz)
+runtime_quiz_cache = TTLCache(ttl_seconds=settings.PREWARM_CACHE_TTL_SECONDS)
+# quiz_id -> (answer key version, CompiledQuiz)
+answer_key_cache = TTLCache(ttl_seconds=settings.PREWARM_CACHE_TTL_SECONDS)
+prewarmed_quiz_settings = TTLCache(ttl_seconds=settings.PREWARM_CACHE_TTL_SECONDS, max_size=1024)
+
+_answer_key_version_lock = threading.Lock()
+_answer_key_version: dict = {"version": None, "checked_at": None}
+
+
+def current_answer_key_version() -> int | None:
+    """
+    Answer key version from the database, read at most every ANSWER_KEY_VERSION_CHECK_SECONDS.
+    None when it cannot be read - nothing is cached or served from the caches then.
+    """
+    with _answer_key_version_lock:
+        checked_at = _answer_key_version["checked_at"]
+        if checked_at is not None and time.monotonic() - checked_at < settings.ANSWER_KEY_VERSION_CHECK_SECONDS:
+            return _answer_key_version["version"]
+        try:
+            with Session(engine) as db_session:
+                _answer_key_version["version"] = crud_regrade_job.get_answer_key_version(db_session)
+            _answer_key_version["checked_at"] = time.monotonic()
+        except Exception as err:
+            logger.error(f"current_answer_key_version Error: {err}")
+            _answer_key_version["version"] = None
+            _answer_key_version["checked_at"] = None
+        return _answer_key_version["version"]
+
+
+def forget_answer_key_version():
+    """
+    Read the version again on next use, after this process changed it
+    """
+    with _answer_key_version_lock:
+        _answer_key_version["checked_at"] = None
+
+
+def _get_current(cache: TTLCache, quiz_id: int):
+    entry = cache.get(quiz_id)
+    if entry is None:
+        return None
+    version, value = entry
+    if version != current_answer_key_version():
+        return None
+    return value
+
+
+def _set_current(cache: TTLCache, quiz_id: int, version: int | None, value):
+    if version is not None:
+        cache.set(quiz_id, (version, value))
+
+
+def cache_answer_key(quiz_id: int, compiled_quiz: CompiledQuiz):
+    """
+    Cache the compiled answer key of a quiz for the current answer key version
+    """
+    _set_current(answer_key_cache, quiz_id, current_answer_key_version(), compiled_quiz)
+
+
+def get_runtime_quiz(quiz_id: int) -> dict:
+    """
+    Runtime quiz from the prewarm cache or quiz-engine
+    """
+    runtime_quiz = _get_current(runtime_quiz_cache, quiz_id)
+    if runtime_quiz is not None:
+        return runtime_quiz
+    return get_runtime_quiz_questions_coalesced(quiz_id)
+
+
+def get_answer_key_question(quiz_id: int, question_id: int) -> CompiledAnswerKey | None:
+    """
+    Compiled answer key of a question from a prewarmed quiz, None when the quiz is not prewarmed
+    """
+    compiled_quiz = _get_current(answer_key_cache, quiz_id)
+    if compiled_quiz is None:
+        return None
+    return compiled_quiz.get(question_id)
+
+
+def get_answer_key(quiz_id: int) -> CompiledQuiz:
+    """
+    Compiled answer key of a quiz from the prewarm cache or quiz-engine
+    """
+    compiled_quiz = _get_current(answer_key_cache, quiz_id)
+    if compiled_quiz is not None:
+        return compiled_quiz
+    return CompiledQuiz.from_questions(get_quiz_answer_key(quiz_id))
+
+
+def prewarm_quiz(quiz_id: int):
+    """
+    Fetch and cache the runtime quiz and answer key of a quiz
+    """
+    # Read before fetching: a change made while fetching leaves the entries on an old version
+    version = current_answer_key_version()
+    _set_current(runtime_quiz_cache, quiz_id, version, get_runtime_quiz_questions_coalesced(quiz_id))
+    _set_current(answer_key_cache, quiz_id, version, CompiledQuiz.from_questions(get_quiz_answer_key(quiz_id)))
+
+
+def prewarm_quiz_setting(quiz_setting: dict):
+    """
+    Prewarm a QuizSetting once: quiz caches and its waiting room
+    """
+    setting_key = (quiz_setting["quiz_id"], quiz_setting["quiz_key"])
+    if setting_key in prewarmed_quiz_settings:
+        return
+
+    logger.info(f"Prewarming Quiz ID: {quiz_setting['quiz_id']} starting at {quiz_setting['start_time']}")
+    prewarm_quiz(quiz_setting["quiz_id"])
+    open_waiting_room(quiz_setting)
+    prewarmed_quiz_settings.set(setting_key, True)
+
+
+def prewarm_upcoming_quizzes():
+    for quiz_setting in get_upcoming_quiz_settings(within_minutes=settings.PREWARM_LEAD_MINUTES):
+        try:
+            prewarm_quiz_setting(quiz_setting)
+        except Exception as err:
+            logger.error(f"prewarm_quiz_setting Error for Quiz ID {quiz_setting['quiz_id']}: {err}")
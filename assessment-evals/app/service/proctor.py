@@ -0,0 +1,233 @@
+import asyncio
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlmodel import Session
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.core.events import EventBus
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.models.base import QuizAttemptStatus
+from app.models.proctor_model import ProctorQuizSnapshot
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Live Proctor Dashboard
+# ----------------------------
+# Per quiz counters (started, in progress, finished, answers per question) are kept in memory
+# while at least one dashboard is watching the quiz. They are registered when the first viewer
+# subscribes, seeded from the DB once and updated by attempt / save / finish events.
+# Every PROCTOR_BROADCAST_INTERVAL_SECONDS changed quizzes are serialized once and fanned out to
+# all viewers, so DB load and serialization do not grow with the number of viewers.
+
+proctor_events = EventBus("proctor")
+
+
+class QuizLiveCounters:
+    def __init__(
+        self,
+        quiz_id: int,
+        started_sheets: list[tuple[int, QuizAttemptStatus]] = (),
+        answered: list[tuple[int, int]] = (),
+    ):
+        self.quiz_id = quiz_id
+        self._lock = threading.Lock()
+        # Answer Sheet ids and (answer sheet id, question id) pairs, so an attempt or answer seen
+        # both by an event and by the DB seed, or by repeated events, is only counted once
+        self.in_progress_ids: set[int] = set()
+        self.finished_ids: set[int] = set()
+        self.answered: set[tuple[int, int]] = set()
+        self.answers_per_question: Counter[int] = Counter()
+        self.seeded = threading.Event()
+        self.updated_at = datetime.utcnow()
+        self.changed = False
+        if started_sheets or answered:
+            self.seed(started_sheets, answered)
+
+    def seed(self, started_sheets: list[tuple[int, QuizAttemptStatus]], answered: list[tuple[int, int]]):
+        """
+        Merge the DB state into the counters, events recorded before it are kept
+        """
+        with self._lock:
+            for answer_sheet_id, status in started_sheets:
+                if status == QuizAttemptStatus.completed:
+                    self.in_progress_ids.discard(answer_sheet_id)
+                    self.finished_ids.add(answer_sheet_id)
+                elif answer_sheet_id not in self.finished_ids:
+                    self.in_progress_ids.add(answer_sheet_id)
+            for answer_sheet_id, question_id in answered:
+                self._add_answer(answer_sheet_id, question_id)
+            self._touch()
+        self.seeded.set()
+
+    def attempt_started(self, answer_sheet_id: int):
+        with self._lock:
+            if answer_sheet_id not in self.finished_ids:
+                self.in_progress_ids.add(answer_sheet_id)
+                self._touch()
+
+    def answer_saved(self, answer_sheet_id: int, question_id: int):
+        with self._lock:
+            if self._add_answer(answer_sheet_id, question_id):
+                self._touch()
+
+    def _add_answer(self, answer_sheet_id: int, question_id: int) -> bool:
+        if (answer_sheet_id, question_id) in self.answered:
+            return False
+        self.answered.add((answer_sheet_id, question_id))
+        self.answers_per_question[question_id] += 1
+        return True
+
+    def attempt_finished(self, answer_sheet_id: int):
+        with self._lock:
+            if answer_sheet_id not in self.finished_ids:
+                self.in_progress_ids.discard(answer_sheet_id)
+                self.finished_ids.add(answer_sheet_id)
+                self._touch()
+
+    def _touch(self):
+        self.updated_at = datetime.utcnow()
+        self.changed = True
+
+    def take_changes(self) -> ProctorQuizSnapshot | None:
+        """
+        Snapshot if anything changed since the last call
+        """
+        with self._lock:
+            if not self.changed:
+                return None
+            self.changed = False
+        return self.snapshot()
+
+    def snapshot(self) -> ProctorQuizSnapshot:
+        with self._lock:
+            return ProctorQuizSnapshot(
+                quiz_id=self.quiz_id,
+                started=len(self.in_progress_ids) + len(self.finished_ids),
+                in_progress=len(self.in_progress_ids),
+                finished=len(self.finished_ids),
+                total_answers=sum(self.answers_per_question.values()),
+                answers_per_question=dict(self.answers_per_question),
+                updated_at=self.updated_at,
+            )
+
+
+_counters: dict[int, QuizLiveCounters] = {}
+_counters_lock = threading.Lock()
+
+
+def load_quiz_live_state(quiz_id: int) -> tuple[list[tuple[int, QuizAttemptStatus]], list[tuple[int, int]]]:
+    with Session(engine) as db_session:
+        return crud_answer_sheet.get_quiz_live_state(db_session, quiz_id)
+
+
+def get_quiz_snapshot(quiz_id: int) -> ProctorQuizSnapshot:
+    """
+    Live counters of a watched quiz, otherwise counted from the DB
+    """
+    counters = _counters.get(quiz_id) or QuizLiveCounters(quiz_id, *load_quiz_live_state(quiz_id))
+    return counters.snapshot()
+
+
+# ----- Events - no-ops for quizzes nobody is watching
+
+
+def record_attempt_started(quiz_id: int, answer_sheet_id: int):
+    if counters := _counters.get(quiz_id):
+        counters.attempt_started(answer_sheet_id)
+
+
+def record_answer_saved(quiz_id: int, answer_sheet_id: int, question_id: int):
+    if counters := _counters.get(quiz_id):
+        counters.answer_saved(answer_sheet_id, question_id)
+
+
+def record_attempt_finished(quiz_id: int, answer_sheet_id: int):
+    if counters := _counters.get(quiz_id):
+        counters.attempt_finished(answer_sheet_id)
+
+
+# ----- Fan out
+
+
+def format_snapshot_sse(snapshot: ProctorQuizSnapshot) -> str:
+    return f"event: counters\ndata: {snapshot.model_dump_json()}\n\n"
+
+
+def broadcast_proctor_counters() -> int:
+    """
+    Publish one serialized snapshot per changed quiz to all of its viewers
+    """
+    broadcast = 0
+    for quiz_id, counters in list(_counters.items()):
+        snapshot = counters.take_changes()
+        if snapshot is not None:
+            proctor_events.publish(quiz_id, format_snapshot_sse(snapshot))
+            broadcast += 1
+    return broadcast
+
+
+async def _seed_quiz_counters(quiz_id: int):
+    with _counters_lock:
+        counters = _counters.get(quiz_id)
+        first_viewer = counters is None
+        if first_viewer:
+            # Registered before the DB read so events published meanwhile are recorded,
+            # the seed is then merged into them
+            counters = _counters[quiz_id] = QuizLiveCounters(quiz_id)
+
+    if not first_viewer:
+        if not counters.seeded.is_set():
+            await asyncio.to_thread(counters.seeded.wait)
+        if _counters.get(quiz_id) is not counters:
+            # Seeding by the first viewer failed, try again
+            await _seed_quiz_counters(quiz_id)
+        return
+
+    try:
+        started_sheets, answered = await asyncio.to_thread(load_quiz_live_state, quiz_id)
+    except Exception:
+        with _counters_lock:
+            if _counters.get(quiz_id) is counters:
+                _counters.pop(quiz_id)
+        counters.seeded.set()
+        raise
+    counters.seed(started_sheets, answered)
+
+
+async def subscribe_quiz_dashboard(quiz_id: int) -> asyncio.Queue:
+    """
+    Subscribe a viewer, seeding the quiz counters when it is the first one
+    """
+    queue = proctor_events.subscribe(quiz_id)
+    try:
+        await _seed_quiz_counters(quiz_id)
+    except Exception:
+        unsubscribe_quiz_dashboard(quiz_id, queue)
+        raise
+    return queue
+
+
+def unsubscribe_quiz_dashboard(quiz_id: int, queue: asyncio.Queue):
+    proctor_events.unsubscribe(quiz_id, queue)
+    with _counters_lock:
+        # Counters are only kept up to date while watched, the next viewer seeds them again
+        if not proctor_events.has_subscribers(quiz_id):
+            _counters.pop(quiz_id, None)
+
+
+async def quiz_dashboard_events(quiz_id: int, queue: asyncio.Queue) -> AsyncIterator[str]:
+    try:
+        yield format_snapshot_sse(_counters[quiz_id].snapshot())
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=settings.PROCTOR_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        unsubscribe_quiz_dashboard(quiz_id, queue)
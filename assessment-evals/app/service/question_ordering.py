@@ -0,0 +1,51 @@
+import random
+import secrets
+
+# ----------------------------
+# ----- Deterministic Per Attempt Question & Option Ordering
+# ----------------------------
+# Each AnswerSheet stores a shuffle_seed. The order shown to the student is derived
+# from that seed so a resumed attempt always sees the same order.
+
+
+def new_shuffle_seed() -> int:
+    """
+    Generate a new seed to be stored on an AnswerSheet
+    """
+    return secrets.randbits(31)
+
+
+def attempt_seed(answer_sheet) -> int:
+    """
+    Seed for an AnswerSheet. Sheets created before seeds were stored fall back to their id.
+    """
+    if answer_sheet.shuffle_seed is not None:
+        return answer_sheet.shuffle_seed
+    return answer_sheet.id
+
+
+def _question_key(question) -> int:
+    return question["id"] if isinstance(question, dict) else question.id
+
+
+def order_quiz_questions(quiz_questions: list, seed: int) -> list:
+    """
+    Return quiz_questions and their options in the order for the given seed.
+
+    Questions are first put in a canonical (id) order so the upstream order does not matter.
+    Options are shuffled with a per question generator so the option order of a question
+    does not change when other questions are answered or removed.
+    """
+    ordered_questions = sorted(quiz_questions, key=_question_key)
+    random.Random(seed).shuffle(ordered_questions)
+
+    return [_order_options(question, seed) for question in ordered_questions]
+
+
+def _order_options(question, seed: int):
+    # Copy instead of mutating so a shared quiz snapshot is never reordered in place
+    if not isinstance(question, dict) or not question.get("options"):
+        return question
+    options = sorted(question["options"], key=lambda option: option["id"])
+    random.Random(f"{seed}:{question['id']}").shuffle(options)
+    return {**question, "options": options}
@@ -1,47 +1,112 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
+from pydantic import TypeAdapter
 
 from app.models.base import QuizAttemptStatus
-from app.models.answersheet_model import AnswerSheetCreate
-from app.core.requests import get_runtime_quiz_questions
+from app.models.answersheet_model import AnswerSheetCreate, AnswerSheetProvision, ProvisionAnswerSheetsResponse
 from app.models.quiz_runtime_model import RuntimeQuizGenerated
+from app.service.question_ordering import new_shuffle_seed, attempt_seed, order_quiz_questions
+from app.service.quiz_snapshot import build_quiz_snapshot, get_attempt_snapshot
+from app.service.prewarm import get_runtime_quiz, prewarm_quiz
+from app.service.proctor import record_attempt_started
+from app.service.attempt_finish import is_answer_sheet_active
+from app.core.requests import get_quiz_setting_coalesced
 
 from app.core.config import logger_config
 from app.crud.answersheet_crud import crud_answer_sheet
 
 logger = logger_config(__name__)
 
+time_limit_adapter = TypeAdapter(timedelta)
 
-def create_new_quiz_attempt(*, db: Session, student_id: int, quiz_id: int, quiz_key: str, quiz_key_validated) -> RuntimeQuizGenerated:
-    runtime_quiz = get_runtime_quiz_questions(quiz_id)
+
+def create_new_quiz_attempt(*, db: Session, student_id: int, quiz_id: int, quiz_key: str, quiz_key_validated, runtime_quiz) -> RuntimeQuizGenerated:
+    runtime_quiz = build_quiz_snapshot(runtime_quiz)
     answer_sheet = AnswerSheetCreate(
         student_id=student_id,
         quiz_id=quiz_id,
+        course_id=runtime_quiz["course_id"],
         quiz_key=quiz_key,
         time_limit=quiz_key_validated["time_limit"],
         total_points=runtime_quiz["total_points"],
         time_start=datetime.utcnow(),  # Use UTC time
         quiz_title=runtime_quiz["quiz_title"],
+        shuffle_seed=new_shuffle_seed(),
+        quiz_snapshot=runtime_quiz,
     )
     quiz_attempt_response = crud_answer_sheet.create_answer_sheet(db_session=db, answer_sheet_obj_in=answer_sheet)
+    record_attempt_started(quiz_id, quiz_attempt_response.id)
     return build_response_object(quiz_attempt=quiz_attempt_response, 
                                  runtime_quiz=runtime_quiz, 
                                  instructions=quiz_key_validated["instructions"])
 
 
+def provision_quiz_attempts(*, db: Session, quiz_id: int, quiz_key: str, student_ids: list[int]) -> ProvisionAnswerSheetsResponse:
+    """
+    Create to_attempt Answer Sheets for a roster in one batch so POST /attempt only activates them
+    """
+    quiz_setting = get_quiz_setting_coalesced(quiz_id=quiz_id, quiz_key=quiz_key)
+    prewarm_quiz(quiz_id)
+    runtime_quiz = build_quiz_snapshot(get_runtime_quiz(quiz_id))
+
+    student_ids = list(dict.fromkeys(student_ids))
+    provisioned_ids = crud_answer_sheet.get_provisioned_student_ids(db, quiz_id, quiz_key, student_ids)
+    answer_sheets = [
+        AnswerSheetProvision(
+            student_id=student_id,
+            quiz_id=quiz_id,
+            course_id=runtime_quiz["course_id"],
+            quiz_key=quiz_key,
+            time_limit=quiz_setting["time_limit"],
+            total_points=runtime_quiz["total_points"],
+            quiz_title=runtime_quiz["quiz_title"],
+            shuffle_seed=new_shuffle_seed(),
+            quiz_snapshot=runtime_quiz,
+        )
+        for student_id in student_ids
+        if student_id not in provisioned_ids
+    ]
+    logger.info(f"Provisioning {len(answer_sheets)} Answer Sheets for Quiz ID: {quiz_id}")
+    provisioned = crud_answer_sheet.bulk_create_answer_sheets(db_session=db, answer_sheets_in=answer_sheets)
+
+    return ProvisionAnswerSheetsResponse(
+        quiz_id=quiz_id, quiz_key=quiz_key, provisioned=provisioned, already_provisioned=len(provisioned_ids)
+    )
+
+
+def activate_provisioned_quiz_attempt(*, db: Session, attempt_sheet, student_id: int, quiz_key_validated) -> RuntimeQuizGenerated:
+    """
+    Start a pre-provisioned Answer Sheet - a single UPDATE, questions come from its snapshot
+    """
+    activated = crud_answer_sheet.activate_answer_sheet(
+        db_session=db,
+        answer_sheet=attempt_sheet,
+        time_limit=time_limit_adapter.validate_python(quiz_key_validated["time_limit"]),
+    )
+    if not activated:
+        # Another request started it first - continue as a resume
+        return handle_in_progress_quiz_attempt(db=db, attempt_sheet=attempt_sheet, student_id=student_id, quiz_key_validated=quiz_key_validated)
+
+    record_attempt_started(attempt_sheet.quiz_id, attempt_sheet.id)
+    return build_response_object(quiz_attempt=attempt_sheet,
+                                 runtime_quiz=get_attempt_snapshot(db=db, answer_sheet=attempt_sheet),
+                                 instructions=quiz_key_validated["instructions"])
+
+
 def handle_in_progress_quiz_attempt(*, db: Session, attempt_sheet, student_id: int, quiz_key_validated) -> RuntimeQuizGenerated:
     if attempt_sheet.status == QuizAttemptStatus.completed:
         print("Quiz Attempt Already Completed")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You have already attempted this quiz.")
     elif attempt_sheet.status == QuizAttemptStatus.in_progress:
         # Additional check to ensure the quiz attempt is still active
-        quiz_attempt = crud_answer_sheet.is_answer_sheet_active(
+        quiz_attempt = is_answer_sheet_active(
             db_session=db,
             answer_sheet_id=attempt_sheet.id,
             student_id=student_id,
         )
-        if quiz_attempt is False:            
+        if quiz_attempt is False:
+            # Time ran out - the check above just completed the attempt
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Quiz Attempt Finished",
@@ -53,9 +118,12 @@ def handle_in_progress_quiz_attempt(*, db: Session, attempt_sheet, student_id: i
 
 def resume_quiz_attempt(*, db: Session, attempt_sheet, quiz_key_validated):
 
-    quiz_feedback = crud_answer_sheet.get_quiz_feedback(db, attempt_sheet.id, attempt_sheet.student_id)
-    runtime_quiz = get_runtime_quiz_questions(attempt_sheet.quiz_id)
-    remaining_questions = filter_answered_questions(runtime_quiz['quiz_questions'], quiz_feedback.quiz_answers)
+    # Questions come from the snapshot stored with the attempt - no quiz-engine call on resume
+    runtime_quiz = get_attempt_snapshot(db=db, answer_sheet=attempt_sheet)
+    answered_ids = crud_answer_sheet.get_answered_question_ids(db, attempt_sheet.id)
+    # Order first then filter so remaining questions keep the same relative order on every resume
+    ordered_questions = order_quiz_questions(runtime_quiz['quiz_questions'], attempt_seed(attempt_sheet))
+    remaining_questions = filter_answered_questions(ordered_questions, answered_ids)
 
     return build_response_object(quiz_attempt=attempt_sheet, 
                                  runtime_quiz=runtime_quiz, 
@@ -63,14 +131,13 @@ def resume_quiz_attempt(*, db: Session, attempt_sheet, quiz_key_validated):
                                  instructions=quiz_key_validated["instructions"])
 
 
-def filter_answered_questions(all_questions, answered_questions):
-    answered_ids = {answer.question_id for answer in answered_questions}
+def filter_answered_questions(all_questions, answered_ids: set[int]):
     return [question for question in all_questions if question['id'] not in answered_ids]
 
 
 def build_response_object(*, quiz_attempt, runtime_quiz, remaining_questions=None, instructions=None) -> RuntimeQuizGenerated:
     if remaining_questions is None:
-        remaining_questions = runtime_quiz['quiz_questions']
+        remaining_questions = order_quiz_questions(runtime_quiz['quiz_questions'], attempt_seed(quiz_attempt))
         
     if instructions is None:
         instructions = "Attempt the quiz."
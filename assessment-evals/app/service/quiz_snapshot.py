@@ -0,0 +1,84 @@
+from sqlalchemy.orm import Session
+
+from app.core.config import logger_config
+from app.service.prewarm import get_runtime_quiz
+from app.models.base import QuestionTypeEnum
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Per Attempt Quiz Snapshot
+# ----------------------------
+# The runtime quiz is copied onto the AnswerSheet when an attempt is created.
+# Resume, answer validation and feedback read from it instead of calling quiz-engine again,
+# and a quiz edited mid attempt does not change what the student sees.
+# Answer keys are never stored in the snapshot.
+
+
+def build_quiz_snapshot(runtime_quiz: dict) -> dict:
+    """
+    Compact copy of the runtime quiz keeping only the fields shown to the student
+    """
+    return {
+        "quiz_title": runtime_quiz["quiz_title"],
+        "course_id": runtime_quiz["course_id"],
+        "total_points": runtime_quiz["total_points"],
+        "quiz_questions": [
+            {
+                "id": question["id"],
+                "question_text": question["question_text"],
+                "points": question["points"],
+                "question_type": question["question_type"],
+                "options": [
+                    {"id": option["id"], "option_text": option["option_text"]}
+                    for option in question.get("options", [])
+                ],
+            }
+            for question in runtime_quiz["quiz_questions"]
+        ],
+    }
+
+
+def get_attempt_snapshot(*, db: Session, answer_sheet) -> dict:
+    """
+    Snapshot for an AnswerSheet.
+    Sheets created before snapshots were stored get one built from quiz-engine on first use.
+    """
+    if answer_sheet.quiz_snapshot is not None:
+        return answer_sheet.quiz_snapshot
+
+    logger.info(f"Backfilling quiz snapshot for AnswerSheet ID: {answer_sheet.id}")
+    answer_sheet.quiz_snapshot = build_quiz_snapshot(get_runtime_quiz(answer_sheet.quiz_id))
+    db.add(answer_sheet)
+    db.commit()
+    db.refresh(answer_sheet)
+    return answer_sheet.quiz_snapshot
+
+
+def find_snapshot_question(snapshot: dict, question_id: int) -> dict | None:
+    return next(
+        (question for question in snapshot["quiz_questions"] if question["id"] == question_id),
+        None,
+    )
+
+
+def validate_answer_against_snapshot(snapshot: dict, quiz_answer_slot) -> None:
+    """
+    Check an answer references a question of this attempt and only that question's options
+    """
+    question = find_snapshot_question(snapshot, quiz_answer_slot.question_id)
+    if question is None:
+        raise ValueError("Question is not part of this Quiz Attempt")
+
+    if quiz_answer_slot.question_type != question["question_type"]:
+        raise ValueError("Question Type does not match the Quiz Question")
+
+    option_ids = {option["id"] for option in question["options"]}
+    if not set(quiz_answer_slot.selected_options_ids) <= option_ids:
+        raise ValueError("Selected Options do not belong to the Quiz Question")
+
+    if (
+        question["question_type"] == QuestionTypeEnum.single_select_mcq
+        and len(quiz_answer_slot.selected_options_ids) > 1
+    ):
+        raise ValueError("Only one option can be selected for this Question")
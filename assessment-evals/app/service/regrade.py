@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from sqlmodel import Session, update
+
+from app import settings
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.core.requests import get_question
+from app.crud.regrade_crud import crud_regrade_job
+from app.models.answerslot_model import AnswerSlot
+from app.models.base import RegradeJobStatus
+from app.models.regrade_model import RegradeJob
+from app.service.grading import CompiledQuiz, compile_answer_key
+from app.service.prewarm import forget_answer_key_version
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Bulk Regrade on Answer Key Change
+# ----------------------------
+# quiz-engine reports questions whose answer key changed (is_correct, options, points).
+# A RegradeJob is queued and processed by a background worker, never by a web request:
+# all Answer Slots of the question are regraded in keyset batches with the batch grader,
+# changed points are written with one bulk UPDATE per batch and the scores of the affected
+# completed Answer Sheets are recomputed in one UPDATE. Progress is stored on the job.
+# A claimed job holds a lease of REGRADE_LEASE_SECONDS, renewed with every batch; when its
+# worker dies the lease runs out and another worker takes the job over.
+
+
+def regrade_lease_expires_at() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=settings.REGRADE_LEASE_SECONDS)
+
+
+def answer_key_changed(*, db_session: Session, question_id: int) -> RegradeJob:
+    """
+    Invalidate cached answer keys in every process and queue a regrade for the question
+    """
+    crud_regrade_job.bump_answer_key_version(db_session)
+    forget_answer_key_version()
+    return crud_regrade_job.enqueue_regrade_job(db_session=db_session, question_id=question_id)
+
+
+def run_regrade_job(db_session: Session, regrade_job: RegradeJob):
+    try:
+        compiled_quiz = CompiledQuiz([compile_answer_key(get_question(regrade_job.question_id))])
+
+        after_id = 0
+        while True:
+            answer_slots = crud_regrade_job.get_question_slots_batch(
+                db_session, regrade_job.question_id, after_id=after_id, limit=settings.REGRADE_BATCH_SIZE
+            )
+            if not answer_slots:
+                break
+
+            points_awarded = compiled_quiz.grade_batch(
+                [regrade_job.question_id] * len(answer_slots),
+                [selected_option_ids for _, _, _, selected_option_ids in answer_slots],
+            )
+            changed_points = [
+                {"id": slot_id, "points_awarded": float(points)}
+                for (slot_id, _, previous_points, _), points in zip(answer_slots, points_awarded)
+                if points != previous_points
+            ]
+            if changed_points:
+                db_session.execute(update(AnswerSlot), changed_points)
+                changed_ids = {point["id"] for point in changed_points}
+                changed_sheet_ids = list({sheet_id for slot_id, sheet_id, _, _ in answer_slots if slot_id in changed_ids})
+                regrade_job.refreshed_sheets += crud_regrade_job.refresh_attempt_scores(db_session, changed_sheet_ids)
+
+            regrade_job.regraded_slots += len(answer_slots)
+            regrade_job.changed_slots += len(changed_points)
+            regrade_job.lease_expires_at = regrade_lease_expires_at()
+            db_session.add(regrade_job)
+            db_session.commit()
+            after_id = answer_slots[-1][0]
+
+        regrade_job.status = RegradeJobStatus.completed
+        regrade_job.finished_at = datetime.utcnow()
+        regrade_job.lease_expires_at = None
+        db_session.add(regrade_job)
+        db_session.commit()
+        logger.info(f"Regrade Job {regrade_job.id} changed {regrade_job.changed_slots} of {regrade_job.regraded_slots} slots")
+
+    except Exception as e:
+        db_session.rollback()
+        logger.error(f"run_regrade_job Error for Regrade Job {regrade_job.id}: {e}")
+        regrade_job.status = RegradeJobStatus.failed
+        regrade_job.error = str(e)
+        regrade_job.finished_at = datetime.utcnow()
+        regrade_job.lease_expires_at = None
+        db_session.add(regrade_job)
+        db_session.commit()
+
+
+def process_regrade_jobs() -> int:
+    """
+    Run queued Regrade Jobs until none are left
+    """
+    processed = 0
+    with Session(engine) as db_session:
+        while (
+            regrade_job := crud_regrade_job.claim_regrade_job(
+                db_session, now=datetime.utcnow(), lease_expires_at=regrade_lease_expires_at()
+            )
+        ) is not None:
+            run_regrade_job(db_session, regrade_job)
+            processed += 1
+    return processed
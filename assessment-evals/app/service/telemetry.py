@@ -0,0 +1,144 @@
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from sqlmodel import Session
+
+from app import settings
+from app.core.cache import TTLCache
+from app.core.config import logger_config
+from app.core.db_eng import engine
+from app.crud.telemetry_crud import crud_attempt_telemetry
+from app.models.base import QuizAttemptStatus
+from app.models.telemetry_model import AttemptEventBatch
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Attempt Telemetry
+# ----------------------------
+# View, answer change and blur events are accepted in batches from the attempt page and only
+# appended to an in memory buffer, so ingestion never touches the answer save path or the database.
+# The flusher COPYs the buffer into the monthly partitioned attemptevent table.
+# Per question time on task is computed when a sheet finishes and recomputed when late events
+# of a completed sheet are flushed. Buffered events are lost on a crash - it is telemetry.
+
+
+class EventBuffer:
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._events: deque[tuple] = deque()
+        self.dropped = 0
+
+    def add(self, events: list[tuple]) -> int:
+        """
+        Buffer events, returns how many were accepted. Events over max_events are dropped.
+        """
+        with self._lock:
+            accepted = events[: max(self.max_events - len(self._events), 0)]
+            self._events.extend(accepted)
+            self.dropped += len(events) - len(accepted)
+            return len(accepted)
+
+    def drain(self, limit: int | None = None) -> list[tuple]:
+        with self._lock:
+            count = len(self._events) if limit is None else min(limit, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    def requeue(self, events: list[tuple]):
+        """
+        Put events back in front of the buffer after a failed flush
+        """
+        with self._lock:
+            self._events.extendleft(reversed(events[: max(self.max_events - len(self._events), 0)]))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+event_buffer = EventBuffer(max_events=settings.TELEMETRY_BUFFER_MAX_EVENTS)
+# answer_sheet_id -> student_id of in progress sheets, saves a lookup per batch
+_in_progress_owners = TTLCache(ttl_seconds=30, max_size=10000)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Answer Sheet times are naive UTC
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def ingest_attempt_events(db: Session, *, student_id: int, answer_sheet_id: int, batch: AttemptEventBatch) -> int:
+    """
+    Buffer a batch of events of an in progress Answer Sheet, returns how many were accepted
+    """
+    owner_id = _in_progress_owners.get(answer_sheet_id)
+    if owner_id is None:
+        answer_sheet = crud_attempt_telemetry.get_answer_sheet_owner(db, answer_sheet_id)
+        if answer_sheet is None or answer_sheet.status != QuizAttemptStatus.in_progress:
+            raise ValueError("Quiz Time has Ended or Invalid Quiz Attempt ID")
+        owner_id = answer_sheet.student_id
+        _in_progress_owners.set(answer_sheet_id, owner_id)
+    if owner_id != student_id:
+        raise ValueError("Quiz Time has Ended or Invalid Quiz Attempt ID")
+
+    received_at = datetime.utcnow()
+    accepted = event_buffer.add(
+        [
+            (
+                received_at,
+                answer_sheet_id,
+                event.question_id,
+                event.event_type.name,
+                _naive_utc(event.occurred_at),
+            )
+            for event in batch.events
+        ]
+    )
+    if accepted < len(batch.events):
+        logger.warning(f"Telemetry buffer full, dropped {len(batch.events) - accepted} events of Answer Sheet {answer_sheet_id}")
+    return accepted
+
+
+def flush_attempt_events() -> int:
+    """
+    COPY buffered events into attemptevent and refresh time on task of completed sheets among them
+    """
+    events = event_buffer.drain()
+    if not events:
+        return 0
+
+    answer_sheet_ids = list({event[1] for event in events})
+    with Session(engine) as db_session:
+        try:
+            crud_attempt_telemetry.copy_attempt_events(db_session, events)
+            db_session.commit()
+        except Exception as e:
+            db_session.rollback()
+            event_buffer.requeue(events)
+            raise e
+
+        try:
+            crud_attempt_telemetry.compute_time_on_task(
+                db_session, answer_sheet_ids, max_view_seconds=settings.TELEMETRY_MAX_VIEW_SECONDS
+            )
+            db_session.commit()
+        except Exception as err:
+            db_session.rollback()
+            logger.error(f"compute_time_on_task Error: {err}")
+    return len(events)
+
+
+def record_time_on_task(answer_sheet_ids: list[int]):
+    """
+    Flush buffered events and compute time on task of finished Answer Sheets
+    """
+    try:
+        flush_attempt_events()
+        with Session(engine) as db_session:
+            crud_attempt_telemetry.compute_time_on_task(
+                db_session, answer_sheet_ids, max_view_seconds=settings.TELEMETRY_MAX_VIEW_SECONDS
+            )
+            db_session.commit()
+    except Exception as err:
+        logger.error(f"record_time_on_task Error for Answer Sheets {answer_sheet_ids}: {err}")
@@ -0,0 +1,165 @@
+import math
+import threading
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, status
+
+from app import settings
+from app.core.config import logger_config
+from app.core.requests import get_quiz_setting_coalesced
+from app.models.waiting_room_model import WaitingRoomStatus
+
+logger = logger_config(__name__)
+
+# ----------------------------
+# ----- Exam Waiting Room
+# ----------------------------
+# For a QuizSetting with waiting_room_enabled students get a ticket in arrival order.
+# Ticket n is admitted at start_time + n / admission_rate, so admission, queue position
+# and estimated wait are computed without any per student bookkeeping beyond the ticket.
+# Rooms are kept in process memory and dropped once the quiz has ended.
+
+
+class WaitingRoom:
+    def __init__(self, *, quiz_id: int, quiz_key: str, start_time: datetime, end_time: datetime | None, admission_rate: int):
+        self.quiz_id = quiz_id
+        self.quiz_key = quiz_key
+        self.start_time = start_time
+        self.end_time = end_time
+        self.admission_rate = admission_rate
+        self._lock = threading.Lock()
+        self._tickets: dict[int, int] = {}
+        self._next_ticket = 0
+
+    def admitted_count(self, now: datetime) -> int:
+        """
+        Number of tickets admitted by now
+        """
+        if now < self.start_time:
+            return 0
+        elapsed = (now - self.start_time).total_seconds()
+        return math.floor(elapsed * self.admission_rate) + 1
+
+    def admit_at(self, ticket: int) -> datetime:
+        return self.start_time + timedelta(seconds=ticket / self.admission_rate)
+
+    def join(self, student_id: int, now: datetime) -> int:
+        """
+        Ticket for a student. Joining again keeps the original ticket.
+        """
+        with self._lock:
+            if student_id not in self._tickets:
+                # Late arrivals take the latest open slot instead of queueing behind slots that have passed
+                ticket = max(self._next_ticket, self.admitted_count(now) - 1)
+                self._tickets[student_id] = ticket
+                self._next_ticket = ticket + 1
+            return self._tickets[student_id]
+
+    def get_ticket(self, student_id: int) -> int | None:
+        return self._tickets.get(student_id)
+
+    def status(self, student_id: int, now: datetime) -> WaitingRoomStatus:
+        ticket = self._tickets[student_id]
+        admitted_count = self.admitted_count(now)
+        admitted = ticket < admitted_count
+        admit_at = self.admit_at(ticket)
+        estimated_wait = 0 if admitted else math.ceil((admit_at - now).total_seconds())
+        return WaitingRoomStatus(
+            quiz_id=self.quiz_id,
+            ticket=ticket,
+            position=max(ticket - admitted_count, 0),
+            admitted=admitted,
+            admit_at=admit_at,
+            estimated_wait_seconds=estimated_wait,
+            poll_after_seconds=min(max(estimated_wait, 1), settings.WAITING_ROOM_MAX_POLL_SECONDS),
+        )
+
+    def is_closed(self, now: datetime) -> bool:
+        return self.end_time is not None and now > self.end_time
+
+
+def _parse_quiz_time(value: str | None) -> datetime | None:
+    # quiz-engine stores naive datetimes, drop any offset so they compare with datetime.now()
+    return datetime.fromisoformat(value).replace(tzinfo=None) if value else None
+
+
+_rooms: dict[tuple[int, str], WaitingRoom] = {}
+_rooms_lock = threading.Lock()
+
+
+def _prune_closed_rooms(now: datetime):
+    for room_key in [room_key for room_key, room in _rooms.items() if room.is_closed(now)]:
+        logger.info(f"Closing Waiting Room for Quiz ID: {room_key[0]}")
+        del _rooms[room_key]
+
+
+def get_waiting_room(quiz_id: int, quiz_key: str) -> WaitingRoom | None:
+    """
+    Waiting room already opened for a quiz key, no upstream call
+    """
+    return _rooms.get((quiz_id, quiz_key))
+
+
+def open_waiting_room(quiz_setting: dict) -> WaitingRoom | None:
+    """
+    Waiting room for a QuizSetting or None when the waiting room is not enabled for it
+    """
+    if not quiz_setting.get("waiting_room_enabled") or not quiz_setting.get("start_time"):
+        return None
+
+    room_key = (quiz_setting["quiz_id"], quiz_setting["quiz_key"])
+    with _rooms_lock:
+        _prune_closed_rooms(datetime.now())
+        if room_key not in _rooms:
+            _rooms[room_key] = WaitingRoom(
+                quiz_id=quiz_setting["quiz_id"],
+                quiz_key=quiz_setting["quiz_key"],
+                start_time=_parse_quiz_time(quiz_setting["start_time"]),
+                end_time=_parse_quiz_time(quiz_setting.get("end_time")),
+                admission_rate=quiz_setting.get("admission_rate") or settings.WAITING_ROOM_DEFAULT_ADMISSION_RATE,
+            )
+        return _rooms[room_key]
+
+
+def join_waiting_room(*, student_id: int, quiz_id: int, quiz_key: str) -> WaitingRoomStatus | None:
+    """
+    Get a ticket for the quiz. Returns None when the quiz has no waiting room.
+    """
+    room = get_waiting_room(quiz_id, quiz_key)
+    if room is None:
+        room = open_waiting_room(get_quiz_setting_coalesced(quiz_id=quiz_id, quiz_key=quiz_key))
+    if room is None:
+        return None
+
+    # Quiz times are compared in the same clock quiz-engine uses to validate the quiz key
+    now = datetime.now()
+    room.join(student_id, now)
+    return room.status(student_id, now)
+
+
+def get_waiting_room_status(*, student_id: int, quiz_id: int, quiz_key: str) -> WaitingRoomStatus:
+    """
+    Queue position and estimated wait for a student holding a ticket
+    """
+    room = get_waiting_room(quiz_id, quiz_key)
+    if room is None or room.get_ticket(student_id) is None:
+        raise ValueError("No Waiting Room Ticket Found for this Quiz")
+    return room.status(student_id, datetime.now())
+
+
+def ensure_admitted(*, room: WaitingRoom | None, student_id: int):
+    """
+    Raise 429 with Retry-After when a student has not been admitted from the waiting room yet
+    """
+    if room is None:
+        return
+
+    now = datetime.now()
+    room.join(student_id, now)
+    room_status = room.status(student_id, now)
+    if not room_status.admitted:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Waiting Room: {room_status.position} students ahead of you",
+            headers={"Retry-After": str(room_status.estimated_wait_seconds)},
+        )
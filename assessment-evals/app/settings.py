@@ -26,4 +26,76 @@ API_V1_STR="/api/v1"
 
 EDUCATIONAL_PROGRAM_URL = config("EDUCATIONAL_PROGRAM_URL", cast=str)
 QUIZ_ENGINE_API_URL = config("QUIZ_ENGINE_API_URL", cast=str)
-AUTH_SERVER_URL = config("AUTH_SERVER_URL", cast=str)
\ No newline at end of file
+AUTH_SERVER_URL = config("AUTH_SERVER_URL", cast=str)
+
+# Threads used to run independent upstream calls concurrently
+UPSTREAM_MAX_WORKERS = config("UPSTREAM_MAX_WORKERS", default=32, cast=int)
+
+# Waiting Room - students admitted per second when the QuizSetting has no admission_rate
+WAITING_ROOM_DEFAULT_ADMISSION_RATE = config("WAITING_ROOM_DEFAULT_ADMISSION_RATE", default=20, cast=int)
+WAITING_ROOM_MAX_POLL_SECONDS = config("WAITING_ROOM_MAX_POLL_SECONDS", default=10, cast=int)
+
+# Prewarm - runtime quiz & answer key are cached for quizzes starting within PREWARM_LEAD_MINUTES
+PREWARM_ENABLED = config("PREWARM_ENABLED", default=True, cast=bool)
+PREWARM_INTERVAL_SECONDS = config("PREWARM_INTERVAL_SECONDS", default=60, cast=int)
+PREWARM_LEAD_MINUTES = config("PREWARM_LEAD_MINUTES", default=15, cast=int)
+PREWARM_CACHE_TTL_SECONDS = config("PREWARM_CACHE_TTL_SECONDS", default=4 * 60 * 60, cast=int)
+# Cached answer keys & runtime quizzes are dropped when the answer key version in the DB changes,
+# each process reads the version at most every ANSWER_KEY_VERSION_CHECK_SECONDS
+ANSWER_KEY_VERSION_CHECK_SECONDS = config("ANSWER_KEY_VERSION_CHECK_SECONDS", default=2, cast=float)
+
+# Deadline Sweeper - completes and grades in progress attempts past their deadline
+DEADLINE_SWEEPER_ENABLED = config("DEADLINE_SWEEPER_ENABLED", default=True, cast=bool)
+DEADLINE_SWEEPER_INTERVAL_SECONDS = config("DEADLINE_SWEEPER_INTERVAL_SECONDS", default=5, cast=int)
+DEADLINE_SWEEPER_BATCH_SIZE = config("DEADLINE_SWEEPER_BATCH_SIZE", default=500, cast=int)
+
+# Regrade Worker - regrades attempted answers when a question's answer key changes
+REGRADE_WORKER_ENABLED = config("REGRADE_WORKER_ENABLED", default=True, cast=bool)
+REGRADE_INTERVAL_SECONDS = config("REGRADE_INTERVAL_SECONDS", default=5, cast=int)
+REGRADE_BATCH_SIZE = config("REGRADE_BATCH_SIZE", default=5000, cast=int)
+# A running job whose worker renewed its lease longer ago than this is taken over by another worker
+REGRADE_LEASE_SECONDS = config("REGRADE_LEASE_SECONDS", default=300, cast=int)
+# Shared secret quiz-engine sends in the X-Service-Token header when an answer key changes
+SERVICE_TOKEN: Secret = config("SERVICE_TOKEN", cast=Secret, default="")
+
+# Collusion Scans - MinHash/LSH candidates over wrong answer bitsets, scored with exact Jaccard
+COLLUSION_WORKER_ENABLED = config("COLLUSION_WORKER_ENABLED", default=True, cast=bool)
+COLLUSION_INTERVAL_SECONDS = config("COLLUSION_INTERVAL_SECONDS", default=30, cast=int)
+COLLUSION_MINHASH_PERMUTATIONS = config("COLLUSION_MINHASH_PERMUTATIONS", default=128, cast=int)
+COLLUSION_LSH_BANDS = config("COLLUSION_LSH_BANDS", default=32, cast=int)
+COLLUSION_MAX_BUCKET_SIZE = config("COLLUSION_MAX_BUCKET_SIZE", default=500, cast=int)
+COLLUSION_JACCARD_THRESHOLD = config("COLLUSION_JACCARD_THRESHOLD", default=0.7, cast=float)
+COLLUSION_MIN_SHARED_WRONG_ANSWERS = config("COLLUSION_MIN_SHARED_WRONG_ANSWERS", default=3, cast=int)
+
+# Archival - completed attempts older than ARCHIVE_AFTER_DAYS are compacted into answersheetarchive
+ARCHIVE_ENABLED = config("ARCHIVE_ENABLED", default=False, cast=bool)
+ARCHIVE_INTERVAL_SECONDS = config("ARCHIVE_INTERVAL_SECONDS", default=60 * 60, cast=int)
+ARCHIVE_AFTER_DAYS = config("ARCHIVE_AFTER_DAYS", default=365, cast=int)
+ARCHIVE_BATCH_SIZE = config("ARCHIVE_BATCH_SIZE", default=500, cast=int)
+
+# Idempotency-Key - stored responses are replayed to retries for IDEMPOTENCY_TTL_SECONDS
+IDEMPOTENCY_TTL_SECONDS = config("IDEMPOTENCY_TTL_SECONDS", default=60 * 60, cast=int)
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = config("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", default=10 * 60, cast=int)
+# A request still running after IDEMPOTENCY_LEASE_SECONDS is considered dead and a retry may take its key over
+IDEMPOTENCY_LEASE_SECONDS = config("IDEMPOTENCY_LEASE_SECONDS", default=60, cast=int)
+
+# Write Behind - answer saves go to a staging table and are flushed into answerslot in batches
+ANSWER_WRITE_BEHIND_ENABLED = config("ANSWER_WRITE_BEHIND_ENABLED", default=False, cast=bool)
+ANSWER_FLUSH_INTERVAL_SECONDS = config("ANSWER_FLUSH_INTERVAL_SECONDS", default=1, cast=float)
+ANSWER_FLUSH_BATCH_SIZE = config("ANSWER_FLUSH_BATCH_SIZE", default=5000, cast=int)
+
+# Attempt State Stream - seconds between remaining time ticks on an idle stream
+ATTEMPT_STREAM_TICK_SECONDS = config("ATTEMPT_STREAM_TICK_SECONDS", default=15, cast=int)
+
+# Proctor Dashboard - changed quiz counters are pushed to viewers every PROCTOR_BROADCAST_INTERVAL_SECONDS
+PROCTOR_BROADCAST_INTERVAL_SECONDS = config("PROCTOR_BROADCAST_INTERVAL_SECONDS", default=2, cast=float)
+PROCTOR_KEEPALIVE_SECONDS = config("PROCTOR_KEEPALIVE_SECONDS", default=15, cast=int)
+
+# Gradebook Export - rows fetched per server side cursor batch
+EXPORT_BATCH_SIZE = config("EXPORT_BATCH_SIZE", default=2000, cast=int)
+
+# Attempt Telemetry - client events are buffered in memory and written in bulk with COPY
+TELEMETRY_FLUSH_INTERVAL_SECONDS = config("TELEMETRY_FLUSH_INTERVAL_SECONDS", default=2, cast=float)
+TELEMETRY_BUFFER_MAX_EVENTS = config("TELEMETRY_BUFFER_MAX_EVENTS", default=100000, cast=int)
+# Longest gap counted towards a question's time, longer gaps are treated as idle
+TELEMETRY_MAX_VIEW_SECONDS = config("TELEMETRY_MAX_VIEW_SECONDS", default=600, cast=int)
@@ -18,3 +18,8 @@ def test_health_stats(client: TestClient):
     assert response.json()["answersheet"] >= 0
     assert response.json()["answerslot"] >= 0
 
+
+def test_health_upstream(client: TestClient):
+    response = client.get(f"{settings.API_V1_STR}/health/upstream")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
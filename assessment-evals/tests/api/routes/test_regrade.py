@@ -0,0 +1,28 @@
+from fastapi.testclient import TestClient
+from starlette.datastructures import Secret
+
+from app import settings
+
+
+def test_answer_key_changed_requires_service_token(client: TestClient, monkeypatch):
+    monkeypatch.setattr(settings, "SERVICE_TOKEN", Secret("service-token"))
+    url = f"{settings.API_V1_STR}/regrade/answer-key-changed"
+
+    response = client.post(url, json={"question_id": 1})
+    assert response.status_code == 401
+
+    response = client.post(url, json={"question_id": 1}, headers={"X-Service-Token": "wrong-token"})
+    assert response.status_code == 401
+
+    response = client.post(url, json={"question_id": 1}, headers={"X-Service-Token": "service-token"})
+    assert response.status_code == 200
+    assert response.json()["question_id"] == 1
+
+
+def test_answer_key_changed_rejected_without_configured_token(client: TestClient, monkeypatch):
+    monkeypatch.setattr(settings, "SERVICE_TOKEN", Secret(""))
+
+    response = client.post(
+        f"{settings.API_V1_STR}/regrade/answer-key-changed", json={"question_id": 1}, headers={"X-Service-Token": ""}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,22 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_entries_expire():
+    cache = TTLCache(ttl_seconds=0.05)
+    cache.set(1, {"quiz_title": "Quiz"})
+    assert cache.get(1) == {"quiz_title": "Quiz"}
+    time.sleep(0.06)
+    assert cache.get(1) is None
+    assert 1 not in cache
+
+
+def test_oldest_entries_are_evicted():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.set(3, "c")
+    assert cache.get(1) is None
+    assert cache.get(2) == "b"
+    assert cache.get(3) == "c"
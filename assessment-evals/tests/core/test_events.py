@@ -0,0 +1,35 @@
+import asyncio
+import threading
+
+from app.core.events import EventBus
+
+
+def test_publish_from_thread_reaches_subscriber():
+    bus = EventBus("test")
+
+    async def main():
+        queue = bus.subscribe("topic")
+        thread = threading.Thread(target=bus.publish, args=("topic", "event"))
+        thread.start()
+        thread.join()
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        bus.unsubscribe("topic", queue)
+        return event
+
+    assert asyncio.run(main()) == "event"
+    assert not bus.has_subscribers("topic")
+
+
+def test_publish_without_subscribers_and_full_queue():
+    bus = EventBus("test", max_queued_events=2)
+    assert bus.publish("nobody", "event") == 0
+
+    async def main():
+        queue = bus.subscribe("topic")
+        for event in range(3):
+            bus.publish("topic", event)
+        await asyncio.sleep(0)
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    # oldest event is dropped for a slow subscriber
+    assert asyncio.run(main()) == [1, 2]
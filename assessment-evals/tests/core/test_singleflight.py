@@ -0,0 +1,47 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    release = threading.Event()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        release.wait(timeout=5)
+        return {"quiz_id": 1}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(flight.do, (1, "key"), fetch) for _ in range(8)]
+        # Bounded wait for all callers to arrive, the assert below fails instead of hanging
+        deadline = time.monotonic() + 5
+        while flight.stats()["calls"] < 8 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        arrived = flight.stats()["calls"]
+        release.set()
+        results = [future.result(timeout=10) for future in futures]
+
+    assert arrived == 8
+    assert len(executions) == 1
+    assert all(result == {"quiz_id": 1} for result in results)
+    assert flight.stats()["executed"] == 1
+    assert flight.stats()["coalesced"] == 7
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight("test")
+
+    def failing():
+        raise ValueError("Invalid Quiz Key")
+
+    with pytest.raises(ValueError):
+        flight.do((1, "key"), failing)
+    assert flight.do((1, "key"), lambda: "ok") == "ok"
+    assert flight.stats()["executed"] == 2
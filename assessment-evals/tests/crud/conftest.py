@@ -0,0 +1,91 @@
+from collections.abc import Callable, Generator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session, SQLModel, delete
+
+from app.core.db_eng import tests_engine as engine
+from app.models.base import QuizAttemptStatus
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.answer_staging_model import AnswerSlotStaging
+from app.models.regrade_model import RegradeJob
+from app.models.archive_model import AnswerSheetArchive
+from app.models.idempotency_model import IdempotencyRecord
+from app.models.telemetry_model import AttemptEvent, QuestionTimeOnTask
+from app.service import prewarm
+from app.service.grading import CompiledQuiz
+
+QUIZ_ID = 9001
+
+# Answer key of QUIZ_ID: question 1 (4 points, options 10 & 11 correct), question 2 (3 points, option 20)
+QUIZ_QUESTIONS = [
+    {
+        "id": 1,
+        "points": 4,
+        "question_type": "multiple_select_mcq",
+        "options": [
+            {"id": 10, "is_correct": True},
+            {"id": 11, "is_correct": True},
+            {"id": 12, "is_correct": False},
+        ],
+    },
+    {
+        "id": 2,
+        "points": 3,
+        "question_type": "single_select_mcq",
+        "options": [{"id": 20, "is_correct": True}, {"id": 21, "is_correct": False}],
+    },
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables() -> None:
+    SQLModel.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session(tables, monkeypatch) -> Generator[Session, None, None]:
+    # The answer key version is read from the test database
+    monkeypatch.setattr(prewarm, "engine", engine)
+    prewarm.forget_answer_key_version()
+    prewarm.cache_answer_key(QUIZ_ID, CompiledQuiz.from_questions(QUIZ_QUESTIONS))
+    with Session(engine) as session:
+        yield session
+        session.rollback()
+        session.exec(delete(AnswerSlotStaging))
+        session.exec(delete(AnswerSlot))
+        session.exec(delete(AnswerSheet))
+        session.exec(delete(RegradeJob))
+        session.exec(delete(AnswerSheetArchive))
+        session.exec(delete(AttemptEvent))
+        session.exec(delete(QuestionTimeOnTask))
+        session.exec(delete(IdempotencyRecord))
+        session.commit()
+    prewarm.answer_key_cache.clear()
+    prewarm.runtime_quiz_cache.clear()
+    prewarm.forget_answer_key_version()
+
+
+@pytest.fixture()
+def make_answer_sheet(session: Session) -> Callable[..., AnswerSheet]:
+    def _make_answer_sheet(*, started_minutes_ago: int = 0, time_limit_minutes: int = 30, **fields) -> AnswerSheet:
+        time_start = datetime.utcnow() - timedelta(minutes=started_minutes_ago)
+        answer_sheet = AnswerSheet(
+            student_id=fields.pop("student_id", 1),
+            quiz_id=fields.pop("quiz_id", QUIZ_ID),
+            time_limit=timedelta(minutes=time_limit_minutes),
+            time_start=time_start,
+            deadline=time_start + timedelta(minutes=time_limit_minutes),
+            status=QuizAttemptStatus.in_progress,
+            total_points=7,
+            quiz_title="Test Quiz",
+            quiz_key=fields.pop("quiz_key", "test-key"),
+            **fields,
+        )
+        session.add(answer_sheet)
+        session.commit()
+        session.refresh(answer_sheet)
+        return answer_sheet
+
+    return _make_answer_sheet
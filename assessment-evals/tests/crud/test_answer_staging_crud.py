@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.db_eng import tests_engine
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.models.base import QuizAttemptStatus, QuestionTypeEnum
+from app.models.answerslot_model import AnswerSlot, AnswerSlotCreate
+from app.models.answer_staging_model import AnswerSlotStaging
+
+
+def stage(session: Session, answer_sheet_id: int, question_id: int, selected_options_ids: list[int]) -> AnswerSlot:
+    return crud_answer_slot_staging.stage_answer_slot(
+        session,
+        AnswerSlotCreate(
+            quiz_answer_sheet_id=answer_sheet_id,
+            question_id=question_id,
+            question_type=QuestionTypeEnum.multiple_select_mcq if question_id == 1 else QuestionTypeEnum.single_select_mcq,
+            selected_options_ids=selected_options_ids,
+        ),
+    )
+
+
+def test_stage_answer_slot_once_per_question(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    staged = stage(session, answer_sheet.id, 1, [11, 10, 11])
+
+    assert staged.selected_option_ids == [10, 11]
+    assert crud_answer_slot_staging.is_question_staged(session, answer_sheet.id, 1)
+    assert not crud_answer_slot_staging.is_question_staged(session, answer_sheet.id, 2)
+    with pytest.raises(ValueError, match="Question Already Attempted"):
+        stage(session, answer_sheet.id, 1, [12])
+    assert crud_answer_slot_staging.get_staged_question_ids(session, answer_sheet.id) == {1}
+
+
+def test_flush_copies_staged_answers_into_answerslot(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    first = stage(session, answer_sheet.id, 1, [10, 11])
+    second = stage(session, answer_sheet.id, 2, [21])
+
+    flushed = crud_answer_slot_staging.flush_staged_answers(session, answer_sheet_ids=[answer_sheet.id])
+    session.commit()
+
+    assert flushed == [(first.id, answer_sheet.id), (second.id, answer_sheet.id)]
+    assert session.exec(select(AnswerSlotStaging)).all() == []
+    answer_slots = session.exec(select(AnswerSlot).order_by(AnswerSlot.id)).all()
+    assert [(slot.id, slot.question_id, slot.selected_option_ids, slot.points_awarded) for slot in answer_slots] == [
+        (first.id, 1, [10, 11], 0),
+        (second.id, 2, [21], 0),
+    ]
+    assert answer_slots[0].created_at == first.created_at
+
+
+def test_rolled_back_flush_is_replayed(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    staged = stage(session, answer_sheet.id, 2, [20])
+
+    # A flush that never commits (crash, failed COPY) leaves the answer staged
+    assert crud_answer_slot_staging.flush_staged_answers(session) == [(staged.id, answer_sheet.id)]
+    session.rollback()
+    assert crud_answer_slot_staging.get_staged_question_ids(session, answer_sheet.id) == {2}
+    assert session.exec(select(AnswerSlot)).all() == []
+
+    assert crud_answer_slot_staging.flush_staged_answers(session, limit=10) == [(staged.id, answer_sheet.id)]
+    session.commit()
+    assert session.exec(select(AnswerSlot.id)).all() == [staged.id]
+
+
+def test_finalize_waits_for_a_running_flush(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet(started_minutes_ago=45)
+    stage(session, answer_sheet.id, 1, [10, 11])
+    stage(session, answer_sheet.id, 2, [20])
+
+    with Session(tests_engine) as flusher_session:
+        # The background flusher holds the staged rows of the sheet
+        assert len(crud_answer_slot_staging.flush_staged_answers(flusher_session, limit=10)) == 2
+
+        def finalize():
+            with Session(tests_engine) as sweeper_session:
+                crud_answer_sheet.finalize_answer_sheets(sweeper_session, [answer_sheet.id])
+
+        sweeper = threading.Thread(target=finalize)
+        sweeper.start()
+        sweeper.join(timeout=1)
+        assert sweeper.is_alive()
+
+        flusher_session.commit()
+    sweeper.join(timeout=10)
+    assert not sweeper.is_alive()
+
+    session.refresh(answer_sheet)
+    assert answer_sheet.status == QuizAttemptStatus.completed
+    assert answer_sheet.attempt_score == 7
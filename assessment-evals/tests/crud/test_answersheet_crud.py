@@ -0,0 +1,66 @@
+from sqlmodel import Session
+
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.crud.answerslot_crud import crud_answer_slot
+from app.models.base import QuizAttemptStatus, QuestionTypeEnum
+from app.models.answerslot_model import AnswerSlotCreate
+from app.service import attempt_finish
+
+
+def test_active_answer_sheet_is_left_in_progress(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet(started_minutes_ago=5)
+
+    assert crud_answer_sheet.is_answer_sheet_active(session, answer_sheet.id, answer_sheet.student_id)
+    session.refresh(answer_sheet)
+    assert answer_sheet.status == QuizAttemptStatus.in_progress
+    assert answer_sheet.time_finish is None
+
+
+def test_overdue_answer_sheet_is_finalized_with_score(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet(started_minutes_ago=45)
+    crud_answer_slot.create_quiz_answer_slot(
+        db_session=session,
+        quiz_answer_slot=AnswerSlotCreate(
+            quiz_answer_sheet_id=answer_sheet.id,
+            question_id=1,
+            question_type=QuestionTypeEnum.multiple_select_mcq,
+            selected_options_ids=[10, 11],
+        ),
+    )
+
+    assert not crud_answer_sheet.is_answer_sheet_active(session, answer_sheet.id, answer_sheet.student_id)
+    session.refresh(answer_sheet)
+    assert answer_sheet.status == QuizAttemptStatus.completed
+    assert answer_sheet.time_finish == answer_sheet.deadline
+    assert answer_sheet.attempt_score == 4
+
+
+def test_overdue_answer_sheet_found_on_save_is_followed_up(session: Session, make_answer_sheet, monkeypatch):
+    followed_up = []
+    monkeypatch.setattr(
+        attempt_finish,
+        "publish_attempt_finished",
+        lambda answer_sheet_id, finish_reason: followed_up.append(("stream", answer_sheet_id, finish_reason)),
+    )
+    monkeypatch.setattr(
+        attempt_finish,
+        "record_attempt_finished",
+        lambda quiz_id, answer_sheet_id: followed_up.append(("proctor", answer_sheet_id, quiz_id)),
+    )
+    monkeypatch.setattr(
+        attempt_finish,
+        "record_time_on_task",
+        lambda answer_sheet_ids: followed_up.append(("time_on_task", answer_sheet_ids)),
+    )
+    answer_sheet = make_answer_sheet(started_minutes_ago=45)
+
+    assert not attempt_finish.is_answer_sheet_active(session, answer_sheet.id, answer_sheet.student_id)
+    assert followed_up == [
+        ("stream", answer_sheet.id, "deadline"),
+        ("proctor", answer_sheet.id, answer_sheet.quiz_id),
+        ("time_on_task", [answer_sheet.id]),
+    ]
+
+    # Already finalized - nothing is sent twice
+    assert not attempt_finish.is_answer_sheet_active(session, answer_sheet.id, answer_sheet.student_id)
+    assert len(followed_up) == 3
@@ -0,0 +1,39 @@
+from sqlmodel import Session, select, text
+
+from app.crud.answerslot_crud import crud_answer_slot
+from app.models.base import QuestionTypeEnum
+from app.models.answerslot_model import AnswerSlot, AnswerSlotCreate
+
+
+def test_selected_option_ids_are_stored_sorted_and_unique(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    answer_slot = crud_answer_slot.create_quiz_answer_slot(
+        db_session=session,
+        quiz_answer_slot=AnswerSlotCreate(
+            quiz_answer_sheet_id=answer_sheet.id,
+            question_id=1,
+            question_type=QuestionTypeEnum.multiple_select_mcq,
+            selected_options_ids=[12, 10, 12],
+        ),
+    )
+    session.expunge_all()
+
+    stored = session.exec(select(AnswerSlot).where(AnswerSlot.id == answer_slot.id)).one()
+    assert stored.selected_option_ids == [10, 12]
+    assert [option.option_id for option in stored.selected_options] == [10, 12]
+    assert all(option.quiz_answer_slot_id == answer_slot.id for option in stored.selected_options)
+
+
+def test_selected_option_ids_default_to_empty_array(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    session.exec(
+        text(
+            "INSERT INTO answerslot (quiz_answer_sheet_id, question_id, question_type, points_awarded) "
+            "VALUES (:answer_sheet_id, 2, 'single_select_mcq', 0)"
+        ).bindparams(answer_sheet_id=answer_sheet.id)
+    )
+    session.commit()
+
+    assert session.exec(
+        select(AnswerSlot.selected_option_ids).where(AnswerSlot.quiz_answer_sheet_id == answer_sheet.id)
+    ).one() == []
@@ -0,0 +1,150 @@
+import json
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select, func
+
+from app import settings
+from app.core.db_eng import tests_engine
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.crud.telemetry_crud import crud_attempt_telemetry
+from app.models.base import QuizAttemptStatus, QuestionTypeEnum
+from app.models.export_model import ExportFormat
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.archive_model import AnswerSheetArchive
+from app.models.idempotency_model import IdempotencyRecord
+from app.models.telemetry_model import AttemptEvent, QuestionTimeOnTask
+from app.service import archive, gradebook_export
+from app.service.archive import archived_time_on_task
+from app.service.attempt_history import get_attempt_history_page, get_attempt_history_summary
+from tests.crud.conftest import QUIZ_ID
+
+
+def finished_attempt(session: Session, make_answer_sheet, time_finish: datetime, **fields) -> AnswerSheet:
+    answer_sheet = make_answer_sheet(**fields)
+    answer_sheet.status = QuizAttemptStatus.completed
+    answer_sheet.time_finish = time_finish
+    answer_sheet.attempt_score = 3
+    session.add(answer_sheet)
+    session.add(
+        AnswerSlot(
+            quiz_answer_sheet_id=answer_sheet.id,
+            question_id=2,
+            question_type=QuestionTypeEnum.single_select_mcq,
+            selected_option_ids=[20],
+            points_awarded=3,
+        )
+    )
+    session.add(QuestionTimeOnTask(answer_sheet_id=answer_sheet.id, question_id=2, time_spent_seconds=42, view_count=2))
+    crud_attempt_telemetry.copy_attempt_events(
+        session, [(time_finish, answer_sheet.id, 2, "view", time_finish - timedelta(minutes=1))]
+    )
+    session.add(
+        IdempotencyRecord(
+            student_id=answer_sheet.student_id,
+            idempotency_key=f"attempt-{answer_sheet.id}",
+            request_hash="hash",
+            status_code=200,
+            response_body={"answer_sheet_id": answer_sheet.id, "quiz_id": answer_sheet.quiz_id},
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+        )
+    )
+    session.commit()
+    return answer_sheet
+
+
+def count(session: Session, model, *where) -> int:
+    return session.exec(select(func.count()).select_from(model).where(*where)).one()
+
+
+def test_archive_moves_attempt_and_dependent_rows(session: Session, make_answer_sheet, monkeypatch):
+    monkeypatch.setattr(archive, "engine", tests_engine)
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 365)
+    old_attempt = finished_attempt(session, make_answer_sheet, datetime.utcnow() - timedelta(days=800), quiz_key="old-key")
+    recent_attempt = finished_attempt(session, make_answer_sheet, datetime.utcnow(), student_id=2)
+    old_attempt_id, student_id = old_attempt.id, old_attempt.student_id
+
+    assert archive.archive_completed_attempts() == 1
+    session.expire_all()
+
+    archived = session.exec(select(AnswerSheetArchive).where(AnswerSheetArchive.id == old_attempt_id)).one()
+    assert archived.quiz_key == "old-key"
+    assert [(question_time.question_id, question_time.time_spent_seconds) for question_time in archived_time_on_task(archived)] == [(2, 42)]
+
+    # Every row referencing the archived sheet is gone, the recent attempt keeps its rows
+    for model, column in (
+        (AnswerSheet, AnswerSheet.id),
+        (AnswerSlot, AnswerSlot.quiz_answer_sheet_id),
+        (QuestionTimeOnTask, QuestionTimeOnTask.answer_sheet_id),
+        (AttemptEvent, AttemptEvent.answer_sheet_id),
+    ):
+        assert count(session, model, column == old_attempt_id) == 0
+        assert count(session, model, column == recent_attempt.id) == 1
+    assert count(session, IdempotencyRecord, IdempotencyRecord.student_id == student_id) == 0
+    assert count(session, IdempotencyRecord, IdempotencyRecord.student_id == recent_attempt.student_id) == 1
+
+
+def test_archived_attempt_cannot_be_started_again(session: Session, make_answer_sheet, monkeypatch):
+    monkeypatch.setattr(archive, "engine", tests_engine)
+    answer_sheet = finished_attempt(session, make_answer_sheet, datetime.utcnow() - timedelta(days=800), quiz_key="old-key")
+    student_id, quiz_id = answer_sheet.student_id, answer_sheet.quiz_id
+    assert archive.archive_completed_attempts() == 1
+
+    existing = crud_answer_sheet.student_answer_sheet_exists(session, user_id=student_id, quiz_id=quiz_id, quiz_key="old-key")
+    assert existing is not None
+    assert existing.status == QuizAttemptStatus.completed
+    assert crud_answer_sheet.student_answer_sheet_exists(session, user_id=student_id, quiz_id=quiz_id, quiz_key="new-key") is None
+
+
+def test_archived_attempts_are_part_of_history_and_summary(session: Session, make_answer_sheet, monkeypatch):
+    monkeypatch.setattr(archive, "engine", tests_engine)
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 365)
+    old_attempt = finished_attempt(
+        session, make_answer_sheet, datetime.utcnow() - timedelta(days=800), started_minutes_ago=800 * 24 * 60, course_id=5
+    )
+    recent_attempt = finished_attempt(session, make_answer_sheet, datetime.utcnow(), started_minutes_ago=30, course_id=6)
+    in_progress = make_answer_sheet(course_id=6)
+    old_attempt_id = old_attempt.id
+    assert archive.archive_completed_attempts() == 1
+
+    first_page = get_attempt_history_page(session, student_id=1, limit=2)
+    assert [item.id for item in first_page.items] == [in_progress.id, recent_attempt.id]
+    last_page = get_attempt_history_page(session, student_id=1, limit=2, cursor=first_page.next_cursor)
+    assert [(item.id, item.status, item.quiz_title) for item in last_page.items] == [
+        (old_attempt_id, QuizAttemptStatus.completed, "Test Quiz")
+    ]
+    assert last_page.next_cursor is None
+
+    summary = get_attempt_history_summary(session, student_id=1)
+    assert (summary.overall.attempt_count, summary.overall.completed_count, summary.overall.in_progress_count) == (3, 2, 1)
+    assert {course.course_id: (course.attempt_count, course.best_score) for course in summary.courses} == {
+        5: (1, 3),
+        6: (2, 3),
+    }
+
+
+def test_gradebook_export_streams_archived_attempts(session: Session, make_answer_sheet, monkeypatch):
+    monkeypatch.setattr(archive, "engine", tests_engine)
+    monkeypatch.setattr(gradebook_export, "engine", tests_engine)
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 365)
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    # Created before quiz snapshots: no course_id
+    old_attempt = finished_attempt(session, make_answer_sheet, datetime.utcnow() - timedelta(days=800))
+    recent_attempt = finished_attempt(session, make_answer_sheet, datetime.utcnow(), course_id=5)
+    in_progress = make_answer_sheet(course_id=5)
+    other_quiz = make_answer_sheet(quiz_id=QUIZ_ID + 1, course_id=5)
+    old_attempt_id = old_attempt.id
+    assert archive.archive_completed_attempts() == 1
+
+    monkeypatch.setattr(gradebook_export, "get_course_quiz_ids", lambda course_id: [QUIZ_ID] if course_id == 5 else [])
+    content, _ = gradebook_export.export_gradebook(
+        export_format=ExportFormat.ndjson, quiz_id=None, course_id=5, include_question_points=True
+    )
+    rows = [json.loads(line) for line in "".join(content).splitlines()]
+
+    assert [row["answer_sheet_id"] for row in rows] == [old_attempt_id, recent_attempt.id, in_progress.id]
+    assert other_quiz.id not in [row["answer_sheet_id"] for row in rows]
+    archived_row, recent_row = rows[0], rows[1]
+    assert set(archived_row) == set(recent_row) == set(gradebook_export.gradebook_columns(True))
+    assert (archived_row["status"], archived_row["quiz_title"], archived_row["course_id"]) == ("completed", "Test Quiz", None)
+    assert archived_row["question_points"] == recent_row["question_points"] == {"2": 3}
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app import settings
+from app.models.answersheet_model import AttemptQuizRequest
+from app.models.idempotency_model import IdempotencyRecord
+from app.service.idempotency import run_idempotent
+
+REQUEST = AttemptQuizRequest(quiz_id=1, quiz_key="key")
+
+
+def run(session: Session, fn, idempotency_key: str = "retry-key", request_body=REQUEST):
+    return run_idempotent(
+        db=session, student_id=1, idempotency_key=idempotency_key, route="attempt",
+        request_body=request_body, response_model=AttemptQuizRequest, fn=fn,
+    )
+
+
+def test_completed_request_is_replayed(session: Session):
+    calls = []
+    assert run(session, lambda: calls.append(1) or REQUEST) == REQUEST
+
+    replayed = run(session, lambda: calls.append(2) or REQUEST)
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+    assert calls == [1]
+
+    with pytest.raises(HTTPException) as err:
+        run(session, lambda: REQUEST, request_body=AttemptQuizRequest(quiz_id=2, quiz_key="key"))
+    assert err.value.status_code == 422
+
+
+def test_pending_request_within_lease_conflicts(session: Session):
+    def retry_while_running():
+        with pytest.raises(HTTPException) as err:
+            run(session, lambda: REQUEST)
+        assert err.value.status_code == 409
+        return REQUEST
+
+    assert run(session, retry_while_running) == REQUEST
+
+
+def test_failed_request_releases_the_key(session: Session):
+    def fail():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        run(session, fail)
+    assert session.get(IdempotencyRecord, (1, "retry-key")) is None
+
+
+def test_pending_request_past_its_lease_is_taken_over(session: Session):
+    # The process that claimed the key died before completing or releasing it
+    now = datetime.utcnow()
+    session.add(
+        IdempotencyRecord(
+            student_id=1,
+            idempotency_key="retry-key",
+            request_hash="hash of the dead request",
+            created_at=now - timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS + 5),
+            expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS),
+            locked_until=now - timedelta(seconds=5),
+        )
+    )
+    session.commit()
+
+    calls = []
+    assert run(session, lambda: calls.append(1) or REQUEST) == REQUEST
+    assert calls == [1]
+
+    session.expire_all()
+    record = session.get(IdempotencyRecord, (1, "retry-key"))
+    assert record.status_code == 200
+    assert record.locked_until is None
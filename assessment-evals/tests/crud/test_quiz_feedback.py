@@ -0,0 +1,86 @@
+from sqlalchemy import inspect
+from sqlmodel import Session
+
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.crud.answer_staging_crud import crud_answer_slot_staging
+from app.models.base import QuestionTypeEnum
+from app.models.answerslot_model import AnswerSlot, AnswerSlotCreate, AnswerSlotFeedback
+
+
+def test_quiz_feedback_matches_answer_slots(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet(quiz_snapshot={"quiz_questions": [{"id": 1}, {"id": 2}]})
+    session.add_all(
+        [
+            AnswerSlot(
+                quiz_answer_sheet_id=answer_sheet.id,
+                question_id=1,
+                question_type=QuestionTypeEnum.multiple_select_mcq,
+                selected_option_ids=[10, 12],
+                points_awarded=2,
+            ),
+            AnswerSlot(
+                quiz_answer_sheet_id=answer_sheet.id,
+                question_id=2,
+                question_type=QuestionTypeEnum.single_select_mcq,
+                selected_option_ids=[20],
+                points_awarded=3,
+            ),
+        ]
+    )
+    session.commit()
+
+    feedback_sheet, quiz_answers = crud_answer_sheet.get_quiz_feedback(
+        db_session=session, answer_sheet_id=answer_sheet.id, student_id=answer_sheet.student_id
+    )
+
+    # Same answers as loading the sheet's Answer Slots one by one through the relationship
+    session.refresh(answer_sheet)
+    per_question = [
+        AnswerSlotFeedback.model_validate(answer_slot).model_dump()
+        for answer_slot in sorted(answer_sheet.quiz_answers, key=lambda answer_slot: answer_slot.id)
+    ]
+    assert [AnswerSlotFeedback.model_validate(quiz_answer).model_dump() for quiz_answer in quiz_answers] == per_question
+    assert feedback_sheet.id == answer_sheet.id
+    assert feedback_sheet.quiz_snapshot == {"quiz_questions": [{"id": 1}, {"id": 2}]}
+
+
+def test_quiz_feedback_includes_staged_answers(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    staged = crud_answer_slot_staging.stage_answer_slot(
+        session,
+        AnswerSlotCreate(
+            quiz_answer_sheet_id=answer_sheet.id,
+            question_id=2,
+            question_type=QuestionTypeEnum.single_select_mcq,
+            selected_options_ids=[21, 20, 21],
+        ),
+    )
+
+    _, quiz_answers = crud_answer_sheet.get_quiz_feedback(
+        db_session=session, answer_sheet_id=answer_sheet.id, student_id=answer_sheet.student_id
+    )
+    assert [AnswerSlotFeedback.model_validate(quiz_answer) for quiz_answer in quiz_answers] == [
+        AnswerSlotFeedback(
+            id=staged.id,
+            quiz_answer_sheet_id=answer_sheet.id,
+            question_id=2,
+            question_type=QuestionTypeEnum.single_select_mcq,
+            points_awarded=0,
+            selected_option_ids=[20, 21],
+        )
+    ]
+
+
+def test_quiz_feedback_without_questions(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet(quiz_snapshot={"quiz_questions": []})
+    session.expunge_all()
+
+    feedback_sheet, quiz_answers = crud_answer_sheet.get_quiz_feedback(
+        db_session=session, answer_sheet_id=answer_sheet.id, student_id=answer_sheet.student_id, include_snapshot=False
+    )
+    assert quiz_answers == []
+    assert "quiz_snapshot" in inspect(feedback_sheet).unloaded
+
+    assert crud_answer_sheet.get_quiz_feedback(
+        db_session=session, answer_sheet_id=answer_sheet.id, student_id=answer_sheet.student_id + 1
+    ) is None
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app import settings
+from app.crud.regrade_crud import crud_regrade_job
+from app.models.base import QuizAttemptStatus, QuestionTypeEnum, RegradeJobStatus
+from app.models.answerslot_model import AnswerSlot
+from app.models.regrade_model import RegradeJob
+from app.service import prewarm, regrade
+from app.service.grading import CompiledQuiz
+from tests.crud.conftest import QUIZ_ID, QUIZ_QUESTIONS
+
+
+def add_answer_slot(session: Session, answer_sheet_id: int, question_id: int, selected_option_ids: list[int], points_awarded: float):
+    answer_slot = AnswerSlot(
+        quiz_answer_sheet_id=answer_sheet_id,
+        question_id=question_id,
+        question_type=QuestionTypeEnum.single_select_mcq,
+        selected_option_ids=selected_option_ids,
+        points_awarded=points_awarded,
+    )
+    session.add(answer_slot)
+    session.commit()
+    return answer_slot
+
+
+def claim(session: Session, now: datetime | None = None):
+    now = now or datetime.utcnow()
+    return crud_regrade_job.claim_regrade_job(session, now=now, lease_expires_at=now + timedelta(minutes=5))
+
+
+def test_claim_regrade_job_takes_oldest_queued_job(session: Session):
+    first_job = crud_regrade_job.enqueue_regrade_job(db_session=session, question_id=2)
+    second_job = crud_regrade_job.enqueue_regrade_job(db_session=session, question_id=1)
+    # A job already queued for the question is reused
+    assert crud_regrade_job.enqueue_regrade_job(db_session=session, question_id=2).id == first_job.id
+
+    claimed_job = claim(session)
+    assert claimed_job.id == first_job.id
+    assert claimed_job.status == RegradeJobStatus.running
+    assert claimed_job.started_at is not None
+
+    assert claim(session).id == second_job.id
+    assert claim(session) is None
+
+
+def test_running_regrade_job_is_taken_over_after_its_lease_expires(session: Session):
+    regrade_job = crud_regrade_job.enqueue_regrade_job(db_session=session, question_id=2)
+    claimed_at = datetime.utcnow()
+    assert claim(session, now=claimed_at).id == regrade_job.id
+
+    # Its worker is still within the lease
+    assert claim(session, now=claimed_at + timedelta(minutes=4)) is None
+
+    # The worker died - the next one takes the job over with a new lease
+    taken_over = claim(session, now=claimed_at + timedelta(minutes=6))
+    assert taken_over.id == regrade_job.id
+    assert taken_over.status == RegradeJobStatus.running
+    assert taken_over.lease_expires_at == claimed_at + timedelta(minutes=11)
+
+
+def test_run_regrade_job_updates_changed_slots_and_scores(session: Session, make_answer_sheet, monkeypatch):
+    # Question 2's correct option changes from 20 to 21
+    changed_question = {**QUIZ_QUESTIONS[1], "options": [{"id": 20, "is_correct": False}, {"id": 21, "is_correct": True}]}
+    monkeypatch.setattr(regrade, "get_question", lambda question_id: changed_question)
+    # Small batches so the job pages through the slots
+    monkeypatch.setattr(settings, "REGRADE_BATCH_SIZE", 2)
+
+    completed_sheets = [make_answer_sheet(student_id=student_id) for student_id in range(1, 4)]
+    in_progress_sheet = make_answer_sheet(student_id=4)
+    for answer_sheet in completed_sheets:
+        answer_sheet.status = QuizAttemptStatus.completed
+        session.add(answer_sheet)
+    session.commit()
+
+    add_answer_slot(session, completed_sheets[0].id, 1, [10, 11], 4)
+    add_answer_slot(session, completed_sheets[0].id, 2, [20], 3)
+    add_answer_slot(session, completed_sheets[1].id, 2, [21], 0)
+    add_answer_slot(session, completed_sheets[2].id, 2, [21], 3)
+    add_answer_slot(session, in_progress_sheet.id, 2, [21], 0)
+
+    regrade.answer_key_changed(db_session=session, question_id=2)
+    regrade_job = claim(session)
+    assert regrade_job.total_slots == 4
+    regrade.run_regrade_job(session, regrade_job)
+
+    session.refresh(regrade_job)
+    assert regrade_job.status == RegradeJobStatus.completed
+    assert regrade_job.regraded_slots == 4
+    assert regrade_job.changed_slots == 3
+    # Only completed sheets get their score recomputed
+    assert regrade_job.refreshed_sheets == 2
+
+    points = {
+        (sheet_id, question_id): points_awarded
+        for sheet_id, question_id, points_awarded in session.exec(
+            select(AnswerSlot.quiz_answer_sheet_id, AnswerSlot.question_id, AnswerSlot.points_awarded)
+        ).all()
+    }
+    assert points[(completed_sheets[0].id, 1)] == 4
+    assert points[(completed_sheets[0].id, 2)] == 0
+    assert points[(completed_sheets[1].id, 2)] == 3
+    assert points[(completed_sheets[2].id, 2)] == 3
+    assert points[(in_progress_sheet.id, 2)] == 3
+
+    for answer_sheet in [*completed_sheets, in_progress_sheet]:
+        session.refresh(answer_sheet)
+    assert [answer_sheet.attempt_score for answer_sheet in completed_sheets] == [4, 3, None]
+    assert in_progress_sheet.attempt_score is None
+
+
+def test_answer_key_change_invalidates_cached_answer_keys(session: Session, monkeypatch):
+    assert prewarm.get_answer_key(QUIZ_ID).get(2) is not None
+
+    # Another process reports the change: only the version in the database moves
+    crud_regrade_job.bump_answer_key_version(session)
+    session.commit()
+    monkeypatch.setattr(settings, "ANSWER_KEY_VERSION_CHECK_SECONDS", 0)
+
+    assert prewarm.get_answer_key_question(QUIZ_ID, 2) is None
+    prewarm.cache_answer_key(QUIZ_ID, CompiledQuiz.from_questions(QUIZ_QUESTIONS))
+    assert prewarm.get_answer_key_question(QUIZ_ID, 2) is not None
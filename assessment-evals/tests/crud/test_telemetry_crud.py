@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select, text
+
+from app import settings
+from app.core.db_eng import tests_engine
+from app.core.partitions import monthly_partition_name
+from app.crud.answersheet_crud import crud_answer_sheet
+from app.crud.telemetry_crud import crud_attempt_telemetry
+from app.models.base import AttemptEventType
+from app.models.telemetry_model import AttemptEvent, AttemptEventBatch, AttemptEventCreate
+from app.service import telemetry
+
+
+def test_time_on_task_of_a_finished_sheet(session: Session, make_answer_sheet, monkeypatch):
+    monkeypatch.setattr(telemetry, "engine", tests_engine)
+    monkeypatch.setattr(settings, "TELEMETRY_MAX_VIEW_SECONDS", 300)
+    telemetry.event_buffer.drain()
+    answer_sheet = make_answer_sheet(started_minutes_ago=20)
+    now = datetime.utcnow()
+
+    def event(minutes_ago: int, event_type: AttemptEventType, question_id: int | None = None) -> AttemptEventCreate:
+        return AttemptEventCreate(
+            question_id=question_id, event_type=event_type, occurred_at=now - timedelta(minutes=minutes_ago)
+        )
+
+    # A view lasts until the next event of the sheet (blur included), at most TELEMETRY_MAX_VIEW_SECONDS
+    batch = AttemptEventBatch(
+        events=[
+            event(10, AttemptEventType.view, 1),
+            event(9, AttemptEventType.answer_change, 1),
+            event(9, AttemptEventType.answer_change, 1),
+            event(8, AttemptEventType.view, 2),
+            event(2, AttemptEventType.view, 1),
+            event(1, AttemptEventType.blur),
+        ]
+    )
+    assert telemetry.ingest_attempt_events(
+        session, student_id=answer_sheet.student_id, answer_sheet_id=answer_sheet.id, batch=batch
+    ) == 6
+
+    crud_answer_sheet.finish_answer_sheet_attempt(session, answer_sheet.id, answer_sheet.student_id)
+    telemetry.record_time_on_task([answer_sheet.id])
+
+    time_on_task = {
+        row.question_id: (row.time_spent_seconds, row.view_count, row.answer_changes)
+        for row in crud_attempt_telemetry.get_time_on_task(session, answer_sheet.id)
+    }
+    assert time_on_task == {
+        1: (120, 2, 2),
+        # 6 minutes until the next view, capped
+        2: (300, 1, 0),
+    }
+
+
+def test_copy_attempt_events_creates_monthly_partitions(session: Session, make_answer_sheet):
+    answer_sheet = make_answer_sheet()
+    received_at = [datetime(2031, 1, 31, 23, 59), datetime(2031, 2, 1, 0, 1)]
+    crud_attempt_telemetry.copy_attempt_events(
+        session,
+        [(value, answer_sheet.id, 1, AttemptEventType.view.name, value) for value in received_at],
+    )
+    session.commit()
+
+    partitions = session.exec(
+        text(
+            "SELECT tableoid::regclass::text FROM attemptevent WHERE answer_sheet_id = :answer_sheet_id ORDER BY received_at"
+        ).bindparams(answer_sheet_id=answer_sheet.id)
+    ).all()
+    assert [partition for partition, in partitions] == [
+        monthly_partition_name(AttemptEvent.__tablename__, 2031, 1),
+        monthly_partition_name(AttemptEvent.__tablename__, 2031, 2),
+    ]
+    assert len(session.exec(select(AttemptEvent).where(AttemptEvent.answer_sheet_id == answer_sheet.id)).all()) == 2
@@ -0,0 +1,80 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Engine, create_engine, inspect, text
+from starlette.datastructures import Secret
+
+from app import settings
+from app.core.db_eng import tests_engine
+
+SCHEMA = "migration_test"
+BEFORE_REVISION = "5d8e1b4f7c20"
+REVISION = "e2c6a4d9b731"
+
+
+@pytest.fixture()
+def migration_engine(monkeypatch) -> Generator[Engine, None, None]:
+    """
+    Engine on an empty schema of the test database; alembic/env.py connects to it through DATABASE_URL
+    """
+    with tests_engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    url = tests_engine.url.update_query_dict({"options": f"-csearch_path={SCHEMA}"})
+    monkeypatch.setattr(settings, "DATABASE_URL", Secret(url.render_as_string(hide_password=False)))
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+    with tests_engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+@pytest.fixture()
+def alembic_config() -> Config:
+    root = Path(__file__).resolve().parents[2]
+    config = Config(str(root / "alembic.ini"))
+    config.set_main_option("script_location", str(root / "alembic"))
+    return config
+
+
+def test_selected_option_ids_backfill_and_downgrade(migration_engine: Engine, alembic_config: Config):
+    command.upgrade(alembic_config, BEFORE_REVISION)
+    with migration_engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO answersheet (id, student_id, quiz_id, time_limit, status, total_points, quiz_title) "
+                "VALUES (1, 1, 1, interval '30 minutes', 'completed', 7, 'Quiz')"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO answerslot (id, quiz_answer_sheet_id, question_id, question_type, points_awarded) VALUES "
+                "(1, 1, 1, 'multiple_select_mcq', 4), (2, 1, 2, 'single_select_mcq', 0)"
+            )
+        )
+        # Unordered and repeated option rows of slot 1, none for slot 2
+        connection.execute(
+            text(
+                "INSERT INTO answerslotoption (id, quiz_answer_slot_id, option_id) VALUES "
+                "(1, 1, 11), (2, 1, 10), (3, 1, 11)"
+            )
+        )
+
+    command.upgrade(alembic_config, REVISION)
+    with migration_engine.connect() as connection:
+        selected = connection.execute(text("SELECT id, selected_option_ids FROM answerslot ORDER BY id")).all()
+    assert [tuple(row) for row in selected] == [(1, [10, 11]), (2, [])]
+    assert "answerslotoption" not in inspect(migration_engine).get_table_names()
+
+    command.downgrade(alembic_config, BEFORE_REVISION)
+    with migration_engine.connect() as connection:
+        options = connection.execute(
+            text("SELECT quiz_answer_slot_id, option_id FROM answerslotoption ORDER BY quiz_answer_slot_id, option_id")
+        ).all()
+    assert [tuple(row) for row in options] == [(1, 10), (1, 11)]
+    assert "selected_option_ids" not in {column["name"] for column in inspect(migration_engine).get_columns("answerslot")}
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from app.main import app  # noqa: F401 - configures the model relationships
+from app.models.answersheet_model import AnswerSheet
+from app.models.answerslot_model import AnswerSlot
+from app.models.archive_model import AnswerSheetArchive
+from app.service.archive import pack_attempt, unpack_attempt, archived_answer_sheet_read, archived_quiz_feedback
+
+
+def _completed_attempt():
+    answer_sheet = AnswerSheet(
+        id=7, student_id=3, quiz_id=2, time_limit=timedelta(minutes=30), time_start=datetime(2024, 5, 1, 9),
+        time_finish=datetime(2024, 5, 1, 9, 20), status="completed", total_points=10, attempt_score=4,
+        quiz_title="Quiz", quiz_key="key",
+        quiz_snapshot={"quiz_questions": [{"id": 11, "question_text": "Q", "options": []}]},
+    )
+    answer_slots = [
+        AnswerSlot(id=1, quiz_answer_sheet_id=7, question_id=11, question_type="single_select_mcq",
+                   points_awarded=4, selected_option_ids=[21]),
+    ]
+    return answer_sheet, answer_slots
+
+
+def test_pack_attempt_roundtrip():
+    answer_sheet, answer_slots = _completed_attempt()
+    attempt = unpack_attempt(pack_attempt(answer_sheet, answer_slots))
+
+    assert attempt["answer_sheet"]["id"] == 7
+    assert attempt["quiz_answers"][0]["selected_option_ids"] == [21]
+    assert attempt["quiz_snapshot"]["quiz_questions"][0]["id"] == 11
+
+
+def test_archived_reads_match_live_shapes():
+    answer_sheet, answer_slots = _completed_attempt()
+    archived = AnswerSheetArchive(
+        id=7, time_finish=answer_sheet.time_finish, student_id=3, quiz_id=2,
+        payload=pack_attempt(answer_sheet, answer_slots),
+    )
+
+    assert archived_answer_sheet_read(archived).attempt_score == 4
+    feedback = archived_quiz_feedback(archived)
+    assert feedback.overview.id == 7
+    assert feedback.quiz_answers_attempted[0].points_awarded == 4
+    assert feedback.quiz_questions[0]["id"] == 11
+    assert archived_quiz_feedback(archived, include_questions=False).quiz_questions is None
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+import pytest
+
+from app.service.attempt_history import encode_history_cursor, decode_history_cursor
+
+
+def test_history_cursor_round_trip():
+    time_start = datetime(2024, 5, 1, 9, 30, 15, 123456)
+    cursor = encode_history_cursor(time_start, 42)
+    assert "=" not in cursor
+    assert decode_history_cursor(cursor) == (time_start, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "MjAyNC0wNS0wMQ"])
+def test_history_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_history_cursor(cursor)
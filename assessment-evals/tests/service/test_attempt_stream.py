@@ -0,0 +1,60 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from app.models.base import QuizAttemptStatus
+from app.service.attempt_stream import (
+    AttemptState,
+    attempt_events,
+    attempt_state_events,
+    publish_answer_saved,
+    publish_attempt_finished,
+)
+
+
+def _parse(message: str) -> tuple[str, dict]:
+    event_line, data_line = message.strip().split("\n")
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+
+def test_stream_pushes_answers_and_finish():
+    async def main():
+        state = AttemptState(
+            answer_sheet_id=101,
+            status=QuizAttemptStatus.in_progress,
+            deadline=datetime.utcnow() + timedelta(minutes=30),
+            answered_count=2,
+        )
+        queue = attempt_events.subscribe(101)
+        events = attempt_state_events(state, queue)
+
+        messages = [await anext(events)]
+        publish_answer_saved(101)
+        messages.append(await anext(events))
+        publish_attempt_finished(101, finish_reason="submitted")
+        messages.append(await anext(events))
+        return [_parse(message) for message in messages]
+
+    (first, initial), (second, answered), (third, finished) = asyncio.run(main())
+    assert (first, initial["answered_count"]) == ("state", 2)
+    assert 0 < initial["remaining_seconds"] <= 30 * 60
+    assert (second, answered["answered_count"]) == ("answered", 3)
+    assert (third, finished["finish_reason"]) == ("finished", "submitted")
+    assert not attempt_events.has_subscribers(101)
+
+
+def test_stream_finishes_at_deadline():
+    async def main():
+        state = AttemptState(
+            answer_sheet_id=102,
+            status=QuizAttemptStatus.in_progress,
+            deadline=datetime.utcnow() + timedelta(milliseconds=50),
+            answered_count=0,
+        )
+        queue = attempt_events.subscribe(102)
+        return [_parse(message) async for message in attempt_state_events(state, queue)]
+
+    messages = asyncio.run(main())
+    assert [event for event, _ in messages] == ["state", "finished"]
+    assert messages[-1][1]["finish_reason"] == "deadline"
+    assert messages[-1][1]["remaining_seconds"] == 0
@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+
+from app.service.collusion import encode_wrong_answers, find_similar_attempts, jaccard, minhash_signatures
+from app.service.grading import CompiledQuiz
+
+
+def _quiz(question_count: int) -> CompiledQuiz:
+    # Four options per question, the first one is correct
+    return CompiledQuiz.from_questions(
+        [
+            {
+                "id": question_id,
+                "points": 1,
+                "question_type": "single_select_mcq",
+                "options": [{"id": question_id * 10 + option, "is_correct": option == 0} for option in range(4)],
+            }
+            for question_id in range(1, question_count + 1)
+        ]
+    )
+
+
+def test_encode_wrong_answers_keeps_only_wrong_options():
+    compiled_quiz = _quiz(2)
+    wrong_answer_sets = encode_wrong_answers(
+        compiled_quiz,
+        [
+            (1, 100, 1, [12]),  # wrong
+            (1, 100, 2, [20]),  # correct
+            (2, 200, 1, [10]),  # correct only - no wrong answers
+            (1, 100, 3, [31]),  # unknown question
+        ],
+    )
+    assert len(wrong_answer_sets) == 1
+    assert wrong_answer_sets[0].answer_sheet_id == 1
+    assert wrong_answer_sets[0].positions.tolist() == [2]
+    assert wrong_answer_sets[0].bitset == 0b100
+
+
+def test_minhash_agreement_tracks_jaccard():
+    feature_a = np.arange(0, 100, dtype=np.uint64)
+    feature_b = np.arange(20, 120, dtype=np.uint64)
+    signatures = minhash_signatures([feature_a, feature_b, feature_a], num_permutations=256)
+    assert (signatures[0] == signatures[2]).all()
+    # true Jaccard is 80 / 120
+    assert abs((signatures[0] == signatures[1]).mean() - 80 / 120) < 0.1
+
+
+def test_find_similar_attempts_flags_copied_wrong_answers():
+    question_count = 40
+    compiled_quiz = _quiz(question_count)
+    rng = np.random.default_rng(7)
+
+    selections = []
+    for answer_sheet_id in range(1, 3001):
+        for question_id in range(1, question_count + 1):
+            selections.append((answer_sheet_id, answer_sheet_id, question_id, [question_id * 10 + int(rng.integers(0, 4))]))
+    # Sheet 2 copies the answers of sheet 1
+    copied = {question_id: option for sheet_id, _, question_id, option in selections if sheet_id == 1}
+    selections = [
+        (sheet_id, student_id, question_id, copied[question_id] if sheet_id == 2 else option)
+        for sheet_id, student_id, question_id, option in selections
+    ]
+
+    wrong_answer_sets = encode_wrong_answers(compiled_quiz, selections)
+    started = time.perf_counter()
+    candidate_pairs, flagged_pairs = find_similar_attempts(wrong_answer_sets)
+    assert time.perf_counter() - started < 60
+
+    # a small fraction of the 4.5M pairs
+    assert candidate_pairs < 3000 * 2999 // 2 // 20
+    assert [(pair["answer_sheet_id_a"], pair["answer_sheet_id_b"]) for pair in flagged_pairs] == [(1, 2)]
+    assert flagged_pairs[0]["jaccard"] == 1.0
+
+
+def test_jaccard():
+    assert jaccard(0b1100, 0b0110) == 1 / 3
+    assert jaccard(0, 0) == 0.0
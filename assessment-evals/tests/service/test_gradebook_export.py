@@ -0,0 +1,34 @@
+import csv
+import io
+import json
+
+from app.service.gradebook_export import export_csv, export_ndjson, gradebook_columns
+
+
+def _batches():
+    yield [
+        {"answer_sheet_id": 1, "student_id": 7, "attempt_score": 4.5, "question_points": {"11": 4.5}},
+        {"answer_sheet_id": 2, "student_id": 8, "attempt_score": None, "question_points": None},
+    ]
+    yield [{"answer_sheet_id": 3, "student_id": 9, "attempt_score": 0.0, "question_points": {}}]
+
+
+def test_export_csv_sends_header_first():
+    columns = ["answer_sheet_id", "student_id", "attempt_score", "question_points"]
+    chunks = export_csv(_batches(), columns)
+
+    assert next(chunks).strip() == ",".join(columns)
+    rows = list(csv.DictReader(io.StringIO(",".join(columns) + "\n" + "".join(chunks))))
+    assert [row["answer_sheet_id"] for row in rows] == ["1", "2", "3"]
+    assert json.loads(rows[0]["question_points"]) == {"11": 4.5}
+    assert json.loads(rows[1]["question_points"]) == {}
+
+
+def test_export_ndjson_one_object_per_line():
+    lines = "".join(export_ndjson(_batches(), [])).splitlines()
+    assert [json.loads(line)["answer_sheet_id"] for line in lines] == [1, 2, 3]
+
+
+def test_gradebook_columns():
+    assert "question_points" not in gradebook_columns(False)
+    assert gradebook_columns(True)[-1] == "question_points"
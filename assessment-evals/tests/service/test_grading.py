@@ -0,0 +1,55 @@
+import numpy as np
+
+from app.service.grading import CompiledQuiz, compile_answer_key, grade_answer
+
+multiple_select_question = {
+    "id": 1,
+    "points": 4,
+    "question_type": "multiple_select_mcq",
+    "options": [
+        {"id": 12, "is_correct": False},
+        {"id": 10, "is_correct": True},
+        {"id": 11, "is_correct": True},
+    ],
+}
+single_select_question = {
+    "id": 2,
+    "points": 3,
+    "question_type": "single_select_mcq",
+    "options": [{"id": 20, "is_correct": True}, {"id": 21, "is_correct": False}],
+}
+
+
+def test_compiled_answer_key_bitmask():
+    answer_key = compile_answer_key(multiple_select_question)
+    assert answer_key.option_ids == (10, 11, 12)
+    assert answer_key.correct_mask == 0b011
+    assert answer_key.selection_mask([12, 10, 99]) == 0b101
+
+
+def test_single_select():
+    answer_key = compile_answer_key(single_select_question)
+    assert grade_answer(answer_key, [20]) == 3
+    assert grade_answer(answer_key, [21]) == 0
+    assert grade_answer(answer_key, [20, 21]) == 0
+
+
+def test_multiple_select_partial_credit():
+    answer_key = compile_answer_key(multiple_select_question)
+    assert grade_answer(answer_key, [10, 11]) == 4
+    assert grade_answer(answer_key, [10, 12]) == 2
+    assert grade_answer(answer_key, [12]) == 0
+    assert grade_answer(answer_key, []) == 0
+
+
+def test_grade_batch_matches_single_grading():
+    compiled_quiz = CompiledQuiz.from_questions([multiple_select_question, single_select_question])
+    answers = [(1, [10, 11]), (1, [10, 12]), (2, [20]), (2, [21]), (2, [10]), (1, []), (3, [20])]
+
+    points_awarded = compiled_quiz.grade_batch(
+        [question_id for question_id, _ in answers], [selected for _, selected in answers]
+    )
+
+    assert np.isnan(points_awarded[-1])
+    for (question_id, selected), points in zip(answers[:-1], points_awarded[:-1]):
+        assert points == grade_answer(compiled_quiz.get(question_id), selected)
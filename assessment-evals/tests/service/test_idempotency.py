@@ -0,0 +1,26 @@
+from app.models.answersheet_model import AttemptQuizRequest
+from app.service.idempotency import request_hash
+
+
+def test_request_hash_is_stable_for_the_same_request():
+    assert request_hash("attempt", AttemptQuizRequest(quiz_id=1, quiz_key="key")) == request_hash(
+        "attempt", {"quiz_key": "key", "quiz_id": 1}
+    )
+
+
+def test_request_hash_differs_by_route_and_body():
+    body = AttemptQuizRequest(quiz_id=1, quiz_key="key")
+    assert request_hash("attempt", body) != request_hash("answer_slot/save", body)
+    assert request_hash("attempt", body) != request_hash("attempt", AttemptQuizRequest(quiz_id=2, quiz_key="key"))
+
+
+def test_run_idempotent_without_key_runs_the_request():
+    from app.service.idempotency import run_idempotent
+
+    calls = []
+    response = run_idempotent(
+        db=None, student_id=1, idempotency_key=None, route="attempt", request_body={},
+        response_model=AttemptQuizRequest, fn=lambda: calls.append(1) or "response",
+    )
+    assert response == "response"
+    assert calls == [1]
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from app.models.base import QuizAttemptStatus
+from app.service import proctor
+from app.service.proctor import QuizLiveCounters, broadcast_proctor_counters, proctor_events
+
+
+def test_counters_seeded_and_updated_by_events():
+    counters = QuizLiveCounters(
+        1,
+        [(10, QuizAttemptStatus.in_progress), (11, QuizAttemptStatus.completed)],
+        [(10, 100), (11, 100)],
+    )
+    counters.attempt_started(12)
+    counters.answer_saved(12, 100)
+    counters.answer_saved(12, 101)
+    # repeated answer event for the same sheet and question
+    counters.answer_saved(12, 101)
+    counters.attempt_finished(10)
+    # repeated finish and a late start for a finished sheet do not count twice
+    counters.attempt_finished(10)
+    counters.attempt_started(10)
+
+    snapshot = counters.snapshot()
+    assert (snapshot.started, snapshot.in_progress, snapshot.finished) == (3, 1, 2)
+    assert snapshot.answers_per_question == {100: 3, 101: 1}
+    assert snapshot.total_answers == 4
+
+
+def test_broadcast_sends_changed_quizzes_once():
+    async def main():
+        counters = QuizLiveCounters(2)
+        proctor._counters[2] = counters
+        queue = proctor_events.subscribe(2)
+        try:
+            assert broadcast_proctor_counters() == 0
+            proctor.record_attempt_started(2, 20)
+            proctor.record_answer_saved(2, 20, 200)
+            assert broadcast_proctor_counters() == 1
+            assert broadcast_proctor_counters() == 0
+            await asyncio.sleep(0)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+        finally:
+            proctor.unsubscribe_quiz_dashboard(2, queue)
+
+    (message,) = asyncio.run(main())
+    event_line, data_line = message.strip().split("\n")
+    assert event_line == "event: counters"
+    assert json.loads(data_line.removeprefix("data: "))["answers_per_question"] == {"200": 1}
+    assert 2 not in proctor._counters
+
+
+def test_events_during_seeding_are_kept(monkeypatch):
+    def load_quiz_live_state(quiz_id):
+        # published after the counters were registered, before the DB read returned;
+        # sheet 31 is also in the DB state and must only be counted once
+        proctor.record_attempt_started(quiz_id, 31)
+        proctor.record_answer_saved(quiz_id, 31, 300)
+        proctor.record_attempt_finished(quiz_id, 30)
+        proctor.record_answer_saved(quiz_id, 32, 300)
+        return [(30, QuizAttemptStatus.in_progress), (31, QuizAttemptStatus.in_progress)], [(30, 300), (31, 300)]
+
+    monkeypatch.setattr(proctor, "load_quiz_live_state", load_quiz_live_state)
+
+    async def main():
+        queue = await proctor.subscribe_quiz_dashboard(3)
+        try:
+            return proctor._counters[3].snapshot()
+        finally:
+            proctor.unsubscribe_quiz_dashboard(3, queue)
+
+    snapshot = asyncio.run(main())
+    assert (snapshot.started, snapshot.in_progress, snapshot.finished) == (2, 1, 1)
+    assert snapshot.answers_per_question == {300: 3}
+    assert 3 not in proctor._counters
@@ -0,0 +1,26 @@
+from app.service.question_ordering import order_quiz_questions
+
+quiz_questions = [
+    {"id": question_id, "options": [{"id": option_id, "option_text": "Option"} for option_id in range(4)]}
+    for question_id in range(1, 11)
+]
+
+
+def test_same_seed_gives_same_order():
+    first = order_quiz_questions(quiz_questions, 1234)
+    second = order_quiz_questions(list(reversed(quiz_questions)), 1234)
+    assert [question["id"] for question in first] == [question["id"] for question in second]
+    assert [option["id"] for option in first[0]["options"]] == [option["id"] for option in second[0]["options"]]
+
+
+def test_option_order_is_stable_when_questions_are_filtered():
+    ordered = order_quiz_questions(quiz_questions, 99)
+    remaining = order_quiz_questions(quiz_questions[5:], 99)
+    ordered_by_id = {question["id"]: question["options"] for question in ordered}
+    for question in remaining:
+        assert question["options"] == ordered_by_id[question["id"]]
+
+
+def test_snapshot_is_not_mutated():
+    order_quiz_questions(quiz_questions, 7)
+    assert [option["id"] for option in quiz_questions[0]["options"]] == [0, 1, 2, 3]
@@ -0,0 +1,51 @@
+import pytest
+
+from app.models.answerslot_model import AnswerSlotCreate
+from app.service.quiz_snapshot import build_quiz_snapshot, validate_answer_against_snapshot
+
+runtime_quiz = {
+    "quiz_title": "Quiz",
+    "course_id": 1,
+    "total_points": 2,
+    "quiz_questions": [
+        {
+            "id": 1,
+            "question_text": "Question",
+            "points": 2,
+            "question_type": "single_select_mcq",
+            "options": [{"id": 10, "option_text": "A", "is_correct": True}, {"id": 11, "option_text": "B"}],
+        }
+    ],
+}
+
+
+def answer(question_id=1, question_type="single_select_mcq", selected_options_ids=[10]):
+    return AnswerSlotCreate(
+        quiz_answer_sheet_id=1,
+        question_id=question_id,
+        question_type=question_type,
+        selected_options_ids=selected_options_ids,
+    )
+
+
+def test_snapshot_has_no_answer_keys():
+    snapshot = build_quiz_snapshot(runtime_quiz)
+    assert "is_correct" not in snapshot["quiz_questions"][0]["options"][0]
+
+
+def test_valid_answer_passes():
+    validate_answer_against_snapshot(build_quiz_snapshot(runtime_quiz), answer())
+
+
+@pytest.mark.parametrize(
+    "invalid_answer",
+    [
+        answer(question_id=2),
+        answer(question_type="multiple_select_mcq"),
+        answer(selected_options_ids=[12]),
+        answer(selected_options_ids=[10, 11]),
+    ],
+)
+def test_invalid_answer_raises(invalid_answer):
+    with pytest.raises(ValueError):
+        validate_answer_against_snapshot(build_quiz_snapshot(runtime_quiz), invalid_answer)
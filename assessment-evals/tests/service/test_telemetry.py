@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta, timezone
+
+from app.service.telemetry import EventBuffer, _naive_utc
+
+
+def test_event_buffer_drops_events_over_capacity():
+    event_buffer = EventBuffer(max_events=3)
+    assert event_buffer.add([(1,), (2,)]) == 2
+    assert event_buffer.add([(3,), (4,)]) == 1
+    assert event_buffer.dropped == 1
+    assert event_buffer.drain(limit=2) == [(1,), (2,)]
+    assert len(event_buffer) == 1
+
+
+def test_event_buffer_requeues_in_front():
+    event_buffer = EventBuffer(max_events=10)
+    event_buffer.add([(1,), (2,), (3,)])
+    drained = event_buffer.drain()
+    event_buffer.add([(4,)])
+    event_buffer.requeue(drained)
+    assert event_buffer.drain() == [(1,), (2,), (3,), (4,)]
+
+
+def test_naive_utc():
+    aware = datetime(2024, 5, 1, 14, 30, tzinfo=timezone(timedelta(hours=5)))
+    assert _naive_utc(aware) == datetime(2024, 5, 1, 9, 30)
+    assert _naive_utc(datetime(2024, 5, 1, 9, 30)) == datetime(2024, 5, 1, 9, 30)
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.service.waiting_room import WaitingRoom, ensure_admitted
+
+start_time = datetime(2026, 1, 1, 9, 0, 0)
+
+
+def make_room(admission_rate=10):
+    return WaitingRoom(quiz_id=1, quiz_key="key", start_time=start_time, end_time=None, admission_rate=admission_rate)
+
+
+def test_tickets_are_admitted_at_the_configured_rate():
+    room = make_room()
+    early = start_time - timedelta(minutes=5)
+    for student_id in range(30):
+        room.join(student_id, early)
+
+    assert room.status(0, start_time).admitted
+    assert not room.status(10, start_time).admitted
+    assert room.status(10, start_time + timedelta(seconds=1)).admitted
+    assert room.status(25, start_time).position == 24
+    assert room.status(25, start_time).estimated_wait_seconds == 3
+
+
+def test_join_keeps_the_original_ticket():
+    room = make_room()
+    first = room.join(7, start_time)
+    room.join(8, start_time)
+    assert room.join(7, start_time + timedelta(seconds=5)) == first
+
+
+def test_late_arrivals_skip_passed_slots():
+    room = make_room()
+    room.join(1, start_time)
+    late = start_time + timedelta(seconds=60)
+    room.join(2, late)
+    assert room.status(2, late).admitted
+
+
+def test_not_admitted_raises_429_with_retry_after():
+    room = WaitingRoom(quiz_id=1, quiz_key="key", start_time=datetime.now() + timedelta(minutes=1), end_time=None, admission_rate=1)
+    with pytest.raises(HTTPException) as exc:
+        ensure_admitted(room=room, student_id=4)
+    assert exc.value.status_code == 429
+    assert int(exc.value.headers["Retry-After"]) > 0
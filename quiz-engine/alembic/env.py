@@ -11,10 +11,11 @@ from sqlmodel import SQLModel
 from app.models.question_models import QuestionBank
 from app.models.answer_models import MCQOption
 from app.models.topic_models import Topic
-from app.models.content_models import Content
+from app.models.content_models import Content, ContentSegment
 from app.models.quiz_models import Quiz, QuizQuestion
 from app.models.link_models import QuizTopic
 from app.models.quiz_setting import QuizSetting
+from app.models.dedup_models import QuestionFingerprint
 
 
 # this is the Alembic Config object, which provides
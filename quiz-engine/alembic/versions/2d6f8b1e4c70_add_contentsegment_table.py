@@ -0,0 +1,86 @@
+"""Add ContentSegment table
+
+Revision ID: 2d6f8b1e4c70
+Revises: 7b1e4d9c3a52
+Create Date: 2026-10-18 22:41:03.117264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from app.settings import CONTENT_SEGMENT_MAX_BYTES
+from app.core.content_segments import split_segments, json_byte_size, estimate_tokens
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d6f8b1e4c70'
+down_revision: Union[str, None] = '7b1e4d9c3a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _segments(rows) -> list[dict]:
+    """
+    Segments of (id, topic_id, content_text) content rows
+    """
+    return [
+        {
+            "content_id": row.id,
+            "topic_id": row.topic_id,
+            "position": position,
+            "text": text,
+            "byte_size": json_byte_size(text),
+            "token_count": estimate_tokens(text),
+        }
+        for row in rows
+        for position, text in enumerate(split_segments(row.content_text, CONTENT_SEGMENT_MAX_BYTES))
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('contentsegment',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_id', sa.Integer(), nullable=False),
+    sa.Column('topic_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('text', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('byte_size', sa.Integer(), nullable=False),
+    sa.Column('token_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['content_id'], ['content.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_contentsegment_topic_order', 'contentsegment', ['topic_id', 'content_id', 'position'], unique=True)
+
+    # Segments of the content already stored, new content is segmented when saved
+    content_segment = sa.table(
+        'contentsegment',
+        sa.column('content_id', sa.Integer()),
+        sa.column('topic_id', sa.Integer()),
+        sa.column('position', sa.Integer()),
+        sa.column('text', sa.String()),
+        sa.column('byte_size', sa.Integer()),
+        sa.column('token_count', sa.Integer()),
+    )
+    bind = op.get_bind()
+    after_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text("SELECT id, topic_id, content_text FROM content WHERE id > :after_id ORDER BY id LIMIT :limit"),
+            {"after_id": after_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        segments = _segments(rows)
+        if segments:
+            bind.execute(sa.insert(content_segment), segments)
+        after_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contentsegment_topic_order', table_name='contentsegment')
+    op.drop_table('contentsegment')
@@ -0,0 +1,80 @@
+"""Add QuestionFingerprint table
+
+Revision ID: 7b1e4d9c3a52
+Revises: e5a8c2f1b7d3
+Create Date: 2026-10-18 21:27:19.548802
+
+"""
+from datetime import datetime
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.minhash import band_keys, question_shingles
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e4d9c3a52'
+down_revision: Union[str, None] = 'e5a8c2f1b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _fingerprints(rows, updated_at: datetime) -> list[dict]:
+    """
+    Band keys of (id, question_text, option_text) rows ordered by question id
+    """
+    fingerprints = []
+    for question_id, question_rows in groupby(rows, key=lambda row: row.id):
+        question_rows = list(question_rows)
+        option_texts = [row.option_text for row in question_rows if row.option_text is not None]
+        fingerprints.append({
+            "question_id": question_id,
+            "band_keys": band_keys(question_shingles(question_rows[0].question_text, option_texts)),
+            "updated_at": updated_at,
+        })
+    return fingerprints
+
+
+def upgrade() -> None:
+    op.create_table('questionfingerprint',
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('band_keys', postgresql.ARRAY(sa.BigInteger()), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['questionbank.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('question_id')
+    )
+    op.create_index('ix_questionfingerprint_band_keys', 'questionfingerprint', ['band_keys'], unique=False, postgresql_using='gin')
+
+    # Fingerprints of the questions already in the bank, new ones are indexed when saved
+    question_fingerprint = sa.table(
+        'questionfingerprint',
+        sa.column('question_id', sa.Integer()),
+        sa.column('band_keys', postgresql.ARRAY(sa.BigInteger())),
+        sa.column('updated_at', sa.DateTime()),
+    )
+    bind = op.get_bind()
+    after_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT q.id, q.question_text, o.option_text FROM ("
+                "SELECT id, question_text FROM questionbank WHERE id > :after_id ORDER BY id LIMIT :limit"
+                ") q LEFT JOIN mcqoption o ON o.question_id = q.id ORDER BY q.id"
+            ),
+            {"after_id": after_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(sa.insert(question_fingerprint), _fingerprints(rows, datetime.utcnow()))
+        after_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questionfingerprint_band_keys', table_name='questionfingerprint', postgresql_using='gin')
+    op.drop_table('questionfingerprint')
@@ -0,0 +1,28 @@
+"""Add QuizSetting waiting room
+
+Revision ID: c41d7b9e2a06
+Revises: 89fabb012a3a
+Create Date: 2026-10-18 11:20:05.604712
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7b9e2a06'
+down_revision: Union[str, None] = '89fabb012a3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('quizsetting', sa.Column('waiting_room_enabled', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('quizsetting', sa.Column('admission_rate', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('quizsetting', 'admission_rate')
+    op.drop_column('quizsetting', 'waiting_room_enabled')
@@ -0,0 +1,43 @@
+"""Add QuestionBank & MCQOption search vectors
+
+Revision ID: e5a8c2f1b7d3
+Revises: c41d7b9e2a06
+Create Date: 2026-10-18 20:52:44.190367
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a8c2f1b7d3'
+down_revision: Union[str, None] = 'c41d7b9e2a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('questionbank', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', question_text)", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_questionbank_search_vector', 'questionbank', ['search_vector'], unique=False, postgresql_using='gin')
+    op.add_column('mcqoption', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(option_text, ''))", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_mcqoption_search_vector', 'mcqoption', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mcqoption_search_vector', table_name='mcqoption', postgresql_using='gin')
+    op.drop_column('mcqoption', 'search_vector')
+    op.drop_index('ix_questionbank_search_vector', table_name='questionbank', postgresql_using='gin')
+    op.drop_column('questionbank', 'search_vector')
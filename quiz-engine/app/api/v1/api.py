@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.routes import (health, topic, content, question, answer, quiz, quiz_question, quiz_setting, wrapper)
+from app.api.v1.routes import (health, topic, content, question, answer, quiz, quiz_question, quiz_setting, wrapper, search, batch)
 from app.settings import GET_CUSTOM_GPT_SPEC
 from app.api.deps import GetCurrentAdminDep
 
@@ -15,3 +15,5 @@ api_router.include_router(quiz.router, tags=["Quiz"], prefix="/quiz", dependenci
 api_router.include_router(quiz_question.router, tags=["QuizQuestion"], prefix="/quiz", dependencies=[GetCurrentAdminDep])
 api_router.include_router(quiz_setting.router, tags=["QuizSetting"], prefix="/quiz-setting", dependencies=[GetCurrentAdminDep])
 api_router.include_router(wrapper.router, tags=["Wrapper & Runtime Generation APIs"], prefix="/wrapper", include_in_schema=GET_CUSTOM_GPT_SPEC)
+api_router.include_router(search.router, tags=["Search"], prefix="/search", dependencies=[GetCurrentAdminDep])
+api_router.include_router(batch.router, tags=["Batch"], prefix="/batch", dependencies=[GetCurrentAdminDep])
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
 
 from app.api.deps import DBSessionDep
 from app.core.config import logger_config
+from app.core.requests import notify_answer_key_changed
 
 from app.crud.answer_crud import mcq_crud
 from app.models.answer_models import (
@@ -66,7 +67,7 @@ def call_read_mcq_options(
 
 
 @router.post("/mcq-option", response_model=MCQOptionRead)
-def call_add_mcq_option(mcq_option: MCQOptionCreate, db: DBSessionDep):
+def call_add_mcq_option(mcq_option: MCQOptionCreate, db: DBSessionDep, background_tasks: BackgroundTasks):
     """
     Add an MCQ option to the database.
 
@@ -79,7 +80,11 @@ def call_add_mcq_option(mcq_option: MCQOptionCreate, db: DBSessionDep):
     """
     logger.info("%s.add_mcq_option: %s", __name__, mcq_option)
     try:
-        return mcq_crud.add_mcq_option(mcq_option=mcq_option, session=db)
+        mcq_option_added = mcq_crud.add_mcq_option(mcq_option=mcq_option, session=db)
+        # A new correct option changes the answer key of the question
+        if mcq_option_added.is_correct and mcq_option_added.question_id:
+            background_tasks.add_task(notify_answer_key_changed, mcq_option_added.question_id)
+        return mcq_option_added
     except HTTPException as http_err:
         raise http_err
     except Exception as e:
@@ -109,7 +114,7 @@ def call_get_mcq_option_by_id(mcq_option_id: int, db: DBSessionDep):
 
 @router.patch("/mcq-option/{mcq_option_id}", response_model=MCQOptionRead)
 def call_update_mcq_option(
-    mcq_option_id: int, mcq_option: MCQOptionUpdate, db: DBSessionDep
+    mcq_option_id: int, mcq_option: MCQOptionUpdate, db: DBSessionDep, background_tasks: BackgroundTasks
 ):
     """
     Update an MCQ option by its ID in the database.
@@ -124,9 +129,15 @@ def call_update_mcq_option(
     """
     logger.info("%s.update_mcq_option: %s", __name__, mcq_option)
     try:
-        return mcq_crud.update_mcq_option(
+        previous_question_id = mcq_crud.get_mcq_option_by_id(id=mcq_option_id, db=db).question_id
+        mcq_option_updated = mcq_crud.update_mcq_option(
             id=mcq_option_id, mcq_option=mcq_option, db=db
         )
+        # is_correct or moving the option to another question changes the answer key
+        if mcq_option.model_fields_set & {"is_correct", "question_id"}:
+            for question_id in {previous_question_id, mcq_option_updated.question_id} - {None}:
+                background_tasks.add_task(notify_answer_key_changed, question_id)
+        return mcq_option_updated
     except HTTPException as http_err:
         raise http_err
     except Exception as e:
@@ -134,7 +145,7 @@ def call_update_mcq_option(
 
 
 @router.delete("/mcq-option/{mcq_option_id}")
-def call_delete_mcq_option(mcq_option_id: int, db: DBSessionDep):
+def call_delete_mcq_option(mcq_option_id: int, db: DBSessionDep, background_tasks: BackgroundTasks):
     """
     Delete an MCQ option by its ID from the database.
 
@@ -147,7 +158,11 @@ def call_delete_mcq_option(mcq_option_id: int, db: DBSessionDep):
     """
     logger.info("%s.delete_mcq_option: %s", __name__, mcq_option_id)
     try:
-        return mcq_crud.delete_mcq_option(id=mcq_option_id, db=db)
+        question_id = mcq_crud.get_mcq_option_by_id(id=mcq_option_id, db=db).question_id
+        deleted = mcq_crud.delete_mcq_option(id=mcq_option_id, db=db)
+        if question_id:
+            background_tasks.add_task(notify_answer_key_changed, question_id)
+        return deleted
     except HTTPException as http_err:
         raise http_err
     except Exception as e:
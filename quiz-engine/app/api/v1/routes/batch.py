@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException
+
+from app.api.deps import DBSessionDep
+from app.core.config import logger_config
+from app.crud.batch_read_crud import batch_read_crud
+from app.models.batch_models import BatchReadRequest, BatchReadResponse
+
+router = APIRouter()
+
+logger = logger_config(__name__)
+
+
+@router.post("/read", response_model=BatchReadResponse)
+def call_batch_read(batch: BatchReadRequest, db: DBSessionDep):
+    """
+    Run several reads in one call: topic, subtopics, questions_by_topic and quiz (with optional fields / include).
+
+    Args:
+        batch (BatchReadRequest): Up to 20 operations, each with a unique key.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        BatchReadResponse: Status code and data (or error detail) per operation key.
+    """
+    logger.info("%s.batch_read: %s", __name__, [operation.key for operation in batch.operations])
+    try:
+        return BatchReadResponse(results=batch_read_crud.read_many(operations=batch.operations, db=db))
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,8 +2,11 @@ from fastapi import APIRouter, Query, HTTPException, status
 from app.api.deps import DBSessionDep
 
 from app.crud.content_crud import content_crud
-from app.models.content_models import ContentCreate, ContentResponse, ContentUpdate
+from app.crud.content_segment_crud import content_segment_crud
+from app.models.content_models import ContentCreate, ContentResponse, ContentUpdate, ContentSegmentRead, ContentSegmentPage
 from app.core.config import logger_config
+from app.core.utils import encode_cursor, decode_cursor
+from app.settings import CONTENT_PAGE_DEFAULT_BYTES
 
 router = APIRouter()
 
@@ -63,6 +66,54 @@ def get_content_for_topic(topic_id: int, db: DBSessionDep):
         raise HTTPException(status_code=500, detail="Failed to retrieve content.")
 
 
+# Get the Content of a Topic as segments that fit a response size
+@router.get("/{topic_id}/segments", response_model=ContentSegmentPage)
+def get_content_segments_for_topic(
+    topic_id: int,
+    db: DBSessionDep,
+    max_bytes: int = Query(default=CONTENT_PAGE_DEFAULT_BYTES, ge=4096, le=1_000_000),
+    cursor: str | None = None,
+):
+    """
+    Get the content of a topic in order, a page at a time, each page at most max_bytes of JSON.
+
+    Args:
+        topic_id (int): The ID of the topic.
+        max_bytes (int, optional): Response size budget in bytes.
+        cursor (str, optional): next_cursor of the previous page.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        ContentSegmentPage: The segments with their byte and token sizes, and the next page cursor.
+    """
+    logger.info("%s.get_content_segments_for_topic: %s", __name__, topic_id)
+    after = None
+    if cursor:
+        try:
+            content_id, position = decode_cursor(cursor)
+            after = (int(content_id), int(position))
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        segments, has_more = content_segment_crud.read_segment_page(
+            topic_id=topic_id, max_bytes=max_bytes, db=db, after=after
+        )
+        next_cursor = encode_cursor(segments[-1].content_id, segments[-1].position) if has_more else None
+        return ContentSegmentPage(
+            topic_id=topic_id,
+            segments=[ContentSegmentRead.model_validate(segment) for segment in segments],
+            byte_size=sum(segment.byte_size for segment in segments),
+            token_count=sum(segment.token_count for segment in segments),
+            next_cursor=next_cursor,
+        )
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        logger.error(f"Unexpected error retrieving content segments: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve content.")
+
+
 # Get a Content by ID
 @router.get("/{topic_id}/content/{content_id}", response_model=ContentResponse)
 def call_get_content_by_id(topic_id: int, content_id: int, db: DBSessionDep):
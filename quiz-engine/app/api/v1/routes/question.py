@@ -1,15 +1,25 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+from fastapi.responses import JSONResponse
 
 from app.api.deps import DBSessionDep
 from app.core.config import logger_config
+from app.core.requests import notify_answer_key_changed
+from app.core.utils import encode_cursor, decode_cursor
+from app.core.fieldsets import parse_fieldset
 
 from app.crud.question_crud import question_crud
+from app.crud.question_dedup_crud import question_dedup_crud
 from app.models.question_models import (
+    QuestionBank,
     QuestionBankCreate,
     QuestionBankUpdate,
     QuestionBankRead,
+    QuestionSearchHit,
+    QuestionSearchPage,
 )
-from app.settings import GET_CUSTOM_GPT_SPEC
+from app.models.base import QuestionDifficultyEnum, QuestionTypeEnum
+from app.models.dedup_models import SimilarQuestion, DuplicateQuestionPair
+from app.settings import GET_CUSTOM_GPT_SPEC, DUPLICATE_QUESTION_THRESHOLD
 
 
 router = APIRouter()
@@ -17,12 +27,14 @@ router = APIRouter()
 logger = logger_config(__name__)
 
 @router.post("", response_model=QuestionBankRead)
-def create_new_question(question: QuestionBankCreate, db: DBSessionDep):
+def create_new_question(question: QuestionBankCreate, db: DBSessionDep, reject_duplicates: bool = False):
     """
     Add a question to the database.
 
     Args:
         question (QuestionBank): The question to be added.
+        reject_duplicates (bool, optional): Respond 409 with the similar questions instead of
+            adding a near duplicate. Defaults to False.
         db (optional) : Database Dependency Injection.
 
     Returns:
@@ -30,6 +42,21 @@ def create_new_question(question: QuestionBankCreate, db: DBSessionDep):
     """
     logger.info("%s.create_a_question: %s", __name__, question)
     try:
+        if reject_duplicates:
+            similar_questions = question_dedup_crud.find_similar_questions(
+                question_text=question.question_text,
+                option_texts=[option.option_text for option in question.options],
+                threshold=DUPLICATE_QUESTION_THRESHOLD,
+                db=db,
+            )
+            if similar_questions:
+                raise HTTPException(
+                    status_code=409,
+                    detail={
+                        "message": "Similar questions already exist",
+                        "similar_question_ids": [similar.id for similar, _ in similar_questions],
+                    },
+                )
         return question_crud.add_question(question=question, db=db)
     except HTTPException as http_err:
         raise http_err
@@ -110,21 +137,154 @@ def call_read_questions_by_type(question_type: str, db: DBSessionDep):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/similar", response_model=list[SimilarQuestion])
+def call_find_similar_questions(
+    question: QuestionBankCreate,
+    db: DBSessionDep,
+    threshold: float = Query(default=DUPLICATE_QUESTION_THRESHOLD, gt=0, le=1),
+):
+    """
+    Check a new question for near duplicates in the question bank before adding it.
+
+    Args:
+        question (QuestionBankCreate): The question text and options to check.
+        threshold (float, optional): Minimum similarity (0-1) of question text and options.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        list[SimilarQuestion]: Similar questions, most similar first.
+    """
+    logger.info("%s.find_similar_questions: %s", __name__, question.question_text)
+    try:
+        similar_questions = question_dedup_crud.find_similar_questions(
+            question_text=question.question_text,
+            option_texts=[option.option_text for option in question.options],
+            threshold=threshold,
+            db=db,
+        )
+        return [
+            SimilarQuestion.model_validate(similar, update={"similarity": round(similarity, 4)})
+            for similar, similarity in similar_questions
+        ]
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/duplicates", response_model=list[DuplicateQuestionPair])
+def call_duplicate_questions_report(
+    db: DBSessionDep,
+    threshold: float = Query(default=DUPLICATE_QUESTION_THRESHOLD, gt=0, le=1),
+):
+    """
+    Report all near duplicate question pairs in the question bank.
+
+    Args:
+        threshold (float, optional): Minimum similarity (0-1) of question text and options.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        list[DuplicateQuestionPair]: Near duplicate pairs, most similar first.
+    """
+    logger.info("%s.duplicate_questions_report", __name__)
+    try:
+        return question_dedup_crud.duplicate_report(threshold=threshold, db=db)
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search", response_model=QuestionSearchPage)
+def call_search_questions(
+    db: DBSessionDep,
+    q: str = Query(min_length=1, max_length=200),
+    topic_id: int | None = None,
+    difficulty: QuestionDifficultyEnum | None = None,
+    is_verified: bool | None = None,
+    question_type: QuestionTypeEnum | None = None,
+    limit: int = Query(default=10, ge=1, le=50),
+    cursor: str | None = None,
+):
+    """
+    Search questions by question and option text, best matches first.
+
+    Args:
+        q (str): Search text, supports "quoted phrases", or and -excluded words.
+        topic_id (int, optional): Only questions of this topic and its subtopics.
+        difficulty (str, optional): "easy", "medium" or "hard".
+        is_verified (bool, optional): Only verified or unverified questions.
+        question_type (str, optional): "single_select_mcq" or "multiple_select_mcq".
+        limit (int, optional): Page size. Defaults to 10.
+        cursor (str, optional): next_cursor of the previous page.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        QuestionSearchPage: Matching questions with their options and rank, and the next page cursor.
+    """
+    logger.info("%s.search_questions: %s", __name__, q)
+    after = None
+    if cursor:
+        try:
+            rank, question_id = decode_cursor(cursor)
+            after = (float(rank), int(question_id))
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        results = question_crud.search_questions(
+            query=q,
+            db=db,
+            limit=limit + 1,
+            topic_id=topic_id,
+            difficulty=difficulty,
+            is_verified=is_verified,
+            question_type=question_type,
+            after=after,
+        )
+        items = [
+            QuestionSearchHit.model_validate(question, update={"rank": rank})
+            for question, rank in results[:limit]
+        ]
+        next_cursor = encode_cursor(items[-1].rank, items[-1].id) if len(results) > limit else None
+        return QuestionSearchPage(items=items, next_cursor=next_cursor)
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{question_id}", response_model=QuestionBankRead)
-def call_get_question_by_id(question_id: int, db: DBSessionDep):
+def call_get_question_by_id(
+    question_id: int,
+    db: DBSessionDep,
+    fields: str | None = Query(default=None, description="e.g. question_text,options.option_text"),
+    include: str | None = Query(default=None, description="e.g. options"),
+):
     """
     Get a question by its ID from the database.
 
     Args:
         question_id (int): The ID of the question.
+        fields (str, optional): Comma separated fields to return, nested with dots.
+        include (str, optional): Comma separated relations to return.
        db (optional) : Database Dependency Injection.
 
     Returns:
-        QuestionBank: The retrieved question.
+        QuestionBank: The retrieved question, only the requested parts when fields / include are given.
     """
     logger.info("%s.get_question_by_id: %s", __name__, question_id)
     try:
-        return question_crud.get_question_by_id(id=question_id, db=db)
+        fieldset = parse_fieldset(QuestionBank, QuestionBankRead, fields, include)
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err))
+
+    try:
+        question = question_crud.get_question_by_id(id=question_id, db=db, fieldset=fieldset)
+        if fieldset is not None:
+            return JSONResponse(fieldset.serialize(question))
+        return question
     except HTTPException as http_err:
         raise http_err
     except Exception as e:
@@ -133,7 +293,7 @@ def call_get_question_by_id(question_id: int, db: DBSessionDep):
 
 @router.patch("/{question_id}", response_model=QuestionBankRead)
 def call_update_question(
-    question_id: int, question: QuestionBankUpdate, db: DBSessionDep
+    question_id: int, question: QuestionBankUpdate, db: DBSessionDep, background_tasks: BackgroundTasks
 ):
     """
     Update a question by its ID in the database.
@@ -148,9 +308,13 @@ def call_update_question(
     """
     logger.info("%s.update_question: %s", __name__, question)
     try:
-        return question_crud.update_question(
+        question_updated = question_crud.update_question(
             id=question_id, question=question, db=db
         )
+        # Points or question type change the answer key - attempted answers are regraded
+        if question.model_fields_set & {"points", "question_type"}:
+            background_tasks.add_task(notify_answer_key_changed, question_id)
+        return question_updated
     except HTTPException as http_err:
         raise http_err
     except Exception as e:
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Query, HTTPException, status
+from fastapi.responses import JSONResponse
 
 from app.api.deps import DBSessionDep, CourseQuizDep, CourseByIdDep
 from app.core.config import logger_config
+from app.core.fieldsets import parse_fieldset
 from app.models.quiz_models import (
+    Quiz,
     QuizCreate,
     QuizReadWithTopics,
     QuizUpdate,
@@ -87,15 +90,22 @@ def call_read_all_quizzes(
 
 
 @router.get("/{quiz_id}", response_model=QuizReadWithQuestionsAndTopics)
-def call_read_quiz_by_id(quiz_id: int, db: DBSessionDep):
+def call_read_quiz_by_id(
+    quiz_id: int,
+    db: DBSessionDep,
+    fields: str | None = Query(default=None, description="e.g. quiz_title,quiz_questions.question.question_text"),
+    include: str | None = Query(default=None, description="e.g. topics,quiz_questions.question.options"),
+):
     """
     Read a Quiz by ID
 
     Args:
         quiz_id (int): ID of the Quiz
+        fields (str, optional): Comma separated fields to return, nested with dots
+        include (str, optional): Comma separated relations to return, nested with dots
 
     Returns:
-        QuizReadWithQuizTopics: The Quiz with QuizTopics Included
+        QuizReadWithQuizTopics: The Quiz with QuizTopics Included, only the requested parts when fields / include are given
 
     Raises:
         HTTPException: Quiz not found
@@ -104,7 +114,14 @@ def call_read_quiz_by_id(quiz_id: int, db: DBSessionDep):
     logger.info(f"Reading Quiz by ID: {__name__}, {quiz_id}")
 
     try:
-        quiz_called = quiz_engine.read_quiz_by_id(quiz_id=quiz_id, db=db)
+        fieldset = parse_fieldset(Quiz, QuizReadWithQuestionsAndTopics, fields, include)
+    except ValueError as err:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
+
+    try:
+        quiz_called = quiz_engine.read_quiz_by_id(quiz_id=quiz_id, db=db, fieldset=fieldset)
+        if fieldset is not None:
+            return JSONResponse(fieldset.serialize(quiz_called))
         return quiz_called
 
     except HTTPException as http_err:
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Query, HTTPException, status
+
+from app.api.deps import DBSessionDep
+from app.core.config import logger_config
+from app.core.semantic_index import semantic_search_available
+from app.crud.semantic_search_crud import semantic_search_crud
+from app.models.search_models import SemanticSearchHit, SemanticIndexStats
+from app.settings import GET_CUSTOM_GPT_SPEC
+
+router = APIRouter()
+
+logger = logger_config(__name__)
+
+
+def _require_semantic_search():
+    if not semantic_search_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Semantic search is not available"
+        )
+
+
+@router.get("/semantic", response_model=list[SemanticSearchHit])
+def call_semantic_search(
+    db: DBSessionDep,
+    course_id: int,
+    q: str = Query(min_length=1, max_length=500),
+    k: int = Query(default=5, ge=1, le=50),
+    include_questions: bool = False,
+):
+    """
+    Find the topic content passages of a course most related to a free text query.
+
+    Args:
+        course_id (int): The course to search.
+        q (str): What the learner is asking about.
+        k (int, optional): Number of passages returned. Defaults to 5.
+        include_questions (bool, optional): Also match question bank questions. Defaults to False.
+       db (optional) : Database Dependency Injection.
+
+    Returns:
+        list[SemanticSearchHit]: Passages with their topic and similarity score, best first.
+    """
+    logger.info("%s.semantic_search: %s %s", __name__, course_id, q)
+    _require_semantic_search()
+    try:
+        return semantic_search_crud.search(
+            query=q, course_id=course_id, limit=k, include_questions=include_questions, db=db
+        )
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/semantic/rebuild", response_model=SemanticIndexStats, include_in_schema=GET_CUSTOM_GPT_SPEC)
+def call_rebuild_semantic_index(db: DBSessionDep):
+    """
+    Rebuild the semantic index from all content and questions,
+    e.g. after topics were moved between courses.
+
+    Returns:
+        SemanticIndexStats: Number of contents, questions and chunks indexed.
+    """
+    logger.info("%s.rebuild_semantic_index", __name__)
+    _require_semantic_search()
+    try:
+        return semantic_search_crud.rebuild_index(db=db)
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,13 +1,15 @@
+from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, status
 
 from app.api.deps import DBSessionDep
 from app.core.config import logger_config
 
-from app.crud.quiz_crud import runtime_quiz_engine
+from app.crud.quiz_crud import quiz_engine, runtime_quiz_engine
 from app.crud.quiz_setting_crud import quiz_setting_engine
 from app.models.quiz_runtime_model import WrapperRuntimeQuiz
 from app.crud.question_crud import question_crud
 from app.models.question_models import QuestionBankRead
+from app.models.quiz_setting import QuizSettingRead
 
 logger = logger_config(__name__)
 
@@ -75,6 +77,89 @@ def validate_quiz_key(
             status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
         )
         
+# Get Quiz Setting by Quiz Key - Used by the Waiting Room before the quiz starts
+@router.get("/quiz-setting", response_model=QuizSettingRead)
+def get_quiz_setting_by_key(
+    quiz_id:int, quiz_key:str, db: DBSessionDep
+):
+    logger.info(f"Getting Quiz Setting by Key: {__name__}")
+
+    try:
+        return quiz_setting_engine.get_quiz_setting_by_key(
+            db=db, quiz_id=quiz_id, quiz_key=quiz_key
+        )
+
+    except HTTPException as http_err:
+        logger.error(f"get_quiz_setting_by_key Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"get_quiz_setting_by_key Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+# Get Quiz Settings starting within the next minutes - Used to prewarm caches
+@router.get("/upcoming-quiz-settings", response_model=list[QuizSettingRead])
+def get_upcoming_quiz_settings(
+    within_minutes: int, db: DBSessionDep
+):
+    logger.info(f"Getting Upcoming Quiz Settings: {__name__}")
+
+    try:
+        return quiz_setting_engine.get_upcoming_quiz_settings(
+            db=db, starts_before=datetime.now() + timedelta(minutes=within_minutes)
+        )
+
+    except HTTPException as http_err:
+        logger.error(f"get_upcoming_quiz_settings Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"get_upcoming_quiz_settings Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Error in getting Upcoming Quiz Settings"
+        )
+
+# Get all Quiz Questions with correct options - Answer Key used for grading
+@router.get("/answer-key", response_model=list[QuestionBankRead])
+def get_quiz_answer_key(
+    quiz_id:int, db: DBSessionDep
+):
+    logger.info(f"Getting Quiz Answer Key: {__name__}")
+
+    try:
+        quiz_with_questions = runtime_quiz_engine.generate_quiz(
+            quiz_id=quiz_id, db=db
+        )
+        return [quiz_question.question for quiz_question in quiz_with_questions.quiz_questions]
+
+    except HTTPException as http_err:
+        logger.error(f"get_quiz_answer_key Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"get_quiz_answer_key Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+# Get the Quiz IDs of a Course - Used to export the gradebook of a course
+@router.get("/course-quiz-ids", response_model=list[int])
+def get_course_quiz_ids(
+    course_id:int, db: DBSessionDep
+):
+    logger.info(f"Getting Course Quiz IDs: {__name__}")
+
+    try:
+        return quiz_engine.read_quiz_ids_for_course(db=db, course_id=course_id)
+
+    except HTTPException as http_err:
+        logger.error(f"get_course_quiz_ids Error: {http_err}")
+        raise http_err
+    except Exception as err:
+        logger.error(f"get_course_quiz_ids Error: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Error in fetching Quizzes"
+        )
+
 # Get a Question by ID
 
 @router.get("/{question_id}", response_model=QuestionBankRead)
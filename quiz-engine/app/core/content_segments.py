@@ -0,0 +1,77 @@
+import json
+import re
+
+# ----------------------------
+# ----- Content Segments
+# ----------------------------
+# GPT action responses have a hard size limit, so Content is stored a second time as ordered
+# segments of at most SEGMENT_MAX_BYTES UTF-8 bytes with their serialized size and token estimate
+# precomputed. Pages are then packed to a byte budget in SQL from the stored sizes, nothing is
+# rendered just to be measured. Text is split on paragraphs, then sentences, then words; only a
+# single word longer than the limit is cut mid word.
+
+_SPLITTERS = (
+    (re.compile(r"\n\s*\n"), "\n\n"),
+    (re.compile(r"(?<=[.!?])\s+"), " "),
+    (re.compile(r"\s+"), " "),
+)
+_TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+
+
+def _byte_length(text: str) -> int:
+    return len(text.encode())
+
+
+def _cut(text: str, max_bytes: int) -> list[str]:
+    pieces, piece = [], ""
+    for character in text:
+        if _byte_length(piece + character) > max_bytes:
+            pieces.append(piece)
+            piece = ""
+        piece += character
+    return pieces + [piece] if piece else pieces
+
+
+def _split(text: str, max_bytes: int, level: int) -> list[str]:
+    if _byte_length(text) <= max_bytes:
+        return [text]
+    if level == len(_SPLITTERS):
+        return _cut(text, max_bytes)
+
+    pattern, separator = _SPLITTERS[level]
+    segments, current = [], ""
+    for part in filter(None, (part.strip() for part in pattern.split(text))):
+        candidate = f"{current}{separator}{part}" if current else part
+        if _byte_length(candidate) <= max_bytes:
+            current = candidate
+            continue
+        if current:
+            segments.append(current)
+        if _byte_length(part) <= max_bytes:
+            current = part
+        else:
+            *parts, current = _split(part, max_bytes, level + 1)
+            segments.extend(parts)
+    return segments + [current] if current else segments
+
+
+def split_segments(text: str, max_bytes: int) -> list[str]:
+    """
+    Ordered segments of text, each at most max_bytes UTF-8 bytes
+    """
+    text = (text or "").strip()
+    return _split(text, max_bytes, 0) if text else []
+
+
+def json_byte_size(text: str) -> int:
+    """
+    Bytes text takes as a JSON string in a response (quotes and escapes included)
+    """
+    return _byte_length(json.dumps(text, ensure_ascii=False))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough BPE token count: punctuation marks and every 4 characters of a word
+    """
+    return len(_TOKEN_PATTERN.findall(text))
@@ -0,0 +1,127 @@
+import typing
+from dataclasses import dataclass, field
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, selectinload, joinedload, raiseload
+from sqlmodel import SQLModel
+
+# ----------------------------
+# ----- Sparse Fieldsets
+# ----------------------------
+# Read routes accept fields=quiz_title,quiz_questions.question.question_text and
+# include=topics,quiz_questions.question.options. The response model of the route defines what
+# may be asked for: its scalar fields are the selectable columns and its nested models the
+# includable relations. The selection becomes load_only / selectinload / joinedload options, so
+# unrequested columns are never selected and unrequested relations never loaded (raiseload).
+# A relation with no fields listed returns all of its response model fields.
+
+
+def _nested_model(annotation) -> type[SQLModel] | None:
+    """
+    The model of a model, list[model] or model | None annotation
+    """
+    if isinstance(annotation, type) and issubclass(annotation, SQLModel):
+        return annotation
+    for argument in typing.get_args(annotation):
+        nested = _nested_model(argument)
+        if nested is not None:
+            return nested
+    return None
+
+
+def _split(value: str | None) -> list[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+@dataclass
+class FieldSet:
+    # ORM class of this level and the response model limiting what can be selected
+    orm_model: type[SQLModel]
+    read_model: type[SQLModel]
+    fields: set[str] = field(default_factory=set)
+    relations: dict[str, "FieldSet"] = field(default_factory=dict)
+
+    @property
+    def _mapper(self):
+        return inspect(self.orm_model)
+
+    @property
+    def selectable_fields(self) -> list[str]:
+        columns = self._mapper.column_attrs.keys()
+        return [name for name in self.read_model.model_fields if name in columns]
+
+    def _relation(self, name: str) -> "FieldSet":
+        if name in self.relations:
+            return self.relations[name]
+        read_field = self.read_model.model_fields.get(name)
+        relationship = self._mapper.relationships.get(name)
+        nested_read_model = _nested_model(read_field.annotation) if read_field is not None else None
+        if relationship is None or nested_read_model is None:
+            raise ValueError(f"Unknown relation: {name}")
+        self.relations[name] = FieldSet(orm_model=relationship.mapper.class_, read_model=nested_read_model)
+        return self.relations[name]
+
+    def _walk(self, path: list[str]) -> "FieldSet":
+        fieldset = self
+        for name in path:
+            fieldset = fieldset._relation(name)
+        return fieldset
+
+    @property
+    def output_fields(self) -> list[str]:
+        return sorted(self.fields) if self.fields else self.selectable_fields
+
+    def _columns(self) -> list:
+        names = set(self.output_fields)
+        # Keys the relationship loaders join on must be loaded even when not returned
+        for name in self.relations:
+            names.update(column.key for column in self._mapper.relationships[name].local_columns)
+        return [getattr(self.orm_model, name) for name in names if name in self._mapper.column_attrs]
+
+    def _relation_loaders(self) -> list:
+        loaders = []
+        for name, child in self.relations.items():
+            attribute = getattr(self.orm_model, name)
+            loader = selectinload(attribute) if self._mapper.relationships[name].uselist else joinedload(attribute)
+            loaders.append(loader.options(load_only(*child._columns()), *child._relation_loaders(), raiseload("*")))
+        return loaders
+
+    def loader_options(self) -> list:
+        """
+        Loader options for a select of orm_model returning exactly this fieldset
+        """
+        return [load_only(*self._columns()), *self._relation_loaders(), raiseload("*")]
+
+    def serialize(self, instance) -> dict:
+        data = {name: getattr(instance, name) for name in self.output_fields}
+        for name, child in self.relations.items():
+            related = getattr(instance, name)
+            if isinstance(related, list):
+                data[name] = [child.serialize(item) for item in related]
+            else:
+                data[name] = child.serialize(related) if related is not None else None
+        return jsonable_encoder(data)
+
+
+def parse_fieldset(
+    orm_model: type[SQLModel], read_model: type[SQLModel], fields: str | None, include: str | None
+) -> FieldSet | None:
+    """
+    FieldSet from the fields / include query parameters, None when neither is given.
+    Raises ValueError for fields or relations the response model does not have.
+    """
+    if not _split(fields) and not _split(include):
+        return None
+
+    fieldset = FieldSet(orm_model=orm_model, read_model=read_model)
+    for path in _split(include):
+        fieldset._walk(path.split("."))
+    for path in _split(fields):
+        *relation_path, name = path.split(".")
+        # Asking for a field of a relation includes the relation
+        level = fieldset._walk(relation_path)
+        if name not in level.selectable_fields:
+            raise ValueError(f"Unknown field: {path}")
+        level.fields.add(name)
+    return fieldset
@@ -0,0 +1,61 @@
+import hashlib
+import random
+import re
+import zlib
+
+# ----------------------------
+# ----- MinHash / LSH Signatures
+# ----------------------------
+# A question is a set of shingles: word trigrams of its normalized text plus one shingle per option.
+# Its MinHash signature (NUM_PERMUTATIONS minimum hashes) is split into BANDS bands; each band
+# is hashed to one 64 bit band key. Questions sharing a band key are near duplicate candidates,
+# candidates are then compared with the exact Jaccard similarity of their shingles.
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed seed - stored band keys must stay comparable across processes and restarts
+_random = random.Random(46)
+_PERMUTATIONS = [
+    (_random.randrange(1, _MERSENNE_PRIME), _random.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(text: str | None) -> str:
+    return _NON_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def question_shingles(question_text: str, option_texts: list[str]) -> set[str]:
+    words = normalize_text(question_text).split()
+    shingles = {" ".join(words[start : start + 3]) for start in range(max(len(words) - 2, 1))} if words else set()
+    shingles.update(f"option:{option}" for option in map(normalize_text, option_texts) if option)
+    return shingles
+
+
+def minhash_signature(shingles: set[str]) -> list[int]:
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+    return [min((a * value + b) % _MERSENNE_PRIME for value in hashes) for a, b in _PERMUTATIONS]
+
+
+def band_keys(shingles: set[str]) -> list[int]:
+    """
+    One signed 64 bit key per band, empty for a question without text
+    """
+    if not shingles:
+        return []
+    signature = minhash_signature(shingles)
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(f"{band}:{rows}".encode(), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def jaccard(shingles_a: set[str], shingles_b: set[str]) -> float:
+    union = len(shingles_a | shingles_b)
+    return len(shingles_a & shingles_b) / union if union else 0.0
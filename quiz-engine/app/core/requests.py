@@ -2,6 +2,9 @@ from fastapi import HTTPException
 from requests import get, post
 from app import settings
 from app.core.utils import load_error_json
+from app.core.config import logger_config
+
+logger = logger_config(__name__)
 
 def get_course(course_id: int, token: str):
     course_request = get(f"{settings.EDUCATIONAL_PROGRAM_URL}/api/v1/course/{course_id}",
@@ -34,4 +37,20 @@ def login_for_access_token(form_data):
     if response.status_code == 200:
         return response.json()
     
-    raise HTTPException(status_code=response.status_code, detail=load_error_json(response))
\ No newline at end of file
+    raise HTTPException(status_code=response.status_code, detail=load_error_json(response))
+
+# Answer Key Changed - assessment-evals regrades attempted answers of the question
+# Runs as a background task so errors are logged instead of raised
+def notify_answer_key_changed(question_id: int):
+    url = f"{settings.ASSESSMENT_EVALS_URL}/api/v1/regrade/answer-key-changed"
+    try:
+        response = post(
+            url,
+            json={"question_id": question_id},
+            headers={"X-Service-Token": str(settings.ASSESSMENT_EVALS_SERVICE_TOKEN)},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            logger.error(f"notify_answer_key_changed Error: {response.status_code} {response.text}")
+    except Exception as e:
+        logger.error(f"notify_answer_key_changed Error: {e}")
@@ -0,0 +1,316 @@
+import fcntl
+import json
+import math
+import os
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # Semantic search is optional: pip install numpy
+    np = None
+
+from app.core.minhash import normalize_text
+
+# ----------------------------
+# ----- Local Semantic Index
+# ----------------------------
+# CPU only retrieval over topic Content and questions. Text is split into word chunks and every
+# chunk is embedded with signed feature hashing of its words and word bigrams (sublinear tf,
+# L2 normalized) - no model, no network. Vectors live in a memory mapped float32 matrix on disk
+# with one metadata row per chunk; document frequencies are kept per hash bucket so queries are
+# weighted by idf. A search is one vectorized dot product over the live rows of a course.
+# Updates are incremental: a changed document's rows are marked dead and its new chunks appended,
+# dead rows are compacted away once they make up half of the matrix.
+# Every worker process maps the same files. Writers hold an exclusive flock on index.lock and
+# searches a shared one; each write bumps the generation in meta.json, and a process whose maps
+# are of an older generation re-opens the files before using them.
+
+KIND_CONTENT = 0
+KIND_QUESTION = 1
+
+_MIN_CAPACITY = 1024
+
+
+def semantic_search_available() -> bool:
+    return np is not None
+
+
+def chunk_text(text: str, chunk_words: int, overlap_words: int) -> list[str]:
+    """
+    Split text into chunks of chunk_words words, consecutive chunks share overlap_words words
+    """
+    words = (text or "").split()
+    if not words:
+        return []
+    step = max(chunk_words - overlap_words, 1)
+    return [
+        " ".join(words[start : start + chunk_words])
+        for start in range(0, max(len(words) - overlap_words, 1), step)
+    ]
+
+
+def embed(text: str, dimensions: int) -> "np.ndarray":
+    vector = np.zeros(dimensions, dtype=np.float32)
+    tokens = normalize_text(text).split()
+    features = Counter(tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])])
+    for feature, count in features.items():
+        hashed = zlib.crc32(feature.encode())
+        # Top bit picks the sign so colliding features tend to cancel out instead of adding up
+        sign = 1.0 if hashed & 0x80000000 else -1.0
+        vector[(hashed & 0x7FFFFFFF) % dimensions] += sign * (1.0 + math.log(count))
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass(frozen=True)
+class SemanticMatch:
+    kind: int
+    source_id: int
+    topic_id: int
+    chunk_index: int
+    score: float
+
+
+class SemanticIndex:
+    ROW_DTYPE = [
+        ("kind", "i1"),
+        ("source_id", "i4"),
+        ("course_id", "i4"),
+        ("topic_id", "i4"),
+        ("chunk_index", "i4"),
+        ("live", "?"),
+    ]
+
+    def __init__(self, directory: str, dimensions: int, chunk_words: int, overlap_words: int):
+        self.directory = directory
+        self.dimensions = dimensions
+        self.chunk_words = chunk_words
+        self.overlap_words = overlap_words
+        # Threads of this process, other processes are kept out by the flock
+        self._lock = threading.RLock()
+        self._lock_file = None
+        self._generation = None
+        self._size = 0
+        self._vectors = None
+        self._rows = None
+        self._document_frequency = None
+
+    # ---- Storage
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """
+        Hold the index for this thread and process, with the files of the current generation mapped
+        """
+        with self._lock:
+            if self._lock_file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._lock_file = open(self._path("index.lock"), "a")
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                self._sync(exclusive)
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def rebuild_lock(self, blocking: bool = True):
+        """
+        Held while the index is rebuilt from the database, yields False when not blocking and taken
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path("rebuild.lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_meta(self) -> dict:
+        if not os.path.exists(self._path("meta.json")):
+            return {}
+        with open(self._path("meta.json")) as meta_file:
+            return json.load(meta_file)
+
+    def _sync(self, exclusive: bool):
+        meta = self._read_meta()
+        if meta.get("dimensions") != self.dimensions or not os.path.exists(self._path("vectors.npy")):
+            if exclusive:
+                self._generation = meta.get("generation")
+                self._allocate(_MIN_CAPACITY, size=0)
+                self._write_document_frequency(np.zeros(self.dimensions, dtype=np.int64))
+            else:
+                # Nothing indexed yet, searches find nothing and create no files
+                self._generation = None
+                self._size = 0
+                self._vectors = np.zeros((0, self.dimensions), dtype=np.float32)
+                self._rows = np.zeros(0, dtype=self.ROW_DTYPE)
+                self._document_frequency = np.zeros(self.dimensions, dtype=np.int64)
+            return
+        if meta.get("generation") == self._generation and self._vectors is not None:
+            return
+
+        self._vectors = np.load(self._path("vectors.npy"), mmap_mode="r+")
+        self._rows = np.load(self._path("rows.npy"), mmap_mode="r+")
+        self._size = meta["size"]
+        self._generation = meta.get("generation", 0)
+        if os.path.exists(self._path("document_frequency.npy")):
+            self._document_frequency = np.load(self._path("document_frequency.npy"), mmap_mode="r+")
+        elif exclusive:
+            self._write_document_frequency(self._count_document_frequency())
+        else:
+            self._document_frequency = self._count_document_frequency()
+
+    def _allocate(self, capacity: int, size: int, vectors=None, rows=None):
+        """
+        (Re)create the matrix files with capacity rows, keeping the first size rows of vectors / rows
+        """
+        new_vectors = np.lib.format.open_memmap(
+            self._path("vectors.tmp.npy"), mode="w+", dtype=np.float32, shape=(capacity, self.dimensions)
+        )
+        new_rows = np.lib.format.open_memmap(
+            self._path("rows.tmp.npy"), mode="w+", dtype=self.ROW_DTYPE, shape=(capacity,)
+        )
+        if size:
+            new_vectors[:size] = vectors
+            new_rows[:size] = rows
+        new_vectors.flush()
+        new_rows.flush()
+        del new_vectors, new_rows
+        os.replace(self._path("vectors.tmp.npy"), self._path("vectors.npy"))
+        os.replace(self._path("rows.tmp.npy"), self._path("rows.npy"))
+
+        self._vectors = np.load(self._path("vectors.npy"), mmap_mode="r+")
+        self._rows = np.load(self._path("rows.npy"), mmap_mode="r+")
+        self._size = size
+        self._write_meta()
+
+    def _write_document_frequency(self, document_frequency: "np.ndarray"):
+        np.save(self._path("document_frequency.tmp.npy"), document_frequency.astype(np.int64))
+        os.replace(self._path("document_frequency.tmp.npy"), self._path("document_frequency.npy"))
+        self._document_frequency = np.load(self._path("document_frequency.npy"), mmap_mode="r+")
+
+    def _write_meta(self):
+        self._generation = (self._generation or 0) + 1
+        with open(self._path("meta.json.tmp"), "w") as meta_file:
+            json.dump({"dimensions": self.dimensions, "size": self._size, "generation": self._generation}, meta_file)
+        os.replace(self._path("meta.json.tmp"), self._path("meta.json"))
+
+    def _flush(self):
+        self._vectors.flush()
+        self._rows.flush()
+        self._document_frequency.flush()
+        self._write_meta()
+
+    def _count_document_frequency(self) -> "np.ndarray":
+        live = np.flatnonzero(self._rows["live"][: self._size])
+        if live.size == 0:
+            return np.zeros(self.dimensions, dtype=np.int64)
+        return (self._vectors[live] != 0).sum(axis=0).astype(np.int64)
+
+    def _ensure_capacity(self, extra_rows: int):
+        capacity = self._vectors.shape[0]
+        if self._size + extra_rows <= capacity:
+            return
+        new_capacity = max(capacity * 2, self._size + extra_rows)
+        self._allocate(new_capacity, self._size, self._vectors[: self._size], self._rows[: self._size])
+
+    def _compact(self):
+        live = np.flatnonzero(self._rows["live"][: self._size])
+        capacity = max(_MIN_CAPACITY, live.size * 2)
+        self._allocate(capacity, live.size, self._vectors[live], self._rows[live])
+
+    # ---- Updates
+
+    def _remove(self, kind: int, source_id: int) -> int:
+        rows = self._rows[: self._size]
+        removed = np.flatnonzero(rows["live"] & (rows["kind"] == kind) & (rows["source_id"] == source_id))
+        if removed.size:
+            self._document_frequency -= (self._vectors[removed] != 0).sum(axis=0)
+            self._rows["live"][removed] = False
+        return removed.size
+
+    def upsert_document(self, *, kind: int, source_id: int, course_id: int, topic_id: int, text: str):
+        """
+        Replace the chunks of a document with the chunks of its current text
+        """
+        chunks = chunk_text(text, self.chunk_words, self.overlap_words)
+        with self._locked(exclusive=True):
+            self._remove(kind, source_id)
+            if chunks:
+                self._ensure_capacity(len(chunks))
+                start, end = self._size, self._size + len(chunks)
+                vectors = np.stack([embed(chunk, self.dimensions) for chunk in chunks])
+                self._vectors[start:end] = vectors
+                self._rows[start:end] = [
+                    (kind, source_id, course_id, topic_id, chunk_index, True) for chunk_index in range(len(chunks))
+                ]
+                self._size = end
+                self._document_frequency += (vectors != 0).sum(axis=0)
+            if self._dead_rows() * 2 > self._size >= _MIN_CAPACITY:
+                self._compact()
+            self._flush()
+
+    def remove_document(self, *, kind: int, source_id: int):
+        with self._locked(exclusive=True):
+            if self._remove(kind, source_id):
+                self._flush()
+
+    def reset(self):
+        with self._locked(exclusive=True):
+            self._allocate(_MIN_CAPACITY, size=0)
+            self._write_document_frequency(np.zeros(self.dimensions, dtype=np.int64))
+
+    # ---- Search
+
+    @property
+    def live_rows(self) -> int:
+        with self._locked(exclusive=False):
+            return int(self._rows["live"][: self._size].sum())
+
+    def _dead_rows(self) -> int:
+        return self._size - int(self._rows["live"][: self._size].sum())
+
+    def search(self, query: str, *, course_id: int, kinds: tuple[int, ...], limit: int) -> list[SemanticMatch]:
+        """
+        Chunks of the course most similar to query, best first
+        """
+        with self._locked(exclusive=False):
+            rows = self._rows[: self._size]
+            candidates = np.flatnonzero(rows["live"] & (rows["course_id"] == course_id) & np.isin(rows["kind"], kinds))
+            if candidates.size == 0:
+                return []
+
+            live_count = int(rows["live"].sum())
+            idf = np.log((live_count + 1) / (self._document_frequency + 1)) + 1
+            query_vector = embed(query, self.dimensions) * idf.astype(np.float32)
+            norm = np.linalg.norm(query_vector)
+            if not norm:
+                return []
+            query_vector /= norm
+
+            scores = self._vectors[candidates] @ query_vector
+            top = np.argpartition(-scores, min(limit, scores.size) - 1)[:limit]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [
+                SemanticMatch(
+                    kind=int(rows["kind"][candidates[index]]),
+                    source_id=int(rows["source_id"][candidates[index]]),
+                    topic_id=int(rows["topic_id"][candidates[index]]),
+                    chunk_index=int(rows["chunk_index"][candidates[index]]),
+                    score=float(scores[index]),
+                )
+                for index in top
+                if scores[index] > 0
+            ]
@@ -1,4 +1,5 @@
 from typing import Any
+import base64
 import json
 
 def parse_cors(v: Any) -> list[str] | str:
@@ -11,4 +12,17 @@ def parse_cors(v: Any) -> list[str] | str:
 def load_error_json(error_message: str) -> str:
     details = json.loads(error_message.text)
     error_details = details.get("detail")
-    return error_details
\ No newline at end of file
+    return error_details
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Opaque keyset pagination cursor holding the sort key of the last row of a page
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, UnicodeDecodeError) as err:
+        raise ValueError("Invalid cursor") from err
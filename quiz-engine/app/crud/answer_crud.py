@@ -9,6 +9,8 @@ from app.models.answer_models import (
 )
 from app.models.question_models import QuestionBank
 from app.core.config import logger_config
+from app.crud.question_dedup_crud import question_dedup_crud
+from app.crud.semantic_search_crud import semantic_search_crud
 
 logger = logger_config(__name__)
 
@@ -34,6 +36,9 @@ class MCQCRUD:
             session.add(db_mcq_option)
             session.commit()
             session.refresh(db_mcq_option)
+            if db_mcq_option.question_id is not None:
+                question_dedup_crud.index_question_by_id(question_id=db_mcq_option.question_id, db=session)
+                semantic_search_crud.index_question_by_id(question_id=db_mcq_option.question_id, db=session)
             return db_mcq_option
         except IntegrityError as e:
             session.rollback()
@@ -134,6 +139,9 @@ class MCQCRUD:
             db.add(mcq_option_to_update)
             db.commit()
             db.refresh(mcq_option_to_update)
+            if mcq_option_to_update.question_id is not None:
+                question_dedup_crud.index_question_by_id(question_id=mcq_option_to_update.question_id, db=db)
+                semantic_search_crud.index_question_by_id(question_id=mcq_option_to_update.question_id, db=db)
             return mcq_option_to_update
         except ValueError as e:
             db.rollback()
@@ -166,8 +174,12 @@ class MCQCRUD:
             mcq_option = db.get(MCQOption, id)
             if not mcq_option:
                 raise ValueError("MCQ Option not found")
+            question_id = mcq_option.question_id
             db.delete(mcq_option)
             db.commit()
+            if question_id is not None:
+                question_dedup_crud.index_question_by_id(question_id=question_id, db=db)
+                semantic_search_crud.index_question_by_id(question_id=question_id, db=db)
             return {"message": "MCQ Option deleted successfully"}
         except ValueError as e:
             db.rollback()
@@ -0,0 +1,87 @@
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlmodel import Session
+
+from app.core.config import logger_config
+from app.core.fieldsets import parse_fieldset
+from app.crud.question_crud import question_crud
+from app.crud.quiz_crud import quiz_engine
+from app.crud.topic_crud import topic_crud
+from app.models.base import BatchReadOperation
+from app.models.batch_models import BatchReadItem, BatchReadResult
+from app.models.question_models import QuestionBankRead
+from app.models.quiz_models import Quiz, QuizReadWithQuestionsAndTopics
+from app.models.topic_models import TopicResponseWithContent
+
+logger = logger_config(__name__)
+
+_questions_adapter = TypeAdapter(list[QuestionBankRead])
+
+
+class BatchReadCRUD:
+    def _read(self, *, operation: BatchReadItem, db: Session):
+        """
+        Result of one operation, shaped like the response of its single read route
+        """
+        if operation.op != BatchReadOperation.quiz and (operation.fields or operation.include):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="fields / include are only supported for quiz"
+            )
+
+        if operation.op == BatchReadOperation.topic:
+            topic = topic_crud.read_topic_by_id(id=operation.id, db=db)
+            return jsonable_encoder(TopicResponseWithContent.model_validate(topic))
+        if operation.op == BatchReadOperation.subtopics:
+            return jsonable_encoder(topic_crud.read_topic_and_subtopics(id=operation.id, db=db))
+        if operation.op == BatchReadOperation.questions_by_topic:
+            questions = question_crud.get_questions_by_topic(topic_id=operation.id, db=db)
+            return jsonable_encoder(_questions_adapter.validate_python(questions, from_attributes=True))
+
+        try:
+            fieldset = parse_fieldset(Quiz, QuizReadWithQuestionsAndTopics, operation.fields, operation.include)
+        except ValueError as err:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
+        quiz = quiz_engine.read_quiz_by_id(quiz_id=operation.id, db=db, fieldset=fieldset)
+        if fieldset is not None:
+            data = fieldset.serialize(quiz)
+            # Partially loaded instances must not be reused by the next operations of the batch
+            db.expunge_all()
+            return data
+        return jsonable_encoder(QuizReadWithQuestionsAndTopics.model_validate(quiz))
+
+    def read_many(self, *, operations: list[BatchReadItem], db: Session) -> dict[str, BatchReadResult]:
+        """
+        Run read operations on one session and return their results keyed by operation key.
+        A failing operation gets its status code and detail, the others still run.
+        Identical operations are read once.
+
+        Args:
+            operations (list[BatchReadItem]): The read operations.
+            db (Session): The database session shared by all operations.
+
+        Returns:
+            dict[str, BatchReadResult]: Result per operation key, in request order.
+        """
+        results: dict[str, BatchReadResult] = {}
+        done: dict[tuple, BatchReadResult] = {}
+        for operation in operations:
+            signature = (operation.op, operation.id, operation.fields, operation.include)
+            if signature not in done:
+                try:
+                    done[signature] = BatchReadResult(
+                        status_code=status.HTTP_200_OK, data=self._read(operation=operation, db=db)
+                    )
+                except HTTPException as http_err:
+                    done[signature] = BatchReadResult(status_code=http_err.status_code, detail=str(http_err.detail))
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"BATCH_Read: {operation.op.value} {operation.id} failed: {e}")
+                    done[signature] = BatchReadResult(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred."
+                    )
+            results[operation.key] = done[signature]
+        return results
+
+
+batch_read_crud = BatchReadCRUD()
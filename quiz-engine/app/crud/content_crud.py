@@ -4,6 +4,8 @@ from sqlmodel import select, and_, Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from app.core.config import logger_config
+from app.crud.content_segment_crud import content_segment_crud
+from app.crud.semantic_search_crud import semantic_search_crud
 
 from app.models.content_models import (
     Content,
@@ -32,8 +34,11 @@ class ContentCRUD:
         try:
             content_to_db = Content.model_validate(content)
             db.add(content_to_db)
+            db.flush()
+            content_segment_crud.write_segments(content=content_to_db, db=db)
             db.commit()
             db.refresh(content_to_db)
+            semantic_search_crud.index_content(content=content_to_db)
             return content_to_db
         except IntegrityError as e:
             db.rollback()
@@ -191,8 +196,11 @@ class ContentCRUD:
             for key, value in content_data.items():
                 setattr(content_to_update, key, value)
             db.add(content_to_update)
+            if content_data.keys() & {"content_text", "topic_id"}:
+                content_segment_crud.write_segments(content=content_to_update, db=db)
             db.commit()
             db.refresh(content_to_update)
+            semantic_search_crud.index_content(content=content_to_update)
             return content_to_update
 
         except HTTPException as e:
@@ -241,6 +249,7 @@ class ContentCRUD:
                 raise ValueError("Content not found")
             db.delete(content)
             db.commit()
+            semantic_search_crud.remove_content(content_id=id)
             return {"message": "Content deleted successfully"}
         except ValueError:
             db.rollback()
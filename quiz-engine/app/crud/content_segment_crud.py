@@ -0,0 +1,96 @@
+from fastapi import HTTPException, status
+from sqlmodel import select, delete, func, Session
+from sqlalchemy import tuple_
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import settings
+from app.core.config import logger_config
+from app.core.content_segments import split_segments, json_byte_size, estimate_tokens
+from app.models.content_models import Content, ContentSegment
+
+logger = logger_config(__name__)
+
+# JSON a segment adds around its text in a page ({"content_id":..,"position":..,"text":..,...})
+SEGMENT_JSON_OVERHEAD_BYTES = 96
+# Page envelope: topic_id, totals and next_cursor
+PAGE_JSON_OVERHEAD_BYTES = 160
+MAX_SEGMENTS_PER_PAGE = 500
+
+
+class ContentSegmentCRUD:
+    def write_segments(self, *, content: Content, db: Session):
+        """
+        Replace the segments of a content in the current transaction, the caller commits.
+
+        Args:
+            content (Content): The content, flushed so it has an id.
+            db (Session): The database session.
+        """
+        db.exec(delete(ContentSegment).where(ContentSegment.content_id == content.id))
+        db.add_all(
+            ContentSegment(
+                content_id=content.id,
+                topic_id=content.topic_id,
+                position=position,
+                text=text,
+                byte_size=json_byte_size(text),
+                token_count=estimate_tokens(text),
+            )
+            for position, text in enumerate(split_segments(content.content_text, settings.CONTENT_SEGMENT_MAX_BYTES))
+        )
+
+    def read_segment_page(
+        self, *, topic_id: int, max_bytes: int, db: Session, after: tuple[int, int] | None = None
+    ) -> tuple[list[ContentSegment], bool]:
+        """
+        The next segments of a topic (in content and position order) whose JSON fits in max_bytes.
+        Sizes are summed in the database with a running window over the stored byte sizes,
+        at least one segment is returned so paging always advances.
+
+        Args:
+            topic_id (int): The topic to read.
+            max_bytes (int): Response byte budget.
+            db (Session): The database session.
+            after (tuple[int, int], optional): (content_id, position) of the last segment already read.
+
+        Returns:
+            tuple[List[ContentSegment], bool]: The segments and whether more segments follow.
+        """
+        try:
+            statement = select(ContentSegment).where(ContentSegment.topic_id == topic_id)
+            if after is not None:
+                statement = statement.where(tuple_(ContentSegment.content_id, ContentSegment.position) > after)
+            window = (
+                statement.order_by(ContentSegment.content_id, ContentSegment.position)
+                .limit(MAX_SEGMENTS_PER_PAGE + 1)
+                .subquery()
+            )
+            running_bytes = func.sum(window.c.byte_size + SEGMENT_JSON_OVERHEAD_BYTES).over(
+                order_by=(window.c.content_id, window.c.position)
+            )
+            packed = select(window, running_bytes.label("running_bytes")).subquery()
+            budget = max_bytes - PAGE_JSON_OVERHEAD_BYTES
+            # Segments starting within the budget: all that fit plus the first one that does not
+            rows = db.exec(
+                select(ContentSegment, packed.c.running_bytes)
+                .join(packed, packed.c.id == ContentSegment.id)
+                .where(packed.c.running_bytes - packed.c.byte_size - SEGMENT_JSON_OVERHEAD_BYTES <= budget)
+                .order_by(packed.c.content_id, packed.c.position)
+            ).all()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"READ_Segment_Page: A database error occurred: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+
+        segments = [
+            segment
+            for index, (segment, running) in enumerate(rows[:MAX_SEGMENTS_PER_PAGE])
+            if index == 0 or running <= budget
+        ]
+        return segments, len(rows) > len(segments)
+
+
+content_segment_crud = ContentSegmentCRUD()
@@ -1,5 +1,7 @@
 from fastapi import HTTPException, status
-from sqlmodel import select, Session
+from sqlmodel import select, func, or_, Session, Float
+from sqlalchemy import cast, tuple_, literal_column
+from sqlalchemy.orm import defer
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from app.models.question_models import (
@@ -8,8 +10,13 @@ from app.models.question_models import (
     QuestionBankUpdate,
     MCQOption,
 )
+from app.models.base import QuestionDifficultyEnum, QuestionTypeEnum
+from app.models.topic_models import Topic
 from app.core.config import logger_config
+from app.core.fieldsets import FieldSet
 from app.crud.topic_crud import topic_crud
+from app.crud.question_dedup_crud import question_dedup_crud
+from app.crud.semantic_search_crud import semantic_search_crud
 logger = logger_config(__name__)
 
 
@@ -37,6 +44,8 @@ class QuestionCRUD:
             db.add(db_question)
             db.commit()
             db.refresh(db_question)
+            question_dedup_crud.index_question(question=db_question, db=db)
+            semantic_search_crud.index_question(question=db_question)
             return db_question
         except IntegrityError as e:
             db.rollback()  # Ensure rollback is awaited
@@ -132,13 +141,14 @@ class QuestionCRUD:
             db.rollback()  # Ensure rollback is awaited
             raise Exception("An unexpected error occurred.") from e
 
-    def get_question_by_id(self, *, id: int, db: Session):
+    def get_question_by_id(self, *, id: int, db: Session, fieldset: FieldSet | None = None):
         """
         Get a question by its ID from the database.
 
         Args:
             id (int): The ID of the question.
             db (Session): The database session.
+            fieldset (FieldSet, optional): Only load these columns and relations.
 
         Returns:
             QuestionBank: The retrieved question.
@@ -147,7 +157,10 @@ class QuestionCRUD:
 
         try:
             # question = db.get(QuestionBank, id)
-            result = db.exec(select(QuestionBank).where(QuestionBank.id == id))
+            statement = select(QuestionBank).where(QuestionBank.id == id)
+            if fieldset is not None:
+                statement = statement.options(*fieldset.loader_options())
+            result = db.exec(statement)
             question = result.first()
             if not question:
                 raise ValueError("Question not found")
@@ -191,6 +204,10 @@ class QuestionCRUD:
             db.add(question_to_update)
             db.commit()
             db.refresh(question_to_update)
+            if "question_text" in question_data:
+                question_dedup_crud.index_question(question=question_to_update, db=db)
+            if question_data.keys() & {"question_text", "topic_id"}:
+                semantic_search_crud.index_question(question=question_to_update)
             return question_to_update
         except ValueError:
             db.rollback()
@@ -230,6 +247,7 @@ class QuestionCRUD:
                 raise ValueError("Question not found")
             db.delete(question)
             db.commit()
+            semantic_search_crud.remove_question(question_id=id)
             return {"message": "Question deleted successfully"}
         except HTTPException:
             db.rollback()
@@ -284,6 +302,95 @@ class QuestionCRUD:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred.",
             ) from e
-        
+
+
+    def search_questions(
+        self,
+        *,
+        query: str,
+        db: Session,
+        limit: int,
+        topic_id: int | None = None,
+        difficulty: QuestionDifficultyEnum | None = None,
+        is_verified: bool | None = None,
+        question_type: QuestionTypeEnum | None = None,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple[QuestionBank, float]]:
+        """
+        Full text search over question and option text, best matches first.
+
+        Both tables carry a generated tsvector column with a GIN index. A question matches
+        on its own text or on any of its options; option matches count half.
+        Results are keyset paginated on (rank, id).
+
+        Args:
+            query (str): Web search style query ("quoted phrases", or, -excluded).
+            db (Session): The database session.
+            limit (int): Page size.
+            topic_id (int, optional): Only questions of this topic and its subtopics.
+            difficulty, is_verified, question_type (optional): Filters.
+            after (tuple, optional): (rank, id) of the last question of the previous page.
+
+        Returns:
+            List[tuple[QuestionBank, float]]: Questions with their rank.
+        """
+        try:
+            ts_query = func.websearch_to_tsquery(literal_column("'english'"), query)
+
+            option_matches = (
+                select(
+                    MCQOption.question_id,
+                    func.max(func.ts_rank(MCQOption.search_vector, ts_query)).label("option_rank"),
+                )
+                .where(MCQOption.search_vector.op("@@")(ts_query))
+                .group_by(MCQOption.question_id)
+                .subquery()
+            )
+            # double precision so the rank round trips through the cursor unchanged
+            rank = cast(
+                func.ts_rank(QuestionBank.search_vector, ts_query)
+                + 0.5 * func.coalesce(option_matches.c.option_rank, 0),
+                Float(precision=53),
+            )
+
+            statement = (
+                select(QuestionBank, rank.label("rank"))
+                .options(defer(QuestionBank.search_vector))
+                .outerjoin(option_matches, option_matches.c.question_id == QuestionBank.id)
+                .where(
+                    or_(
+                        QuestionBank.search_vector.op("@@")(ts_query),
+                        option_matches.c.question_id.is_not(None),
+                    )
+                )
+            )
+            if topic_id is not None:
+                topic_tree = select(Topic.id).where(Topic.id == topic_id).cte("topic_tree", recursive=True)
+                topic_tree = topic_tree.union_all(
+                    select(Topic.id).where(Topic.parent_id == topic_tree.c.id)
+                )
+                statement = statement.where(QuestionBank.topic_id.in_(select(topic_tree.c.id)))
+            if difficulty is not None:
+                statement = statement.where(QuestionBank.difficulty == difficulty)
+            if is_verified is not None:
+                statement = statement.where(QuestionBank.is_verified == is_verified)
+            if question_type is not None:
+                statement = statement.where(QuestionBank.question_type == question_type)
+            if after is not None:
+                statement = statement.where(tuple_(rank, QuestionBank.id) < tuple_(*after))
+
+            result = db.exec(
+                statement.order_by(rank.desc(), QuestionBank.id.desc()).limit(limit)
+            )
+            return result.all()
+
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"SEARCH_Questions: A database error occurred while searching Questions: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+
 
 question_crud = QuestionCRUD()
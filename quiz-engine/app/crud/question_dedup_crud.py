@@ -0,0 +1,164 @@
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlmodel import select, func, Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import logger_config
+from app.core.minhash import band_keys, jaccard, question_shingles
+from app.models.question_models import QuestionBank
+from app.models.dedup_models import QuestionFingerprint, DuplicateQuestionPair
+
+logger = logger_config(__name__)
+
+
+def _shingles_of(question: QuestionBank) -> set[str]:
+    return question_shingles(question.question_text, [option.option_text for option in question.options])
+
+
+class QuestionDedupCRUD:
+    def index_question(self, *, question: QuestionBank, db: Session):
+        """
+        Store the LSH band keys of a question (after add_question / update_question).
+        Indexing errors are logged and never fail the question write.
+
+        Args:
+            question (QuestionBank): The saved question with its options.
+            db (Session): The database session.
+        """
+        try:
+            keys = band_keys(_shingles_of(question))
+            upsert = insert(QuestionFingerprint).values(
+                question_id=question.id, band_keys=keys, updated_at=datetime.utcnow()
+            )
+            db.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=["question_id"],
+                    set_={"band_keys": upsert.excluded.band_keys, "updated_at": upsert.excluded.updated_at},
+                )
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"INDEX_Question: Error indexing question {question.id}: {e}")
+
+    def index_question_by_id(self, *, question_id: int, db: Session):
+        question = db.get(QuestionBank, question_id)
+        if question is not None:
+            self.index_question(question=question, db=db)
+
+    def find_similar_questions(
+        self,
+        *,
+        question_text: str,
+        option_texts: list[str],
+        threshold: float,
+        db: Session,
+        exclude_question_id: int | None = None,
+        limit: int = 10,
+    ) -> list[tuple[QuestionBank, float]]:
+        """
+        Questions sharing an LSH band key with the given text and options whose exact
+        Jaccard similarity is at least threshold, most similar first.
+
+        Args:
+            question_text (str): Text of the new or edited question.
+            option_texts (list[str]): Texts of its options.
+            threshold (float): Minimum Jaccard similarity.
+            db (Session): The database session.
+            exclude_question_id (int, optional): The question itself when it is already saved.
+            limit (int, optional): Maximum number of questions returned.
+
+        Returns:
+            List[tuple[QuestionBank, float]]: Similar questions with their similarity.
+        """
+        shingles = question_shingles(question_text, option_texts)
+        keys = band_keys(shingles)
+        if not keys:
+            return []
+
+        try:
+            statement = (
+                select(QuestionBank)
+                .join(QuestionFingerprint, QuestionFingerprint.question_id == QuestionBank.id)
+                .where(QuestionFingerprint.band_keys.overlap(keys))
+            )
+            if exclude_question_id is not None:
+                statement = statement.where(QuestionBank.id != exclude_question_id)
+            candidates = db.exec(statement).all()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"SIMILAR_Questions: A database error occurred: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+
+        similar = [(candidate, jaccard(shingles, _shingles_of(candidate))) for candidate in candidates]
+        similar = [(candidate, similarity) for candidate, similarity in similar if similarity >= threshold]
+        similar.sort(key=lambda match: (-match[1], match[0].id))
+        return similar[:limit]
+
+    def duplicate_report(self, *, threshold: float, db: Session) -> list[DuplicateQuestionPair]:
+        """
+        All near duplicate question pairs in the bank, most similar first.
+        Candidate pairs share a band key (self join on the unnested keys), only
+        candidates are compared exactly - never all pairs. Read only, questions are
+        indexed when saved and existing ones by the migration adding the index.
+
+        Args:
+            threshold (float): Minimum Jaccard similarity.
+            db (Session): The database session.
+
+        Returns:
+            List[DuplicateQuestionPair]: Pairs with the lower question id first.
+        """
+        try:
+            keys = select(
+                QuestionFingerprint.question_id, func.unnest(QuestionFingerprint.band_keys).label("band_key")
+            ).subquery()
+            duplicate_keys = keys.alias()
+            candidate_pairs = db.exec(
+                select(keys.c.question_id, duplicate_keys.c.question_id)
+                .join(
+                    duplicate_keys,
+                    (keys.c.band_key == duplicate_keys.c.band_key)
+                    & (keys.c.question_id < duplicate_keys.c.question_id),
+                )
+                .distinct()
+            ).all()
+            if not candidate_pairs:
+                return []
+
+            question_ids = {question_id for pair in candidate_pairs for question_id in pair}
+            questions = {
+                question.id: question
+                for question in db.exec(select(QuestionBank).where(QuestionBank.id.in_(question_ids))).all()
+            }
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"DUPLICATE_Report: A database error occurred: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+
+        shingles = {question_id: _shingles_of(question) for question_id, question in questions.items()}
+        report = []
+        for question_id, duplicate_question_id in candidate_pairs:
+            similarity = jaccard(shingles[question_id], shingles[duplicate_question_id])
+            if similarity >= threshold:
+                report.append(
+                    DuplicateQuestionPair(
+                        question_id=question_id,
+                        question_text=questions[question_id].question_text,
+                        duplicate_question_id=duplicate_question_id,
+                        duplicate_question_text=questions[duplicate_question_id].question_text,
+                        similarity=round(similarity, 4),
+                    )
+                )
+        report.sort(key=lambda pair: (-pair.similarity, pair.question_id, pair.duplicate_question_id))
+        return report
+
+
+question_dedup_crud = QuestionDedupCRUD()
@@ -3,6 +3,7 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import and_, delete, select, Session
 
 from app.core.config import logger_config
+from app.core.fieldsets import FieldSet
 from app.models.question_models import QuestionBank
 from app.models.quiz_models import (
     Quiz,
@@ -175,18 +176,37 @@ class CRUDQuizEngine:
                 detail="Error in fetching Quizzes",
             )
 
-    def read_quiz_by_id(self, *, quiz_id: int, db: Session):
+    def read_quiz_ids_for_course(self, *, db: Session, course_id: int) -> list[int]:
+        """
+        IDs of every Quiz of a course, empty when the course has none
+        """
+        try:
+            return list(db.exec(select(Quiz.id).where(Quiz.course_id == course_id).order_by(Quiz.id)).all())  # type:ignore
+        except Exception as e:
+            db.rollback()
+            logger.error(f"read_quiz_ids_for_course Error: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Error in fetching Quizzes",
+            )
+
+    def read_quiz_by_id(self, *, quiz_id: int, db: Session, fieldset: FieldSet | None = None):
         try:
             # quiz = db.get(Quiz, quiz_id)
-            result = db.exec(
-                select(Quiz)
-                .options(
+            if fieldset is not None:
+                # Sparse fieldset: only the requested columns and relations are loaded
+                options = fieldset.loader_options()
+            else:
+                options = [
                     selectinload(Quiz.topics),  # type:ignore
                     selectinload(Quiz.quiz_settings),  # type:ignore
                     selectinload(
                         Quiz.quiz_questions  # type:ignore
                     ).joinedload(QuizQuestion.question),  # type:ignore
-                )
+                ]
+            result = db.exec(
+                select(Quiz)
+                .options(*options)
                 .where(Quiz.id == quiz_id)  # type:ignore
             )
             quiz = result.one()
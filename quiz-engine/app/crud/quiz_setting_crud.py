@@ -160,23 +160,52 @@ class CRUDQuizSetting:
             logger.error(f"remove_quiz_setting Error: {e}")
             raise HTTPException(status_code=400, detail=str(e))
 
-    # Check Is Key Valid
-    def validate_quiz_key(self, *, db: Session, quiz_id: int, quiz_key: str):
+    # Get a QuizSetting by Quiz Key - No Time Window Check
+    def get_quiz_setting_by_key(self, *, db: Session, quiz_id: int, quiz_key: str) -> QuizSetting:
         """
-        Check if the Quiz Key is valid
+        Get the QuizSetting for a quiz key whether or not the quiz is active
+        """
+        quiz_setting = db.exec(
+            select(QuizSetting).where(
+                and_(
+                    QuizSetting.quiz_id == quiz_id, QuizSetting.quiz_key == quiz_key
+                )
+            )
+        ).one_or_none()
+
+        if quiz_setting is None:
+            raise HTTPException(status_code=404, detail="QuizSetting not found")
+
+        return quiz_setting
+
+    # Get QuizSettings starting soon - Used to prewarm assessment-evals
+    def get_upcoming_quiz_settings(self, *, db: Session, starts_before: datetime):
+        """
+        Get QuizSettings whose start_time is between now and starts_before
         """
         try:
-            quiz_setting_statement = db.exec(
+            quiz_settings = db.exec(
                 select(QuizSetting).where(
                     and_(
-                        QuizSetting.quiz_id == quiz_id, QuizSetting.quiz_key == quiz_key
+                        QuizSetting.start_time >= datetime.now(),
+                        QuizSetting.start_time <= starts_before,
                     )
-                )
+                ).order_by(QuizSetting.start_time)
             )
-            quiz_setting = quiz_setting_statement.one_or_none()
+            return quiz_settings.all()
 
-            if quiz_setting is None:
-                raise HTTPException(status_code=404, detail="QuizSetting not found")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"get_upcoming_quiz_settings Error: {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # Check Is Key Valid
+    def validate_quiz_key(self, *, db: Session, quiz_id: int, quiz_key: str):
+        """
+        Check if the Quiz Key is valid
+        """
+        try:
+            quiz_setting = self.get_quiz_setting_by_key(db=db, quiz_id=quiz_id, quiz_key=quiz_key)
 
             # If Time is not None then check if it is between start and end time
             if quiz_setting.start_time and quiz_setting.end_time:
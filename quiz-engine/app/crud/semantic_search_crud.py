@@ -0,0 +1,246 @@
+from fastapi import HTTPException, status
+from sqlmodel import select, Session
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import settings
+from app.core.config import logger_config
+from app.core.semantic_index import (
+    KIND_CONTENT,
+    KIND_QUESTION,
+    SemanticIndex,
+    chunk_text,
+    semantic_search_available,
+)
+from app.models.base import SemanticHitKind
+from app.models.content_models import Content
+from app.models.question_models import QuestionBank
+from app.models.topic_models import Topic
+from app.models.search_models import SemanticSearchHit, SemanticIndexStats
+
+logger = logger_config(__name__)
+
+semantic_index = (
+    SemanticIndex(
+        directory=settings.SEMANTIC_INDEX_DIR,
+        dimensions=settings.SEMANTIC_INDEX_DIMENSIONS,
+        chunk_words=settings.SEMANTIC_CHUNK_WORDS,
+        overlap_words=settings.SEMANTIC_CHUNK_OVERLAP_WORDS,
+    )
+    if semantic_search_available()
+    else None
+)
+
+_KINDS = {KIND_CONTENT: SemanticHitKind.content, KIND_QUESTION: SemanticHitKind.question}
+
+
+def _question_text(question: QuestionBank) -> str:
+    return " ".join([question.question_text, *(option.option_text for option in question.options)])
+
+
+class SemanticSearchCRUD:
+    def index_content(self, *, content: Content):
+        """
+        Replace the indexed chunks of a content (after create / update).
+        Indexing errors are logged and never fail the content write.
+
+        Args:
+            content (Content): The saved content with its topic.
+        """
+        if semantic_index is None:
+            return
+        try:
+            semantic_index.upsert_document(
+                kind=KIND_CONTENT,
+                source_id=content.id,
+                course_id=content.topic.course_id,
+                topic_id=content.topic_id,
+                text=content.content_text,
+            )
+        except Exception as e:
+            logger.error(f"INDEX_Content: Error indexing content {content.id}: {e}")
+
+    def index_question(self, *, question: QuestionBank):
+        """
+        Replace the indexed text (question and options) of a question.
+        Indexing errors are logged and never fail the question write.
+
+        Args:
+            question (QuestionBank): The saved question.
+        """
+        if semantic_index is None:
+            return
+        try:
+            semantic_index.upsert_document(
+                kind=KIND_QUESTION,
+                source_id=question.id,
+                course_id=question.topic.course_id,
+                topic_id=question.topic_id,
+                text=_question_text(question),
+            )
+        except Exception as e:
+            logger.error(f"INDEX_Question: Error semantic indexing question {question.id}: {e}")
+
+    def index_question_by_id(self, *, question_id: int, db: Session):
+        question = db.get(QuestionBank, question_id)
+        if question is not None:
+            self.index_question(question=question)
+
+    def remove_content(self, *, content_id: int):
+        self._remove(kind=KIND_CONTENT, source_id=content_id)
+
+    def remove_question(self, *, question_id: int):
+        self._remove(kind=KIND_QUESTION, source_id=question_id)
+
+    def _remove(self, *, kind: int, source_id: int):
+        if semantic_index is None:
+            return
+        try:
+            semantic_index.remove_document(kind=kind, source_id=source_id)
+        except Exception as e:
+            logger.error(f"REMOVE_Semantic: Error removing {_KINDS[kind].value} {source_id} from the index: {e}")
+
+    def rebuild_index(self, *, db: Session, batch_size: int = 500) -> SemanticIndexStats:
+        """
+        Re-index every content and question from the database, in id ordered batches.
+        One rebuild at a time across workers, a second one waits for the first.
+
+        Args:
+            db (Session): The database session.
+            batch_size (int, optional): Rows loaded per query.
+
+        Returns:
+            SemanticIndexStats: Number of contents, questions and chunks indexed.
+        """
+        with semantic_index.rebuild_lock():
+            return self._rebuild(db=db, batch_size=batch_size)
+
+    def build_missing_index(self, *, db: Session) -> SemanticIndexStats | None:
+        """
+        Build the index when it is empty (first start, index directory lost), run off the request path.
+        Workers starting together build it once, the others skip.
+
+        Returns:
+            SemanticIndexStats | None: The build stats, None when nothing was built.
+        """
+        if semantic_index is None:
+            return None
+        with semantic_index.rebuild_lock(blocking=False) as acquired:
+            if not acquired or semantic_index.live_rows:
+                return None
+            return self._rebuild(db=db)
+
+    def _rebuild(self, *, db: Session, batch_size: int = 500) -> SemanticIndexStats:
+        try:
+            semantic_index.reset()
+            contents = questions = 0
+            last_id = 0
+            while batch := db.exec(
+                select(Content.id, Content.topic_id, Topic.course_id, Content.content_text)
+                .join(Topic, Topic.id == Content.topic_id)
+                .where(Content.id > last_id)
+                .order_by(Content.id)
+                .limit(batch_size)
+            ).all():
+                for content_id, topic_id, course_id, content_text in batch:
+                    semantic_index.upsert_document(
+                        kind=KIND_CONTENT, source_id=content_id, course_id=course_id, topic_id=topic_id, text=content_text
+                    )
+                contents += len(batch)
+                last_id = batch[-1][0]
+
+            last_id = 0
+            while batch := db.exec(
+                select(QuestionBank, Topic.course_id)
+                .join(Topic, Topic.id == QuestionBank.topic_id)
+                .options(selectinload(QuestionBank.options))
+                .where(QuestionBank.id > last_id)
+                .order_by(QuestionBank.id)
+                .limit(batch_size)
+            ).all():
+                for question, course_id in batch:
+                    semantic_index.upsert_document(
+                        kind=KIND_QUESTION,
+                        source_id=question.id,
+                        course_id=course_id,
+                        topic_id=question.topic_id,
+                        text=_question_text(question),
+                    )
+                questions += len(batch)
+                last_id = batch[-1][0].id
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"REBUILD_Semantic: A database error occurred: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+        return SemanticIndexStats(contents=contents, questions=questions, chunks=semantic_index.live_rows)
+
+    def search(
+        self, *, query: str, course_id: int, limit: int, include_questions: bool, db: Session
+    ) -> list[SemanticSearchHit]:
+        """
+        Top content chunks (and optionally questions) of a course for a free text query.
+        Only reads the index, it is built at startup (build_missing_index) or by a rebuild.
+
+        Args:
+            query (str): Free text query.
+            course_id (int): The course whose topics are searched.
+            limit (int): Maximum number of chunks returned.
+            include_questions (bool): Also match questions and their options.
+            db (Session): The database session.
+
+        Returns:
+            List[SemanticSearchHit]: Matching chunks with their text, best first.
+        """
+        kinds = (KIND_CONTENT, KIND_QUESTION) if include_questions else (KIND_CONTENT,)
+        matches = semantic_index.search(query, course_id=course_id, kinds=kinds, limit=limit)
+
+        try:
+            content_ids = [match.source_id for match in matches if match.kind == KIND_CONTENT]
+            question_ids = [match.source_id for match in matches if match.kind == KIND_QUESTION]
+            texts = {}
+            if content_ids:
+                for content_id, content_text in db.exec(
+                    select(Content.id, Content.content_text).where(Content.id.in_(content_ids))
+                ).all():
+                    texts[(KIND_CONTENT, content_id)] = chunk_text(
+                        content_text, semantic_index.chunk_words, semantic_index.overlap_words
+                    )
+            if question_ids:
+                for question in db.exec(
+                    select(QuestionBank)
+                    .options(selectinload(QuestionBank.options))
+                    .where(QuestionBank.id.in_(question_ids))
+                ).all():
+                    texts[(KIND_QUESTION, question.id)] = chunk_text(
+                        _question_text(question), semantic_index.chunk_words, semantic_index.overlap_words
+                    )
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"SEARCH_Semantic: A database error occurred: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database operation failed.",
+            ) from e
+
+        hits = []
+        for match in matches:
+            chunks = texts.get((match.kind, match.source_id), [])
+            # Rows of a document deleted or edited outside this service are skipped until the next rebuild
+            if match.chunk_index < len(chunks):
+                hits.append(
+                    SemanticSearchHit(
+                        kind=_KINDS[match.kind],
+                        source_id=match.source_id,
+                        topic_id=match.topic_id,
+                        chunk_index=match.chunk_index,
+                        text=chunks[match.chunk_index],
+                        score=round(match.score, 4),
+                    )
+                )
+        return hits
+
+
+semantic_search_crud = SemanticSearchCRUD()
@@ -12,6 +12,8 @@ from app.models.topic_models import (
     TopicUpdate,
 )
 from app.models.content_models import Content
+from app.crud.content_segment_crud import content_segment_crud
+from app.crud.semantic_search_crud import semantic_search_crud
 
 logger = logger_config(__name__)
 
@@ -45,8 +47,13 @@ class TopicCRUD:
 
             # Add the new topic to the database and commit the transaction
             db.add(topic_to_db)
+            db.flush()
+            for content in topic_to_db.contents:
+                content_segment_crud.write_segments(content=content, db=db)
             db.commit()
             db.refresh(topic_to_db)
+            for content in topic_to_db.contents:
+                semantic_search_crud.index_content(content=content)
 
             return topic_to_db
 
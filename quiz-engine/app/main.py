@@ -1,6 +1,9 @@
+import threading
+
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from contextlib import asynccontextmanager
+from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
 
 from app import settings
@@ -8,14 +11,31 @@ from app.core.config import logger_config
 from app.api.v1 import api as v1_api
 from app.settings import GET_CUSTOM_GPT_SPEC
 from app.api.deps import LoginForAccessTokenDep
+from app.core.db_eng import engine
+from app.core.semantic_index import semantic_search_available
+from app.crud.semantic_search_crud import semantic_search_crud
 
 logger = logger_config(__name__)
 
+
+def build_semantic_index():
+    try:
+        with Session(engine) as db:
+            stats = semantic_search_crud.build_missing_index(db=db)
+        if stats is not None:
+            logger.info(f"startup: semantic index built {stats}")
+    except Exception as e:
+        logger.error(f"startup: semantic index build failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("startup: triggered")
     origins = [str(origin).strip("/") for origin in settings.BACKEND_CORS_ORIGINS]
     print(f"Allowed origins: {origins}")
+    if settings.SEMANTIC_INDEX_BUILD_ON_STARTUP and semantic_search_available():
+        # In the background, searches find nothing until it is built
+        threading.Thread(target=build_semantic_index, daemon=True).start()
     yield
     logger.info("shutdown: triggered")
 
@@ -1,4 +1,5 @@
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, Column, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from datetime import datetime
 from typing import TYPE_CHECKING
 from app.models.base import BaseIdModel
@@ -33,6 +34,16 @@ class MCQOptionBase(SQLModel):
 
 
 class MCQOption(BaseIdModel, MCQOptionBase, table=True):
+    __table_args__ = (
+        Index("ix_mcqoption_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    # Full text search document, generated by Postgres from option_text
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, Computed("to_tsvector('english', coalesce(option_text, ''))", persisted=True)),
+    )
+
     # question Relationship
     question: "QuestionBank" = Relationship(
         back_populates="options", sa_relationship_kwargs={"lazy": "joined"}
@@ -35,3 +35,15 @@ class QuizAttemptStatus(str, enum.Enum):
     to_attempt = ("to_attempt",)
     in_progress = ("in_progress",)
     completed = "completed"
+
+
+class SemanticHitKind(str, enum.Enum):
+    content = "content"
+    question = "question"
+
+
+class BatchReadOperation(str, enum.Enum):
+    topic = "topic"
+    subtopics = "subtopics"
+    questions_by_topic = "questions_by_topic"
+    quiz = "quiz"
@@ -0,0 +1,51 @@
+from typing import Any
+from pydantic import field_validator
+from sqlmodel import SQLModel, Field
+
+from app.models.base import BatchReadOperation
+
+MAX_BATCH_OPERATIONS = 20
+
+example_batch_read = {
+    "operations": [
+        {"key": "topic", "op": "topic", "id": 1},
+        {"key": "tree", "op": "subtopics", "id": 1},
+        {"key": "questions", "op": "questions_by_topic", "id": 1},
+        {"key": "quiz", "op": "quiz", "id": 1, "fields": "quiz_title,quiz_questions.question.question_text"},
+    ]
+}
+
+
+class BatchReadItem(SQLModel):
+    # Caller chosen name the result is returned under
+    key: str = Field(min_length=1, max_length=64)
+    op: BatchReadOperation
+    id: int
+    # Sparse fieldset, quiz operations only
+    fields: str | None = None
+    include: str | None = None
+
+
+class BatchReadRequest(SQLModel):
+    operations: list[BatchReadItem] = Field(min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+    @field_validator("operations")
+    @classmethod
+    def keys_are_unique(cls, operations: list[BatchReadItem]) -> list[BatchReadItem]:
+        keys = [operation.key for operation in operations]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Operation keys must be unique")
+        return operations
+
+    class Config:
+        json_schema_extra = {"example": example_batch_read}
+
+
+class BatchReadResult(SQLModel):
+    status_code: int
+    data: Any = None
+    detail: str | None = None
+
+
+class BatchReadResponse(SQLModel):
+    results: dict[str, BatchReadResult]
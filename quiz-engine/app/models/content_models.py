@@ -1,4 +1,4 @@
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, Column, Integer, ForeignKey, Index
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -53,4 +53,40 @@ class ContentUpdate(SQLModel):
     content_text: str | None = None
 
     class Config:
-        json_schema_extra = {"example": example_input_content}
\ No newline at end of file
+        json_schema_extra = {"example": example_input_content}
+
+
+class ContentSegment(SQLModel, table=True):
+    """
+    Content text pre split for size budgeted responses, rewritten whenever its Content changes
+    """
+    __table_args__ = (
+        Index("ix_contentsegment_topic_order", "topic_id", "content_id", "position", unique=True),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    content_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("content.id", ondelete="CASCADE"), nullable=False)
+    )
+    topic_id: int
+    position: int
+    text: str
+    # Size of text as a JSON string
+    byte_size: int
+    token_count: int
+
+
+class ContentSegmentRead(SQLModel):
+    content_id: int
+    position: int
+    text: str
+    byte_size: int
+    token_count: int
+
+
+class ContentSegmentPage(SQLModel):
+    topic_id: int
+    segments: list[ContentSegmentRead]
+    byte_size: int
+    token_count: int
+    next_cursor: str | None = None
@@ -0,0 +1,32 @@
+from sqlmodel import Field, SQLModel, Column, BigInteger, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import ARRAY
+from datetime import datetime
+
+from app.models.question_models import QuestionBankRead
+
+
+class QuestionFingerprint(SQLModel, table=True):
+    """
+    LSH band keys of a question's MinHash signature, the GIN index finds questions sharing a key
+    """
+    __table_args__ = (
+        Index("ix_questionfingerprint_band_keys", "band_keys", postgresql_using="gin"),
+    )
+
+    question_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("questionbank.id", ondelete="CASCADE"), primary_key=True)
+    )
+    band_keys: list[int] = Field(default_factory=list, sa_column=Column(ARRAY(BigInteger), nullable=False))
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class SimilarQuestion(QuestionBankRead):
+    similarity: float
+
+
+class DuplicateQuestionPair(SQLModel):
+    question_id: int
+    question_text: str
+    duplicate_question_id: int
+    duplicate_question_text: str
+    similarity: float
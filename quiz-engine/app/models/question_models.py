@@ -1,4 +1,5 @@
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, Column, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from typing import TYPE_CHECKING
 
 from app.models.base import QuestionTypeEnum, BaseIdModel, QuestionDifficultyEnum
@@ -67,6 +68,16 @@ class QuestionBankBase(SQLModel):
 
 
 class QuestionBank(BaseIdModel, QuestionBankBase, table=True):
+    __table_args__ = (
+        Index("ix_questionbank_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    # Full text search document, generated by Postgres from question_text
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, Computed("to_tsvector('english', question_text)", persisted=True)),
+    )
+
     # topic Relationship
     topic: "Topic" = Relationship(back_populates="questions")
 
@@ -105,3 +116,13 @@ class QuestionBankUpdate(SQLModel):
     points: int | None = None
     difficulty: QuestionDifficultyEnum | None = None
     topic_id: int | None = None
+
+
+class QuestionSearchHit(QuestionBankRead):
+    rank: float
+
+
+class QuestionSearchPage(SQLModel):
+    items: list[QuestionSearchHit]
+    # Pass as cursor to get the next page, None on the last page
+    next_cursor: str | None = None
@@ -5,14 +5,21 @@ from datetime import datetime, timedelta
 
 from app.models.base import QuestionTypeEnum
 
-import random
-
 # TODO: Review when create quiz apis - LEAVING AS IT IS THE BELOW Models
 # ----------------------------
 # ----- Runtime Quiz Models for Validation & Serialization
 # ----------------------------
 
 
+def quiz_question_sort_key(quiz_question) -> int:
+    # Accepts QuizQuestion links, QuestionBank rows or plain dicts
+    if isinstance(quiz_question, dict):
+        return quiz_question["id"]
+    if hasattr(quiz_question, "question_id"):
+        return quiz_question.question_id
+    return quiz_question.id
+
+
 class MCQOptionRuntimeQuiz(SQLModel):
     id: int
     option_text: str
@@ -25,6 +32,10 @@ class QuestionRuntimeQuiz(SQLModel):
     question_type: QuestionTypeEnum = Field(default=QuestionTypeEnum.single_select_mcq)
     options: list[MCQOptionRuntimeQuiz] = []
 
+    @validator("options", pre=True)
+    def sort_options(cls, v):
+        return sorted(v, key=lambda option: option["id"] if isinstance(option, dict) else option.id)
+
 
 class RuntimeQuizGenerated(SQLModel):
     answer_sheet_id: int
@@ -40,11 +51,10 @@ class RuntimeQuizGenerated(SQLModel):
     total_points: int
     quiz_key: str
 
-    # Custom validator to shuffle the order of quiz_questions
+    # Stable order so the response is cacheable. Per attempt shuffling happens in assessment-evals
     @validator("quiz_questions", pre=True)
-    def shuffle_quiz_questions(cls, v):
-        random.shuffle(v)
-        return v
+    def sort_quiz_questions(cls, v):
+        return sorted(v, key=quiz_question_sort_key)
 
     # Custom validator to directly include question data
 
@@ -60,11 +70,10 @@ class WrapperRuntimeQuiz(SQLModel):
     course_id: int
     quiz_questions: list[QuestionRuntimeQuiz] = []
 
-    # Custom validator to shuffle the order of quiz_questions
+    # Stable order so the response is cacheable. Per attempt shuffling happens in assessment-evals
     @validator("quiz_questions", pre=True)
-    def shuffle_quiz_questions(cls, v):
-        random.shuffle(v)
-        return v
+    def sort_quiz_questions(cls, v):
+        return sorted(v, key=quiz_question_sort_key)
 
     # Custom validator to directly include question data
 
@@ -12,6 +12,8 @@ example_quiz_setting_input = {
     "start_time": "2023-02-26T14:56:46.277Z",
     "end_time": "2025-02-29T14:56:46.277Z",
     "quiz_key": "BAT_Q1TS278",
+    "waiting_room_enabled": False,
+    "admission_rate": None,
 }
 
 example_quiz_setting_output = {
@@ -21,6 +23,8 @@ example_quiz_setting_output = {
     "start_time": "2021-07-10T14:48:00.000Z",
     "end_time": "2021-07-10T14:48:00.000Z",
     "quiz_key": "BAT_Q1TS278",
+    "waiting_room_enabled": False,
+    "admission_rate": None,
     "created_at": "2021-07-10T14:48:00.000Z",
     "updated_at": "2021-07-10T14:48:00.000Z",
 }
@@ -32,6 +36,9 @@ class QuizSettingBase(SQLModel):
     start_time: datetime
     end_time: datetime 
     quiz_key: str = Field(max_length=160)
+    # Waiting Room: students are admitted to start the quiz at admission_rate per second
+    waiting_room_enabled: bool = Field(default=False)
+    admission_rate: int | None = Field(default=None, gt=0)
 
 
 class QuizSetting(BaseIdModel, QuizSettingBase, table=True):
@@ -62,6 +69,8 @@ class QuizSettingUpdate(SQLModel):
     start_time: datetime | None = None
     end_time: datetime | None = None
     quiz_key: str | None = None
+    waiting_room_enabled: bool | None = None
+    admission_rate: int | None = Field(default=None, gt=0)
 
     class Config:
         json_schema_extra = {"example": example_quiz_setting_input}
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel
+
+from app.models.base import SemanticHitKind
+
+
+class SemanticSearchHit(SQLModel):
+    kind: SemanticHitKind
+    # Content id or QuestionBank id depending on kind
+    source_id: int
+    topic_id: int
+    chunk_index: int
+    text: str
+    score: float
+
+
+class SemanticIndexStats(SQLModel):
+    contents: int
+    questions: int
+    chunks: int
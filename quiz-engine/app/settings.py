@@ -26,5 +26,23 @@ API_V1_STR="/api/v1"
 
 EDUCATIONAL_PROGRAM_URL = config("EDUCATIONAL_PROGRAM_URL", cast=str)
 AUTH_SERVER_URL=config("AUTH_SERVER_URL", cast=str)
+ASSESSMENT_EVALS_URL = config("ASSESSMENT_EVALS_URL", cast=str, default="http://assessment-evals:8003")
+# Sent as X-Service-Token on calls to assessment-evals, same value as its SERVICE_TOKEN
+ASSESSMENT_EVALS_SERVICE_TOKEN: Secret = config("ASSESSMENT_EVALS_SERVICE_TOKEN", cast=Secret, default="")
 
 GET_CUSTOM_GPT_SPEC = config("IS_NOT_CUSTOM_GPT_SPEC", cast=bool, default=True)
+
+# Near duplicate questions - Jaccard similarity of question & option shingles above which questions are duplicates
+DUPLICATE_QUESTION_THRESHOLD = config("DUPLICATE_QUESTION_THRESHOLD", cast=float, default=0.8)
+
+# Semantic search - memory mapped hashed vector index over topic Content and questions (needs numpy)
+SEMANTIC_INDEX_DIR = config("SEMANTIC_INDEX_DIR", cast=str, default="data/semantic_index")
+SEMANTIC_INDEX_DIMENSIONS = config("SEMANTIC_INDEX_DIMENSIONS", cast=int, default=4096)
+SEMANTIC_CHUNK_WORDS = config("SEMANTIC_CHUNK_WORDS", cast=int, default=120)
+SEMANTIC_CHUNK_OVERLAP_WORDS = config("SEMANTIC_CHUNK_OVERLAP_WORDS", cast=int, default=20)
+# Build an empty index in the background at startup, otherwise only by POST /search/semantic/rebuild
+SEMANTIC_INDEX_BUILD_ON_STARTUP = config("SEMANTIC_INDEX_BUILD_ON_STARTUP", cast=bool, default=True)
+
+# Content segments - size limit of a stored segment and of segment pages (GPT action responses are size limited)
+CONTENT_SEGMENT_MAX_BYTES = config("CONTENT_SEGMENT_MAX_BYTES", cast=int, default=2000)
+CONTENT_PAGE_DEFAULT_BYTES = config("CONTENT_PAGE_DEFAULT_BYTES", cast=int, default=40000)
@@ -7,6 +7,7 @@ from tests.utils.test_items import temp_topic  # Ensure this is available in you
 from tests.utils.test_items import temp_question  # Ensure this is available in your test utils
 from app.init_data import init_course_id
 from app.crud.topic_crud import topic_crud
+from app.crud.question_crud import question_crud
 from app.models.topic_models import TopicCreate
 
 # Example fixture for creating a new topic
@@ -76,4 +77,18 @@ def test_create_new_question_invalid_data(client: TestClient):
         json=incomplete_data
     )
     assert response.status_code == 422
-    assert (response.json()["detail"]) == [{'type': 'missing', 'loc': ['body', 'question_text'], 'msg': 'Field required', 'input': {'text': ''}}, {'type': 'missing', 'loc': ['body', 'topic_id'], 'msg': 'Field required', 'input': {'text': ''}}]
\ No newline at end of file
+    assert (response.json()["detail"]) == [{'type': 'missing', 'loc': ['body', 'question_text'], 'msg': 'Field required', 'input': {'text': ''}}, {'type': 'missing', 'loc': ['body', 'topic_id'], 'msg': 'Field required', 'input': {'text': ''}}]
+
+def test_search_questions_invalid_cursor(client: TestClient):
+    response = client.get(f"{settings.API_V1_STR}/question/search", params={"q": "python", "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+def test_search_questions_errors_are_not_reported_as_invalid_cursor(client: TestClient, monkeypatch):
+    def failing_search(**kwargs):
+        raise ValueError("search failed")
+
+    monkeypatch.setattr(question_crud, "search_questions", failing_search)
+    response = client.get(f"{settings.API_V1_STR}/question/search", params={"q": "python"})
+    assert response.status_code == 500
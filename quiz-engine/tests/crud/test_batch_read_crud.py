@@ -0,0 +1,46 @@
+import random
+import pytest
+from pydantic import ValidationError
+from sqlmodel import Session
+
+from app.crud.batch_read_crud import batch_read_crud
+from app.crud.question_crud import question_crud
+from app.crud.topic_crud import topic_crud
+from app.models.batch_models import BatchReadRequest
+from app.models.question_models import QuestionBankCreate
+from app.models.topic_models import TopicCreate
+from app.init_data import init_course_id
+
+
+def test_batch_read_keys_must_be_unique():
+    with pytest.raises(ValidationError):
+        BatchReadRequest.model_validate(
+            {"operations": [{"key": "a", "op": "topic", "id": 1}, {"key": "a", "op": "quiz", "id": 1}]}
+        )
+
+
+def test_batch_read_returns_results_per_key(db: Session):
+    topic = topic_crud.create_topic(
+        topic=TopicCreate(title="batch" + str(random.randint(1, 10000)), description="Batch", course_id=init_course_id),
+        db=db,
+    )
+    question = question_crud.add_question(
+        question=QuestionBankCreate(question_text="Batched?", topic_id=topic.id, options=[]), db=db
+    )
+    batch = BatchReadRequest.model_validate(
+        {
+            "operations": [
+                {"key": "topic", "op": "topic", "id": topic.id},
+                {"key": "tree", "op": "subtopics", "id": topic.id},
+                {"key": "questions", "op": "questions_by_topic", "id": topic.id},
+                {"key": "unsupported", "op": "topic", "id": topic.id, "fields": "title"},
+            ]
+        }
+    )
+
+    results = batch_read_crud.read_many(operations=batch.operations, db=db)
+    assert list(results) == ["topic", "tree", "questions", "unsupported"]
+    assert results["topic"].status_code == 200 and results["topic"].data["id"] == topic.id
+    assert results["tree"].data["topic_id"] == topic.id
+    assert [item["id"] for item in results["questions"].data] == [question.id]
+    assert results["unsupported"].status_code == 400
@@ -0,0 +1,48 @@
+import random
+from sqlmodel import Session
+
+from app.core.content_segments import split_segments, json_byte_size, estimate_tokens
+from app.crud.content_crud import content_crud
+from app.crud.content_segment_crud import content_segment_crud
+from app.crud.topic_crud import topic_crud
+from app.models.content_models import ContentCreate
+from app.models.topic_models import TopicCreate
+from app.init_data import init_course_id
+
+
+def test_split_segments_prefers_paragraph_and_sentence_boundaries():
+    text = "First sentence. Second sentence!\n\n" + "word " * 60 + "\n\n" + "x" * 250
+    segments = split_segments(text, 100)
+    assert segments[0] == "First sentence. Second sentence!"
+    assert all(len(segment.encode()) <= 100 for segment in segments)
+    assert "".join(segments).replace(" ", "") == text.replace(" ", "").replace("\n", "")
+    assert split_segments("  ", 100) == []
+
+
+def test_segment_sizes():
+    assert json_byte_size('a"é') == len('"a\\"é"'.encode())
+    assert estimate_tokens("Hello, internationalization!") == 9
+
+
+def test_segment_pages_fit_the_byte_budget(db: Session):
+    topic = topic_crud.create_topic(
+        topic=TopicCreate(title="segments" + str(random.randint(1, 10000)), description="Segments", course_id=init_course_id),
+        db=db,
+    )
+    texts = [" ".join(f"w{index}_{word}" for word in range(1500)) for index in range(3)]
+    for text in texts:
+        content_crud.create_new_content(content=ContentCreate(topic_id=topic.id, content_text=text), db=db)
+
+    pages, after = [], None
+    while True:
+        segments, has_more = content_segment_crud.read_segment_page(topic_id=topic.id, max_bytes=5000, db=db, after=after)
+        pages.append(segments)
+        if not has_more:
+            break
+        after = (segments[-1].content_id, segments[-1].position)
+
+    assert len(pages) > 1
+    for segments in pages:
+        assert sum(segment.byte_size + 96 for segment in segments) + 160 <= 5000
+    read_words = [word for segments in pages for segment in segments for word in segment.text.split()]
+    assert read_words == [word for text in texts for word in text.split()]
@@ -0,0 +1,54 @@
+import random
+import pytest
+from sqlmodel import Session
+
+from app.core.fieldsets import parse_fieldset
+from app.crud.question_crud import question_crud
+from app.crud.topic_crud import topic_crud
+from app.models.question_models import QuestionBank, QuestionBankCreate, QuestionBankRead
+from app.models.quiz_models import Quiz, QuizReadWithQuestionsAndTopics
+from app.models.topic_models import TopicCreate
+from app.init_data import init_course_id
+
+
+def test_parse_fieldset_follows_the_response_model():
+    assert parse_fieldset(Quiz, QuizReadWithQuestionsAndTopics, None, " ") is None
+
+    fieldset = parse_fieldset(
+        Quiz, QuizReadWithQuestionsAndTopics, "quiz_title,quiz_questions.question.question_text", "topics"
+    )
+    assert fieldset.output_fields == ["quiz_title"]
+    assert set(fieldset.relations) == {"topics", "quiz_questions"}
+    assert fieldset.relations["quiz_questions"].relations["question"].output_fields == ["question_text"]
+    assert "title" in fieldset.relations["topics"].output_fields
+
+    with pytest.raises(ValueError):
+        parse_fieldset(Quiz, QuizReadWithQuestionsAndTopics, "secret", None)
+    # Not part of the response model
+    with pytest.raises(ValueError):
+        parse_fieldset(Quiz, QuizReadWithQuestionsAndTopics, None, "quiz_settings")
+    with pytest.raises(ValueError):
+        parse_fieldset(QuestionBank, QuestionBankRead, "search_vector", None)
+
+
+def test_get_question_by_id_with_fieldset(db: Session):
+    topic = topic_crud.create_topic(
+        topic=TopicCreate(title="fieldset" + str(random.randint(1, 10000)), description="Fieldset", course_id=init_course_id),
+        db=db,
+    )
+    options = [{"is_correct": True, "option_text": "Yes"}, {"is_correct": False, "option_text": "No"}]
+    question = question_crud.add_question(
+        question=QuestionBankCreate(question_text="Is this sparse?", topic_id=topic.id, options=options), db=db
+    )
+    db.expunge_all()
+
+    fieldset = parse_fieldset(QuestionBank, QuestionBankRead, "question_text,options.option_text", None)
+    sparse_question = question_crud.get_question_by_id(id=question.id, db=db, fieldset=fieldset)
+    data = fieldset.serialize(sparse_question)
+    assert data["question_text"] == "Is this sparse?"
+    assert sorted(data["options"], key=lambda option: option["option_text"]) == [
+        {"option_text": "No"},
+        {"option_text": "Yes"},
+    ]
+    assert set(data) == {"question_text", "options"}
+    db.expunge_all()
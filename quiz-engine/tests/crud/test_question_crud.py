@@ -80,4 +80,25 @@ def test_read_questions_by_type(db: Session):
 
 def test_get_questions_by_topic_error(db: Session, init_topic_id):
     with pytest.raises(HTTPException) as e:
-        question_crud.get_questions_by_topic(topic_id=init_topic_id, db=db)
\ No newline at end of file
+        question_crud.get_questions_by_topic(topic_id=init_topic_id, db=db)
+
+def test_search_questions_matches_question_and_option_text(db: Session, init_topic_id):
+    marker = "zebrafish" + str(random.randint(1, 10000))
+    question_data = QuestionBankCreate(
+        question_text=f"Which {marker} statement is valid?",
+        question_type=temp_question.get("question_type"),
+        topic_id=init_topic_id,
+        difficulty="hard",
+        is_verified=True,
+        options=[{"is_correct": True, "option_text": "Option with quokka"}],
+    )
+    created_question = question_crud.add_question(question=question_data, db=db)
+
+    results = question_crud.search_questions(query=marker, db=db, limit=10)
+    assert [question.id for question, _ in results] == [created_question.id]
+
+    # matched on an option only
+    results = question_crud.search_questions(query="quokka", db=db, limit=10, topic_id=init_topic_id)
+    assert created_question.id in [question.id for question, _ in results]
+
+    assert question_crud.search_questions(query=marker, db=db, limit=10, difficulty="easy") == []
@@ -0,0 +1,52 @@
+import random
+from sqlmodel import Session
+
+from app.core.minhash import band_keys, jaccard, question_shingles
+from app.crud.question_crud import question_crud
+from app.crud.question_dedup_crud import question_dedup_crud
+from app.crud.topic_crud import topic_crud
+from app.models.question_models import QuestionBankCreate
+from app.models.topic_models import TopicCreate
+from app.init_data import init_course_id
+
+
+def test_band_keys_ignore_case_punctuation_and_option_order():
+    shingles = question_shingles("What is a Python list?", ["A mutable sequence", "A mapping"])
+    reordered = question_shingles("what is a python list", ["A mapping", "a mutable sequence!"])
+    assert shingles == reordered
+    assert band_keys(shingles) == band_keys(reordered)
+    assert band_keys(question_shingles("", [])) == []
+
+
+def test_jaccard_of_shingles():
+    assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+    assert jaccard(set(), set()) == 0.0
+
+
+def test_find_similar_questions_and_report(db: Session):
+    topic = topic_crud.create_topic(
+        topic=TopicCreate(title="dedup" + str(random.randint(1, 10000)), description="Dedup", course_id=init_course_id),
+        db=db,
+    )
+    marker = "walrus" + str(random.randint(1, 10000))
+    question_text = f"Which operator assigns inside an expression in {marker} Python code?"
+    options = [{"is_correct": True, "option_text": "The walrus operator"}, {"is_correct": False, "option_text": "The plus operator"}]
+    created_question = question_crud.add_question(
+        question=QuestionBankCreate(question_text=question_text, topic_id=topic.id, options=options), db=db
+    )
+
+    similar = question_dedup_crud.find_similar_questions(
+        question_text=question_text.upper(),
+        option_texts=[option["option_text"] for option in reversed(options)],
+        threshold=0.8,
+        db=db,
+    )
+    assert [(question.id, similarity) for question, similarity in similar] == [(created_question.id, 1.0)]
+
+    duplicate_question = question_crud.add_question(
+        question=QuestionBankCreate(question_text=question_text + "!", topic_id=topic.id, options=options), db=db
+    )
+    report = question_dedup_crud.duplicate_report(threshold=0.8, db=db)
+    assert (created_question.id, duplicate_question.id) in {
+        (pair.question_id, pair.duplicate_question_id) for pair in report
+    }
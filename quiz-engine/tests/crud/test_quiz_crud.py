@@ -64,6 +64,12 @@ def test_read_all_quizzes_for_course(db: Session):
     assert isinstance(quizzes, list)
     assert len(quizzes) > 0
 
+def test_read_quiz_ids_for_course(db: Session, quiz_id):
+    quiz_ids = quiz_engine.read_quiz_ids_for_course(db=db, course_id=temp_quiz_data['course_id'])
+    assert quiz_id in quiz_ids
+    assert quiz_ids == sorted(quiz_ids)
+    assert quiz_engine.read_quiz_ids_for_course(db=db, course_id=99999) == []
+
 def test_quiz_not_found_error(db: Session):
     with pytest.raises(HTTPException) as e:
         quiz_engine.read_quiz_by_id(quiz_id=99999, db=db)  # Assume 99999 is an invalid ID
@@ -93,3 +93,24 @@ def test_validate_quiz_key_invalid(db: Session, quiz_id):
     assert exc.value.status_code == 404
     assert "QuizSetting not found" in exc.value.detail
 
+
+def test_get_quiz_setting_by_key(db: Session, quiz_setting_id):
+    quiz_setting = quiz_setting_engine.get_quiz_setting_by_id(db=db, quiz_setting_id=quiz_setting_id)
+    found_quiz_setting = quiz_setting_engine.get_quiz_setting_by_key(db=db, quiz_id=quiz_setting.quiz_id, quiz_key=quiz_setting.quiz_key)
+    assert found_quiz_setting == quiz_setting
+    assert found_quiz_setting.waiting_room_enabled is False
+
+def test_get_upcoming_quiz_settings(db: Session, quiz_id):
+    quiz_setting_data = QuizSettingCreate(
+        quiz_id=quiz_id,
+        start_time=datetime.now() + timedelta(minutes=10),
+        end_time=datetime.now() + timedelta(hours=2),
+        quiz_key="upcomingkey",
+        instructions="Do not cheat!",
+        time_limit=60
+    )
+    created_quiz_setting = quiz_setting_engine.create_quiz_setting(db=db, quiz_setting=quiz_setting_data)
+    upcoming = quiz_setting_engine.get_upcoming_quiz_settings(db=db, starts_before=datetime.now() + timedelta(minutes=15))
+    assert created_quiz_setting.id in [quiz_setting.id for quiz_setting in upcoming]
+    later = quiz_setting_engine.get_upcoming_quiz_settings(db=db, starts_before=datetime.now() + timedelta(minutes=5))
+    assert created_quiz_setting.id not in [quiz_setting.id for quiz_setting in later]
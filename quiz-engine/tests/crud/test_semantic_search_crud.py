@@ -0,0 +1,84 @@
+import random
+from sqlmodel import Session
+
+from app.core.semantic_index import KIND_CONTENT, KIND_QUESTION, SemanticIndex, chunk_text
+from app.crud.content_crud import content_crud
+from app.crud.semantic_search_crud import semantic_search_crud
+from app.crud.topic_crud import topic_crud
+from app.models.base import SemanticHitKind
+from app.models.content_models import ContentCreate
+from app.models.topic_models import TopicCreate
+from app.init_data import init_course_id
+
+
+def test_chunk_text_overlaps_chunks():
+    text = " ".join(str(word) for word in range(50))
+    chunks = chunk_text(text, 20, 5)
+    assert [chunk.split()[0] for chunk in chunks] == ["0", "15", "30"]
+    assert chunks[-1].split()[-1] == "49"
+    assert chunk_text("", 20, 5) == []
+
+
+def test_index_updates_and_persists(tmp_path):
+    index = SemanticIndex(str(tmp_path), dimensions=1024, chunk_words=20, overlap_words=5)
+    index.upsert_document(kind=KIND_CONTENT, source_id=1, course_id=7, topic_id=3, text="Python lists are mutable sequences")
+    index.upsert_document(kind=KIND_CONTENT, source_id=2, course_id=7, topic_id=4, text="Dictionaries map keys to values")
+    index.upsert_document(kind=KIND_QUESTION, source_id=2, course_id=7, topic_id=4, text="What maps keys to values?")
+    index.upsert_document(kind=KIND_CONTENT, source_id=3, course_id=8, topic_id=5, text="Dictionaries map keys to values")
+
+    matches = index.search("how do dictionaries map keys", course_id=7, kinds=(KIND_CONTENT,), limit=3)
+    assert [(match.kind, match.source_id) for match in matches] == [(KIND_CONTENT, 2)]
+    assert 0 < matches[0].score <= 1.0001
+
+    index.upsert_document(kind=KIND_CONTENT, source_id=2, course_id=7, topic_id=4, text="Sets hold unique items")
+    assert index.search("dictionaries", course_id=7, kinds=(KIND_CONTENT,), limit=3) == []
+
+    reopened = SemanticIndex(str(tmp_path), dimensions=1024, chunk_words=20, overlap_words=5)
+    assert [match.source_id for match in reopened.search("unique sets", course_id=7, kinds=(KIND_CONTENT,), limit=3)] == [2]
+    reopened.remove_document(kind=KIND_CONTENT, source_id=2)
+    assert reopened.search("unique sets", course_id=7, kinds=(KIND_CONTENT,), limit=3) == []
+
+
+def test_index_instances_sharing_a_directory_stay_in_sync(tmp_path):
+    # Two workers mapping the same files
+    first = SemanticIndex(str(tmp_path), dimensions=256, chunk_words=20, overlap_words=5)
+    second = SemanticIndex(str(tmp_path), dimensions=256, chunk_words=20, overlap_words=5)
+    assert second.search("lists", course_id=7, kinds=(KIND_CONTENT,), limit=3) == []
+    assert not (tmp_path / "vectors.npy").exists()
+
+    first.upsert_document(kind=KIND_CONTENT, source_id=1, course_id=7, topic_id=3, text="Python lists are mutable")
+    assert [match.source_id for match in second.search("lists", course_id=7, kinds=(KIND_CONTENT,), limit=3)] == [1]
+
+    # Growing past the capacity replaces the files under the other instance's maps
+    for source_id in range(2, 1100):
+        second.upsert_document(kind=KIND_CONTENT, source_id=source_id, course_id=8, topic_id=4, text=f"Tuples {source_id}")
+    first.upsert_document(kind=KIND_CONTENT, source_id=1, course_id=7, topic_id=3, text="Sets hold unique items")
+    assert second.live_rows == first.live_rows == 1099
+    assert [match.source_id for match in second.search("unique sets", course_id=7, kinds=(KIND_CONTENT,), limit=3)] == [1]
+
+    second.reset()
+    assert first.live_rows == 0
+
+
+def test_semantic_search_finds_new_content(db: Session):
+    topic = topic_crud.create_topic(
+        topic=TopicCreate(title="semantic" + str(random.randint(1, 10000)), description="Semantic", course_id=init_course_id),
+        db=db,
+    )
+    marker = "zebrafish" + str(random.randint(1, 10000))
+    content = content_crud.create_new_content(
+        content=ContentCreate(topic_id=topic.id, content_text=f"Generators in {marker} yield values lazily one at a time"),
+        db=db,
+    )
+
+    hits = semantic_search_crud.search(
+        query=f"{marker} lazily yield", course_id=init_course_id, limit=3, include_questions=False, db=db
+    )
+    assert (hits[0].kind, hits[0].source_id, hits[0].topic_id) == (SemanticHitKind.content, content.id, topic.id)
+    assert marker in hits[0].text
+
+    content_crud.delete_content(id=content.id, db=db)
+    hits = semantic_search_crud.search(
+        query=f"{marker} lazily yield", course_id=init_course_id, limit=3, include_questions=False, db=db
+    )
+    assert content.id not in [hit.source_id for hit in hits if hit.kind == SemanticHitKind.content]